@@ -23,6 +23,7 @@ from views.ui_optimization import app as optim_app
 from views.ui_participant import app as participant_app
 from views.ui_registration import app as reg_app
 from views.ui_inference import app as infer_app
+from views.ui_search import app as search_app
 from views.utils import load_custom_css
 
 ##################
@@ -107,6 +108,9 @@ def main():
     elif resource == "inferences":
         infer_app(action=requested_view)
 
+    elif resource == "search":
+        search_app(action=requested_view)
+
 
 ###########
 # Scripts #
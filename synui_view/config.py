@@ -43,6 +43,102 @@ TMP_DIR = os.path.join(SRC_DIR, "tmp")
 TRACKER_HOST = os.environ['TRACK_HOST']
 TRACKER_PORT = os.environ['TRACK_PORT']
 
+##############################################
+# Synergos UI Container Cache Configurations #
+##############################################
+""" Parameters governing locally materialized orchestrator metadata """
+
+# Directory to store locally materialized orchestrator metadata
+CACHE_DIR = os.path.join(SRC_DIR, "cache")
+
+# Directory to store exported orchestrator snapshots
+SNAPSHOT_DIR = os.path.join(CACHE_DIR, "snapshots")
+
+# Time (in seconds) before a listed level of the job hierarchy is refreshed
+HIERARCHY_REFRESH_INTERVAL = 30
+
+# Time (in seconds) between synchronisation cycles of orchestrator replicas
+REPLICA_SYNC_INTERVAL = 60
+
+# No. of synchronisation cycles between full (i.e. non-incremental) syncs
+REPLICA_FULL_SYNC_CYCLES = 10
+
+# Time (in seconds) before the search index of an orchestrator is resynced
+SEARCH_REFRESH_INTERVAL = 60
+
+# SQLite store recording the stages & durations of all launched jobs
+JOB_HISTORY_PATH = os.path.join(CACHE_DIR, "history.db")
+
+# Time (in seconds) without a heartbeat before a started job is deemed abandoned
+LEASE_DURATION = 30
+
+# Time (in seconds) between heartbeats renewing the lease of a running job
+LEASE_RENEWAL_INTERVAL = 5
+
+#############################################
+# Synergos UI Container View Configurations #
+#############################################
+""" Parameters governing how records are presented for selection """
+
+# No. of IDs rendered per page of a selector
+SELECTOR_PAGE_SIZE = 50
+
+# No. of recently selected IDs pinned at the top of a selector
+SELECTOR_RECENT_LIMIT = 5
+
+# Time (in seconds) between refreshes of a live hyperparameter sweep monitor
+SWEEP_REFRESH_INTERVAL = 10
+
+# No. of most recently created runs tabulated by a sweep monitor
+SWEEP_TABLE_SIZE = 50
+
+# Parameter count beyond which an experiment's model is flagged as oversized
+MODEL_PARAMETER_LIMIT = 50000000
+
+# Estimated training memory (in bytes) per worker beyond which an experiment's
+# model is flagged as oversized
+MODEL_MEMORY_LIMIT = 4 * 1024**3
+
+# Max no. of records declared in a single bulk upload of experiments or runs
+BULK_IMPORT_MAX_ITEMS = 1000
+
+# Max uncompressed size (in bytes) of a single document in a bulk upload
+BULK_IMPORT_MAX_BYTES = 10 * 1024**2
+
+# Max no. of concurrent creation requests made to the orchestrator when
+# importing records in bulk
+BULK_IMPORT_WORKERS = 8
+
+# No. of alignment indexes expanded per page when browsing an alignment
+ALIGNMENT_PAGE_SIZE = 500
+
+# Max no. of concurrent requests made to the orchestrator when retrieving the
+# alignments of all participants in a project
+COVERAGE_FETCH_WORKERS = 8
+
+# Max no. of features rendered in a project's alignment coverage matrix
+COVERAGE_MATRIX_COLUMNS = 100
+
+# Time (in seconds) before a declared node port is deemed unresponsive
+NODE_PROBE_TIMEOUT = 3
+
+# Max no. of node ports tested concurrently before registration
+NODE_PROBE_WORKERS = 16
+
+# Time (in seconds) that probe results of the same node declarations are reused
+NODE_PROBE_TTL = 60
+
+# No. of round trips sampled when benchmarking the orchestrator
+BENCHMARK_SAMPLES = 5
+
+# No. of API requests timed when benchmarking the orchestrator. Requests list
+# the orchestrator's collaborations, & are hence kept few.
+BENCHMARK_REQUEST_SAMPLES = 1
+
+# Median round-trip time (in ms) to the orchestrator beyond which a connection
+# is flagged as too slow to sustain training
+BENCHMARK_RTT_LIMIT = 250
+
 ################################################
 # Synergos UI Container Service Configurations #
 ################################################
@@ -63,6 +159,40 @@ SUPPORTED_COMPONENTS = {
     }
 }
 
+# Credentials used to query the REST API of a deployed Synergos Logger
+LOGGER_USERNAME = os.environ.get('LOGGER_USERNAME', "admin")
+LOGGER_PASSWORD = os.environ.get('LOGGER_PASSWORD', "admin")
+
+# Max no. of log messages retained while streaming the progress of a job
+PROGRESS_BUFFER_SIZE = 500
+
+# Max no. of log messages fetched from a Synergos Logger per poll
+PROGRESS_FETCH_LIMIT = 200
+
+# Credentials used to subscribe to a deployed Synergos MQ
+MQ_USERNAME = os.environ.get('MQ_USERNAME', "guest")
+MQ_PASSWORD = os.environ.get('MQ_PASSWORD', "guest")
+
+# Exchange on which a deployed Synergos MQ publishes job completion events
+MQ_COMPLETION_EXCHANGE = os.environ.get('MQ_COMPLETION_EXCHANGE', "synergos.completed")
+
+# Time (in seconds) before a lost connection to a Synergos MQ is retried
+MQ_RECONNECT_INTERVAL = 30
+
+# Max no. of recently published completion events retained per Synergos MQ
+NOTIFICATION_BUFFER_SIZE = 1000
+
+# Time (in seconds) between the first checks of whether a job has completed
+POLL_MIN_INTERVAL = 1
+
+# Max time (in seconds) between checks, as intervals grow by POLL_BACKOFF
+POLL_MAX_INTERVAL = 15
+POLL_BACKOFF = 1.5
+
+# Time (in seconds) between confirmatory checks when completion events are
+# subscribed to, guarding against events that were never delivered
+MQ_FALLBACK_INTERVAL = 60
+
 DEFAULT_DEPLOYMENTS = {
     'Synergos Basic': [],
     'Synergos Plus': [
@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from typing import Callable, Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+ALIGNMENT_PARTITIONS = ['train', 'evaluate', 'predict']
+
+SUMMARY_COLUMNS = ['partition', 'count', 'ranges', 'first', 'last', 'coverage']
+
+###########
+# Helpers #
+###########
+
+def merge_intervals(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ Merges sorted, non-overlapping half-open intervals that touch one
+        another (i.e. a stop equal to the next start) into single intervals
+
+    Args:
+        starts (np.ndarray): Sorted starts of intervals
+        stops (np.ndarray): Corresponding (exclusive) stops of intervals
+    Returns:
+        Merged starts & stops (tuple(np.ndarray, np.ndarray))
+    """
+    if len(starts) == 0:
+        return starts, stops
+
+    breaks = np.flatnonzero(starts[1:] != stops[:-1]) + 1
+    return (
+        starts[np.concatenate(([0], breaks))],
+        stops[np.concatenate((breaks - 1, [len(stops) - 1]))]
+    )
+
+####################################
+# Index Ranges class - IndexRanges #
+####################################
+
+class IndexRanges:
+    """
+    Range-encoded, sorted set of alignment indexes. Consecutive indexes are
+    stored as a single half-open interval, so an alignment of thousands of
+    indexes typically reduces to a handful of ranges.
+
+    Attributes:
+        starts (np.ndarray): Start of every range
+        stops (np.ndarray): (Exclusive) stop of every range
+    """
+    def __init__(self, starts: np.ndarray = None, stops: np.ndarray = None):
+        self.starts = np.asarray([] if starts is None else starts, dtype=np.int64)
+        self.stops = np.asarray([] if stops is None else stops, dtype=np.int64)
+
+        # Cumulative no. of indexes preceding every range, used for paging
+        self._offsets = np.concatenate(([0], np.cumsum(self.stops - self.starts)))
+
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, IndexRanges) and
+            np.array_equal(self.starts, other.starts) and
+            np.array_equal(self.stops, other.stops)
+        )
+
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def range_count(self) -> int:
+        return len(self.starts)
+
+
+    @property
+    def first(self) -> int:
+        return int(self.starts[0]) if self.range_count else None
+
+
+    @property
+    def last(self) -> int:
+        return int(self.stops[-1]) - 1 if self.range_count else None
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _membership(self, points: np.ndarray) -> np.ndarray:
+        """ Checks which points lie within any of the ranges
+
+        Args:
+            points (np.ndarray): Sorted points to be checked
+        Returns:
+            Membership mask (np.ndarray)
+        """
+        return (
+            np.searchsorted(self.starts, points, side="right") -
+            np.searchsorted(self.stops, points, side="right")
+        ) > 0
+
+
+    def _combine(self, other: 'IndexRanges', operation: Callable) -> 'IndexRanges':
+        """ Combines two sets of ranges via their range boundaries alone, so
+            that the cost scales with the no. of ranges rather than the no. of
+            indexes they contain
+
+        Args:
+            other (IndexRanges): Ranges to combine with
+            operation (callable): Element-wise boolean operation deciding if
+                an elementary interval is retained, given its membership in
+                both sets
+        Returns:
+            Combined ranges (IndexRanges)
+        """
+        boundaries = np.unique(np.concatenate(
+            (self.starts, self.stops, other.starts, other.stops)
+        ))
+        if len(boundaries) < 2:
+            return IndexRanges()
+
+        starts, stops = boundaries[:-1], boundaries[1:]
+        is_retained = operation(self._membership(starts), other._membership(starts))
+        return IndexRanges(*merge_intervals(starts[is_retained], stops[is_retained]))
+
+    ##################
+    # Core functions #
+    ##################
+
+    @classmethod
+    def from_indexes(cls, indexes: List[int]) -> 'IndexRanges':
+        """ Encodes a list of indexes into ranges. Duplicates are dropped and
+            order is not preserved, as alignments are sets of positions.
+
+        Args:
+            indexes (list(int)): Alignment indexes
+        Returns:
+            Encoded indexes (IndexRanges)
+        """
+        try:
+            values = np.unique(np.asarray(list(indexes), dtype=np.int64))
+        except (TypeError, ValueError, OverflowError) as e:
+            raise ValueError(f"Alignment indexes must be integers ({e})")
+
+        if len(values) == 0:
+            return cls()
+
+        breaks = np.flatnonzero(np.diff(values) != 1) + 1
+        starts = values[np.concatenate(([0], breaks))]
+        stops = values[np.concatenate((breaks - 1, [len(values) - 1]))] + 1
+        return cls(starts, stops)
+
+
+    @classmethod
+    def from_string(cls, text: str) -> 'IndexRanges':
+        """ Parses ranges declared in their compact form (eg. "0-4, 7, 9-12").
+            Plain lists of indexes (eg. "[0, 1, 2]") are accepted as well.
+
+        Args:
+            text (str): Compact declaration of indexes
+        Returns:
+            Encoded indexes (IndexRanges)
+        """
+        starts = []
+        stops = []
+        for token in text.strip().strip("[]").replace("\n", ",").split(","):
+            token = token.strip()
+            if not token:
+                continue
+
+            bounds = token.split("-", 1) if not token.startswith("-") else [token]
+            try:
+                start = int(bounds[0])
+                end = int(bounds[-1])
+            except ValueError:
+                raise ValueError(f"Invalid index range '{token}'")
+
+            if end < start:
+                raise ValueError(f"Index range '{token}' is reversed")
+
+            starts.append(start)
+            stops.append(end + 1)
+
+        order = np.argsort(starts, kind="stable")
+        starts = np.asarray(starts, dtype=np.int64)[order]
+        stops = np.asarray(stops, dtype=np.int64)[order]
+
+        # Overlapping declarations are absorbed into their preceding range
+        if len(stops):
+            stops = np.maximum.accumulate(stops)
+            group_starts = np.flatnonzero(np.concatenate(([True], starts[1:] > stops[:-1])))
+            group_stops = np.concatenate((group_starts[1:] - 1, [len(stops) - 1]))
+            starts, stops = starts[group_starts], stops[group_stops]
+
+        return cls(*merge_intervals(starts, stops))
+
+
+    def to_string(self, limit: int = None) -> str:
+        """ Formats ranges in their compact form (eg. "0-4, 7, 9-12")
+
+        Args:
+            limit (int): Max no. of ranges to be formatted, beyond which the
+                remainder is summarised
+        Returns:
+            Compact declaration of indexes (str)
+        """
+        count = self.range_count if limit is None else min(limit, self.range_count)
+        tokens = [
+            f"{start}" if stop - start == 1 else f"{start}-{stop - 1}"
+            for start, stop in zip(self.starts[:count].tolist(), self.stops[:count].tolist())
+        ]
+        if count < self.range_count:
+            tokens.append(f"... (+{self.range_count - count} ranges)")
+
+        return ", ".join(tokens)
+
+
+    def to_list(self) -> List[int]:
+        """ Expands all ranges back into their indexes
+
+        Returns:
+            Alignment indexes (list(int))
+        """
+        return self.page(0, len(self))
+
+
+    def page(self, page_idx: int, page_size: int) -> List[int]:
+        """ Expands a single page of indexes, without expanding any range
+            outside of it
+
+        Args:
+            page_idx (int): Zero-indexed page to be expanded
+            page_size (int): No. of indexes per page
+        Returns:
+            Alignment indexes on the page (list(int))
+        """
+        begin = max(page_idx, 0) * page_size
+        end = min(begin + page_size, len(self))
+        if begin >= end:
+            return []
+
+        first = int(np.searchsorted(self._offsets, begin, side="right")) - 1
+        last = int(np.searchsorted(self._offsets, end, side="left"))
+        indexes = np.concatenate([
+            np.arange(start, stop)
+            for start, stop in zip(self.starts[first:last], self.stops[first:last])
+        ])
+        skipped = begin - int(self._offsets[first])
+        return indexes[skipped:skipped + end - begin].tolist()
+
+
+    def page_count(self, page_size: int) -> int:
+        return -(-len(self) // page_size)
+
+
+    def union(self, other: 'IndexRanges') -> 'IndexRanges':
+        return self._combine(other, np.logical_or)
+
+
+    def intersection(self, other: 'IndexRanges') -> 'IndexRanges':
+        return self._combine(other, np.logical_and)
+
+
+    def difference(self, other: 'IndexRanges') -> 'IndexRanges':
+        return self._combine(other, lambda is_in_self, is_in_other: is_in_self & ~is_in_other)
+
+##################
+# Core functions #
+##################
+
+def encode_alignment(data: Dict[str, Any]) -> Dict[str, IndexRanges]:
+    """ Range-encodes every partition of an alignment record
+
+    Args:
+        data (dict): Alignment record of a registration
+    Returns:
+        Encoded indexes of every partition (dict(str, IndexRanges))
+    """
+    return {
+        partition: IndexRanges.from_indexes(data.get(partition) or [])
+        for partition in ALIGNMENT_PARTITIONS
+    }
+
+
+def summarize_alignment(
+    alignment: Dict[str, IndexRanges],
+    total: int = None
+) -> pd.DataFrame:
+    """ Tabulates the size & coverage of every partition of an alignment.
+        Coverage is computed against `total` if declared, otherwise against
+        the span of indexes across all partitions.
+
+    Args:
+        alignment (dict(str, IndexRanges)): Encoded alignment
+        total (int): Total no. of positions alignable
+    Returns:
+        Alignment summary (pd.DataFrame)
+    """
+    if total is None:
+        lasts = [ranges.last for ranges in alignment.values() if len(ranges)]
+        total = max(lasts) + 1 if lasts else 0
+
+    return pd.DataFrame(
+        [
+            {
+                'partition': partition,
+                'count': len(ranges),
+                'ranges': ranges.range_count,
+                'first': ranges.first,
+                'last': ranges.last,
+                'coverage': round(len(ranges) / total, 4) if total else None
+            }
+            for partition, ranges in alignment.items()
+        ],
+        columns=SUMMARY_COLUMNS
+    )
+
+
+def diff_alignments(
+    alignment: Dict[str, IndexRanges],
+    other: Dict[str, IndexRanges]
+) -> Dict[str, Dict[str, IndexRanges]]:
+    """ Compares the alignments of two participants, partition by partition
+
+    Args:
+        alignment (dict(str, IndexRanges)): Encoded alignment of a participant
+        other (dict(str, IndexRanges)): Encoded alignment of another
+    Returns:
+        Indexes exclusive to either participant & shared by both, for every
+        partition (dict(str, dict(str, IndexRanges)))
+    """
+    diff = {}
+    for partition in ALIGNMENT_PARTITIONS:
+        ranges = alignment.get(partition, IndexRanges())
+        other_ranges = other.get(partition, IndexRanges())
+        diff[partition] = {
+            'removed': ranges.difference(other_ranges),
+            'added': other_ranges.difference(ranges),
+            'shared': ranges.intersection(other_ranges)
+        }
+
+    return diff
@@ -0,0 +1,579 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import operator
+import re
+from functools import reduce
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+# Libs
+import pandas as pd
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+# Size (in bytes) of every parameter & activation value (i.e. float32)
+BYTES_PER_VALUE = 4
+
+# No. of gates (i.e. stacked weight matrices) of every recurrent layer type
+RECURRENT_GATES = {'RNN': 1, 'GRU': 3, 'LSTM': 4}
+
+# Layers that neither hold parameters nor change the shape of their inputs
+PASSTHROUGH_LAYERS = [
+    'Dropout', 'Dropout2d', 'Dropout3d', 'AlphaDropout', 'Identity',
+    'ReLU', 'ReLU6', 'LeakyReLU', 'ELU', 'SELU', 'GELU', 'Sigmoid',
+    'Tanh', 'Softmax', 'LogSoftmax', 'Softplus', 'Hardtanh'
+]
+
+ANALYSIS_COLUMNS = [
+    'layer', 'l_type', 'input_shape', 'output_shape', 'parameters', 'flops',
+    'activations'
+]
+
+###########
+# Helpers #
+###########
+
+def as_tuple(value: Any, n_dims: int) -> Tuple[int, ...]:
+    """ Expands a scalar layer argument (eg. kernel_size=3) across all spatial
+        dimensions of a layer
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return (value,) * n_dims
+
+
+def count_values(shape: Optional[Tuple[Optional[int], ...]]) -> Optional[int]:
+    """ Counts the values within a tensor of a shape (excluding the batch
+        dimension), or None if any dimension is unknown
+    """
+    if shape is None or any(dim is None for dim in shape):
+        return None
+    return reduce(operator.mul, shape, 1)
+
+
+def infer_input_shape(model: List[Dict[str, Any]]) -> Optional[Tuple[Optional[int], ...]]:
+    """ Infers the shape of a single sample from the input layer of a model.
+        Spatial dimensions cannot be inferred, and are left unknown.
+
+    Args:
+        model (list(dict)): Layer specifications of a model
+    Returns:
+        Input shape (tuple), or None if it cannot be inferred
+    """
+    if not model:
+        return None
+
+    input_layer = next(
+        (layer for layer in model if layer.get('is_input')),
+        model[0]
+    )
+    l_type = input_layer.get('l_type', "")
+    structure = input_layer.get('structure', {}) or {}
+
+    if l_type == "Linear":
+        return (structure.get('in_features'),)
+
+    conv_match = re.match(r"^Conv(?:Transpose)?([123])d$", l_type)
+    if conv_match:
+        return (structure.get('in_channels'),) + (None,) * int(conv_match.group(1))
+
+    if l_type in RECURRENT_GATES:
+        return (None, structure.get('input_size'))
+
+    if l_type == "Embedding":
+        return (None,)
+
+    return None
+
+
+def parse_shape(shape_string: str) -> Optional[Tuple[Optional[int], ...]]:
+    """ Parses a comma-separated shape (eg. "3, 32, 32"). Unknown dimensions
+        may be declared as "?".
+
+    Args:
+        shape_string (str): Shape declared by the user
+    Returns:
+        Shape (tuple), or None if the string is blank
+    """
+    dims = [dim.strip() for dim in shape_string.strip("()[] ").split(",")]
+    dims = [dim for dim in dims if dim]
+    if not dims:
+        return None
+    return tuple([None if dim in ["?", "None"] else int(dim) for dim in dims])
+
+
+def format_shape(shape: Optional[Tuple[Optional[int], ...]]) -> str:
+    if shape is None:
+        return "?"
+    return "(" + ", ".join(["?" if dim is None else str(dim) for dim in shape]) + ")"
+
+
+def format_bytes(size: float) -> str:
+    """ Formats a no. of bytes in the largest unit it spans """
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+###################
+# Layer Analyzers #
+###################
+
+def analyze_linear(structure: Dict[str, Any], shape: tuple) -> dict:
+    in_features = structure.get('in_features')
+    out_features = structure.get('out_features')
+    has_bias = structure.get('bias', True)
+
+    issues = []
+    if shape is not None and shape[-1] is not None and shape[-1] != in_features:
+        if len(shape) > 1 and count_values(shape) == in_features:
+            issues.append(
+                f"expects {in_features} features, but receives {format_shape(shape)}; a Flatten layer is required"
+            )
+        else:
+            issues.append(
+                f"expects {in_features} input features, but receives {shape[-1]}"
+            )
+
+    leading_shape = (shape or (None,))[:-1]
+    out_shape = leading_shape + (out_features,)
+    positions = count_values(leading_shape) if leading_shape else 1
+    return {
+        'parameters': in_features * out_features + (out_features if has_bias else 0),
+        'flops': (
+            positions * (2 * in_features * out_features + (out_features if has_bias else 0))
+            if positions is not None
+            else None
+        ),
+        'output_shape': out_shape,
+        'issues': issues
+    }
+
+
+def analyze_convolution(
+    structure: Dict[str, Any],
+    shape: tuple,
+    n_dims: int,
+    is_transposed: bool = False
+) -> dict:
+    in_channels = structure.get('in_channels')
+    out_channels = structure.get('out_channels')
+    kernel_size = as_tuple(structure.get('kernel_size', 1), n_dims)
+    stride = as_tuple(structure.get('stride', 1), n_dims)
+    padding = structure.get('padding', 0)
+    dilation = as_tuple(structure.get('dilation', 1), n_dims)
+    output_padding = as_tuple(structure.get('output_padding', 0), n_dims)
+    groups = structure.get('groups', 1)
+    has_bias = structure.get('bias', True)
+
+    issues = []
+    if shape is None or len(shape) != n_dims + 1:
+        issues.append(
+            f"expects inputs of shape (channels, {n_dims} spatial dims), but receives {format_shape(shape)}"
+        )
+        spatial_shape = (None,) * n_dims
+    else:
+        if shape[0] is not None and shape[0] != in_channels:
+            issues.append(f"expects {in_channels} input channels, but receives {shape[0]}")
+        spatial_shape = shape[1:]
+
+    if in_channels % groups or out_channels % groups:
+        issues.append(f"channels are not divisible into {groups} groups")
+
+    if padding == "same":
+        out_spatial = spatial_shape
+    else:
+        padding = (0,) * n_dims if padding == "valid" else as_tuple(padding, n_dims)
+        out_spatial = []
+        for length, k, s, p, d, o in zip(
+            spatial_shape, kernel_size, stride, padding, dilation, output_padding
+        ):
+            if length is None:
+                out_spatial.append(None)
+            elif is_transposed:
+                out_spatial.append((length - 1) * s - 2 * p + d * (k - 1) + o + 1)
+            else:
+                out_spatial.append((length + 2 * p - d * (k - 1) - 1) // s + 1)
+        out_spatial = tuple(out_spatial)
+
+    if any(length is not None and length < 1 for length in out_spatial):
+        issues.append(f"kernel is larger than its padded input {format_shape(shape)}")
+
+    kernel_volume = count_values(kernel_size)
+    weights = in_channels * out_channels // groups * kernel_volume
+    parameters = weights + (out_channels if has_bias else 0)
+
+    # Every weight is applied once per input (transposed) or output position
+    positions = count_values(spatial_shape if is_transposed else out_spatial)
+    return {
+        'parameters': parameters,
+        'flops': (
+            positions * (2 * weights + (out_channels if has_bias else 0))
+            if positions is not None
+            else None
+        ),
+        'output_shape': (out_channels,) + out_spatial,
+        'issues': issues
+    }
+
+
+def analyze_pooling(
+    structure: Dict[str, Any],
+    shape: tuple,
+    n_dims: int,
+    is_adaptive: bool = False
+) -> dict:
+    if shape is None or len(shape) != n_dims + 1:
+        return {
+            'parameters': 0,
+            'flops': None,
+            'output_shape': None,
+            'issues': [
+                f"expects inputs of shape (channels, {n_dims} spatial dims), but receives {format_shape(shape)}"
+            ]
+        }
+
+    if is_adaptive:
+        out_spatial = as_tuple(structure.get('output_size'), n_dims)
+        out_shape = (shape[0],) + tuple(out_spatial)
+        return {
+            'parameters': 0,
+            'flops': count_values(shape),
+            'output_shape': out_shape,
+            'issues': []
+        }
+
+    kernel_size = as_tuple(structure.get('kernel_size', 1), n_dims)
+    stride = as_tuple(structure.get('stride') or kernel_size, n_dims)
+    padding = as_tuple(structure.get('padding', 0), n_dims)
+    dilation = as_tuple(structure.get('dilation', 1), n_dims)
+    out_spatial = tuple([
+        None if length is None else (length + 2 * p - d * (k - 1) - 1) // s + 1
+        for length, k, s, p, d in zip(shape[1:], kernel_size, stride, padding, dilation)
+    ])
+    out_shape = (shape[0],) + out_spatial
+    out_count = count_values(out_shape)
+    kernel_volume = count_values(kernel_size)
+    return {
+        'parameters': 0,
+        'flops': out_count * kernel_volume if out_count is not None else None,
+        'output_shape': out_shape,
+        'issues': []
+    }
+
+
+def analyze_normalization(
+    structure: Dict[str, Any],
+    shape: tuple,
+    is_layer_norm: bool = False
+) -> dict:
+    issues = []
+    if is_layer_norm:
+        normalized_shape = as_tuple(structure.get('normalized_shape'), 1)
+        features = count_values(normalized_shape)
+        if shape is not None and tuple(shape[-len(normalized_shape):]) != normalized_shape:
+            issues.append(
+                f"normalizes over {format_shape(normalized_shape)}, but receives {format_shape(shape)}"
+            )
+        is_affine = structure.get('elementwise_affine', True)
+    else:
+        features = structure.get('num_features')
+        if shape is not None and shape[0] is not None and shape[0] != features:
+            issues.append(f"expects {features} channels, but receives {shape[0]}")
+        is_affine = structure.get('affine', True)
+
+    value_count = count_values(shape)
+    return {
+        'parameters': 2 * features if is_affine else 0,
+        'flops': 4 * value_count if value_count is not None else None,
+        'output_shape': shape,
+        'issues': issues
+    }
+
+
+def analyze_recurrent(structure: Dict[str, Any], shape: tuple, gates: int) -> dict:
+    input_size = structure.get('input_size')
+    hidden_size = structure.get('hidden_size')
+    num_layers = structure.get('num_layers', 1)
+    has_bias = structure.get('bias', True)
+    directions = 2 if structure.get('bidirectional', False) else 1
+
+    issues = []
+    if shape is None or len(shape) != 2:
+        issues.append(
+            f"expects inputs of shape (sequence, features), but receives {format_shape(shape)}"
+        )
+        seq_length = None
+    else:
+        seq_length = shape[0]
+        if shape[1] is not None and shape[1] != input_size:
+            issues.append(f"expects {input_size} input features, but receives {shape[1]}")
+
+    parameters = 0
+    step_flops = 0
+    for layer_idx in range(num_layers):
+        layer_input_size = input_size if layer_idx == 0 else hidden_size * directions
+        layer_weights = gates * hidden_size * (layer_input_size + hidden_size)
+        parameters += directions * (
+            layer_weights + (2 * gates * hidden_size if has_bias else 0)
+        )
+        step_flops += directions * 2 * layer_weights
+
+    return {
+        'parameters': parameters,
+        'flops': seq_length * step_flops if seq_length is not None else None,
+        'output_shape': (seq_length, hidden_size * directions),
+        'issues': issues
+    }
+
+
+def analyze_embedding(structure: Dict[str, Any], shape: tuple) -> dict:
+    num_embeddings = structure.get('num_embeddings')
+    embedding_dim = structure.get('embedding_dim')
+    return {
+        'parameters': num_embeddings * embedding_dim,
+        'flops': 0,
+        'output_shape': (shape or (None,)) + (embedding_dim,),
+        'issues': []
+    }
+
+
+def analyze_flatten(structure: Dict[str, Any], shape: tuple) -> dict:
+    return {
+        'parameters': 0,
+        'flops': 0,
+        'output_shape': (count_values(shape),) if shape is not None else None,
+        'issues': []
+    }
+
+
+def analyze_passthrough(structure: Dict[str, Any], shape: tuple) -> dict:
+    value_count = count_values(shape)
+    return {
+        'parameters': 0,
+        'flops': value_count,
+        'output_shape': shape,
+        'issues': []
+    }
+
+
+def resolve_analyzer(l_type: str) -> Optional[Callable]:
+    """ Maps a layer type (i.e. the name of a PyTorch module) to its analyzer
+
+    Args:
+        l_type (str): Layer type (eg. 'Conv2d')
+    Returns:
+        Analyzer (callable), or None if the layer type is unsupported
+    """
+    if l_type == "Linear":
+        return analyze_linear
+
+    conv_match = re.match(r"^Conv(Transpose)?([123])d$", l_type)
+    if conv_match:
+        return lambda structure, shape: analyze_convolution(
+            structure, shape,
+            n_dims=int(conv_match.group(2)),
+            is_transposed=bool(conv_match.group(1))
+        )
+
+    pool_match = re.match(r"^(Adaptive)?(?:Max|Avg)Pool([123])d$", l_type)
+    if pool_match:
+        return lambda structure, shape: analyze_pooling(
+            structure, shape,
+            n_dims=int(pool_match.group(2)),
+            is_adaptive=bool(pool_match.group(1))
+        )
+
+    if re.match(r"^(BatchNorm|InstanceNorm)[123]d$", l_type):
+        return analyze_normalization
+
+    if l_type == "LayerNorm":
+        return lambda structure, shape: analyze_normalization(
+            structure, shape, is_layer_norm=True
+        )
+
+    if l_type in RECURRENT_GATES:
+        return lambda structure, shape: analyze_recurrent(
+            structure, shape, gates=RECURRENT_GATES[l_type]
+        )
+
+    if l_type == "Embedding":
+        return analyze_embedding
+
+    if l_type == "Flatten":
+        return analyze_flatten
+
+    if l_type in PASSTHROUGH_LAYERS:
+        return analyze_passthrough
+
+    return None
+
+#############################################
+# Architecture class - ArchitectureAnalysis #
+#############################################
+
+class ArchitectureAnalysis:
+    """
+    Offline analysis of a model declared as a list of layer specifications
+    (i.e. `l_type`, `structure` & `activation`). Layers are walked in order,
+    propagating the shape of a single sample, so as to validate that
+    consecutive layers are compatible, and to estimate the parameters, FLOPs
+    (per sample, forward pass) & activations (per sample) of every layer.
+    Dimensions that cannot be inferred are propagated as unknown, in which
+    case dependent estimates are left blank rather than guessed.
+
+    Attributes:
+        layers (pd.DataFrame): Per-layer analysis
+        issues (list(str)): Incompatibilities detected between layers
+        input_shape (tuple): Shape of a single input sample
+    """
+    def __init__(
+        self,
+        model: List[Dict[str, Any]],
+        input_shape: Tuple[Optional[int], ...] = None
+    ):
+        self.input_shape = input_shape or infer_input_shape(model)
+        self.issues = []
+
+        rows = []
+        shape = self.input_shape
+        for layer_idx, layer in enumerate(model):
+            l_type = layer.get('l_type', "")
+            structure = layer.get('structure', {}) or {}
+            analyzer = resolve_analyzer(l_type)
+
+            if analyzer is None:
+                self.issues.append(
+                    f"Layer {layer_idx} ({l_type}): unsupported layer type, shapes past this layer are unknown"
+                )
+                result = {
+                    'parameters': None,
+                    'flops': None,
+                    'output_shape': None,
+                    'issues': []
+                }
+            else:
+                try:
+                    result = analyzer(structure, shape)
+                except (TypeError, ZeroDivisionError) as e:
+                    self.issues.append(
+                        f"Layer {layer_idx} ({l_type}): invalid structure ({e})"
+                    )
+                    result = {
+                        'parameters': None,
+                        'flops': None,
+                        'output_shape': None,
+                        'issues': []
+                    }
+
+            self.issues += [
+                f"Layer {layer_idx} ({l_type}): {issue}"
+                for issue in result['issues']
+            ]
+
+            out_count = count_values(result['output_shape'])
+            flops = result['flops']
+            activations = out_count
+            if layer.get('activation') and out_count is not None:
+                # Activation functions are applied (& stored) elementwise
+                flops = flops + out_count if flops is not None else None
+                activations = 2 * out_count
+
+            rows.append({
+                'layer': layer_idx,
+                'l_type': l_type,
+                'input_shape': format_shape(shape),
+                'output_shape': format_shape(result['output_shape']),
+                'parameters': result['parameters'],
+                'flops': flops,
+                'activations': activations
+            })
+            shape = result['output_shape']
+
+        self.layers = pd.DataFrame(rows, columns=ANALYSIS_COLUMNS)
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+
+
+    @property
+    def parameter_count(self) -> Optional[int]:
+        return self._total('parameters')
+
+
+    @property
+    def flop_count(self) -> Optional[int]:
+        return self._total('flops')
+
+
+    @property
+    def activation_count(self) -> Optional[int]:
+        return self._total('activations')
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _total(self, column: str) -> Optional[int]:
+        """ Sums a per-layer estimate, or None if any layer is unknown """
+        if self.layers.empty or self.layers[column].isnull().any():
+            return None
+        return int(self.layers[column].sum())
+
+    ##################
+    # Core functions #
+    ##################
+
+    def estimate_memory(
+        self,
+        batch_size: int,
+        bytes_per_value: int = BYTES_PER_VALUE
+    ) -> Dict[str, Optional[int]]:
+        """ Estimates the memory (in bytes) required to train the model on a
+            worker with a given batch size, i.e. parameters & their gradients,
+            and activations retained for backpropagation
+
+        Args:
+            batch_size (int): No. of samples per batch
+            bytes_per_value (int): Size of every value
+        Returns:
+            Memory estimates (dict)
+        """
+        parameter_count = self.parameter_count
+        activation_count = self.activation_count
+
+        parameter_memory = (
+            2 * parameter_count * bytes_per_value
+            if parameter_count is not None
+            else None
+        )
+        activation_memory = (
+            batch_size * activation_count * bytes_per_value
+            if activation_count is not None
+            else None
+        )
+        total_memory = (
+            parameter_memory + activation_memory
+            if parameter_memory is not None and activation_memory is not None
+            else None
+        )
+        return {
+            'parameters': parameter_memory,
+            'activations': activation_memory,
+            'total': total_memory
+        }
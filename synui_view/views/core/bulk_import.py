@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import io
+import json
+import os
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Any, Iterator, Optional, Tuple
+
+# Libs
+import pandas as pd
+
+# Custom
+from config import BULK_IMPORT_MAX_BYTES, BULK_IMPORT_MAX_ITEMS, BULK_IMPORT_WORKERS
+from views.core.architecture import ArchitectureAnalysis
+from views.core.comparison import EXCLUDED_FIELDS
+
+##################
+# Configurations #
+##################
+
+SUPPORTED_UPLOADS = ["json", "jsonl", "zip", "tar", "gz", "tgz"]
+
+# Field declaring the ID of every importable record type
+ID_FIELDS = {'experiment': 'expt_id', 'run': 'run_id'}
+
+# Hierarchy keys of a run, which are assigned on import & cannot be declared
+KEY_FIELDS = ['collab_id', 'project_id', 'expt_id', 'run_id']
+
+# Hyperparameters that must be positive integers, if declared
+POSITIVE_INTEGER_HYPERPARAMETERS = ['rounds', 'epochs', 'batch_size']
+
+IMPORT_STATUSES = ["invalid", "valid", "created", "failed"]
+
+IMPORT_COLUMNS = ['source', 'record_id', 'status', 'errors', 'warnings']
+
+###########
+# Helpers #
+###########
+
+def iterate_documents(
+    filename: str, 
+    content: bytes
+) -> Iterator[Tuple[str, str, Optional[bytes]]]:
+    """ Lazily unpacks an upload into its JSON/JSONL documents. Archives (i.e.
+        zip, tar, tar.gz) are unpacked member by member, only as documents are
+        consumed; hidden members & directories are skipped. Documents whose
+        declared (uncompressed) size exceeds `BULK_IMPORT_MAX_BYTES` are never
+        read, & are yielded without content.
+
+    Args:
+        filename (str): Name of uploaded file
+        content (bytes): Raw content of uploaded file
+    Returns:
+        Source, file extension & content (or None if oversized) of every 
+        document (iterator)
+    """
+    def split_extension(name: str) -> str:
+        return os.path.splitext(name)[-1].lower().lstrip(".")
+
+    def is_document(name: str) -> bool:
+        basename = os.path.basename(name)
+        return (
+            not basename.startswith(".") and
+            not name.startswith("__MACOSX") and
+            split_extension(name) in ["json", "jsonl"]
+        )
+
+    if zipfile.is_zipfile(io.BytesIO(content)):
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            for member in sorted(archive.namelist()):
+                if not member.endswith("/") and is_document(member):
+                    is_oversized = archive.getinfo(member).file_size > BULK_IMPORT_MAX_BYTES
+                    yield (
+                        f"{filename}/{member}", 
+                        split_extension(member), 
+                        None if is_oversized else archive.read(member)
+                    )
+
+    elif split_extension(filename) in ["tar", "gz", "tgz"]:
+        with tarfile.open(fileobj=io.BytesIO(content), mode="r:*") as archive:
+            for member in sorted(archive.getmembers(), key=lambda member: member.name):
+                if member.isfile() and is_document(member.name):
+                    is_oversized = member.size > BULK_IMPORT_MAX_BYTES
+                    yield (
+                        f"{filename}/{member.name}",
+                        split_extension(member.name),
+                        None if is_oversized else archive.extractfile(member).read()
+                    )
+
+    else:
+        is_oversized = len(content) > BULK_IMPORT_MAX_BYTES
+        yield filename, split_extension(filename), None if is_oversized else content
+
+##################################
+# Import Item class - ImportItem #
+##################################
+
+class ImportItem:
+    """
+    A single record declared in a bulk upload
+
+    Attributes:
+        source (str): Document (& line) the record was declared in
+        record_id (str): ID of record to be created
+        payload (Any): Model architecture (experiments) or hyperparameters
+            (runs) of the record
+        status (str): One of IMPORT_STATUSES
+        errors (list(str)): Problems preventing the record's creation
+        warnings (list(str)): Problems that do not prevent its creation
+    """
+    def __init__(self, source: str, record_id: str = None, payload: Any = None):
+        self.source = source
+        self.record_id = record_id
+        self.payload = payload
+        self.status = IMPORT_STATUSES[1]
+        self.errors = []
+        self.warnings = []
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    ###########
+    # Helpers #
+    ###########
+
+    def invalidate(self, error: str):
+        self.errors.append(error)
+        self.status = IMPORT_STATUSES[0]
+
+##################
+# Core functions #
+##################
+
+def parse_upload(filename: str, content: bytes, r_type: str) -> List[ImportItem]:
+    """ Parses a bulk upload into importable items. Every JSON document
+        declares a single record, while every line of a JSONL document
+        declares one record. Records without an explicit ID are named after
+        their document (& line). Parsing failures are captured as invalid
+        items rather than raised, so that they can be reported alongside all
+        other items. Parsing stops once `BULK_IMPORT_MAX_ITEMS` records have
+        been declared, so that the remainder of the upload is never read.
+
+        Experiments may be declared as a list of layers, or as an object with
+        `expt_id` & `model` fields. Runs are declared as an object of
+        hyperparameters, optionally with a `run_id` field.
+
+    Args:
+        filename (str): Name of uploaded file
+        content (bytes): Raw content of uploaded file
+        r_type (str): Type of record imported (i.e. 'experiment' or 'run')
+    Returns:
+        Items (list(ImportItem))
+    """
+    id_field = ID_FIELDS[r_type]
+
+    def declare_item(source: str, default_id: str, record: Any) -> ImportItem:
+        if r_type == "experiment" and isinstance(record, list):
+            return ImportItem(source, default_id, record)
+
+        if not isinstance(record, dict):
+            item = ImportItem(source, default_id)
+            item.invalidate(f"Expected a JSON object, but found {type(record).__name__}")
+            return item
+
+        record = dict(record)
+        record_id = record.pop(id_field, default_id)
+        payload = record.get('model') if r_type == "experiment" else record
+        return ImportItem(source, record_id, payload)
+
+    def parse_document(
+        source: str, 
+        extension: str, 
+        document: Optional[bytes]
+    ) -> Iterator[ImportItem]:
+        stem = os.path.splitext(os.path.basename(source))[0]
+        if document is None:
+            item = ImportItem(source, stem)
+            item.invalidate(
+                f"Document exceeds the limit of {BULK_IMPORT_MAX_BYTES:,} bytes"
+            )
+            yield item
+            return
+
+        try:
+            text = document.decode("utf-8")
+        except UnicodeDecodeError:
+            item = ImportItem(source, stem)
+            item.invalidate("Document is not UTF-8 encoded")
+            yield item
+            return
+
+        if extension == "jsonl":
+            for line_idx, line in enumerate(text.splitlines(), start=1):
+                if not line.strip():
+                    continue
+                line_source = f"{source}:{line_idx}"
+                try:
+                    yield declare_item(line_source, f"{stem}-{line_idx}", json.loads(line))
+                except json.JSONDecodeError as e:
+                    item = ImportItem(line_source, f"{stem}-{line_idx}")
+                    item.invalidate(f"Invalid JSON ({e.msg})")
+                    yield item
+        else:
+            try:
+                yield declare_item(source, stem, json.loads(text))
+            except json.JSONDecodeError as e:
+                item = ImportItem(source, stem)
+                item.invalidate(f"Invalid JSON ({e.msg})")
+                yield item
+
+    items = []
+    try:
+        for source, extension, document in iterate_documents(filename, content):
+            for item in parse_document(source, extension, document):
+                if len(items) == BULK_IMPORT_MAX_ITEMS:
+                    item = ImportItem(filename)
+                    item.invalidate(
+                        f"Upload exceeds the limit of {BULK_IMPORT_MAX_ITEMS} records; the remaining records were not read"
+                    )
+                    items.append(item)
+                    return items
+                items.append(item)
+
+    except (tarfile.TarError, zipfile.BadZipFile, EOFError) as e:
+        item = ImportItem(filename)
+        item.invalidate(f"Corrupted archive ({e})")
+        return [item]
+
+    return items
+
+
+def validate_items(
+    items: List[ImportItem],
+    r_type: str,
+    existing_ids: List[str] = []
+) -> List[ImportItem]:
+    """ Validates all items of a bulk upload up front, so that no record is
+        created unless the whole upload has been checked
+
+    Args:
+        items (list(ImportItem)): Items parsed from a bulk upload
+        r_type (str): Type of record imported (i.e. 'experiment' or 'run')
+        existing_ids (list(str)): IDs of records that already exist
+    Returns:
+        Validated items (list(ImportItem))
+    """
+    if len(items) > BULK_IMPORT_MAX_ITEMS:
+        for item in items[BULK_IMPORT_MAX_ITEMS:]:
+            if item.is_valid:
+                item.invalidate(
+                    f"Upload exceeds the limit of {BULK_IMPORT_MAX_ITEMS} records"
+                )
+
+    existing_ids = set(existing_ids)
+    declared_ids = {}
+    for item in items:
+        if not item.is_valid:
+            continue
+
+        if not isinstance(item.record_id, str) or not item.record_id.strip():
+            item.invalidate(f"Missing or invalid {ID_FIELDS[r_type]}")
+        elif item.record_id in existing_ids:
+            item.invalidate(f"{r_type.capitalize()} '{item.record_id}' already exists")
+        elif item.record_id in declared_ids:
+            item.invalidate(
+                f"{r_type.capitalize()} '{item.record_id}' is already declared in {declared_ids[item.record_id]}"
+            )
+        else:
+            declared_ids[item.record_id] = item.source
+
+        if r_type == "experiment":
+            model = item.payload
+            if not isinstance(model, list) or not model:
+                item.invalidate("Model architecture must be a non-empty list of layers")
+                continue
+
+            for layer_idx, layer in enumerate(model):
+                if not isinstance(layer, dict):
+                    item.invalidate(f"Layer {layer_idx} is not a JSON object")
+                elif not isinstance(layer.get('l_type'), str):
+                    item.invalidate(f"Layer {layer_idx} is missing its 'l_type'")
+                elif not isinstance(layer.get('structure', {}), dict):
+                    item.invalidate(f"Layer {layer_idx} has an invalid 'structure'")
+
+            if item.is_valid:
+                item.warnings += ArchitectureAnalysis(model).issues
+
+        else:
+            hyperparameters = item.payload
+            if not hyperparameters:
+                item.invalidate("No hyperparameters declared")
+                continue
+
+            reserved_fields = sorted(
+                set(hyperparameters) & set(EXCLUDED_FIELDS + KEY_FIELDS)
+            )
+            if reserved_fields:
+                item.invalidate(f"Reserved fields declared: {reserved_fields}")
+
+            for name in POSITIVE_INTEGER_HYPERPARAMETERS:
+                value = hyperparameters.get(name, 1)
+                if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                    item.invalidate(f"'{name}' must be a positive integer, but is {value}")
+
+    return items
+
+
+def import_items(
+    items: List[ImportItem],
+    create: Callable,
+    max_workers: int = BULK_IMPORT_WORKERS,
+    on_update: Callable = None
+) -> List[ImportItem]:
+    """ Creates the records of all valid items, with at most `max_workers`
+        requests in flight. Failures are recorded per item, and do not
+        interrupt the creation of other items.
+
+    Args:
+        items (list(ImportItem)): Validated items
+        create (callable): Function creating the record of an item, returning
+            the orchestrator's response
+        max_workers (int): Max no. of concurrent requests
+        on_update (callable): Function invoked with every item that has been
+            created (or has failed)
+    Returns:
+        Imported items (list(ImportItem))
+    """
+    valid_items = [item for item in items if item.is_valid]
+    with ThreadPoolExecutor(max_workers=max(int(max_workers), 1)) as pool:
+        futures = {pool.submit(create, item): item for item in valid_items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                resp = future.result() or {}
+                status_code = resp.get('status') or 0
+                if 200 <= status_code < 300:
+                    item.status = IMPORT_STATUSES[2]
+                else:
+                    item.status = IMPORT_STATUSES[3]
+                    item.errors.append(
+                        f"Orchestrator responded with {status_code}: {resp.get('message', '')}".strip()
+                    )
+            except Exception as e:
+                item.status = IMPORT_STATUSES[3]
+                item.errors.append(str(e))
+
+            if on_update:
+                on_update(item)
+
+    return items
+
+
+def summarize_items(items: List[ImportItem]) -> pd.DataFrame:
+    """ Tabulates the outcome of every item in a bulk upload
+
+    Args:
+        items (list(ImportItem)): Parsed, validated or imported items
+    Returns:
+        Item report (pd.DataFrame)
+    """
+    return pd.DataFrame(
+        [
+            {
+                'source': item.source,
+                'record_id': item.record_id,
+                'status': item.status,
+                'errors': "; ".join(item.errors),
+                'warnings': "; ".join(item.warnings)
+            }
+            for item in items
+        ],
+        columns=IMPORT_COLUMNS
+    )
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import math
+from typing import Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+# Node states within the participant x node matrix
+UNREGISTERED = 0
+UNAVAILABLE = 1
+AVAILABLE = 2
+
+########################################
+# Capacity class - GridCapacityPlanner #
+########################################
+
+class GridCapacityPlanner:
+    """
+    Capacity model of the grids available to a project. In Synergos, grid `i`
+    is formed by the `node_i` of every registered participant, so a grid is
+    only usable when every participant has registered, and can reach, its
+    i-th node. Registrations are materialized into a participant x node
+    matrix of node states, from which usable grids, parallel training slots
+    & bottlenecks are derived.
+
+    Attributes:
+        participants (list(str)): IDs of registered participants (matrix rows)
+        matrix (np.ndarray): Node states (i.e. UNREGISTERED, UNAVAILABLE or
+            AVAILABLE), with one row per participant & one column per node
+    """
+    def __init__(
+        self,
+        registry_data: List[Dict[str, Any]],
+        node_states: Dict[Tuple[str, int], bool] = None
+    ):
+        self.participants = [
+            reg_record.get('key', {}).get('participant_id')
+            for reg_record in registry_data
+        ]
+        node_counts = [
+            reg_record.get('n_count', 0) or 0
+            for reg_record in registry_data
+        ]
+
+        self.matrix = np.full(
+            (len(self.participants), max(node_counts, default=0)),
+            UNREGISTERED,
+            dtype=np.int8
+        )
+        for p_idx, (participant_id, node_count) in enumerate(
+            zip(self.participants, node_counts)
+        ):
+            for node_idx in range(node_count):
+                # Without health data, every registered node is assumed usable
+                is_available = (
+                    node_states.get((participant_id, node_idx), False)
+                    if node_states is not None
+                    else True
+                )
+                self.matrix[p_idx, node_idx] = (
+                    AVAILABLE if is_available else UNAVAILABLE
+                )
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def registered_grids(self) -> List[int]:
+        """ Indexes of grids that every participant has registered a node for """
+        if not self.participants:
+            return []
+        is_registered = (self.matrix != UNREGISTERED).all(axis=0)
+        return np.flatnonzero(is_registered).tolist()
+
+
+    @property
+    def usable_grids(self) -> List[int]:
+        """ Indexes of grids whose nodes are all available """
+        if not self.participants:
+            return []
+        is_usable = (self.matrix == AVAILABLE).all(axis=0)
+        return np.flatnonzero(is_usable).tolist()
+
+
+    @property
+    def parallel_slots(self) -> int:
+        """ No. of federated jobs that can be trained concurrently, given that
+            each usable grid trains a single job at a time
+        """
+        return len(self.usable_grids)
+
+
+    @property
+    def bottlenecks(self) -> Dict[str, Dict[str, Any]]:
+        """ Participants limiting the no. of usable grids, alongside their no.
+            of available nodes, their unavailable node indexes, and the no.
+            of additional nodes they need to match the best-provisioned
+            participant
+        """
+        if not self.participants:
+            return {}
+
+        available_counts = (self.matrix == AVAILABLE).sum(axis=1)
+        target_count = available_counts.max()
+
+        bottlenecks = {}
+        for p_idx, participant_id in enumerate(self.participants):
+            unavailable_idxs = np.flatnonzero(
+                self.matrix[p_idx] == UNAVAILABLE
+            ).tolist()
+            shortfall = int(target_count - available_counts[p_idx])
+            if shortfall or unavailable_idxs:
+                bottlenecks[participant_id] = {
+                    'available': int(available_counts[p_idx]),
+                    'unavailable_nodes': unavailable_idxs,
+                    'shortfall': shortfall
+                }
+
+        return bottlenecks
+
+    ##################
+    # Core functions #
+    ##################
+
+    def estimate_wall_clock(
+        self,
+        queue_size: int,
+        durations: List[float]
+    ) -> Dict[str, float]:
+        """ Estimates the time taken to clear a queue of federated jobs, given
+            the durations of previously completed jobs. Jobs are assumed to be
+            dispatched in waves of `parallel_slots` jobs.
+
+        Args:
+            queue_size (int): No. of jobs to be submitted
+            durations (list(float)): Historical job durations (in seconds)
+        Returns:
+            Estimates (dict) - no. of waves, as well as the expected (median)
+            & pessimistic (90th percentile) total durations in seconds.
+            Durations are NaN if they cannot be estimated.
+        """
+        slots = self.parallel_slots
+        if not slots or queue_size <= 0:
+            waves = 0 if queue_size <= 0 else math.inf
+        else:
+            waves = math.ceil(queue_size / slots)
+
+        durations = np.asarray([
+            duration for duration in durations if duration and duration > 0
+        ], dtype=float)
+        if not durations.size or math.isinf(waves):
+            return {'waves': waves, 'expected': math.nan, 'pessimistic': math.nan}
+
+        return {
+            'waves': waves,
+            'expected': float(waves * np.median(durations)),
+            'pessimistic': float(waves * np.percentile(durations, 90))
+        }
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from synergos import Driver
+from views.core.leaderboard import Leaderboard
+
+##################
+# Configurations #
+##################
+
+# Max no. of concurrent requests made to the orchestrator when fetching runs
+COMPARISON_WORKERS = 8
+
+# Fields that are not hyperparameters (i.e. catalogue metadata & relations)
+EXCLUDED_FIELDS = ['key', 'doc_id', 'kind', 'relations', 'created_at']
+
+###########
+# Helpers #
+###########
+
+def flatten_hyperparameters(record: Any, path: str = "") -> Dict[str, Any]:
+    """ Flattens a (nested) run record into a mapping of dotted paths to leaf
+        values. Unlike search flattening, list indexes are retained, so that
+        positional hyperparameters remain comparable.
+
+    Args:
+        record (Any): Run record, or any nested value within it
+        path (str): Path that `record` was found under
+    Returns:
+        Leaf paths & values (dict)
+    """
+    if isinstance(record, dict):
+        flattened = {}
+        for name, value in record.items():
+            if not path and name in EXCLUDED_FIELDS:
+                continue
+            child_path = f"{path}.{name}" if path else str(name)
+            flattened.update(flatten_hyperparameters(value, child_path))
+        return flattened
+
+    elif isinstance(record, (list, tuple)):
+        flattened = {}
+        for idx, value in enumerate(record):
+            flattened.update(flatten_hyperparameters(value, f"{path}[{idx}]"))
+        return flattened
+
+    return {path: record}
+
+
+def label_run(run_key: Dict[str, str]) -> str:
+    """ Generates a display label for a run (i.e. "<expt_id> > <run_id>")
+
+    Args:
+        run_key (dict): Composite key of run
+    Returns:
+        Label (str)
+    """
+    return f"{run_key.get('expt_id')} > {run_key.get('run_id')}"
+
+##################
+# Core functions #
+##################
+
+def fetch_runs(
+    driver: Driver,
+    run_keys: List[Dict[str, str]],
+    max_workers: int = COMPARISON_WORKERS
+) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """ Retrieves the run records & validation records of multiple runs in
+        parallel
+
+    Args:
+        driver (Driver): Synergos abstraction object to facilitate REST operations
+        run_keys (list(dict)): Composite keys of runs to fetch
+        max_workers (int): Max no. of concurrent requests
+    Returns:
+        Run record & validation records of every run, in order (list(tuple))
+    """
+    def fetch(run_key: Dict[str, str]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        run_data = driver.runs.read(**run_key).get('data', {}) or {}
+        val_data = driver.validations.read(**run_key).get('data', []) or []
+        if isinstance(val_data, dict):
+            val_data = [val_data]
+        return run_data, val_data
+
+    if not run_keys:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(run_keys))) as pool:
+        return list(pool.map(fetch, run_keys))
+
+
+def diff_hyperparameters(run_records: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """ Tabulates hyperparameters that differ across runs. All runs are
+        flattened & aligned over a single sorted array of paths, after which
+        differing paths are detected column-wise in one pass.
+
+    Args:
+        run_records (dict): Run label -> run record
+    Returns:
+        Differing hyperparameters, one row per path & one column per run
+        (pd.DataFrame)
+    """
+    flattened_runs = {
+        label: flatten_hyperparameters(record)
+        for label, record in run_records.items()
+    }
+    all_paths = np.unique(np.array(
+        [path for flattened in flattened_runs.values() for path in flattened],
+        dtype=object
+    ))
+
+    # Leaves are compared by their representation, so that missing paths,
+    # None & mixed types are handled uniformly
+    values = np.array([
+        [repr(flattened.get(path, "<missing>")) for flattened in flattened_runs.values()]
+        for path in all_paths
+    ], dtype=object).reshape(len(all_paths), len(flattened_runs))
+    is_different = (values != values[:, :1]).any(axis=1)
+
+    differing_paths = all_paths[is_different]
+    return pd.DataFrame(
+        {
+            label: [flattened.get(path) for path in differing_paths]
+            for label, flattened in flattened_runs.items()
+        },
+        index=pd.Index(differing_paths, name="hyperparameter")
+    )
+
+
+def overlay_metrics(
+    validations: Dict[str, List[Dict[str, Any]]],
+    action: str = "classify",
+    how: str = "mean"
+) -> pd.DataFrame:
+    """ Aggregates validation scores of multiple runs for overlaying
+
+    Args:
+        validations (dict): Run label -> validation records of run
+        action (str): ML operation of the project
+        how (str): Aggregation across participants (see `Leaderboard.aggregate`)
+    Returns:
+        Grid-wide scores, one row per run & one column per metric (pd.DataFrame)
+    """
+    leaderboard = Leaderboard(action=action)
+    for val_data in validations.values():
+        leaderboard.extend(val_data)
+
+    aggregated = leaderboard.aggregate(how)
+    aggregated.index = [
+        label_run({'expt_id': expt_id, 'run_id': run_id})
+        for expt_id, run_id in aggregated.index
+    ]
+    return aggregated.reindex([
+        label for label in validations
+        if label in aggregated.index
+    ])
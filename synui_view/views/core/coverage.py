@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from config import COVERAGE_FETCH_WORKERS
+from views.core.alignment_index import ALIGNMENT_PARTITIONS, IndexRanges
+from views.core.replica import generate_fingerprint
+
+##################
+# Configurations #
+##################
+
+FEATURE_COLUMNS = ['feature', 'padded_by', 'coverage', 'participants']
+
+PARTICIPANT_COLUMNS = ['participant_id', 'padded', 'exclusive', 'padded_share']
+
+# Max no. of participants listed against every feature forcing padding
+LISTED_PARTICIPANTS = 10
+
+###########
+# Helpers #
+###########
+
+def fetch_alignments(
+    participant_ids: List[str],
+    read: Callable,
+    max_workers: int = COVERAGE_FETCH_WORKERS
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """ Retrieves the alignment records of many participants, with at most
+        `max_workers` requests in flight. Failures are recorded per
+        participant, and do not interrupt the retrieval of other alignments.
+
+    Args:
+        participant_ids (list(str)): IDs of participants to retrieve for
+        read (callable): Function retrieving the alignment of a participant,
+            returning the orchestrator's response
+        max_workers (int): Max no. of concurrent requests
+    Returns:
+        Alignments (dict(str, dict)) & failures (dict(str, str)), both keyed
+        by participant ID
+    """
+    alignments = {}
+    failures = {}
+    with ThreadPoolExecutor(max_workers=max(int(max_workers), 1)) as pool:
+        futures = {pool.submit(read, p_id): p_id for p_id in participant_ids}
+        for future in as_completed(futures):
+            participant_id = futures[future]
+            try:
+                alignments[participant_id] = (future.result() or {}).get('data') or {}
+            except Exception as e:
+                failures[participant_id] = str(e)
+
+    return alignments, failures
+
+
+def is_aligned(alignment: Dict[str, Any]) -> bool:
+    """ Checks if an alignment record declares any partition at all. Records
+        without partitions belong to participants that are not aligned yet,
+        as opposed to aligned participants that need no padding.
+    """
+    return any(partition in alignment for partition in ALIGNMENT_PARTITIONS)
+
+
+def rasterize_ranges(ranges: IndexRanges, width: int) -> np.ndarray:
+    """ Expands ranges into a boolean mask over `width` positions, without
+        iterating over the positions within every range
+
+    Args:
+        ranges (IndexRanges): Encoded indexes
+        width (int): No. of positions in mask
+    Returns:
+        Membership mask (np.ndarray)
+    """
+    deltas = np.zeros(width + 1, dtype=np.int64)
+    np.add.at(deltas, ranges.starts, 1)
+    np.add.at(deltas, ranges.stops, -1)
+    return np.cumsum(deltas[:-1]) > 0
+
+######################################
+# Coverage class - AlignmentCoverage #
+######################################
+
+class AlignmentCoverage:
+    """
+    Participant x feature padding matrix of a project, for every alignment
+    partition. An alignment declares the positions of the aligned feature
+    space that a participant lacks & hence must pad, so a feature padded by
+    any participant is one that prevents the grid from aligning cleanly.
+
+    Rows are only rewritten for participants whose alignments have changed
+    since the last refresh, and the no. of participants padding every
+    feature is maintained alongside the matrix, instead of being recounted.
+
+    Alignments only declare padded positions, not the size of the aligned
+    feature space. Hence, features are only known up to the last position
+    padded by any participant, and shares of padding are relative to the
+    features padded by any participant.
+
+    Attributes:
+        participant_ids (list(str)): Aligned participant occupying every row
+        unaligned_ids (list(str)): Registered participants not aligned yet,
+            which are excluded from the matrix
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self):
+        self.participant_ids = []
+        self.unaligned_ids = []
+        self._positions = {}
+        self._fingerprints = {}
+        self._padding = {
+            partition: np.zeros((0, 0), dtype=bool)
+            for partition in ALIGNMENT_PARTITIONS
+        }
+        self._counts = {
+            partition: np.zeros(0, dtype=np.int64)
+            for partition in ALIGNMENT_PARTITIONS
+        }
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    def __len__(self) -> int:
+        return len(self.participant_ids)
+
+
+    def width(self, partition: str) -> int:
+        """ Retrieves the no. of positions spanned by the padding of any
+            participant within a partition (i.e. the last padded position + 1).
+            This is a lower bound on, not the count of, aligned features.
+
+        Args:
+            partition (str): One of ALIGNMENT_PARTITIONS
+        Returns:
+            No. of features (int)
+        """
+        padded_features = np.flatnonzero(self._counts[partition])
+        return int(padded_features[-1]) + 1 if len(padded_features) else 0
+
+
+    def padded_feature_count(self, partition: str) -> int:
+        return int(np.count_nonzero(self._counts[partition]))
+
+
+    def matrix(self, partition: str) -> np.ndarray:
+        """ Retrieves the padding matrix of a partition
+
+        Args:
+            partition (str): One of ALIGNMENT_PARTITIONS
+        Returns:
+            Participant x feature padding matrix (np.ndarray)
+        """
+        with self._lock:
+            return self._padding[partition][:len(self), :self.width(partition)].copy()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _reserve(self, partition: str, rows: int, width: int):
+        """ Grows the padding matrix of a partition to accommodate at least
+            `rows` participants & `width` features. Capacity is doubled on
+            growth, so that adding participants one at a time stays cheap.
+        """
+        padding = self._padding[partition]
+        capacity_rows, capacity_width = padding.shape
+        if rows <= capacity_rows and width <= capacity_width:
+            return
+
+        grown_rows = max(rows, 2 * capacity_rows) if rows > capacity_rows else capacity_rows
+        grown_width = max(width, 2 * capacity_width) if width > capacity_width else capacity_width
+        grown_padding = np.zeros((grown_rows, grown_width), dtype=bool)
+        grown_padding[:capacity_rows, :capacity_width] = padding
+        self._padding[partition] = grown_padding
+
+        grown_counts = np.zeros(grown_width, dtype=np.int64)
+        grown_counts[:capacity_width] = self._counts[partition]
+        self._counts[partition] = grown_counts
+
+
+    def _write_row(self, row_idx: int, partition: str, ranges: IndexRanges):
+        """ Replaces a participant's padding within a partition, adjusting
+            the padding counts of affected features
+        """
+        width = 0 if ranges.last is None else ranges.last + 1
+        self._reserve(partition, row_idx + 1, width)
+        padding = self._padding[partition]
+        counts = self._counts[partition]
+
+        counts -= padding[row_idx]
+        padding[row_idx] = rasterize_ranges(ranges, padding.shape[1])
+        counts += padding[row_idx]
+
+
+    def _remove_row(self, participant_id: str):
+        """ Removes a participant by moving the last row into its place """
+        row_idx = self._positions.pop(participant_id)
+        last_idx = len(self.participant_ids) - 1
+
+        for partition in ALIGNMENT_PARTITIONS:
+            padding = self._padding[partition]
+            if row_idx < padding.shape[0]:
+                self._counts[partition] -= padding[row_idx]
+                padding[row_idx] = padding[last_idx]
+                padding[last_idx] = False
+
+        last_participant_id = self.participant_ids.pop()
+        if last_participant_id != participant_id:
+            self.participant_ids[row_idx] = last_participant_id
+            self._positions[last_participant_id] = row_idx
+
+        self._fingerprints.pop(participant_id)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def refresh(
+        self,
+        alignments: Dict[str, Dict[str, Any]],
+        retained_ids: List[str] = []
+    ) -> Dict[str, List[str]]:
+        """ Synchronises the matrix with the latest alignment of every
+            registered participant. Participants whose alignments could not be
+            retrieved are retained as they were, participants that are not 
+            aligned yet are excluded, and all other participants absent from
+            `alignments` are deemed to have deregistered.
+
+        Args:
+            alignments (dict): Participant ID -> alignment record
+            retained_ids (list(str)): IDs of participants whose alignments
+                could not be retrieved
+        Returns:
+            IDs of participants added, updated & removed (dict)
+        """
+        changes = {'added': [], 'updated': [], 'removed': []}
+        with self._lock:
+            retained_ids = set(retained_ids)
+            aligned = {
+                participant_id: alignment
+                for participant_id, alignment in alignments.items()
+                if is_aligned(alignment)
+            }
+            self.unaligned_ids = sorted(set(alignments) - set(aligned))
+
+            for participant_id in list(self.participant_ids):
+                if participant_id not in aligned and participant_id not in retained_ids:
+                    self._remove_row(participant_id)
+                    changes['removed'].append(participant_id)
+
+            for participant_id, alignment in aligned.items():
+                record = {
+                    partition: alignment.get(partition) or []
+                    for partition in ALIGNMENT_PARTITIONS
+                }
+                fingerprint = generate_fingerprint(record)
+                if self._fingerprints.get(participant_id) == fingerprint:
+                    continue
+
+                if participant_id in self._positions:
+                    changes['updated'].append(participant_id)
+                else:
+                    self._positions[participant_id] = len(self.participant_ids)
+                    self.participant_ids.append(participant_id)
+                    changes['added'].append(participant_id)
+
+                row_idx = self._positions[participant_id]
+                for partition, indexes in record.items():
+                    self._write_row(row_idx, partition, IndexRanges.from_indexes(indexes))
+                self._fingerprints[participant_id] = fingerprint
+
+        return changes
+
+
+    def padded_features(self, partition: str, limit: int = None) -> pd.DataFrame:
+        """ Tabulates the features forcing padding within a partition, most
+            widely padded first
+
+        Args:
+            partition (str): One of ALIGNMENT_PARTITIONS
+            limit (int): Max no. of features tabulated
+        Returns:
+            Padded features (pd.DataFrame)
+        """
+        with self._lock:
+            width = self.width(partition)
+            counts = self._counts[partition][:width]
+            padding = self._padding[partition]
+
+            features = np.flatnonzero(counts)
+            features = features[np.argsort(-counts[features], kind="stable")][:limit]
+            rows = []
+            for feature in features.tolist():
+                padded_rows = np.flatnonzero(padding[:len(self), feature])
+                listed_ids = [
+                    self.participant_ids[row_idx]
+                    for row_idx in padded_rows[:LISTED_PARTICIPANTS]
+                ]
+                if len(padded_rows) > LISTED_PARTICIPANTS:
+                    listed_ids.append(f"... (+{len(padded_rows) - LISTED_PARTICIPANTS})")
+
+                rows.append({
+                    'feature': feature,
+                    'padded_by': int(counts[feature]),
+                    'coverage': round(1 - counts[feature] / len(self), 4),
+                    'participants': ", ".join(listed_ids)
+                })
+
+        return pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+
+
+    def participant_summary(self, partition: str) -> pd.DataFrame:
+        """ Tabulates the padding of every participant within a partition.
+            Exclusive padding counts the features that no other participant
+            pads, which are resolved by that participant alone. The padded
+            share is the fraction of features padded by any participant that
+            a participant pads.
+
+        Args:
+            partition (str): One of ALIGNMENT_PARTITIONS
+        Returns:
+            Participant summary (pd.DataFrame)
+        """
+        with self._lock:
+            width = self.width(partition)
+            padding = self._padding[partition][:len(self), :width]
+            is_exclusive = self._counts[partition][:width] == 1
+            padded = padding.sum(axis=1)
+            exclusive = (padding & is_exclusive).sum(axis=1)
+            padded_feature_count = self.padded_feature_count(partition)
+
+            return pd.DataFrame(
+                {
+                    'participant_id': self.participant_ids,
+                    'padded': padded,
+                    'exclusive': exclusive,
+                    'padded_share': (
+                        np.round(padded / padded_feature_count, 4)
+                        if padded_feature_count
+                        else 0.0
+                    )
+                },
+                columns=PARTICIPANT_COLUMNS
+            ).sort_values('padded', ascending=False, kind="stable")
+
+
+    def to_frame(self, partition: str, features: List[int]) -> pd.DataFrame:
+        """ Tabulates the padding matrix of a partition over selected features
+
+        Args:
+            partition (str): One of ALIGNMENT_PARTITIONS
+            features (list(int)): Features to be tabulated
+        Returns:
+            Participant x feature padding matrix (pd.DataFrame)
+        """
+        with self._lock:
+            features = [feature for feature in features if feature < self.width(partition)]
+            return pd.DataFrame(
+                self._padding[partition][:len(self), features].astype(int),
+                index=self.participant_ids,
+                columns=features
+            )
+
+
+    @classmethod
+    def load(
+        cls,
+        address: Tuple[str, int],
+        collab_id: str,
+        project_id: str
+    ) -> "AlignmentCoverage":
+        """ Retrieves the coverage matrix of the specified project, creating
+            it if it does not exist yet. Matrices are shared across sessions &
+            reruns connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            collab_id (str): ID of collaboration
+            project_id (str): ID of project
+        Returns:
+            Project-specific coverage matrix (AlignmentCoverage)
+        """
+        if address is None:
+            return cls()
+
+        with cls.__registry_lock:
+            registry_key = (address, collab_id, project_id)
+            if registry_key not in cls.__registry:
+                cls.__registry[registry_key] = cls()
+            return cls.__registry[registry_key]
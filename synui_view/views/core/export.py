@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import io
+from typing import Dict, List, Any, Generator
+
+# Libs
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+# Export formats, mapped to their file extensions
+SUPPORTED_FORMATS = {
+    'Parquet': "parquet",
+    'Feather': "feather",
+    'Arrow IPC': "arrow"
+}
+
+EXPORT_COMPRESSION = "zstd"
+
+# No. of rows converted & written per record batch
+EXPORT_CHUNK_SIZE = 65536
+
+KEY_FIELDS = ['participant_id', 'collab_id', 'project_id', 'expt_id', 'run_id']
+RESULT_META = ['train', 'evaluate', 'predict']
+
+RESULT_SCHEMA = pa.schema(
+    [(field, pa.string()) for field in KEY_FIELDS] + [
+        ('meta', pa.string()),
+        ('metric', pa.string()),
+        ('class_index', pa.int32()),    # -1 denotes a grid-level statistic
+        ('value', pa.float64())
+    ]
+)
+
+###########
+# Helpers #
+###########
+
+def extract_result_records(results: Any) -> List[Dict[str, Any]]:
+    """ Normalizes raw validation/prediction payloads into a list of records.
+        Both bare records & full REST responses are accepted.
+
+    Args:
+        results (Any): Payload retrieved from `driver.validations.read` or
+            `driver.predictions.read`
+    Returns:
+        Result records (list(dict))
+    """
+    if isinstance(results, dict) and 'status' in results and 'data' in results:
+        results = results.get('data')
+
+    if isinstance(results, dict):
+        return [results] if results else []
+    elif isinstance(results, list):
+        return [record for record in results if isinstance(record, dict)]
+    else:
+        return []
+
+
+def flatten_statistics(
+    statistics: Dict[str, Any],
+    prefix: str = ""
+) -> Generator[tuple, None, None]:
+    """ Recursively flattens a statistics mapping into (metric, class index,
+        value) triplets. Per-class statistics are expanded into one triplet
+        per class, nested mappings are addressed by dotted metric names, and
+        non-numeric values are skipped.
+
+    Args:
+        statistics (dict): Statistics reported within a result record
+        prefix (str): Dotted path of the parent mapping
+    Returns:
+        Flattened statistics (generator(tuple(str, int, float)))
+    """
+    for name, value in statistics.items():
+        metric = f"{prefix}{name}"
+
+        if isinstance(value, dict):
+            yield from flatten_statistics(value, prefix=f"{metric}.")
+
+        elif isinstance(value, list):
+            for class_idx, class_value in enumerate(value):
+                if (
+                    isinstance(class_value, (int, float)) and
+                    not isinstance(class_value, bool)
+                ):
+                    yield metric, class_idx, float(class_value)
+
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield metric, -1, float(value)
+
+
+def generate_result_batches(
+    results: Any,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Generator[pa.RecordBatch, None, None]:
+    """ Flattens validation/prediction results into long-form record batches
+        of at most `chunk_size` rows, so that no more than a single chunk of
+        Python rows is held in memory at any point in time
+
+    Args:
+        results (Any): Payload retrieved from `driver.validations.read` or
+            `driver.predictions.read`
+        chunk_size (int): Max no. of rows per batch
+    Returns:
+        Record batches (generator(pa.RecordBatch))
+    """
+    columns = {field.name: [] for field in RESULT_SCHEMA}
+
+    def flush() -> pa.RecordBatch:
+        batch = pa.RecordBatch.from_pydict(columns, schema=RESULT_SCHEMA)
+        for column in columns.values():
+            column.clear()
+        return batch
+
+    for record in extract_result_records(results):
+        key = record.get('key', {})
+
+        for meta in RESULT_META:
+            statistics = (record.get(meta) or {}).get('statistics', {}) or {}
+
+            for metric, class_idx, value in flatten_statistics(statistics):
+                for field in KEY_FIELDS:
+                    columns[field].append(key.get(field))
+                columns['meta'].append(meta)
+                columns['metric'].append(metric)
+                columns['class_index'].append(class_idx)
+                columns['value'].append(value)
+
+                if len(columns['value']) >= chunk_size:
+                    yield flush()
+
+    if columns['value']:
+        yield flush()
+
+##################
+# Core functions #
+##################
+
+def export_results(
+    results: Any,
+    export_format: str = "Parquet",
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> bytes:
+    """ Exports validation/prediction results into a compressed, typed
+        columnar file. Results are flattened & written one chunk at a time.
+
+    Args:
+        results (Any): Payload retrieved from `driver.validations.read` or
+            `driver.predictions.read`
+        export_format (str): One of SUPPORTED_FORMATS
+        chunk_size (int): Max no. of rows written per chunk
+    Returns:
+        Serialized file (bytes)
+    """
+    if export_format not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported format '{export_format}'! Supported formats: {list(SUPPORTED_FORMATS)}"
+        )
+
+    sink = io.BytesIO()
+    if export_format == "Parquet":
+        writer = pq.ParquetWriter(
+            sink,
+            RESULT_SCHEMA,
+            compression=EXPORT_COMPRESSION
+        )
+    else:
+        # Feather (v2) is the Arrow IPC file format, stored on disk
+        writer = ipc.new_file(
+            sink,
+            RESULT_SCHEMA,
+            options=ipc.IpcWriteOptions(compression=EXPORT_COMPRESSION)
+        )
+
+    with writer:
+        for batch in generate_result_batches(results, chunk_size):
+            if export_format == "Parquet":
+                writer.write_table(pa.Table.from_batches([batch]))
+            else:
+                writer.write_batch(batch)
+
+    return sink.getvalue()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+import time
+from typing import Dict, List, Any, Tuple
+
+# Libs
+
+
+# Custom
+from config import HIERARCHY_REFRESH_INTERVAL
+from synergos import Driver
+
+##################
+# Configurations #
+##################
+
+HIERARCHY_LEVELS = ['collab_id', 'project_id', 'expt_id', 'run_id']
+
+#######################################
+# Custom Index class - HierarchyIndex #
+#######################################
+
+class HierarchyIndex:
+    """
+    Materialized, in-memory tree of the collaboration > project > experiment
+    > run hierarchy registered under a single orchestrator. Only IDs and
+    lightweight cataloguing metadata are kept. Each level is listed from
+    REST-RPC at most once per refresh interval, and only the level that was
+    queried is relisted, leaving unchanged subtrees untouched. This turns
+    cascading selections into dictionary lookups on most reruns.
+
+    Attributes:
+        driver (Driver): Synergos abstraction object to facilitate REST operations
+        interval (float): Time (in seconds) before a listed level is refreshed
+        _nodes (dict): Composite key (tuple) -> lightweight record metadata
+        _children (dict): Parent composite key (tuple) -> ordered child IDs
+        _refreshed (dict): Parent composite key (tuple) -> time last listed
+        _registrations (dict): Participant ID -> registered hierarchy
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(
+        self,
+        driver: Driver = None,
+        interval: float = HIERARCHY_REFRESH_INTERVAL
+    ):
+        self.driver = driver
+        self.interval = interval
+        self._nodes = {}
+        self._children = {}
+        self._refreshed = {}
+        self._registrations = {}
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    def children(self, *parent_ids: str) -> List[str]:
+        """ Retrieves IDs of all records residing directly under the specified
+            parent. Listing is only triggered when the parent has never been
+            listed before, or when its listing has gone stale.
+
+        Args:
+            parent_ids (str): Hierarchical IDs of parent (i.e. collab_id,
+                project_id, expt_id), in order. No IDs denotes the root.
+        Returns:
+            Child IDs (list(str))
+        """
+        parent_key = tuple(parent_ids)
+        if not all(parent_key) or len(parent_key) >= len(HIERARCHY_LEVELS):
+            return []
+
+        with self._lock:
+            if self.is_stale(*parent_key):
+                self.refresh(*parent_key)
+
+            return list(self._children.get(parent_key, []))
+
+
+    def metadata(self, *ids: str) -> Dict[str, Any]:
+        """ Retrieves lightweight metadata of an indexed record
+
+        Args:
+            ids (str): Hierarchical IDs identifying the record, in order
+        Returns:
+            Record metadata (dict)
+        """
+        with self._lock:
+            return dict(self._nodes.get(tuple(ids), {}))
+
+
+    def is_stale(self, *parent_ids: str) -> bool:
+        """ Checks if the listing of the specified parent has to be refreshed
+
+        Args:
+            parent_ids (str): Hierarchical IDs of parent, in order
+        Returns:
+            Staleness (bool)
+        """
+        refreshed_at = self._refreshed.get(tuple(parent_ids))
+        return (
+            refreshed_at is None or
+            (time.time() - refreshed_at) > self.interval
+        )
+
+
+    def registered_children(
+        self,
+        participant_id: str,
+        *parent_ids: str
+    ) -> List[str]:
+        """ Retrieves IDs of collaborations (or projects of a collaboration)
+            that a participant has registered for. This mirrors `children`,
+            but is restricted to the participant's registrations.
+
+        Args:
+            participant_id (str): ID of participant
+            parent_ids (str): Hierarchical IDs of parent (i.e. only collab_id
+                is supported), in order. No IDs denotes the root.
+        Returns:
+            Registered child IDs (list(str))
+        """
+        parent_key = tuple(parent_ids)
+        if not participant_id or not all(parent_key) or len(parent_key) > 1:
+            return []
+
+        with self._lock:
+            cached = self._registrations.get(participant_id)
+            if cached is None or (time.time() - cached[0]) > self.interval:
+                self.refresh_registrations(participant_id)
+
+            _, registered_tree = self._registrations[participant_id]
+            return list(registered_tree.get(parent_key, []))
+
+    ###########
+    # Setters #
+    ###########
+
+    def bind(self, driver: Driver):
+        """ Binds a (freshly connected) driver to use for subsequent listings
+
+        Args:
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+        Returns:
+            Current index (HierarchyIndex)
+        """
+        self.driver = driver
+        return self
+
+
+    def invalidate(self, **key: str):
+        """ Marks the listing containing the specified record as stale, so
+            that the next query relists it. Should be called after a record is
+            created, updated or deleted through this UI.
+
+        Args:
+            key (dict): Composite key of the modified record (i.e. collab_id,
+                project_id, expt_id, run_id)
+        """
+        ids = [key.get(level) for level in HIERARCHY_LEVELS if key.get(level)]
+
+        with self._lock:
+            # Parent of the modified record, as well as the record's own
+            # listing, have to be re-read
+            for parent_key in (tuple(ids[:-1]), tuple(ids)):
+                self._refreshed.pop(parent_key, None)
+            self._registrations.clear()
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _list_records(self, parent_key: Tuple[str]) -> List[Dict[str, Any]]:
+        """ Lists all records residing directly under a parent from REST-RPC
+
+        Args:
+            parent_key (tuple(str)): Hierarchical IDs of parent, in order
+        Returns:
+            Child records (list(dict))
+        """
+        filters = dict(zip(HIERARCHY_LEVELS, parent_key))
+        resources = [
+            self.driver.collaborations,
+            self.driver.projects,
+            self.driver.experiments,
+            self.driver.runs
+        ]
+        resource = resources[len(parent_key)]
+        return resource.read_all(**filters).get('data', []) or []
+
+
+    def _prune(self, key: Tuple[str]):
+        """ Removes a record & its entire subtree from the index
+
+        Args:
+            key (tuple(str)): Hierarchical IDs of record to remove, in order
+        """
+        for child_id in self._children.pop(key, []):
+            self._prune(key + (child_id,))
+
+        self._nodes.pop(key, None)
+        self._refreshed.pop(key, None)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def refresh(self, *parent_ids: str) -> List[str]:
+        """ Relists all records residing directly under the specified parent.
+            New records are added, removed records are pruned together with
+            their subtrees, while subtrees of retained records are kept as-is.
+
+        Args:
+            parent_ids (str): Hierarchical IDs of parent, in order
+        Returns:
+            Child IDs (list(str))
+        """
+        parent_key = tuple(parent_ids)
+        level = HIERARCHY_LEVELS[len(parent_key)]
+
+        with self._lock:
+            records = self._list_records(parent_key) if self.driver else []
+
+            child_ids = []
+            for record in records:
+                child_id = record.get('key', {}).get(level)
+                if child_id and child_id not in child_ids:
+                    child_ids.append(child_id)
+                    self._nodes[parent_key + (child_id,)] = {
+                        'doc_id': record.get('doc_id'),
+                        'kind': record.get('kind')
+                    }
+
+            removed_ids = set(self._children.get(parent_key, [])) - set(child_ids)
+            for removed_id in removed_ids:
+                self._prune(parent_key + (removed_id,))
+
+            self._children[parent_key] = child_ids
+            self._refreshed[parent_key] = time.time()
+
+        return child_ids
+
+
+    def refresh_registrations(self, participant_id: str) -> Dict[tuple, List[str]]:
+        """ Relists all registrations made by a participant, and materializes
+            them into a collaboration > project tree
+
+        Args:
+            participant_id (str): ID of participant
+        Returns:
+            Registered tree (dict)
+        """
+        with self._lock:
+            participant_data = (
+                self.driver.participants.read(
+                    participant_id=participant_id
+                ).get('data', {})
+                if self.driver
+                else {}
+            ) or {}
+            registrations = participant_data.get(
+                'relations', {}
+            ).get('Registration', [])
+
+            registered_tree = {}
+            for reg_record in registrations:
+                collab_id = reg_record.get('key', {}).get('collab_id')
+                project_id = reg_record.get('key', {}).get('project_id')
+
+                collab_ids = registered_tree.setdefault((), [])
+                if collab_id not in collab_ids:
+                    collab_ids.append(collab_id)
+
+                project_ids = registered_tree.setdefault((collab_id,), [])
+                if project_id not in project_ids:
+                    project_ids.append(project_id)
+
+            self._registrations[participant_id] = (time.time(), registered_tree)
+
+        return registered_tree
+
+
+    @classmethod
+    def load(cls, address: Tuple[str, int], driver: Driver) -> "HierarchyIndex":
+        """ Retrieves the index materialized for the specified orchestrator,
+            creating one if it does not exist yet. Indexes are shared across
+            sessions & reruns connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+        Returns:
+            Orchestrator-specific index (HierarchyIndex)
+        """
+        if address is None:
+            return cls(driver=driver)
+
+        with cls.__registry_lock:
+            index = cls.__registry.get(address)
+            if index is None:
+                index = cls(driver=driver)
+                cls.__registry[address] = index
+
+        return index.bind(driver)
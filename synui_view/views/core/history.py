@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from config import JOB_HISTORY_PATH
+
+##################
+# Configurations #
+##################
+
+KEY_FIELDS = ['collab_id', 'project_id', 'expt_id', 'run_id', 'participant_id']
+
+RUN_KEY_FIELDS = KEY_FIELDS[:4]
+
+# Jobs handed off to the orchestrator (eg. Hyperdrive) are only tracked up to
+# their submission, & hence are recorded as submitted rather than completed.
+# Jobs whose tracking sessions died are recorded as abandoned, as they may
+# still be running on the grid. Jobs that adopted the results of an identical,
+# completed run instead of training are recorded as reused.
+OUTCOMES = ["running", "completed", "failed", "submitted", "abandoned", "reused"]
+
+DURATION_PERCENTILES = [50, 90, 99]
+
+###########
+# Helpers #
+###########
+
+def summarize_durations(durations: pd.Series) -> Dict[str, float]:
+    """ Summarizes a series of durations into its count, mean & percentiles
+
+    Args:
+        durations (pd.Series): Durations (in seconds)
+    Returns:
+        Summary (dict)
+    """
+    durations = durations.dropna()
+    summary = {'count': int(len(durations))}
+    summary['mean'] = float(durations.mean()) if len(durations) else np.nan
+    for percentile in DURATION_PERCENTILES:
+        summary[f"p{percentile}"] = (
+            float(np.percentile(durations, percentile))
+            if len(durations)
+            else np.nan
+        )
+    return summary
+
+
+def attribute_participants(
+    jobs: pd.DataFrame,
+    job_participants: pd.DataFrame
+) -> pd.DataFrame:
+    """ Attributes job durations to participants. The orchestrator does not
+        report per-participant timings, so each participant is instead
+        compared by the median duration of completed jobs it was involved in,
+        against that of jobs it was not involved in.
+
+    Args:
+        jobs (pd.DataFrame): Jobs, as retrieved by `JobHistory.read_jobs`
+        job_participants (pd.DataFrame): Job-participant pairs, as retrieved
+            by `JobHistory.read_participants`
+    Returns:
+        Participants, slowest first (pd.DataFrame)
+    """
+    completed_jobs = jobs[jobs['outcome'] == "completed"].set_index('job_id')
+    attribution_columns = ['participant_id', 'jobs', 'median_with', 'median_without', 'slowdown']
+    if completed_jobs.empty or job_participants.empty:
+        return pd.DataFrame(columns=attribution_columns)
+
+    involvement = pd.crosstab(
+        job_participants['job_id'],
+        job_participants['participant_id']
+    ).reindex(completed_jobs.index, fill_value=0).astype(bool)
+    durations = completed_jobs['duration'].to_numpy()
+
+    attributions = []
+    for participant_id in involvement.columns:
+        is_involved = involvement[participant_id].to_numpy()
+        median_with = np.median(durations[is_involved]) if is_involved.any() else np.nan
+        median_without = (
+            np.median(durations[~is_involved])
+            if (~is_involved).any()
+            else np.median(durations)
+        )
+        attributions.append({
+            'participant_id': participant_id,
+            'jobs': int(is_involved.sum()),
+            'median_with': median_with,
+            'median_without': median_without,
+            'slowdown': median_with - median_without
+        })
+
+    return pd.DataFrame(attributions, columns=attribution_columns).sort_values(
+        by=['slowdown', 'median_with'],
+        ascending=False
+    ).reset_index(drop=True)
+
+#####################################
+# Custom History class - JobHistory #
+#####################################
+
+class JobHistory:
+    """
+    Persistent SQLite store of every federated job launched from this UI.
+    Each job records its type (eg. 'submission'), hierarchy keys, grid size,
+    participating participants, outcome, as well as the start & end times of
+    each of its stages (eg. alignment, training & validation). The result
+    fingerprint of every run submitted from this UI is also recorded, as well
+    as the source run of every run that reused another's results.
+
+    Attributes:
+        db_path (str): Path to SQLite database backing this store
+    """
+    __instance = None
+    __instance_lock = threading.Lock()
+
+    def __init__(self, db_path: str = JOB_HISTORY_PATH):
+        self.db_path = db_path
+        self.initialize()
+
+    ###########
+    # Getters #
+    ###########
+
+    def read_jobs(self, p_type: str = None, **filters: str) -> pd.DataFrame:
+        """ Retrieves all recorded jobs matching the specified process type &
+            key filters, together with their durations
+
+        Args:
+            p_type (str): Process type (eg. 'submission'). None for all types.
+            filters (dict): Subset of the job's hierarchy keys
+        Returns:
+            Jobs, one row per job (pd.DataFrame)
+        """
+        conditions = [
+            (field, filters[field])
+            for field in KEY_FIELDS
+            if filters.get(field)
+        ]
+        if p_type:
+            conditions.append(('p_type', p_type))
+
+        where_clause = (
+            "WHERE " + " AND ".join([f"{field} = ?" for field, _ in conditions])
+            if conditions
+            else ""
+        )
+        with self.connect() as conn:
+            jobs = pd.read_sql_query(
+                f"SELECT * FROM jobs {where_clause} ORDER BY started_at",
+                conn,
+                params=[value for _, value in conditions]
+            )
+        jobs['duration'] = jobs['ended_at'] - jobs['started_at']
+        return jobs
+
+
+    def read_stages(self, job_ids: List[int]) -> pd.DataFrame:
+        """ Retrieves all recorded stages of the specified jobs, together with
+            their durations
+
+        Args:
+            job_ids (list(int)): IDs of jobs
+        Returns:
+            Stages, one row per job stage (pd.DataFrame)
+        """
+        job_ids = [int(job_id) for job_id in job_ids]
+        placeholders = ", ".join(["?"] * len(job_ids)) or "NULL"
+        with self.connect() as conn:
+            stages = pd.read_sql_query(
+                f"SELECT * FROM stages WHERE job_id IN ({placeholders}) "
+                f"ORDER BY started_at",
+                conn,
+                params=job_ids
+            )
+        stages['duration'] = stages['ended_at'] - stages['started_at']
+        return stages
+
+
+    def read_participants(self, job_ids: List[int]) -> pd.DataFrame:
+        """ Retrieves the participants involved in the specified jobs
+
+        Args:
+            job_ids (list(int)): IDs of jobs
+        Returns:
+            Job-participant pairs (pd.DataFrame)
+        """
+        job_ids = [int(job_id) for job_id in job_ids]
+        placeholders = ", ".join(["?"] * len(job_ids)) or "NULL"
+        with self.connect() as conn:
+            return pd.read_sql_query(
+                f"SELECT * FROM job_participants WHERE job_id IN ({placeholders})",
+                conn,
+                params=job_ids
+            )
+
+
+    def read_fingerprints(self, collab_id: str, project_id: str) -> pd.DataFrame:
+        """ Retrieves the result fingerprints recorded for the runs of a 
+            project, as of their submission
+
+        Args:
+            collab_id (str): ID of collaboration
+            project_id (str): ID of project
+        Returns:
+            Run keys & fingerprints, one row per run (pd.DataFrame)
+        """
+        with self.connect() as conn:
+            return pd.read_sql_query(
+                "SELECT * FROM fingerprints WHERE collab_id = ? AND project_id = ?",
+                conn,
+                params=[collab_id, project_id]
+            )
+
+
+    def read_reuse(self, run_key: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """ Retrieves the source run whose results were reused by a run, if any
+
+        Args:
+            run_key (dict): Composite key of the run
+        Returns:
+            Composite key of the source run (dict) or None
+        """
+        with self.connect() as conn:
+            source = conn.execute(
+                "SELECT source_expt_id, source_run_id FROM reuses WHERE "
+                + " AND ".join([f"{field} = ?" for field in RUN_KEY_FIELDS]),
+                [run_key.get(field) for field in RUN_KEY_FIELDS]
+            ).fetchone()
+        if source is None:
+            return None
+
+        source_expt_id, source_run_id = source
+        return {
+            'collab_id': run_key['collab_id'],
+            'project_id': run_key['project_id'],
+            'expt_id': source_expt_id,
+            'run_id': source_run_id
+        }
+
+
+    def durations(self, p_type: str = None, **filters: str) -> List[float]:
+        """ Retrieves the durations of all completed jobs matching the
+            specified process type & key filters
+
+        Args:
+            p_type (str): Process type (eg. 'submission'). None for all types.
+            filters (dict): Subset of the job's hierarchy keys
+        Returns:
+            Durations in seconds (list(float))
+        """
+        jobs = self.read_jobs(p_type, **filters)
+        completed_jobs = jobs[jobs['outcome'] == "completed"]
+        return completed_jobs['duration'].dropna().tolist()
+
+    ###########
+    # Helpers #
+    ###########
+
+    @contextmanager
+    def connect(self):
+        """ Opens a short-lived connection to the store. Connections are never
+            shared across threads.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+    def initialize(self):
+        """ Creates all history tables & indexes if they do not exist yet """
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        key_columns = ", ".join([f"{field} TEXT" for field in KEY_FIELDS])
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                f"p_type TEXT NOT NULL, {key_columns}, "
+                "grid_size INTEGER, participant_count INTEGER, "
+                "started_at REAL NOT NULL, ended_at REAL, outcome TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS stages ("
+                "job_id INTEGER NOT NULL, stage TEXT NOT NULL, "
+                "started_at REAL NOT NULL, ended_at REAL, outcome TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_participants ("
+                "job_id INTEGER NOT NULL, participant_id TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                f"{', '.join([f'{field} TEXT NOT NULL' for field in RUN_KEY_FIELDS])}, "
+                "fingerprint TEXT NOT NULL, recorded_at REAL NOT NULL, "
+                f"PRIMARY KEY ({', '.join(RUN_KEY_FIELDS)}))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS reuses ("
+                f"{', '.join([f'{field} TEXT NOT NULL' for field in RUN_KEY_FIELDS])}, "
+                "source_expt_id TEXT NOT NULL, source_run_id TEXT NOT NULL, "
+                "reused_at REAL NOT NULL, "
+                f"PRIMARY KEY ({', '.join(RUN_KEY_FIELDS)}))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_project "
+                "ON jobs (collab_id, project_id, p_type)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stages_job ON stages (job_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_participants_job "
+                "ON job_participants (job_id)"
+            )
+
+    ##################
+    # Core functions #
+    ##################
+
+    def start_job(
+        self,
+        p_type: str,
+        filters: Dict[str, str],
+        grid_size: int = None,
+        participants: List[str] = []
+    ) -> int:
+        """ Records the commencement of a job
+
+        Args:
+            p_type (str): Process type (eg. 'submission')
+            filters (dict): Composite key set identifying the federated job
+            grid_size (int): No. of grids available to the job
+            participants (list(str)): IDs of participants involved in the job
+        Returns:
+            Job ID (int)
+        """
+        with self.connect() as conn:
+            cursor = conn.execute(
+                f"INSERT INTO jobs (p_type, {', '.join(KEY_FIELDS)}, "
+                "grid_size, participant_count, started_at, outcome) "
+                f"VALUES ({', '.join(['?'] * (len(KEY_FIELDS) + 5))})",
+                [
+                    p_type,
+                    *[filters.get(field) for field in KEY_FIELDS],
+                    grid_size,
+                    len(participants),
+                    time.time(),
+                    OUTCOMES[0]
+                ]
+            )
+            job_id = cursor.lastrowid
+            conn.executemany(
+                "INSERT INTO job_participants (job_id, participant_id) VALUES (?, ?)",
+                [(job_id, participant_id) for participant_id in participants]
+            )
+        return job_id
+
+
+    def end_job(
+        self, 
+        job_id: int, 
+        outcome: str = "completed",
+        only_running: bool = False
+    ):
+        """ Records the termination of a job
+
+        Args:
+            job_id (int): ID of job
+            outcome (str): Outcome of job (eg. 'completed', 'failed' or
+                'submitted')
+            only_running (bool): Toggles if jobs that have already ended 
+                should be left untouched
+        """
+        condition = " AND outcome = ?" if only_running else ""
+        with self.connect() as conn:
+            conn.execute(
+                f"UPDATE jobs SET ended_at = ?, outcome = ? WHERE job_id = ?{condition}",
+                [time.time(), outcome, job_id] + ([OUTCOMES[0]] if only_running else [])
+            )
+
+
+    def record_fingerprint(self, run_key: Dict[str, str], fingerprint: str):
+        """ Records the result fingerprint of a run upon its submission, 
+            replacing that of any previous submission under the same keys
+
+        Args:
+            run_key (dict): Composite key of the run
+            fingerprint (str): Fingerprint of the run's hyperparameters, model
+                architecture & alignment state
+        """
+        with self.connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO fingerprints ({', '.join(RUN_KEY_FIELDS)}, "
+                "fingerprint, recorded_at) "
+                f"VALUES ({', '.join(['?'] * (len(RUN_KEY_FIELDS) + 2))})",
+                [run_key.get(field) for field in RUN_KEY_FIELDS] + [fingerprint, time.time()]
+            )
+
+
+    def record_reuse(
+        self, 
+        run_key: Dict[str, str], 
+        source_key: Dict[str, str],
+        p_type: str = "submission"
+    ) -> int:
+        """ Records a run as having reused the results of an identical, 
+            completed source run in place of being trained, replacing any 
+            reuse previously recorded under the same keys. The reuse is also
+            logged as a job of its own.
+
+        Args:
+            run_key (dict): Composite key of the reusing run
+            source_key (dict): Composite key of the source run
+            p_type (str): Process type (eg. 'submission')
+        Returns:
+            Job ID (int)
+        """
+        with self.connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO reuses ({', '.join(RUN_KEY_FIELDS)}, "
+                "source_expt_id, source_run_id, reused_at) "
+                f"VALUES ({', '.join(['?'] * (len(RUN_KEY_FIELDS) + 3))})",
+                [run_key.get(field) for field in RUN_KEY_FIELDS] + [
+                    source_key['expt_id'], 
+                    source_key['run_id'], 
+                    time.time()
+                ]
+            )
+        job_id = self.start_job(p_type, run_key)
+        self.end_job(job_id, outcome="reused")
+        return job_id
+
+
+    def release_reuse(self, run_key: Dict[str, str]):
+        """ Forgets the reuse recorded for a run, if any (eg. when it is 
+            trained after all)
+
+        Args:
+            run_key (dict): Composite key of the run
+        """
+        with self.connect() as conn:
+            conn.execute(
+                "DELETE FROM reuses WHERE "
+                + " AND ".join([f"{field} = ?" for field in RUN_KEY_FIELDS]),
+                [run_key.get(field) for field in RUN_KEY_FIELDS]
+            )
+
+
+    @contextmanager
+    def stage(self, job_id: int, stage: str):
+        """ Records the start & end times of a single stage of a job. A stage
+            that raises is recorded as failed, and the error is propagated.
+
+        Args:
+            job_id (int): ID of job
+            stage (str): Name of stage (eg. 'training')
+        """
+        started_at = time.time()
+        outcome = OUTCOMES[2]
+        try:
+            yield
+            outcome = OUTCOMES[1]
+        finally:
+            with self.connect() as conn:
+                conn.execute(
+                    "INSERT INTO stages (job_id, stage, started_at, ended_at, outcome) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [job_id, stage, started_at, time.time(), outcome]
+                )
+
+
+    @classmethod
+    def load(cls) -> "JobHistory":
+        """ Retrieves the job history store shared across all sessions
+
+        Returns:
+            Job history (JobHistory)
+        """
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+        return cls.__instance
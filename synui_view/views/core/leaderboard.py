@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+from typing import Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+TARGET_METRICS = {
+    'classify': ["accuracy", "roc_auc_score", "pr_auc_score", "f_score"],
+    'regress': ["R2", "MSE", "MAE"]
+}
+
+# Error metrics are minimised, all other metrics are maximised
+LOWER_IS_BETTER = ["MSE", "MAE"]
+
+# Confusion counts reported per class, used to infer participant sample sizes
+COUNT_METRICS = ["TPs", "TNs", "FPs", "FNs"]
+
+SUPPORTED_AGGREGATIONS = ['mean', 'median', 'min', 'max', 'weighted']
+
+LEADERBOARD_COLUMNS = [
+    'participant_id', 'expt_id', 'run_id', 'metric', 'score', 'weight'
+]
+COMBINATION_COLUMNS = ['expt_id', 'run_id']
+
+###########
+# Helpers #
+###########
+
+def summarize_score(results: Any) -> float:
+    """ Reduces a reported statistic into a single score. Per-class statistics
+        are averaged, while missing or malformed statistics score 0.
+
+    Args:
+        results (Any): Statistic reported within a validation record
+    Returns:
+        Score (float)
+    """
+    if isinstance(results, list) and results:
+        return float(np.mean(results))
+    elif isinstance(results, (int, float)) and not isinstance(results, bool):
+        return float(results)
+    else:
+        return 0.0
+
+
+def infer_sample_count(statistics: Dict[str, Any]) -> float:
+    """ Infers the no. of samples a participant validated on from its confusion
+        counts. Since every class partitions all samples into TP/TN/FP/FN, the
+        counts of the first class suffice. Statistics without confusion counts
+        (eg. regression) are weighted equally.
+
+    Args:
+        statistics (dict): Statistics reported within a validation record
+    Returns:
+        Sample count (float)
+    """
+    counts = [statistics.get(metric) for metric in COUNT_METRICS]
+    if all(isinstance(count, list) and count for count in counts):
+        return float(sum(count[0] for count in counts)) or 1.0
+    return 1.0
+
+###################################
+# Leaderboard class - Leaderboard #
+###################################
+
+class Leaderboard:
+    """
+    Columnar leaderboard over validation statistics of a project. Each record
+    is flattened exactly once into a long-form frame with one row per
+    (participant, experiment, run, metric), after which grid-wide aggregates,
+    ranks & best combinations are computed with vectorized group-bys.
+
+    Attributes:
+        action (str): ML operation of the project (i.e. 'classify' or 'regress')
+        metrics (list(str)): Metrics tracked on the leaderboard
+        frame (pd.DataFrame): Long-form validation scores
+    """
+    def __init__(self, action: str = "classify", frame: pd.DataFrame = None):
+        self.action = action
+        self.metrics = TARGET_METRICS.get(action, TARGET_METRICS['regress'])
+        self.frame = (
+            frame
+            if frame is not None
+            else pd.DataFrame(columns=LEADERBOARD_COLUMNS)
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _flatten(self, val_data: List[Dict[str, Any]]) -> pd.DataFrame:
+        """ Flattens validation records into long-form score rows, in a single
+            pass over the records
+
+        Args:
+            val_data (list(dict)): Validation records
+        Returns:
+            Long-form scores (pd.DataFrame)
+        """
+        columns = {column: [] for column in LEADERBOARD_COLUMNS}
+        for val_record in val_data:
+            key = val_record.get('key', {})
+            statistics = val_record.get('evaluate', {}).get('statistics', {})
+            weight = infer_sample_count(statistics)
+
+            for metric in self.metrics:
+                if metric not in statistics:
+                    continue
+
+                columns['participant_id'].append(key.get('participant_id'))
+                columns['expt_id'].append(key.get('expt_id'))
+                columns['run_id'].append(key.get('run_id'))
+                columns['metric'].append(metric)
+                columns['score'].append(summarize_score(statistics[metric]))
+                columns['weight'].append(weight)
+
+        return pd.DataFrame(columns, columns=LEADERBOARD_COLUMNS).astype(
+            {'score': float, 'weight': float}
+        )
+
+    ##################
+    # Core functions #
+    ##################
+
+    def extend(self, val_data: List[Dict[str, Any]]) -> "Leaderboard":
+        """ Folds new validation records into the leaderboard. Records that
+            were already folded in (i.e. same participant, experiment & run)
+            are replaced.
+
+        Args:
+            val_data (list(dict)): Validation records
+        Returns:
+            Current leaderboard (Leaderboard)
+        """
+        new_frame = self._flatten(val_data)
+        if new_frame.empty:
+            return self
+
+        self.frame = pd.concat(
+            [self.frame, new_frame],
+            ignore_index=True
+        ).drop_duplicates(
+            subset=['participant_id', 'expt_id', 'run_id', 'metric'],
+            keep='last'
+        ).reset_index(drop=True)
+        return self
+
+
+    def aggregate(self, how: str = "mean") -> pd.DataFrame:
+        """ Aggregates participant scores into grid-wide scores for every
+            (experiment, run) combination
+
+        Args:
+            how (str): Aggregation across participants. Supported aggregations
+                are 'mean', 'median', 'min', 'max' & 'weighted' (i.e. mean
+                weighted by participant sample counts)
+        Returns:
+            Grid-wide scores, indexed by combination with one column per
+            metric (pd.DataFrame)
+        """
+        if how not in SUPPORTED_AGGREGATIONS:
+            raise ValueError(
+                f"Unsupported aggregation '{how}'! Supported aggregations: {SUPPORTED_AGGREGATIONS}"
+            )
+
+        if self.frame.empty:
+            return pd.DataFrame(
+                columns=self.metrics,
+                index=pd.MultiIndex.from_tuples([], names=COMBINATION_COLUMNS)
+            )
+
+        group_columns = COMBINATION_COLUMNS + ['metric']
+        if how == "weighted":
+            weighted_frame = self.frame.assign(
+                weighted_score=self.frame['score'] * self.frame['weight']
+            )
+            totals = weighted_frame.groupby(group_columns, sort=False)[
+                ['weighted_score', 'weight']
+            ].sum()
+            grid_scores = totals['weighted_score'] / totals['weight']
+        else:
+            grid_scores = self.frame.groupby(
+                group_columns,
+                sort=False
+            )['score'].agg(how)
+
+        aggregated = grid_scores.unstack('metric')
+        return aggregated.reindex(
+            columns=[metric for metric in self.metrics if metric in aggregated]
+        )
+
+
+    def rank(self, how: str = "mean") -> pd.DataFrame:
+        """ Ranks every (experiment, run) combination per metric, where rank
+            1 is the best performing combination
+
+        Args:
+            how (str): Aggregation across participants (see `aggregate`)
+        Returns:
+            Ranks, indexed by combination with one column per metric
+            (pd.DataFrame)
+        """
+        aggregated = self.aggregate(how)
+        return pd.DataFrame({
+            metric: aggregated[metric].rank(
+                method="min",
+                ascending=metric in LOWER_IS_BETTER
+            )
+            for metric in aggregated.columns
+        }, index=aggregated.index)
+
+
+    def best(
+        self,
+        how: str = "mean"
+    ) -> Tuple[Dict[str, Tuple[str, str, float]], List[Tuple[Tuple[str, str], int]]]:
+        """ Analyses and extracts best expt-run combos that give the best
+            aggregated metrics across the grid
+
+        Args:
+            how (str): Aggregation across participants (see `aggregate`)
+        Returns:
+            Best combination per metric (dict(str, tuple(str, str, float)))
+            Combinations ordered by no. of metrics won (list(tuple))
+        """
+        aggregated = self.aggregate(how)
+
+        best_metrics = {}
+        for metric in aggregated.columns:
+            scores = aggregated[metric].dropna()
+            if scores.empty:
+                continue
+
+            best_idx = (
+                scores.idxmin()
+                if metric in LOWER_IS_BETTER
+                else scores.idxmax()
+            )
+            best_metrics[metric] = (*best_idx, float(scores[best_idx]))
+
+        winners = pd.Series(
+            [combination[:-1] for combination in best_metrics.values()],
+            dtype=object
+        )
+        best_overall = list(winners.value_counts(sort=True).items())
+
+        return best_metrics, best_overall
+
+
+    def summarize(self, how: str = "mean") -> pd.DataFrame:
+        """ Tabulates every (experiment, run) combination on the leaderboard,
+            alongside its grid-wide score & participant spread (i.e. the range
+            of participant scores) for every metric
+
+        Args:
+            how (str): Aggregation across participants (see `aggregate`)
+        Returns:
+            Leaderboard table, one row per combination (pd.DataFrame)
+        """
+        aggregated = self.aggregate(how)
+        summary_columns = COMBINATION_COLUMNS + ['participants'] + [
+            column
+            for metric in aggregated.columns
+            for column in (metric, f"{metric} spread")
+        ]
+        if aggregated.empty:
+            return pd.DataFrame(columns=summary_columns)
+
+        group_columns = COMBINATION_COLUMNS + ['metric']
+        extremes = self.frame.groupby(group_columns, sort=False)['score'].agg(
+            ['min', 'max']
+        )
+        spreads = (extremes['max'] - extremes['min']).unstack('metric')
+        participant_counts = self.frame.groupby(
+            COMBINATION_COLUMNS,
+            sort=False
+        )['participant_id'].nunique()
+
+        summary = pd.DataFrame({'participants': participant_counts})
+        for metric in aggregated.columns:
+            summary[metric] = aggregated[metric]
+            summary[f"{metric} spread"] = spreads[metric]
+
+        return summary.reset_index()[summary_columns]
+
+
+    @classmethod
+    def from_project(cls, project_data: Dict[str, Any]) -> "Leaderboard":
+        """ Builds a leaderboard from all validation records related to a
+            project
+
+        Args:
+            project_data (dict): Project record, inclusive of its relations
+        Returns:
+            Project leaderboard (Leaderboard)
+        """
+        leaderboard = cls(action=project_data.get('action'))
+        val_data = project_data.get('relations', {}).get('Validation', [])
+        return leaderboard.extend(val_data)
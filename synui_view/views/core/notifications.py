@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+
+# Libs
+import pika
+
+# Custom
+from config import (
+    MQ_USERNAME,
+    MQ_PASSWORD,
+    MQ_COMPLETION_EXCHANGE,
+    MQ_RECONNECT_INTERVAL,
+    NOTIFICATION_BUFFER_SIZE
+)
+
+##################
+# Configurations #
+##################
+
+KEY_FIELDS = ['collab_id', 'project_id', 'expt_id', 'run_id', 'participant_id']
+
+SUPPORTED_EVENTS = ["alignment", "training", "validation", "prediction"]
+
+# Process names published by the Synergos MQ, mapped to their events
+EVENT_ALIASES = {
+    'align': "alignment",
+    'alignments': "alignment",
+    'preprocess': "alignment",
+    'train': "training",
+    'models': "training",
+    'evaluate': "validation",
+    'validate': "validation",
+    'validations': "validation",
+    'predict': "prediction",
+    'predictions': "prediction"
+}
+
+###########
+# Helpers #
+###########
+
+def parse_event(
+    routing_key: str,
+    body: bytes
+) -> Optional[Tuple[str, Dict[str, str]]]:
+    """ Parses a completion message published by the Synergos MQ. The event
+        is taken from the message's declared process, or failing that, from
+        the last segment of its routing key.
+
+    Args:
+        routing_key (str): Routing key the message was published under
+        body (bytes): JSON-serialised message
+    Returns:
+        Event & composite key of the completed job (tuple), or None if the
+        message is not a supported completion event
+    """
+    try:
+        message = json.loads(body)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(message, dict):
+        return None
+
+    declared_event = (
+        message.get('process') or
+        message.get('event') or
+        routing_key.split(".")[-1]
+    )
+    declared_event = str(declared_event).lower()
+    event = EVENT_ALIASES.get(declared_event, declared_event)
+    if event not in SUPPORTED_EVENTS:
+        return None
+
+    keys = message.get('keys', message)
+    if not isinstance(keys, dict):
+        return None
+
+    return event, {
+        field: keys[field]
+        for field in KEY_FIELDS
+        if keys.get(field)
+    }
+
+
+def is_match(filters: Dict[str, str], keys: Dict[str, str]) -> bool:
+    """ Checks if a completed job falls under a set of filters
+
+    Args:
+        filters (dict): Composite key set identifying a specific federated job
+        keys (dict): Composite key of the completed job
+    Returns:
+        Match state (bool)
+    """
+    return all(
+        keys.get(field) == filters[field]
+        for field in KEY_FIELDS
+        if filters.get(field)
+    )
+
+###########################################
+# Notification class - CompletionNotifier #
+###########################################
+
+class CompletionNotifier:
+    """
+    Subscriber to the job completion events published by the Synergos MQ
+    declared in a collaboration. A single background listener is shared by
+    all sessions connected to the same MQ. Waiters subscribe to an event of
+    a job & are woken as soon as it is published, while recently published
+    events are retained (with the time they were received) for waiters that
+    subscribe late.
+
+    Attributes:
+        host (str): IP of VM the Synergos MQ is hosted on
+        port (int): AMQP port of the Synergos MQ
+        is_connected (bool): Whether the listener is currently consuming
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.is_connected = False
+        self._subscriptions = {}
+        self._recent = deque(maxlen=NOTIFICATION_BUFFER_SIZE)
+        self._lock = threading.RLock()
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    ###########
+    # Getters #
+    ###########
+
+    def has_completed(
+        self, 
+        event: str, 
+        filters: Dict[str, str],
+        since: float = None
+    ) -> bool:
+        """ Checks if a job's completion event was recently published. As
+            jobs may be rerun under the same keys, events received before
+            `since` (eg. those of a previous run) can be disregarded.
+
+        Args:
+            event (str): One of SUPPORTED_EVENTS
+            filters (dict): Composite key set identifying a specific federated job
+            since (float): Epoch time before which events are disregarded. 
+                None to consider all retained events.
+        Returns:
+            Completion state (bool)
+        """
+        with self._lock:
+            return any(
+                recent_event == event and 
+                is_match(filters, keys) and 
+                (since is None or received_at >= since)
+                for recent_event, keys, received_at in self._recent
+            )
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _dispatch(self, event: str, keys: Dict[str, str]):
+        """ Wakes all waiters subscribed to a published completion event
+
+        Args:
+            event (str): One of SUPPORTED_EVENTS
+            keys (dict): Composite key of the completed job
+        """
+        with self._lock:
+            self._recent.append((event, keys, time.time()))
+            for identity, (filters, notification) in list(self._subscriptions.items()):
+                if identity[0] == event and is_match(filters, keys):
+                    notification.set()
+                    self._subscriptions.pop(identity)
+
+
+    def _on_message(self, channel, method, properties, body: bytes):
+        parsed_event = parse_event(method.routing_key, body)
+        if parsed_event:
+            self._dispatch(*parsed_event)
+
+
+    def _listen(self):
+        """ Consumes completion events for as long as the process lives,
+            reconnecting whenever the connection to the MQ is lost
+        """
+        while True:
+            try:
+                connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(
+                        host=self.host,
+                        port=self.port,
+                        credentials=pika.PlainCredentials(MQ_USERNAME, MQ_PASSWORD)
+                    )
+                )
+                channel = connection.channel()
+                channel.exchange_declare(
+                    exchange=MQ_COMPLETION_EXCHANGE,
+                    exchange_type="topic",
+                    durable=True
+                )
+
+                # Each listener binds its own transient queue, so that events
+                # are never consumed away from other subscribers
+                queue = channel.queue_declare(queue="", exclusive=True)
+                queue_name = queue.method.queue
+                channel.queue_bind(
+                    exchange=MQ_COMPLETION_EXCHANGE,
+                    queue=queue_name,
+                    routing_key="#"
+                )
+                channel.basic_consume(
+                    queue=queue_name,
+                    on_message_callback=self._on_message,
+                    auto_ack=True
+                )
+
+                self.is_connected = True
+                channel.start_consuming()
+
+            except Exception:
+                pass
+
+            self.is_connected = False
+            time.sleep(MQ_RECONNECT_INTERVAL)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def subscribe(
+        self, 
+        event: str, 
+        filters: Dict[str, str],
+        since: float = None
+    ) -> threading.Event:
+        """ Subscribes to the completion event of a job
+
+        Args:
+            event (str): One of SUPPORTED_EVENTS
+            filters (dict): Composite key set identifying a specific federated job
+            since (float): Epoch time before which retained events are 
+                disregarded. None to consider all retained events.
+        Returns:
+            Notification (threading.Event) - set once the event is published
+        """
+        if event not in SUPPORTED_EVENTS:
+            raise ValueError(
+                f"Unsupported event '{event}'! Supported events: {SUPPORTED_EVENTS}"
+            )
+
+        identity = (event, tuple(sorted(filters.items())))
+        with self._lock:
+            notification = self._subscriptions.get(identity, (None, None))[1]
+            if notification is None:
+                notification = threading.Event()
+                self._subscriptions[identity] = (dict(filters), notification)
+
+            # Events may have been published before the waiter subscribed
+            if self.has_completed(event, filters, since):
+                notification.set()
+                self._subscriptions.pop(identity)
+
+        return notification
+
+
+    @classmethod
+    def load(cls, collab_data: Dict[str, Any]) -> Optional["CompletionNotifier"]:
+        """ Retrieves the notifier of the Synergos MQ declared in a
+            collaboration, starting its listener if it does not exist yet
+
+        Args:
+            collab_data (dict): Collaboration record
+        Returns:
+            Notifier (CompletionNotifier), or None if no MQ is declared
+        """
+        mq_info = collab_data.get('mq', {}) or {}
+        mq_host = mq_info.get('host')
+        mq_port = mq_info.get('ports', {}).get('main')
+        if not (mq_host and mq_port):
+            return None
+
+        with cls.__registry_lock:
+            address = (mq_host, mq_port)
+            notifier = cls.__registry.get(address)
+            if notifier is None:
+                notifier = cls.__registry[address] = cls(mq_host, mq_port)
+
+        return notifier
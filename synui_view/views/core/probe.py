@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import errno
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from config import NODE_PROBE_TIMEOUT, NODE_PROBE_WORKERS
+
+##################
+# Configurations #
+##################
+
+# Ports declared for every compute node, keyed by their registration field
+NODE_PORTS = {'f_port': "command", 'port': "data"}
+
+# Channels expected to accept connections at registration. Data ports usually
+# only listen while a job is running, so their probes are merely informative.
+EXPECTED_CHANNELS = ["command"]
+
+FAILURE_KINDS = ["invalid", "dns", "refused", "timeout", "unreachable", "error"]
+
+PROBE_COLUMNS = ['node', 'channel', 'host', 'port', 'status', 'latency_ms', 'detail']
+
+UNREACHABLE_ERRNOS = [errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EHOSTDOWN]
+
+###########
+# Helpers #
+###########
+
+def classify_failure(error: Exception) -> str:
+    """ Maps a connection error onto one of FAILURE_KINDS
+
+    Args:
+        error (Exception): Error raised while connecting
+    Returns:
+        Failure kind (str)
+    """
+    if isinstance(error, socket.gaierror):
+        return FAILURE_KINDS[1]
+
+    elif isinstance(error, ConnectionRefusedError):
+        return FAILURE_KINDS[2]
+
+    elif isinstance(error, socket.timeout):
+        return FAILURE_KINDS[3]
+
+    elif isinstance(error, OSError) and error.errno in UNREACHABLE_ERRNOS:
+        return FAILURE_KINDS[4]
+
+    return FAILURE_KINDS[5]
+
+####################################
+# Probe Result class - ProbeResult #
+####################################
+
+class ProbeResult:
+    """
+    Outcome of testing a single port of a declared compute node
+
+    Attributes:
+        node (str): Name of node declaring the port (eg. node_0)
+        channel (str): Purpose of port (i.e. command or data)
+        host (str): Declared host of node
+        port (int): Declared port
+        latency (float): Time taken (in ms) to establish a connection
+        failure (str): One of FAILURE_KINDS, or None if the port is reachable
+        detail (str): Description of failure, if any
+    """
+    def __init__(self, node: str, channel: str, host: str, port: int):
+        self.node = node
+        self.channel = channel
+        self.host = host
+        self.port = port
+        self.latency = None
+        self.failure = None
+        self.detail = ""
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def is_reachable(self) -> bool:
+        return self.failure is None
+
+    ###########
+    # Helpers #
+    ###########
+
+    def fail(self, kind: str, detail: str):
+        self.failure = kind
+        self.detail = detail
+
+##################
+# Core functions #
+##################
+
+def measure_connection(host: str, port: int, timeout: float) -> float:
+    """ Establishes (& immediately closes) a TCP connection to a port. As
+        a TCP handshake takes a single round trip, the time taken
+        approximates the round-trip time to the host.
+
+    Args:
+        host (str): Host to connect to
+        port (int): Port to connect to
+        timeout (float): Time (in seconds) before the attempt is abandoned
+    Returns:
+        Time taken (in ms) to connect (float)
+    """
+    address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][-1]
+    start = time.perf_counter()
+    with socket.create_connection(address[:2], timeout):
+        return (time.perf_counter() - start) * 1000
+
+
+def probe_port(
+    node: str,
+    channel: str,
+    host: str,
+    port: Any,
+    timeout: float = NODE_PROBE_TIMEOUT
+) -> ProbeResult:
+    """ Tests if a single port of a compute node accepts connections
+
+    Args:
+        node (str): Name of node declaring the port
+        channel (str): Purpose of port (i.e. command or data)
+        host (str): Declared host of node
+        port (Any): Declared port
+        timeout (float): Time (in seconds) before the port is deemed
+            unresponsive
+    Returns:
+        Probe outcome (ProbeResult)
+    """
+    result = ProbeResult(node, channel, host, port)
+
+    if not host:
+        result.fail(FAILURE_KINDS[0], "No host declared")
+        return result
+
+    if isinstance(port, bool) or not isinstance(port, int) or not 0 < port < 65536:
+        result.fail(FAILURE_KINDS[0], f"Port must be within 1-65535, but is {port}")
+        return result
+
+    try:
+        result.latency = round(measure_connection(host, port, timeout), 2)
+    except Exception as e:
+        kind = classify_failure(e)
+        detail = f"No response within {timeout}s" if kind == FAILURE_KINDS[3] else str(e)
+        result.fail(kind, detail)
+
+    return result
+
+
+def probe_nodes(
+    node_details: Dict[str, Dict[str, Any]],
+    timeout: float = NODE_PROBE_TIMEOUT,
+    max_workers: int = NODE_PROBE_WORKERS
+) -> List[ProbeResult]:
+    """ Tests the command & data ports of every declared compute node, with
+        at most `max_workers` ports tested at once. A probe of many nodes
+        hence takes about as long as its slowest port, rather than the sum
+        of all ports.
+
+    Args:
+        node_details (dict): Node name -> declared node information
+        timeout (float): Time (in seconds) before a port is deemed
+            unresponsive
+        max_workers (int): Max no. of concurrent probes
+    Returns:
+        Probe outcomes, ordered by node & channel (list(ProbeResult))
+    """
+    targets = [
+        (node, channel, node_info.get('host', ""), node_info.get(port_field))
+        for node, node_info in sorted(node_details.items())
+        for port_field, channel in NODE_PORTS.items()
+    ]
+    if not targets:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(min(int(max_workers), len(targets)), 1)) as pool:
+        return list(pool.map(
+            lambda target: probe_port(*target, timeout=timeout),
+            targets
+        ))
+
+
+def summarize_probes(results: List[ProbeResult]) -> pd.DataFrame:
+    """ Tabulates the outcome of every probed port
+
+    Args:
+        results (list(ProbeResult)): Probe outcomes
+    Returns:
+        Probe report (pd.DataFrame)
+    """
+    return pd.DataFrame(
+        [
+            {
+                'node': result.node,
+                'channel': result.channel,
+                'host': result.host,
+                'port': result.port,
+                'status': "reachable" if result.is_reachable else result.failure,
+                'latency_ms': result.latency,
+                'detail': result.detail
+            }
+            for result in results
+        ],
+        columns=PROBE_COLUMNS
+    )
+
+
+def benchmark_connection(
+    host: str,
+    port: int,
+    samples: int,
+    request: Callable = None,
+    request_samples: int = 1,
+    timeout: float = NODE_PROBE_TIMEOUT
+) -> Dict[str, Any]:
+    """ Measures the round-trip time to a host over repeated TCP handshakes
+        and, if a `request` function is declared, the time taken for the host
+        to respond to it. Response times include the host's processing time,
+        and are hence not a measure of throughput.
+
+    Args:
+        host (str): Host to benchmark
+        port (int): Port to benchmark
+        samples (int): No. of handshakes made
+        request (callable): Function making an API request to the host
+        request_samples (int): No. of requests timed
+        timeout (float): Time (in seconds) before a handshake is abandoned
+    Returns:
+        Benchmark statistics (dict)
+    """
+    rtts = []
+    failures = 0
+    for _ in range(max(int(samples), 1)):
+        try:
+            rtts.append(measure_connection(host, port, timeout))
+        except Exception:
+            failures += 1
+
+    response_times = []
+    if request:
+        for _ in range(max(int(request_samples), 1)):
+            start = time.perf_counter()
+            request()
+            response_times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'samples': len(rtts),
+        'failures': failures,
+        'rtt_min_ms': round(min(rtts), 2) if rtts else None,
+        'rtt_median_ms': round(float(np.median(rtts)), 2) if rtts else None,
+        'rtt_max_ms': round(max(rtts), 2) if rtts else None,
+        'jitter_ms': round(float(np.std(rtts)), 2) if rtts else None,
+        'response_median_ms': (
+            round(float(np.median(response_times)), 2) 
+            if response_times 
+            else None
+        )
+    }
@@ -6,6 +6,9 @@
 
 # Generic/Built-in
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Any, Union
@@ -14,13 +17,20 @@ from typing import Callable, Dict, List, Any, Union
 
 
 # Custom
-from config import TMP_DIR
+from config import TMP_DIR, LEASE_DURATION, LEASE_RENEWAL_INTERVAL
 from synergos import Driver
+from views.core.history import JobHistory
+from views.core.notifications import CompletionNotifier
 
 ##################
 # Configurations #
 ##################
 
+# Completion events concluding each type of tracked process
+PROCESS_EVENTS = {
+    'submission': "validation",
+    'inference': "prediction"
+}
 
 #########################################
 # Custom Tracker class - TrackedProcess #
@@ -32,7 +42,16 @@ class TrackedProcess:
     and validation resources within a federated cycle. Only one party is
     allowed to trigger the intended process, while subsequent queries will
     get blocked until job has completed. This is done by tracking the existence
-    of a tempfile that is generated upon process startup.
+    of a tempfile that is generated upon process startup. Completion is only
+    remembered for the lifetime of the tracker (i.e. a single rerun), as jobs
+    may be rerun, or deleted & recreated, under the same keys.
+
+    Ownership of a started process is held via a lease, which is renewed by a
+    heartbeat for as long as the owning session is alive. Processes whose
+    leases have expired (eg. due to a container restart) are reaped upon the
+    next check. As the remote job may well still be running, reaped processes
+    are reported as abandoned until their results appear on REST-RPC, or
+    until they are explicitly restarted.
 
     Attributes:
         __STATUS (list(str)):
@@ -42,6 +61,11 @@ class TrackedProcess:
         p_type (str): Process type to be tracked in the context of the FL cycle
         filters (dict): Composite key of hierarchical IDs uniquely identifying
             the specified FL cycle to be tracked
+        job_id (int): ID of the job's record in the job history store
+        notifier (CompletionNotifier): Subscriber to Synergos MQ completion
+            events, if a Synergos MQ is deployed
+        is_recovered (bool): Whether an expired process was reaped during
+            the last check
     """
     def __init__(
         self, 
@@ -49,14 +73,20 @@ class TrackedProcess:
         p_type: str,
         filters: Dict[str, str],
         connector: str = "_-_",
-        extension: str = "txt"
+        extension: str = "txt",
+        notifier: CompletionNotifier = None
     ) -> Dict[str, str]:
-        self.__STATUSES = ["Idle", "In-progress", "Completed"]
+        self.__STATUSES = ["Idle", "In-progress", "Completed", "Abandoned"]
         self.extension = extension
         self.connector = connector
         self.driver = driver
         self.p_type = p_type
         self.filters = filters
+        self.job_id = None
+        self.notifier = notifier
+        self.is_recovered = False
+        self._heartbeat = None
+        self._is_completed = False
 
     ###########
     # Getters #
@@ -95,11 +125,53 @@ class TrackedProcess:
         return is_started and not self.is_completed()
 
 
+    def is_abandoned(self) -> bool:
+        """ Checks if the job corresponding to the current keyset was reaped
+            after its owner stopped renewing its lease. Such a job may still
+            be running remotely, and has to be verified before it is
+            resubmitted.
+
+        Returns:
+            Abandoned state (bool)
+        """
+        return os.path.isfile(self.generate_abandoned_path())
+
+
     def is_completed(self) -> bool:
         """ Checks if the job corresponding to the current keyset is 
-            completed. A process is considered as completed if a model 
-            corresponding to the current set of filters is accessible 
-            from REST-RPC.
+            completed. A process is considered as completed if its completion
+            event was published on the Synergos MQ after it was started, or if
+            its results are accessible from REST-RPC.
+
+        Returns:
+            Completed state (bool)
+        """
+        if self._is_completed:
+            return True
+
+        # Events of previous runs under the same keys are disregarded
+        started_at = self.retrieve_start_timestamp()
+        event = PROCESS_EVENTS.get(self.p_type)
+        self._is_completed = (
+            (
+                self.notifier is not None and 
+                started_at is not None and
+                self.notifier.has_completed(
+                    event, 
+                    self.generate_history_key(),
+                    since=started_at
+                )
+            ) or 
+            self.read_completion()
+        )
+        return self._is_completed
+
+
+    def read_completion(self) -> bool:
+        """ Checks REST-RPC for the results of the job corresponding to the
+            current keyset. A process is considered as completed if a model 
+            & its validation statistics corresponding to the current set of
+            filters are accessible.
 
         Returns:
             Completed state (bool)
@@ -142,6 +214,145 @@ class TrackedProcess:
         return tmp_path
 
 
+    def generate_lease_path(self) -> str:
+        """ Generates path to the lease of the tracked process, whose last
+            modification time marks the last heartbeat of its owner
+
+        Returns:
+            Lease path (str)
+        """
+        return f"{self.generate_tracking_path()}.lease"
+
+
+    def generate_abandoned_path(self) -> str:
+        """ Generates path to the marker of a reaped process, which retains
+            the tracking records of the process
+
+        Returns:
+            Abandoned marker path (str)
+        """
+        return f"{self.generate_tracking_path()}.abandoned"
+
+
+    def generate_history_key(self) -> Dict[str, str]:
+        """ Generates the composite key to record the process under in the job
+            history store
+
+        Returns:
+            History key (dict)
+        """
+        return dict(self.filters)
+
+
+    def renew_lease(self):
+        """ Extends the lease of the tracked process by LEASE_DURATION. The 
+            lease also records the process' ID in the job history store.
+        """
+        lease_path = self.generate_lease_path()
+        if os.path.isfile(lease_path):
+            os.utime(lease_path)
+        else:
+            with open(lease_path, 'w') as lease:
+                lease.write(f"{self.job_id if self.job_id is not None else ''}\n")
+
+
+    def is_lease_expired(self) -> bool:
+        """ Checks if the owner of the tracked process has stopped renewing 
+            its lease. Tempfiles without leases (i.e. created before leases
+            were introduced) expire LEASE_DURATION after they were last
+            modified.
+
+        Returns:
+            Expiry state (bool)
+        """
+        for path in [self.generate_lease_path(), self.generate_tracking_path()]:
+            try:
+                return time.time() - os.path.getmtime(path) > LEASE_DURATION
+            except OSError:
+                continue
+        return True
+
+
+    def start_heartbeat(self):
+        """ Renews the lease of the tracked process every 
+            LEASE_RENEWAL_INTERVAL, for as long as the calling thread (i.e.
+            the owning session) is alive & the process is not stopped
+        """
+        owner = threading.current_thread()
+        is_stopped = threading.Event()
+
+        def beat():
+            while owner.is_alive() and not is_stopped.wait(LEASE_RENEWAL_INTERVAL):
+                try:
+                    self.renew_lease()
+                except OSError:
+                    break
+
+        self.renew_lease()
+        threading.Thread(target=beat, daemon=True).start()
+        self._heartbeat = is_stopped
+
+
+    def stop_heartbeat(self):
+        """ Stops renewing, and releases, the lease of the tracked process """
+        if self._heartbeat is not None:
+            self._heartbeat.set()
+            self._heartbeat = None
+
+        try:
+            os.remove(self.generate_lease_path())
+        except OSError:
+            pass
+
+
+    def reap(self) -> bool:
+        """ Releases the tracked process if its owner's lease has expired.
+            The process is then reconciled against REST-RPC by the ensuing
+            checks (i.e. completed if its results exist, abandoned otherwise),
+            and is recorded as abandoned in the job history store if it had
+            not ended.
+
+        Returns:
+            Reaped state (bool)
+        """
+        tmp_path = self.generate_tracking_path()
+        if not os.path.isfile(tmp_path) or not self.is_lease_expired():
+            return False
+
+        lease_path = self.generate_lease_path()
+        try:
+            with open(lease_path, 'r') as lease:
+                job_id = lease.readline().strip()
+        except OSError:
+            job_id = ""
+
+        # Concurrent reapers may race for the same files
+        try:
+            os.remove(lease_path)
+        except OSError:
+            pass
+        try:
+            os.replace(tmp_path, self.generate_abandoned_path())
+        except OSError:
+            pass
+
+        if job_id:
+            JobHistory.load().end_job(
+                int(job_id), 
+                outcome="abandoned", 
+                only_running=True
+            )
+        return True
+
+
+    def release_abandoned(self):
+        """ Removes the marker of a reaped process, if any """
+        try:
+            os.remove(self.generate_abandoned_path())
+        except OSError:
+            pass
+
+
     def create_tmpfile(self) -> str:
         """ Creates a physical/persistent tempfile to track the commencement
             of any requests under the specified keyset to REST-RPC 
@@ -211,6 +422,19 @@ class TrackedProcess:
             raise RuntimeError("Tempfile not detected! Process has to be started first before tracking.")
 
 
+    def retrieve_start_timestamp(self) -> Union[float, None]:
+        """ Retrieves the starting time of tracked experiment as an epoch time
+
+        Returns:
+            Start time (float), or None if the process is not tracked
+        """
+        try:
+            start_time = self.retrieve_start_time()
+            return datetime.strptime(start_time, "%d-%b-%Y (%H:%M:%S.%f)").timestamp()
+        except (RuntimeError, ValueError):
+            return None
+
+
     def retrieve_access_counts(self) -> str:
         """ Counts number of times process was viewed 
         """
@@ -231,36 +455,86 @@ class TrackedProcess:
     # Core functions #
     ##################
 
-    def start(self) -> str:
-        """ Commences tracking of the remote process
+    def start(
+        self, 
+        grid_size: int = None, 
+        participants: List[str] = []
+    ) -> str:
+        """ Commences tracking of the remote process, and records it in the
+            job history store. Reruns of a completed job are re-checked
+            from REST-RPC.
 
+        Args:
+            grid_size (int): No. of grids available to the process
+            participants (list(str)): IDs of participants involved
         Returns:
             Formatted start time (str)
         """
+        self._is_completed = False
+        self.release_abandoned()
         self.create_tmpfile()
         self.track_access()
+        self.job_id = JobHistory.load().start_job(
+            p_type=self.p_type,
+            filters=self.generate_history_key(),
+            grid_size=grid_size,
+            participants=participants
+        )
+        self.start_heartbeat()
         return self.retrieve_start_time()
+
+
+    @contextmanager
+    def stage(self, name: str):
+        """ Records the duration of a single stage (eg. training) of the
+            remote process in the job history store
+
+        Args:
+            name (str): Name of stage
+        """
+        if self.job_id is None:
+            yield
+        else:
+            with JobHistory.load().stage(self.job_id, name):
+                yield
     
 
-    def stop(self) -> str:
+    def stop(self, outcome: str = "completed") -> str:
         """ Terminates tracking of the remote process.
             Note: This does not stop the actual process!
         
+        Args:
+            outcome (str): Outcome of process (i.e. 'completed' or 'failed')
         Returns:
             Time ended (str)
         """
+        self.stop_heartbeat()
         self.delete_tmpfile()
+        if self.job_id is not None:
+            JobHistory.load().end_job(self.job_id, outcome)
+            self.job_id = None
         return self.format_timestamp(datetime.now())
 
 
     def check(self) -> str:
         """ Determines status of the launched process corresponding to a specified
-            federated keyset. There are 3 possible states:
+            federated keyset. There are 4 possible states:
 
             1. Idle       - Federated Job is unattempted 
             2. In-progess - Federated job is still in progress 
             3. Completed  - Federated job is completed
+            4. Abandoned  - Federated job lost its tracking session before
+                            completing, and may still be in progress
+
+            Processes with expired leases are reaped beforehand.
         """
+        self.is_recovered = self.reap()
+
+        if self.is_abandoned():
+            if not self.is_completed():
+                return self.statuses[3]
+            self.release_abandoned()
+
         if self.is_idle():
             return self.statuses[0]
         elif self.is_running():
@@ -292,6 +566,9 @@ class TrackedInference(TrackedProcess):
         p_type (str): Process type to be tracked in the context of the FL cycle
         filters (dict): Composite key of hierarchical IDs uniquely identifying
             the specified FL cycle to be tracked
+        participant_id (str): ID of participant requesting inference
+        notifier (CompletionNotifier): Subscriber to Synergos MQ completion
+            events, if a Synergos MQ is deployed
     """
     def __init__(
         self, 
@@ -299,14 +576,16 @@ class TrackedInference(TrackedProcess):
         participant_id: str,
         filters: Dict[str, str],
         connector: str = "_-_",
-        extension: str = "txt"
+        extension: str = "txt",
+        notifier: CompletionNotifier = None
     ) -> Dict[str, str]:
         super().__init__(
             driver=driver,
             p_type="inference",
             filters=filters,
             connector=connector,
-            extension=extension
+            extension=extension,
+            notifier=notifier
         )
         self.participant_id = participant_id
 
@@ -343,11 +622,11 @@ class TrackedInference(TrackedProcess):
         return is_started
 
 
-    def is_completed(self) -> bool:
-        """ Checks if the job corresponding to the current keyset is 
-            completed. An inference process is considered as completed if the
-            predictions corresponding to the current set of filters is 
-            accessible from REST-RPC.
+    def read_completion(self) -> bool:
+        """ Checks REST-RPC for the results of the job corresponding to the 
+            current keyset. An inference process is considered as completed 
+            if the predictions corresponding to the current set of filters is 
+            accessible.
 
         Returns:
             Completed state (bool)
@@ -369,4 +648,14 @@ class TrackedInference(TrackedProcess):
             Tracking ID (str)
         """
         process_tracking_id = super().generate_tracking_id()
-        return self.connector.join([self.participant_id, process_tracking_id])
\ No newline at end of file
+        return self.connector.join([self.participant_id, process_tracking_id])
+
+
+    def generate_history_key(self) -> Dict[str, str]:
+        """ Generates the composite key to record the process under in the job
+            history store
+
+        Returns:
+            History key (dict)
+        """
+        return {**self.filters, 'participant_id': self.participant_id}
\ No newline at end of file
@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import base64
+import json
+import re
+import threading
+import urllib.parse
+import urllib.request
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+# Libs
+
+
+# Custom
+from config import (
+    LOGGER_USERNAME,
+    LOGGER_PASSWORD,
+    PROGRESS_BUFFER_SIZE,
+    PROGRESS_FETCH_LIMIT
+)
+
+##################
+# Configurations #
+##################
+
+KEY_FIELDS = ['project_id', 'expt_id', 'run_id']
+
+# Fields requested from the Synergos Logger for every message
+MESSAGE_FIELDS = ['timestamp', 'message', 'source', 'level', 'participant_id']
+
+ROUND_PATTERN = re.compile(r"\bround\W{0,3}(\d+)", re.IGNORECASE)
+EPOCH_PATTERN = re.compile(r"\bepoch\W{0,3}(\d+)", re.IGNORECASE)
+LOSS_PATTERN = re.compile(
+    r"\bloss\W{0,3}(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)",
+    re.IGNORECASE
+)
+
+# Syslog levels at or below this level are reported as errors
+ERROR_LEVEL = 3
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+###########
+# Helpers #
+###########
+
+def parse_progress(message: str) -> Dict[str, float]:
+    """ Extracts training progress (i.e. round, epoch & loss) reported within
+        a single log message
+
+    Args:
+        message (str): Log message
+    Returns:
+        Progress (dict) - only indicators found in the message are included
+    """
+    progress = {}
+    for indicator, pattern, cast in [
+        ('round', ROUND_PATTERN, int),
+        ('epoch', EPOCH_PATTERN, int),
+        ('loss', LOSS_PATTERN, float)
+    ]:
+        match = pattern.search(message)
+        if match:
+            progress[indicator] = cast(match.group(1))
+    return progress
+
+
+def identify_message(message: Dict[str, Any]) -> Tuple[Any, ...]:
+    """ Derives the identity of a log message from its contents, as messages
+        are not retrieved with any logger-assigned ID
+
+    Args:
+        message (dict): Log message
+    Returns:
+        Identity of message (tuple)
+    """
+    return tuple(message.get(field) for field in MESSAGE_FIELDS)
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """ Parses a timestamp reported by the Synergos Logger
+
+    Args:
+        timestamp (str): ISO-8601 timestamp (eg. 2021-05-01T10:00:00.000Z)
+    Returns:
+        Timestamp (datetime)
+    """
+    return datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(
+        tzinfo=timezone.utc
+    )
+
+
+def format_timestamp(timestamp: datetime) -> str:
+    """ Formats a timestamp for querying the Synergos Logger
+
+    Args:
+        timestamp (datetime): Timezone-aware timestamp
+    Returns:
+        ISO-8601 timestamp (str)
+    """
+    return timestamp.astimezone(timezone.utc).strftime(TIMESTAMP_FORMAT)[:-4] + "Z"
+
+#####################################
+# Progress class - TrainingProgress #
+#####################################
+
+class TrainingProgress:
+    """
+    Tails the Synergos Logger declared in a collaboration for messages
+    concerning a single federated job, and folds them into its running
+    progress. Only messages logged since the previous poll are fetched, and
+    at most `buffer_size` messages & loss readings are retained, so memory
+    stays constant regardless of how long the job runs.
+
+    Attributes:
+        url (str): Base URL of the Synergos Logger's REST API
+        filters (dict): Composite key set identifying a specific federated job
+        messages (deque): Most recent log messages
+        losses (deque): Most recent (timestamp, loss) readings
+        participants (dict): Participant ID -> latest status & timestamp
+        round (int): Latest round reported
+        epoch (int): Latest epoch reported
+    """
+    def __init__(
+        self,
+        url: str,
+        filters: Dict[str, str],
+        buffer_size: int = PROGRESS_BUFFER_SIZE
+    ):
+        self.url = url
+        self.filters = filters
+        self.messages = deque(maxlen=buffer_size)
+        self.losses = deque(maxlen=buffer_size)
+        self.participants = {}
+        self.round = None
+        self.epoch = None
+        self._cursor = datetime.now(timezone.utc)
+        self._seen_messages = set()
+        self._lock = threading.Lock()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def loss(self) -> Optional[float]:
+        """ Latest loss reported """
+        return self.losses[-1][1] if self.losses else None
+
+
+    def tail(self, count: int = 20) -> List[str]:
+        """ Retrieves the most recent log lines
+
+        Args:
+            count (int): No. of lines to retrieve
+        Returns:
+            Log lines, oldest first (list(str))
+        """
+        with self._lock:
+            recent_messages = list(self.messages)[-count:]
+        return [
+            f"[{message.get('timestamp')}] {message.get('source', '')}: {message.get('message', '')}"
+            for message in recent_messages
+        ]
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _fetch(self, since: datetime, until: datetime) -> List[Dict[str, Any]]:
+        """ Retrieves messages concerning the job that were logged within the
+            specified interval, oldest first
+
+        Args:
+            since (datetime): Start of interval (inclusive)
+            until (datetime): End of interval (inclusive)
+        Returns:
+            Log messages (list(dict))
+        """
+        query = " AND ".join([
+            f'"{self.filters[field]}"'
+            for field in KEY_FIELDS
+            if self.filters.get(field)
+        ]) or "*"
+        params = urllib.parse.urlencode({
+            'query': query,
+            'from': format_timestamp(since),
+            'to': format_timestamp(until),
+            'limit': PROGRESS_FETCH_LIMIT,
+            'sort': "timestamp:asc",
+            'fields': ",".join(MESSAGE_FIELDS)
+        })
+        credentials = base64.b64encode(
+            f"{LOGGER_USERNAME}:{LOGGER_PASSWORD}".encode()
+        ).decode()
+        request = urllib.request.Request(
+            f"{self.url}/api/search/universal/absolute?{params}",
+            headers={
+                'Accept': "application/json",
+                'Authorization': f"Basic {credentials}",
+                'X-Requested-By': "synergos-ui"
+            }
+        )
+        with urllib.request.urlopen(request, timeout=5) as resp:
+            results = json.loads(resp.read())
+
+        return [
+            result.get('message', {})
+            for result in results.get('messages', [])
+        ]
+
+
+    def _fold(self, message: Dict[str, Any]):
+        """ Folds a single log message into the running progress. Parsed
+            progress is attached to the message under 'progress'.
+
+        Args:
+            message (dict): Log message
+        """
+        progress = parse_progress(str(message.get('message', "")))
+        message['progress'] = progress
+        self.messages.append(message)
+
+        self.round = progress.get('round', self.round)
+        self.epoch = progress.get('epoch', self.epoch)
+        if 'loss' in progress:
+            self.losses.append((message.get('timestamp'), progress['loss']))
+
+        participant_id = message.get('participant_id')
+        if participant_id:
+            level = message.get('level')
+            is_error = isinstance(level, int) and level <= ERROR_LEVEL
+            self.participants[participant_id] = {
+                'status': "error" if is_error else "active",
+                'last_seen': message.get('timestamp')
+            }
+
+    ##################
+    # Core functions #
+    ##################
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """ Fetches & folds all messages logged since the previous poll.
+            Unreachable loggers are tolerated, since progress reporting is
+            merely advisory.
+
+        Returns:
+            Newly folded messages (list(dict))
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            fetched_messages = self._fetch(since=self._cursor, until=now)
+        except Exception:
+            return []
+
+        with self._lock:
+            new_messages = []
+            for message in fetched_messages:
+                # Cursors are inclusive, so skip messages straddling polls
+                if identify_message(message) in self._seen_messages:
+                    continue
+                self._fold(message)
+                new_messages.append(message)
+
+            if fetched_messages:
+                latest = max(
+                    parse_timestamp(message['timestamp'])
+                    for message in fetched_messages
+                    if message.get('timestamp')
+                )
+                self._seen_messages = {
+                    identify_message(message)
+                    for message in fetched_messages
+                    if message.get('timestamp') == format_timestamp(latest)
+                }
+                # Results are capped, so resume from the latest message
+                # fetched rather than from the end of the interval
+                self._cursor = latest
+
+        return new_messages
+
+
+    @classmethod
+    def from_collaboration(
+        cls,
+        collab_data: Dict[str, Any],
+        filters: Dict[str, str]
+    ) -> Optional["TrainingProgress"]:
+        """ Constructs a progress tracker from the Synergos Logger declared
+            in a collaboration
+
+        Args:
+            collab_data (dict): Collaboration record
+            filters (dict): Composite key set identifying a specific federated job
+        Returns:
+            Progress tracker (TrainingProgress), or None if no logger is
+            declared
+        """
+        logger_info = collab_data.get('logs', {}) or {}
+        logger_host = logger_info.get('host')
+        logger_ui_port = logger_info.get('ports', {}).get('ui')
+        if not (logger_host and logger_ui_port):
+            return None
+
+        protocol = "https" if logger_info.get('secure') else "http"
+        return cls(url=f"{protocol}://{logger_host}:{logger_ui_port}", filters=filters)
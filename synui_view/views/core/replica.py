@@ -0,0 +1,683 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Tuple
+
+# Libs
+
+
+# Custom
+from config import (
+    CACHE_DIR,
+    REPLICA_SYNC_INTERVAL,
+    REPLICA_FULL_SYNC_CYCLES
+)
+from synergos import Driver
+
+##################
+# Configurations #
+##################
+
+# Replicated resources, mapped to their composite keys (in hierarchical order)
+REPLICATED_RECORDS = {
+    'collaborations': ['collab_id'],
+    'projects': ['collab_id', 'project_id'],
+    'experiments': ['collab_id', 'project_id', 'expt_id'],
+    'runs': ['collab_id', 'project_id', 'expt_id', 'run_id'],
+    'registrations': ['collab_id', 'project_id', 'participant_id'],
+    'tags': ['collab_id', 'project_id', 'participant_id']
+}
+
+###########
+# Helpers #
+###########
+
+def generate_fingerprint(record: Dict[str, Any]) -> str:
+    """ Generates a content hash of a record, used to detect changes between
+        synchronisation cycles
+
+    Args:
+        record (dict): Any archival record
+    Returns:
+        Fingerprint (str)
+    """
+    serialized = json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+##############################################
+# Custom Replica class - OrchestratorReplica #
+##############################################
+
+class OrchestratorReplica:
+    """
+    Local, read-only SQLite mirror of metadata archived in a single
+    orchestrator (i.e. collaborations, projects, experiments, runs,
+    registrations & tags). Every replicated type is stored in its own table,
+    with its composite key fields as indexed columns and the original record
+    as a JSON payload. Records are only rewritten when their content
+    fingerprint changes.
+
+    Writes forwarded to the orchestrator are tracked per project, so that
+    reads touching a recently written project can be served live until a
+    sync started after the write has completed. Fingerprints of every 
+    project's listing are kept as of the last time its details were pulled,
+    so that only projects whose listings changed are pulled again.
+
+    Attributes:
+        db_path (str): Path to SQLite database backing this replica
+        synchronizer (ReplicaSynchronizer): Daemon keeping the replica updated
+        synced_from (float): Time at which the latest completed sync started
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.synchronizer = None
+        self.synced_from = None
+        self._writes = {}
+        self._listings = {}
+        self._sync_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.initialize()
+
+    ###########
+    # Getters #
+    ###########
+
+    def last_synced(self) -> float:
+        """ Retrieves the time at which the last synchronisation cycle
+            completed
+
+        Returns:
+            Timestamp (float), or None if replica has never been synced
+        """
+        with self.connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM sync_state WHERE name = 'last_synced'"
+            ).fetchone()
+        return float(row[0]) if row else None
+
+
+    def staleness(self) -> float:
+        """ Computes how outdated the replica is at most
+
+        Returns:
+            Seconds since last completed sync (float), or None if never synced
+        """
+        last_synced = self.last_synced()
+        return (time.time() - last_synced) if last_synced else None
+
+
+    def is_ready(self) -> bool:
+        """ Checks if the replica has completed at least one sync cycle
+
+        Returns:
+            Readiness (bool)
+        """
+        return self.last_synced() is not None
+
+
+    def is_outdated(self, **filters: str) -> bool:
+        """ Checks if records matching the specified key filters may have been
+            written to since the replica last synced. A written scope matches
+            unless one of its key fields conflicts with the filters.
+
+        Args:
+            filters (dict): Subset of a type's composite key fields
+        Returns:
+            Outdated state (bool)
+        """
+        with self._write_lock:
+            self._writes = {
+                scope: written_at 
+                for scope, written_at in self._writes.items()
+                if self.synced_from is None or written_at >= self.synced_from
+            }
+            return any(
+                all(
+                    filters.get(field) is None or filters[field] == value
+                    for field, value in scope
+                )
+                for scope in self._writes
+            )
+
+
+    def read_all(self, r_type: str, **filters: str) -> List[Dict[str, Any]]:
+        """ Retrieves all replicated records of a type matching the specified
+            key filters. Unspecified key fields are not filtered on.
+
+        Args:
+            r_type (str): Type of replicated records (eg. 'runs')
+            filters (dict): Subset of the type's composite key fields
+        Returns:
+            Records (list(dict))
+        """
+        key_fields = REPLICATED_RECORDS[r_type]
+        conditions = [
+            (field, filters[field])
+            for field in key_fields
+            if filters.get(field) is not None
+        ]
+        where_clause = (
+            "WHERE " + " AND ".join([f"{field} = ?" for field, _ in conditions])
+            if conditions
+            else ""
+        )
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"SELECT payload FROM {r_type} {where_clause} ORDER BY rowid",
+                [value for _, value in conditions]
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+    def read(self, r_type: str, **key: str) -> Dict[str, Any]:
+        """ Retrieves a single replicated record identified by its full
+            composite key
+
+        Args:
+            r_type (str): Type of replicated records (eg. 'runs')
+            key (dict): Composite key of the record
+        Returns:
+            Record (dict), or an empty dict if it is not replicated
+        """
+        key_fields = REPLICATED_RECORDS[r_type]
+        if not all(key.get(field) for field in key_fields):
+            return {}
+
+        records = self.read_all(r_type, **key)
+        return records[0] if records else {}
+
+    ###########
+    # Helpers #
+    ###########
+
+    @contextmanager
+    def connect(self):
+        """ Opens a short-lived connection to the replica. Connections are
+            never shared across threads.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+    def initialize(self):
+        """ Creates all replicated tables, together with an index on every
+            composite key field, if they do not exist yet
+        """
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with self.connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state "
+                "(name TEXT PRIMARY KEY, value TEXT)"
+            )
+            for r_type, key_fields in REPLICATED_RECORDS.items():
+                key_columns = ", ".join([f"{field} TEXT NOT NULL" for field in key_fields])
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {r_type} ("
+                    f"{key_columns}, "
+                    "doc_id TEXT, "
+                    "fingerprint TEXT NOT NULL, "
+                    "payload TEXT NOT NULL, "
+                    "synced_at REAL NOT NULL, "
+                    f"PRIMARY KEY ({', '.join(key_fields)}))"
+                )
+                for field in key_fields:
+                    conn.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_{r_type}_{field} "
+                        f"ON {r_type} ({field})"
+                    )
+
+
+    def _load_fingerprints(
+        self,
+        conn: sqlite3.Connection,
+        r_type: str,
+        **parent_key: str
+    ) -> Dict[Tuple[str], str]:
+        """ Retrieves fingerprints of all replicated records of a type residing
+            under a parent
+        """
+        key_fields = REPLICATED_RECORDS[r_type]
+        conditions = [field for field in key_fields if field in parent_key]
+        where_clause = (
+            "WHERE " + " AND ".join([f"{field} = ?" for field in conditions])
+            if conditions
+            else ""
+        )
+        rows = conn.execute(
+            f"SELECT {', '.join(key_fields)}, fingerprint FROM {r_type} {where_clause}",
+            [parent_key[field] for field in conditions]
+        ).fetchall()
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+
+    def _delete_subtree(self, conn: sqlite3.Connection, **key: str):
+        """ Removes a record, as well as every replicated record residing under
+            it, across all tables
+        """
+        for r_type, key_fields in REPLICATED_RECORDS.items():
+            if all(field in key_fields for field in key):
+                conditions = " AND ".join([f"{field} = ?" for field in key])
+                conn.execute(
+                    f"DELETE FROM {r_type} WHERE {conditions}",
+                    list(key.values())
+                )
+
+
+    def mark_written(self, **key: str):
+        """ Records a write forwarded to the orchestrator, & requests the
+            affected project to be resynced immediately
+
+        Args:
+            key (dict): Composite key (or key filters) of the write
+        """
+        scope = tuple(
+            (field, key[field]) 
+            for field in ['collab_id', 'project_id']
+            if key.get(field) is not None
+        )
+        with self._write_lock:
+            self._writes[scope] = time.time()
+
+        if self.synchronizer:
+            self.synchronizer.request(dict(scope))
+
+
+    def merge(
+        self,
+        r_type: str,
+        records: List[Dict[str, Any]],
+        **parent_key: str
+    ) -> List[Tuple[str]]:
+        """ Merges a complete listing of records residing under a parent into
+            the replica. Only new or changed records are written, and records
+            no longer listed are removed together with their subtrees.
+
+        Args:
+            r_type (str): Type of replicated records (eg. 'runs')
+            records (list(dict)): All records of type listed under the parent
+            parent_key (dict): Composite key of the parent
+        Returns:
+            Keys of new or changed records (list(tuple))
+        """
+        key_fields = REPLICATED_RECORDS[r_type]
+        synced_at = time.time()
+
+        with self.connect() as conn:
+            existing = self._load_fingerprints(conn, r_type, **parent_key)
+
+            listed_keys = set()
+            changed_keys = []
+            for record in records:
+                record_key = record.get('key', {})
+                key = tuple([
+                    record_key.get(field) or parent_key.get(field)
+                    for field in key_fields
+                ])
+                if not all(key):
+                    continue
+
+                listed_keys.add(key)
+                fingerprint = generate_fingerprint(record)
+                if existing.get(key) == fingerprint:
+                    continue
+
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {r_type} "
+                    f"({', '.join(key_fields)}, doc_id, fingerprint, payload, synced_at) "
+                    f"VALUES ({', '.join(['?'] * (len(key_fields) + 4))})",
+                    [
+                        *key,
+                        record.get('doc_id'),
+                        fingerprint,
+                        json.dumps(record, default=str),
+                        synced_at
+                    ]
+                )
+                changed_keys.append(key)
+
+            for removed_key in set(existing) - listed_keys:
+                self._delete_subtree(conn, **dict(zip(key_fields, removed_key)))
+
+        return changed_keys
+
+    ##################
+    # Core functions #
+    ##################
+
+    def sync(
+        self, 
+        driver: Driver, 
+        full: bool = False, 
+        scopes: List[Dict[str, str]] = []
+    ) -> Dict[str, int]:
+        """ Performs a synchronisation cycle against the orchestrator.
+
+            Synergos does not expose a change feed, so every level is listed,
+            but only new or changed records are written. Furthermore, a
+            project's details (which carry its relations) are only pulled
+            when its listing has changed, and its subtree (experiments, runs,
+            registrations & tags) only when its details have changed, unless
+            a full sync is requested, or the project was written to (i.e.
+            declared in `scopes`).
+
+        Args:
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+            full (bool): Toggles if unchanged project subtrees are pulled too
+            scopes (list(dict)): Keys of projects whose subtrees must be pulled
+        Returns:
+            No. of new or changed records per type (dict)
+        """
+        changes = {r_type: 0 for r_type in REPLICATED_RECORDS}
+        forced_projects = {
+            (scope.get('collab_id'), scope.get('project_id')) 
+            for scope in scopes
+        }
+
+        with self._sync_lock:
+            started_at = time.time()
+
+            collab_data = driver.collaborations.read_all().get('data', []) or []
+            changes['collaborations'] += len(self.merge('collaborations', collab_data))
+
+            for collab_record in collab_data:
+                collab_id = collab_record.get('key', {}).get('collab_id')
+
+                project_data = driver.projects.read_all(
+                    collab_id=collab_id
+                ).get('data', []) or []
+
+                # Projects are replicated with their relations, which are only 
+                # pulled again for projects whose listings have changed
+                detailed_projects = []
+                for project_record in project_data:
+                    project_id = project_record.get('key', {}).get('project_id')
+                    project_scope = (collab_id, project_id)
+                    listing_fingerprint = generate_fingerprint(project_record)
+                    if (
+                        full or
+                        project_scope in forced_projects or
+                        self._listings.get(project_scope) != listing_fingerprint
+                    ):
+                        detailed_project = driver.projects.read(
+                            collab_id=collab_id,
+                            project_id=project_id
+                        ).get('data', {}) or project_record
+                        self._listings[project_scope] = listing_fingerprint
+                    else:
+                        detailed_project = self.read(
+                            'projects',
+                            collab_id=collab_id,
+                            project_id=project_id
+                        ) or project_record
+                    detailed_projects.append(detailed_project)
+
+                listed_scopes = {
+                    (collab_id, project_record.get('key', {}).get('project_id'))
+                    for project_record in project_data
+                }
+                for project_scope in list(self._listings):
+                    if project_scope[0] == collab_id and project_scope not in listed_scopes:
+                        self._listings.pop(project_scope)
+
+                changed_projects = self.merge(
+                    'projects',
+                    detailed_projects,
+                    collab_id=collab_id
+                )
+                changes['projects'] += len(changed_projects)
+
+                for project_record in detailed_projects:
+                    project_id = project_record.get('key', {}).get('project_id')
+                    project_key = {'collab_id': collab_id, 'project_id': project_id}
+                    if (
+                        not full and 
+                        (collab_id, project_id) not in changed_projects and
+                        (collab_id, project_id) not in forced_projects
+                    ):
+                        continue
+
+                    registry_data = driver.registrations.read_all(
+                        **project_key
+                    ).get('data', []) or []
+                    changes['registrations'] += len(
+                        self.merge('registrations', registry_data, **project_key)
+                    )
+
+                    tag_data = project_record.get('relations', {}).get('Tag', [])
+                    changes['tags'] += len(
+                        self.merge('tags', tag_data, **project_key)
+                    )
+
+                    expt_data = driver.experiments.read_all(
+                        **project_key
+                    ).get('data', []) or []
+                    changes['experiments'] += len(
+                        self.merge('experiments', expt_data, **project_key)
+                    )
+
+                    for expt_record in expt_data:
+                        expt_key = {
+                            **project_key,
+                            'expt_id': expt_record.get('key', {}).get('expt_id')
+                        }
+                        run_data = driver.runs.read_all(
+                            **expt_key
+                        ).get('data', []) or []
+                        changes['runs'] += len(
+                            self.merge('runs', run_data, **expt_key)
+                        )
+
+            with self.connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)",
+                    ('last_synced', str(time.time()))
+                )
+            self.synced_from = started_at
+
+        return changes
+
+
+    @classmethod
+    def load(cls, address: Tuple[str, int], driver: Driver) -> "OrchestratorReplica":
+        """ Retrieves the replica of the specified orchestrator, creating it
+            and starting its synchronisation daemon if it does not exist yet.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+        Returns:
+            Orchestrator-specific replica (OrchestratorReplica)
+        """
+        with cls.__registry_lock:
+            replica = cls.__registry.get(address)
+            if replica is None:
+                host, port = address
+                db_name = re.sub(r"[^\w\-]", "_", f"{host}_{port}")
+                db_path = os.path.join(CACHE_DIR, "replicas", f"{db_name}.db")
+                replica = cls(db_path=db_path)
+                replica.synchronizer = ReplicaSynchronizer(replica, driver)
+                replica.synchronizer.start()
+                cls.__registry[address] = replica
+
+        return replica
+
+#############################################
+# Custom Daemon class - ReplicaSynchronizer #
+#############################################
+
+class ReplicaSynchronizer(threading.Thread):
+    """
+    Background daemon that periodically synchronises a replica with its
+    orchestrator. Every few cycles, a full sync is performed to pick up
+    changes that are not reflected in a project's own record.
+
+    Attributes:
+        replica (OrchestratorReplica): Replica to keep updated
+        driver (Driver): Synergos abstraction object to facilitate REST operations
+        interval (float): Time (in seconds) between synchronisation cycles
+        full_sync_cycles (int): No. of cycles between full synchronisations
+        last_error (Exception): Error raised in the latest failed cycle, if any
+    """
+    def __init__(
+        self,
+        replica: OrchestratorReplica,
+        driver: Driver,
+        interval: float = REPLICA_SYNC_INTERVAL,
+        full_sync_cycles: int = REPLICA_FULL_SYNC_CYCLES
+    ):
+        super().__init__(daemon=True)
+        self.replica = replica
+        self.driver = driver
+        self.interval = interval
+        self.full_sync_cycles = full_sync_cycles
+        self.last_error = None
+        self._pending_scopes = []
+        self._pending_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+
+
+    def run(self):
+        cycle = 0
+        while not self._stop_event.is_set():
+            with self._pending_lock:
+                scopes, self._pending_scopes = self._pending_scopes, []
+
+            try:
+                self.replica.sync(
+                    self.driver,
+                    full=(cycle % self.full_sync_cycles == 0),
+                    scopes=scopes
+                )
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+
+            cycle += 1
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+
+    def request(self, scope: Dict[str, str]):
+        """ Wakes the daemon to sync immediately, pulling the subtree of the
+            specified project regardless of whether its record has changed
+
+        Args:
+            scope (dict): Key of project written to
+        """
+        with self._pending_lock:
+            self._pending_scopes.append(scope)
+        self._wake_event.set()
+
+
+    def stop(self):
+        self._stop_event.set()
+        self._wake_event.set()
+
+###################################
+# Driver stand-in - ReplicaDriver #
+###################################
+
+class ReplicaResource:
+    """
+    Read-only view of a single replicated resource, mirroring the `read` &
+    `read_all` interface of its Synergos driver counterpart. All other
+    operations (i.e. creation, updates & deletions) are forwarded to the live
+    resource, and mark the affected project as written to. Reads touching a
+    written project are served live until the replica has resynced.
+
+    Attributes:
+        r_type (str): Type of replicated records (eg. 'runs')
+        replica (OrchestratorReplica): Replica to read from
+        resource (object): Live driver resource of the same type
+    """
+    def __init__(self, r_type: str, replica: OrchestratorReplica, resource):
+        self.r_type = r_type
+        self.replica = replica
+        self.resource = resource
+
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.resource, name)
+        if not callable(attribute):
+            return attribute
+
+        def forward_write(*args, **kwargs):
+            resp = attribute(*args, **kwargs)
+            self.replica.mark_written(**self._parse_key(args, kwargs))
+            return resp
+
+        return forward_write
+
+
+    def _parse_key(self, args: tuple, kwargs: dict) -> Dict[str, str]:
+        """ Maps positional IDs onto the type's composite key fields """
+        key_fields = REPLICATED_RECORDS[self.r_type]
+        return {**dict(zip(key_fields, args)), **kwargs}
+
+
+    def read_all(self, *args, **kwargs) -> Dict[str, Any]:
+        filters = self._parse_key(args, kwargs)
+        if self.replica.is_outdated(**filters):
+            return self.resource.read_all(*args, **kwargs)
+
+        return {
+            'status': 200,
+            'data': self.replica.read_all(self.r_type, **filters)
+        }
+
+
+    def read(self, *args, **kwargs) -> Dict[str, Any]:
+        key = self._parse_key(args, kwargs)
+        if self.replica.is_outdated(**key):
+            return self.resource.read(*args, **kwargs)
+
+        return {
+            'status': 200,
+            'data': self.replica.read(self.r_type, **key)
+        }
+
+
+
+class ReplicaDriver:
+    """
+    Drop-in stand-in for a Synergos driver, serving all replicated resources
+    from a local replica, while forwarding everything else to a live driver.
+
+    Attributes:
+        replica (OrchestratorReplica): Replica to read from
+        driver (Driver): Live Synergos driver
+    """
+    def __init__(self, replica: OrchestratorReplica, driver: Driver):
+        self.replica = replica
+        self.driver = driver
+        for r_type in REPLICATED_RECORDS:
+            setattr(
+                self,
+                r_type,
+                ReplicaResource(r_type, replica, getattr(driver, r_type))
+            )
+
+
+    def __getattr__(self, name: str):
+        return getattr(self.driver, name)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+
+# Libs
+
+
+# Custom
+from views.core.comparison import flatten_hyperparameters
+from views.core.history import RUN_KEY_FIELDS, JobHistory
+from views.core.replica import generate_fingerprint
+from views.core.statistics import identify_record
+
+##################
+# Configurations #
+##################
+
+# Catalogue metadata that does not affect the outcome of a trial
+VOLATILE_FIELDS = ['doc_id', 'created_at', 'relations']
+
+# Precision (in decimal places) that float hyperparameters are compared at
+FLOAT_PRECISION = 12
+
+###########
+# Helpers #
+###########
+
+def canonicalize_value(value: Any) -> Any:
+    """ Normalizes a hyperparameter value, such that values that train
+        identically (eg. 1 & 1.0) are represented identically
+    """
+    if isinstance(value, bool):
+        return value
+
+    elif isinstance(value, float):
+        value = round(value, FLOAT_PRECISION)
+        return int(value) if value.is_integer() else value
+
+    return value
+
+
+def canonicalize_hyperparameters(record: Dict[str, Any]) -> Dict[str, Any]:
+    """ Flattens a run record (or a set of hyperparameters) into its
+        canonical form, independent of key order & catalogue metadata
+
+    Args:
+        record (dict): Run record, or hyperparameters declared for a run
+    Returns:
+        Canonical hyperparameters (dict)
+    """
+    return {
+        path: canonicalize_value(value)
+        for path, value in sorted(flatten_hyperparameters(record).items())
+    }
+
+
+def strip_volatile_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        field: value
+        for field, value in record.items()
+        if field not in VOLATILE_FIELDS
+    }
+
+
+def fingerprint_alignment(project_data: Dict[str, Any]) -> str:
+    """ Fingerprints the data a project's runs are trained on, i.e. the tags
+        declared by each participant & the alignments derived from them
+
+    Args:
+        project_data (dict): Project record, inclusive of its relations
+    Returns:
+        Fingerprint (str)
+    """
+    relations = project_data.get('relations', {}) or {}
+
+    tags = sorted(
+        [
+            strip_volatile_fields(tag_record)
+            for tag_record in relations.get('Tag', []) or []
+        ],
+        key=generate_fingerprint
+    )
+
+    alignments = sorted(
+        [
+            strip_volatile_fields(align_record)
+            for reg_record in relations.get('Registration', []) or []
+            for align_record in (
+                (reg_record.get('relations', {}) or {}).get('Alignment', []) or []
+            )
+        ],
+        key=generate_fingerprint
+    )
+    return generate_fingerprint({'tags': tags, 'alignments': alignments})
+
+##################################
+# Cache class - TrialResultCache #
+##################################
+
+class TrialResultCache:
+    """
+    Content-addressed index of a project's runs. Every run is addressed by
+    the fingerprint of its canonical hyperparameters, its experiment's model
+    architecture & the project's alignment state at the time the run was
+    submitted. Runs sharing a fingerprint train identical models, so any
+    completed (i.e. validated) run can stand in for its duplicates.
+
+    Run records do not capture the alignment they were trained on. Hence,
+    fingerprints are recorded in the job history store upon submission, and
+    runs without a recorded fingerprint (eg. those submitted elsewhere) are
+    never indexed, as the alignment they were trained on is unknown.
+
+    Attributes:
+        collab_id (str): ID of collaboration
+        project_id (str): ID of project
+        alignment_fingerprint (str): Fingerprint of current alignment state
+        architectures (dict): Experiment ID -> fingerprint of model architecture
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, collab_id: str = None, project_id: str = None):
+        self.collab_id = collab_id
+        self.project_id = project_id
+        self.alignment_fingerprint = None
+        self.architectures = {}
+        self._entries = {}
+        self._fingerprints = {}
+        self._completed = set()
+        self._signatures = {'Run': set(), 'Validation': set()}
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+
+    def fingerprint(
+        self,
+        expt_id: str,
+        hyperparameters: Dict[str, Any]
+    ) -> Optional[str]:
+        """ Addresses a set of hyperparameters trained under an experiment
+
+        Args:
+            expt_id (str): ID of experiment declaring the model architecture
+            hyperparameters (dict): Hyperparameters (or run record)
+        Returns:
+            Fingerprint (str), or None if the experiment is unknown
+        """
+        architecture = self.architectures.get(expt_id)
+        if architecture is None:
+            return None
+
+        return generate_fingerprint({
+            'architecture': architecture,
+            'hyperparameters': canonicalize_hyperparameters(hyperparameters),
+            'alignment': self.alignment_fingerprint
+        })
+
+
+    def lookup(
+        self,
+        expt_id: str,
+        hyperparameters: Dict[str, Any],
+        exclude: Dict[str, str] = None
+    ) -> Optional[Dict[str, str]]:
+        """ Finds a completed run that is an exact duplicate of a set of
+            hyperparameters trained under an experiment
+
+        Args:
+            expt_id (str): ID of experiment declaring the model architecture
+            hyperparameters (dict): Hyperparameters (or run record)
+            exclude (dict): Key of a run that may not be returned (eg. the
+                run being looked up)
+        Returns:
+            Key of duplicate run (dict), or None if there are none
+        """
+        excluded_identity = identify_record({'key': exclude or {}})
+        fingerprint = self.fingerprint(expt_id, hyperparameters)
+        with self._lock:
+            for identity in self._entries.get(fingerprint, []):
+                if identity in self._completed and identity != excluded_identity:
+                    return dict(identity)
+        return None
+
+
+    def duplicates(self) -> List[List[Dict[str, str]]]:
+        """ Groups indexed runs that are exact duplicates of one another
+
+        Returns:
+            Keys of duplicate runs, one group per fingerprint (list(list(dict)))
+        """
+        with self._lock:
+            return [
+                [dict(identity) for identity in identities]
+                for identities in self._entries.values()
+                if len(identities) > 1
+            ]
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _diff(self, relation: str, records: List[Dict[str, Any]]) -> Tuple[list, set]:
+        previous = self._signatures[relation]
+        current = {identify_record(record): record for record in records}
+        self._signatures[relation] = set(current)
+        added = [
+            (identity, record)
+            for identity, record in current.items()
+            if identity not in previous
+        ]
+        return added, previous - set(current)
+
+
+    def _read_recorded_fingerprints(self) -> Dict[tuple, str]:
+        """ Retrieves the fingerprints recorded upon submission for the runs
+            of the project, by run identity
+        """
+        if self.collab_id is None or self.project_id is None:
+            return {}
+
+        recorded = JobHistory.load().read_fingerprints(self.collab_id, self.project_id)
+        return {
+            identify_record({
+                'key': {field: row[field] for field in RUN_KEY_FIELDS}
+            }): row['fingerprint']
+            for row in recorded.to_dict('records')
+        }
+
+
+    def _index(self, identity: tuple, fingerprint: str):
+        # Re-indexed runs must not linger under their previous fingerprints
+        if self._fingerprints.get(identity) != fingerprint:
+            self._unindex(identity)
+        self._fingerprints[identity] = fingerprint
+        entries = self._entries.setdefault(fingerprint, [])
+        if identity not in entries:
+            entries.append(identity)
+
+
+    def _unindex(self, identity: tuple):
+        fingerprint = self._fingerprints.pop(identity, None)
+        entries = self._entries.get(fingerprint, [])
+        if identity in entries:
+            entries.remove(identity)
+            if not entries:
+                self._entries.pop(fingerprint)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def refresh(
+        self,
+        project_data: Dict[str, Any],
+        expt_data: List[Dict[str, Any]]
+    ) -> bool:
+        """ Indexes runs & validations added to a project since the previous
+            refresh. Added runs are indexed under the fingerprints recorded
+            upon their submission, if any.
+
+        Args:
+            project_data (dict): Project record, inclusive of its relations
+            expt_data (list(dict)): Experiment records of the project
+        Returns:
+            Change state (bool) - True if the index was updated
+        """
+        relations = project_data.get('relations', {}) or {}
+
+        with self._lock:
+            self.alignment_fingerprint = fingerprint_alignment(project_data)
+            self.architectures = {
+                expt_record.get('key', {}).get('expt_id'): generate_fingerprint(
+                    expt_record.get('model', [])
+                )
+                for expt_record in expt_data
+            }
+
+            added_runs, removed_runs = self._diff(
+                'Run',
+                relations.get('Run', []) or []
+            )
+            for identity in removed_runs:
+                self._unindex(identity)
+
+            recorded = self._read_recorded_fingerprints() if added_runs else {}
+            for identity, _ in added_runs:
+                fingerprint = recorded.get(identity)
+                if fingerprint is not None:
+                    self._index(identity, fingerprint)
+
+            # A run is completed once any participant has validated it
+            added_vals, removed_vals = self._diff(
+                'Validation',
+                relations.get('Validation', []) or []
+            )
+            if removed_vals:
+                self._completed = set()
+                added_vals = [
+                    (identity, None) for identity in self._signatures['Validation']
+                ]
+            for identity, _ in added_vals:
+                run_identity = tuple([
+                    (field, value)
+                    for field, value in identity
+                    if field != 'participant_id'
+                ])
+                self._completed.add(run_identity)
+
+        return bool(added_runs or removed_runs or added_vals or removed_vals)
+
+
+    def record(
+        self,
+        run_key: Dict[str, str],
+        hyperparameters: Dict[str, Any]
+    ) -> Optional[str]:
+        """ Fingerprints a run upon its submission from this UI against the
+            current alignment state, & persists the fingerprint in the job 
+            history store. The run is indexed ahead of the next refresh, 
+            replacing any fingerprint of a previous submission under the same
+            keys.
+
+        Args:
+            run_key (dict): Composite key of the run
+            hyperparameters (dict): Hyperparameters the run was declared with
+        Returns:
+            Fingerprint (str), or None if the experiment is unknown
+        """
+        with self._lock:
+            fingerprint = self.fingerprint(run_key.get('expt_id'), hyperparameters)
+            if fingerprint is None:
+                return None
+
+            identity = identify_record({'key': run_key})
+            JobHistory.load().record_fingerprint(dict(identity), fingerprint)
+            self._completed.discard(identity)
+            self._index(identity, fingerprint)
+            return fingerprint
+
+
+    def complete(self, run_key: Dict[str, str], val_data: Any):
+        """ Marks a recorded run as completed ahead of the next refresh, so 
+            that duplicates within the same batch of runs are also detected.
+            Runs are only completed if they were actually validated.
+
+        Args:
+            run_key (dict): Composite key of the run
+            val_data (Any): Validation records retrieved for the run
+        """
+        identity = identify_record({'key': run_key})
+        with self._lock:
+            if val_data and identity in self._fingerprints:
+                self._completed.add(identity)
+
+
+    @classmethod
+    def load(
+        cls,
+        address: Tuple[str, int],
+        collab_id: str,
+        project_id: str
+    ) -> "TrialResultCache":
+        """ Retrieves the result cache of the specified project, creating it
+            if it does not exist yet. Caches are shared across sessions &
+            reruns connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            collab_id (str): ID of collaboration
+            project_id (str): ID of project
+        Returns:
+            Project-specific result cache (TrialResultCache)
+        """
+        if address is None:
+            return cls(collab_id, project_id)
+
+        with cls.__registry_lock:
+            registry_key = (address, collab_id, project_id)
+            if registry_key not in cls.__registry:
+                cls.__registry[registry_key] = cls(collab_id, project_id)
+            return cls.__registry[registry_key]
@@ -0,0 +1,527 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Any, Generator, Optional
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from synergos import Driver
+from views.core.history import JobHistory
+from views.core.leaderboard import Leaderboard
+from views.core.result_cache import TrialResultCache
+from views.core.search_space import SearchSpace
+
+##################
+# Configurations #
+##################
+
+SUPPORTED_STRATEGIES = ["Random", "Latin hypercube", "Grid"]
+
+SUPPORTED_PRUNERS = ["None", "Median stopping", "Successive halving"]
+
+TRIAL_STATUSES = ["pending", "running", "completed", "pruned", "failed"]
+
+# No. of low-fidelity results required before median stopping prunes trials
+MEDIAN_STOPPING_WARMUP = 3
+
+TRIAL_COLUMNS = [
+    'run_id', 'config_id', 'rung', 'budget', 'status', 'score', 'duration',
+    'reused_from'
+]
+
+###########
+# Helpers #
+###########
+
+def compute_rungs(
+    pruner: str,
+    min_budget: int,
+    max_budget: int,
+    eta: int = 3
+) -> List[int]:
+    """ Derives the budgets (eg. no. of rounds) trials are trained with at
+        every rung of the specified pruner
+
+    Args:
+        pruner (str): One of SUPPORTED_PRUNERS
+        min_budget (int): Budget of the lowest rung
+        max_budget (int): Budget of fully trained trials
+        eta (int): Reduction factor between rungs of successive halving
+    Returns:
+        Budgets, lowest rung first (list(int))
+    """
+    if pruner == SUPPORTED_PRUNERS[0] or min_budget >= max_budget:
+        return [max_budget]
+
+    elif pruner == SUPPORTED_PRUNERS[1]:
+        return [min_budget, max_budget]
+
+    rungs = [min_budget]
+    while rungs[-1] * eta < max_budget:
+        rungs.append(rungs[-1] * eta)
+    return rungs + [max_budget]
+
+#######################
+# Trial class - Trial #
+#######################
+
+class Trial:
+    """
+    A single run launched by the scheduler, training one configuration of
+    hyperparameters at the budget of one rung
+
+    Attributes:
+        config_id (int): Index of the trained configuration
+        hyperparameters (dict): Configuration of hyperparameters
+        rung (int): Index of rung the trial was launched at
+        budget (int): Budget the trial is trained with
+        run_id (str): ID of the run created for the trial
+        status (str): One of TRIAL_STATUSES
+        score (float): Grid-wide validation score of the tuned metric
+        error (str): Error raised by a failed trial
+        started_at (float): Time trial was launched
+        ended_at (float): Time trial was completed
+        is_promoted (bool): Whether the trial was promoted to the next rung
+        reused_from (str): ID of an identical run whose results were reused
+    """
+    def __init__(
+        self,
+        config_id: int,
+        hyperparameters: Dict[str, Any],
+        rung: int,
+        budget: int,
+        run_id: str
+    ):
+        self.config_id = config_id
+        self.hyperparameters = hyperparameters
+        self.rung = rung
+        self.budget = budget
+        self.run_id = run_id
+        self.status = TRIAL_STATUSES[0]
+        self.score = None
+        self.error = None
+        self.started_at = None
+        self.ended_at = None
+        self.is_promoted = False
+        self.reused_from = None
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started_at is None:
+            return None
+        return (self.ended_at or time.time()) - self.started_at
+
+####################################
+# Scheduler class - TrialScheduler #
+####################################
+
+class TrialScheduler:
+    """
+    Local scheduler for hyperparameter tuning. Configurations are lazily
+    drawn from a search space, created as runs & pushed through the model &
+    validation pipeline, with exactly `trial_concurrency` trials in flight.
+    Poor trials are pruned early, based on validation scores obtained at
+    lower budgets:
+
+    1. Median stopping     - Trials are first trained at `min_budget`, and
+                             only trained fully if they score no worse than
+                             the median of all trials at `min_budget`
+    2. Successive halving  - Asynchronous successive halving (ASHA). A trial
+                             is promoted to the next rung (i.e. `eta` times
+                             the budget) once it ranks within the top 1/`eta`
+                             of its rung
+
+    If a result cache is declared, trials duplicating a completed run (i.e.
+    same hyperparameters, model architecture & alignment state) are created
+    as runs linked to its results in the job history, instead of being 
+    retrained, and do not spend any budget.
+
+    Tuning ends once `max_trial_num` full-budget trials' worth of budget is
+    spent, or the time budget has elapsed. Since federated jobs cannot be
+    cancelled, trials in flight at that point are still run to completion.
+
+    Attributes:
+        driver (Driver): Synergos abstraction object to facilitate REST operations
+        filters (dict): Composite key set identifying a specific experiment
+        search_space (SearchSpace): Space to draw configurations from
+        action (str): ML operation of the project
+        metric (str): Metric to optimize
+        optimize_mode (str): Direction of optimization (i.e. 'max' or 'min')
+        trial_concurrency (int): No. of trials in flight
+        max_trial_num (int): Budget, in full-budget trials
+        max_exec_duration (float): Time budget in seconds (None if unbounded)
+        rungs (list(int)): Budgets of every rung
+        result_cache (TrialResultCache): Index of completed runs to reuse
+        trials (list(Trial)): All trials launched
+    """
+    def __init__(
+        self,
+        driver: Driver,
+        filters: Dict[str, str],
+        search_space: SearchSpace,
+        waiter: Callable,
+        action: str = "classify",
+        metric: str = "accuracy",
+        optimize_mode: str = "max",
+        trial_concurrency: int = 1,
+        max_trial_num: int = 10,
+        max_exec_duration: float = None,
+        strategy: str = "Random",
+        pruner: str = "None",
+        budget_param: str = "rounds",
+        min_budget: int = 1,
+        max_budget: int = 10,
+        eta: int = 3,
+        run_prefix: str = "trial",
+        seed: int = None,
+        result_cache: TrialResultCache = None,
+        pipeline_kwargs: Dict[str, Any] = {}
+    ):
+        if strategy not in SUPPORTED_STRATEGIES:
+            raise ValueError(
+                f"Unsupported strategy '{strategy}'! Supported strategies: {SUPPORTED_STRATEGIES}"
+            )
+        if pruner not in SUPPORTED_PRUNERS:
+            raise ValueError(
+                f"Unsupported pruner '{pruner}'! Supported pruners: {SUPPORTED_PRUNERS}"
+            )
+
+        # Budgets are injected into every trial's hyperparameters, & would
+        # otherwise silently overwrite any sampled value of the same name
+        if budget_param in [parameter.name for parameter in search_space.parameters]:
+            raise ValueError(
+                f"Budget hyperparameter '{budget_param}' is also declared in the search space! Please remove it from the search space, or select another budget hyperparameter."
+            )
+
+        # Unscorable metrics would only surface after a trial has been run
+        supported_metrics = Leaderboard(action=action).metrics
+        if metric not in supported_metrics:
+            raise ValueError(
+                f"Unsupported metric '{metric}' for '{action}' projects! Supported metrics: {supported_metrics}"
+            )
+
+        self.driver = driver
+        self.filters = {
+            'collab_id': filters.get('collab_id'),
+            'project_id': filters.get('project_id'),
+            'expt_id': filters.get('expt_id')
+        }
+        self.search_space = search_space
+        self.waiter = waiter
+        self.action = action
+        self.metric = metric
+        self.optimize_mode = optimize_mode
+        self.trial_concurrency = max(int(trial_concurrency), 1)
+        self.max_trial_num = max_trial_num
+        self.max_exec_duration = max_exec_duration
+        self.strategy = strategy
+        self.pruner = pruner
+        self.budget_param = budget_param
+        self.max_budget = max_budget
+        self.eta = max(int(eta), 2)
+        self.rungs = compute_rungs(pruner, min_budget, max_budget, self.eta)
+        self.run_prefix = run_prefix
+        self.seed = seed
+        self.result_cache = result_cache
+        self.pipeline_kwargs = pipeline_kwargs
+        self.trials = []
+        self._configs = self._generate_configs()
+        self._config_count = 0
+        self._promotions = []
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def spent(self) -> float:
+        """ Budget spent on launched trials, in full-budget trials """
+        return sum(
+            trial.budget 
+            for trial in self.trials 
+            if trial.reused_from is None
+        ) / self.max_budget
+
+
+    def summarize(self) -> pd.DataFrame:
+        """ Tabulates all launched trials, best trials first
+
+        Returns:
+            Trials (pd.DataFrame)
+        """
+        trials = pd.DataFrame(
+            [
+                {
+                    **trial.hyperparameters,
+                    **{column: getattr(trial, column) for column in TRIAL_COLUMNS}
+                }
+                for trial in self.trials
+            ]
+        )
+        if trials.empty:
+            return pd.DataFrame(columns=TRIAL_COLUMNS)
+
+        trials = trials[
+            TRIAL_COLUMNS + 
+            [column for column in trials.columns if column not in TRIAL_COLUMNS]
+        ]
+
+        return trials.sort_values(
+            by=['rung', 'score'],
+            ascending=[False, self.optimize_mode == "min"],
+            na_position="last"
+        ).reset_index(drop=True)
+
+
+    def best(self) -> Optional[Trial]:
+        """ Retrieves the best trial trained at the highest rung reached """
+        scored_trials = [
+            trial for trial in self.trials
+            if trial.score is not None
+        ]
+        if not scored_trials:
+            return None
+
+        top_rung = max(trial.rung for trial in scored_trials)
+        return sorted(
+            [trial for trial in scored_trials if trial.rung == top_rung],
+            key=lambda trial: trial.score,
+            reverse=(self.optimize_mode == "max")
+        )[0]
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _generate_configs(self) -> Generator[Dict[str, Any], None, None]:
+        """ Lazily draws configurations from the search space. Samplers are
+            sized to the most configurations the budget could ever afford
+            (i.e. if every trial were pruned at the lowest rung).
+        """
+        if self.strategy == "Grid":
+            return self.search_space.grid()
+
+        max_config_count = math.ceil(
+            self.max_trial_num * self.max_budget / self.rungs[0]
+        )
+        if self.strategy == "Latin hypercube":
+            return self.search_space.latin_hypercube(max_config_count, self.seed)
+        return self.search_space.random(max_config_count, self.seed)
+
+
+    def _rank(self, trials: List[Trial]) -> List[Trial]:
+        return sorted(
+            trials,
+            key=lambda trial: trial.score,
+            reverse=(self.optimize_mode == "max")
+        )
+
+
+    def _is_pruned_by_median(self, trial: Trial) -> bool:
+        """ Checks if a trial scored worse than the median of all trials
+            completed at its rung
+        """
+        rung_scores = [
+            other.score for other in self.trials
+            if other.rung == trial.rung and other.score is not None
+        ]
+        if len(rung_scores) < MEDIAN_STOPPING_WARMUP:
+            return False
+
+        median = float(np.median(rung_scores))
+        return (
+            trial.score < median
+            if self.optimize_mode == "max"
+            else trial.score > median
+        )
+
+
+    def _find_promotion(self) -> Optional[Trial]:
+        """ Finds the trial due for promotion to its next rung, searching
+            from the highest rung downwards
+        """
+        if self.pruner == SUPPORTED_PRUNERS[1]:
+            return self._promotions.pop(0) if self._promotions else None
+
+        for rung in reversed(range(len(self.rungs) - 1)):
+            rung_trials = [
+                trial for trial in self.trials
+                if trial.rung == rung and trial.score is not None
+            ]
+            top_count = len(rung_trials) // self.eta
+            for trial in self._rank(rung_trials)[:top_count]:
+                if not trial.is_promoted:
+                    return trial
+        return None
+
+
+    def _next_trial(self) -> Optional[Trial]:
+        """ Generates the next trial to launch, prioritising promotions over
+            new configurations. No trial is generated once the budget is spent.
+        """
+        promoted_trial = self._find_promotion()
+        if promoted_trial is not None:
+            config_id = promoted_trial.config_id
+            hyperparameters = promoted_trial.hyperparameters
+            rung = promoted_trial.rung + 1
+        else:
+            hyperparameters = next(self._configs, None)
+            if hyperparameters is None:
+                return None
+            config_id = self._config_count
+            rung = 0
+
+        budget = self.rungs[rung]
+        if self.spent + budget / self.max_budget > self.max_trial_num + 1e-9:
+            if promoted_trial is not None:
+                self._promotions.insert(0, promoted_trial)
+            return None
+
+        if promoted_trial is not None:
+            promoted_trial.is_promoted = True
+        else:
+            self._config_count += 1
+
+        trial = Trial(
+            config_id=config_id,
+            hyperparameters={**hyperparameters, self.budget_param: budget},
+            rung=rung,
+            budget=budget,
+            run_id=f"{self.run_prefix}-{config_id:04d}-r{rung}"
+        )
+        self.trials.append(trial)
+        return trial
+
+
+    def _score(
+        self, 
+        run_keys: Dict[str, str], 
+        val_data: List[Dict[str, Any]]
+    ) -> float:
+        """ Aggregates participants' validation scores of the tuned metric """
+        leaderboard = Leaderboard(action=self.action)
+        leaderboard.extend(val_data if isinstance(val_data, list) else [val_data])
+        aggregated = leaderboard.aggregate("mean")
+        return float(
+            aggregated.loc[(run_keys['expt_id'], run_keys['run_id']), self.metric]
+        )
+
+
+    def _run(self, trial: Trial) -> float:
+        """ Pushes a trial through the run, model & validation pipeline. Trials
+            duplicating a completed run are only created as runs, & linked to
+            the results of the completed run.
+
+        Args:
+            trial (Trial): Trial to be run
+        Returns:
+            Grid-wide validation score (float)
+        """
+        run_keys = {**self.filters, 'run_id': trial.run_id}
+        cached_keys = (
+            self.result_cache.lookup(self.filters['expt_id'], trial.hyperparameters)
+            if self.result_cache is not None
+            else None
+        )
+
+        self.driver.runs.create(**self.filters, run_id=trial.run_id, **trial.hyperparameters)
+        if cached_keys:
+            trial.reused_from = cached_keys['run_id']
+            JobHistory.load().record_reuse(run_keys, cached_keys, p_type="optimization")
+            val_data = self.driver.validations.read(**cached_keys).get('data', [])
+            return self._score(cached_keys, val_data)
+
+        if self.result_cache is not None:
+            self.result_cache.record(run_keys, trial.hyperparameters)
+
+        self.driver.models.create(**run_keys, dockerised=True, **self.pipeline_kwargs)
+        self.waiter(self.driver.models, run_keys)
+
+        self.driver.validations.create(**run_keys, dockerised=True, **self.pipeline_kwargs)
+        self.waiter(self.driver.validations, run_keys)
+
+        val_data = self.driver.validations.read(**run_keys).get('data', [])
+        if self.result_cache is not None:
+            self.result_cache.complete(run_keys, val_data)
+        return self._score(run_keys, val_data)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def run(self, on_update: Callable = None) -> List[Trial]:
+        """ Runs trials until the trial or time budget is spent
+
+        Args:
+            on_update (callable): Function invoked with every trial that is
+                launched or completed (eg. to report progress)
+        Returns:
+            All trials (list(Trial))
+        """
+        deadline = (
+            time.time() + self.max_exec_duration
+            if self.max_exec_duration
+            else math.inf
+        )
+
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.trial_concurrency) as pool:
+            while True:
+                while len(in_flight) < self.trial_concurrency and time.time() < deadline:
+                    trial = self._next_trial()
+                    if trial is None:
+                        break
+                    trial.status = TRIAL_STATUSES[1]
+                    trial.started_at = time.time()
+                    in_flight[pool.submit(self._run, trial)] = trial
+                    if on_update:
+                        on_update(trial)
+
+                if not in_flight:
+                    break
+
+                completed_futures, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in completed_futures:
+                    trial = in_flight.pop(future)
+                    trial.ended_at = time.time()
+                    try:
+                        trial.score = future.result()
+                        trial.status = TRIAL_STATUSES[2]
+                    except Exception as e:
+                        trial.status = TRIAL_STATUSES[4]
+                        trial.error = str(e)
+
+                    is_intermediate = (
+                        trial.status == TRIAL_STATUSES[2] and
+                        trial.rung < len(self.rungs) - 1
+                    )
+                    if is_intermediate and self.pruner == SUPPORTED_PRUNERS[1]:
+                        if self._is_pruned_by_median(trial):
+                            trial.status = TRIAL_STATUSES[3]
+                        else:
+                            self._promotions.append(trial)
+
+                    if on_update:
+                        on_update(trial)
+
+        # Intermediate trials that were never promoted were pruned
+        for trial in self.trials:
+            is_intermediate = trial.rung < len(self.rungs) - 1
+            if is_intermediate and trial.status == TRIAL_STATUSES[2] and not trial.is_promoted:
+                trial.status = TRIAL_STATUSES[3]
+
+        return self.trials
@@ -0,0 +1,467 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import numbers
+import re
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Dict, List, Any, Tuple
+
+# Libs
+
+
+# Custom
+from config import SEARCH_REFRESH_INTERVAL
+from synergos import Driver
+from views.core.replica import generate_fingerprint
+
+##################
+# Configurations #
+##################
+
+# Searchable records, mapped to their composite keys (in hierarchical order)
+SEARCHABLE_RECORDS = {
+    'collaborations': ['collab_id'],
+    'projects': ['collab_id', 'project_id'],
+    'experiments': ['collab_id', 'project_id', 'expt_id'],
+    'runs': ['collab_id', 'project_id', 'expt_id', 'run_id'],
+    'registrations': ['collab_id', 'project_id', 'participant_id'],
+    'tags': ['collab_id', 'project_id', 'participant_id']
+}
+
+# Fields that are never indexed (i.e. catalogue metadata & nested relations)
+EXCLUDED_FIELDS = ['doc_id', 'kind', 'relations']
+
+TOKEN_PATTERN = re.compile(r"[\w\.\-]+")
+RANGE_PATTERN = re.compile(r"^([\w\-]+):(-?[\d\.e\-]*)\.\.(-?[\d\.e\-]*)$")
+
+###########
+# Helpers #
+###########
+
+def flatten_record(
+    record: Any,
+    field: str = ""
+) -> List[Tuple[str, Any]]:
+    """ Flattens a (nested) archival record into (leaf field name, value)
+        pairs. List indexes are dropped, so that eg. every layer's
+        `in_features` in an experiment's model is indexed under the same field.
+
+    Args:
+        record (Any): Archival record, or any nested value within it
+        field (str): Name of the field `record` was found under
+    Returns:
+        Leaf fields & values (list(tuple))
+    """
+    if isinstance(record, dict):
+        return [
+            pair
+            for name, value in record.items()
+            if name not in EXCLUDED_FIELDS
+            for pair in flatten_record(value, str(name).lower())
+        ]
+
+    elif isinstance(record, (list, tuple)):
+        return [
+            pair
+            for value in record
+            for pair in flatten_record(value, field)
+        ]
+
+    return [(field, record)]
+
+
+def tokenize(value: Any) -> List[str]:
+    """ Splits any value into lowercased search terms
+
+    Args:
+        value (Any): Value to tokenize
+    Returns:
+        Terms (list(str))
+    """
+    return TOKEN_PATTERN.findall(str(value).lower())
+
+####################################
+# Custom Index class - SearchIndex #
+####################################
+
+class SearchIndex:
+    """
+    In-process inverted index over collaboration, project, experiment (incl.
+    model architectures), run (incl. hyperparameters), registration and tag
+    records of a single orchestrator. Every value is indexed both as a bare
+    term and as a field-scoped term (eg. `l_type:linear`), while numeric
+    values are additionally kept in per-field sorted arrays for range queries.
+
+    Supported query clauses (space-separated, all clauses must match):
+        linear              Term in any field
+        l_type:linear       Term in a specific field
+        fed*  /  algo:fed*  Prefix in any/a specific field
+        lr:0.001..0.01      Numeric range in a field (either end may be open)
+
+    Attributes:
+        interval (float): Time (in seconds) before the index is resynced
+        last_synced (float): Time at which the last sync completed
+        last_error (Exception): Error raised in the latest failed background
+            sync, if any
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, interval: float = SEARCH_REFRESH_INTERVAL):
+        self.interval = interval
+        self.last_synced = None
+        self.last_error = None
+        self._syncer = None
+        self._docs = {}         # doc ID -> document metadata
+        self._doc_ids = {}      # (r_type, key) -> doc ID
+        self._postings = {}     # term -> set of doc IDs
+        self._terms = []        # all terms, sorted (for prefix lookups)
+        self._numerics = {}     # field -> sorted list of (value, doc ID)
+        self._next_doc_id = 0
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+
+    def is_stale(self) -> bool:
+        """ Checks if the index has to be resynced
+
+        Returns:
+            Staleness (bool)
+        """
+        return (
+            self.last_synced is None or
+            (time.time() - self.last_synced) > self.interval
+        )
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _add_term(self, term: str, doc_id: int):
+        postings = self._postings.get(term)
+        if postings is None:
+            postings = self._postings[term] = set()
+            insort(self._terms, term)
+        postings.add(doc_id)
+
+
+    def _remove_term(self, term: str, doc_id: int):
+        postings = self._postings.get(term, set())
+        postings.discard(doc_id)
+        if not postings:
+            self._postings.pop(term, None)
+            term_idx = bisect_left(self._terms, term)
+            if term_idx < len(self._terms) and self._terms[term_idx] == term:
+                del self._terms[term_idx]
+
+
+    def _match_term(self, term: str) -> set:
+        return set(self._postings.get(term, set()))
+
+
+    def _match_prefix(self, prefix: str) -> set:
+        start = bisect_left(self._terms, prefix)
+        end = bisect_left(self._terms, prefix + "\uffff")
+        matches = set()
+        for term in self._terms[start:end]:
+            matches.update(self._postings[term])
+        return matches
+
+
+    def _match_range(self, field: str, lower: float, upper: float) -> set:
+        entries = self._numerics.get(field, [])
+        start = 0 if lower is None else bisect_left(entries, (lower, -1))
+        end = (
+            len(entries)
+            if upper is None
+            else bisect_right(entries, (upper, float('inf')))
+        )
+        return {doc_id for _, doc_id in entries[start:end]}
+
+
+    def _match_clause(self, clause: str) -> set:
+        """ Resolves a single query clause into matching doc IDs """
+        range_match = RANGE_PATTERN.match(clause)
+        if range_match:
+            field, lower, upper = range_match.groups()
+            try:
+                return self._match_range(
+                    field=field,
+                    lower=float(lower) if lower else None,
+                    upper=float(upper) if upper else None
+                )
+            except ValueError:
+                return set()
+
+        field, _, value = clause.rpartition(":")
+        scope = f"{field}:" if field else ""
+        if value.endswith("*"):
+            return self._match_prefix(scope + value[:-1])
+
+        # Values are tokenized the same way they were indexed
+        value_terms = tokenize(value) or [value]
+        matches = self._match_term(scope + value_terms[0])
+        for term in value_terms[1:]:
+            matches &= self._match_term(scope + term)
+        return matches
+
+    ##################
+    # Core functions #
+    ##################
+
+    def update(self, r_type: str, record: Dict[str, Any], **parent_key: str) -> bool:
+        """ Indexes (or reindexes) a single record. Records whose content has
+            not changed since they were last indexed are skipped.
+
+        Args:
+            r_type (str): Type of record (eg. 'runs')
+            record (dict): Archival record
+            parent_key (dict): Composite key of the record's parent, for
+                records which do not carry their own full key
+        Returns:
+            Indexed state (bool) - False if record was unchanged or unkeyed
+        """
+        record_key = record.get('key', {})
+        key = tuple([
+            record_key.get(field) or parent_key.get(field)
+            for field in SEARCHABLE_RECORDS[r_type]
+        ])
+        if not all(key):
+            return False
+
+        fingerprint = generate_fingerprint(record)
+
+        with self._lock:
+            existing_id = self._doc_ids.get((r_type, key))
+            if existing_id is not None:
+                if self._docs[existing_id]['fingerprint'] == fingerprint:
+                    return False
+                self.remove(r_type, **dict(zip(SEARCHABLE_RECORDS[r_type], key)))
+
+            doc_id = self._next_doc_id
+            self._next_doc_id += 1
+
+            terms = set()
+            numerics = set()
+            for field, value in flatten_record(record):
+                for term in tokenize(value):
+                    terms.add(term)
+                    terms.add(f"{field}:{term}")
+                if (
+                    isinstance(value, numbers.Number) and
+                    not isinstance(value, bool)
+                ):
+                    numerics.add((field, float(value)))
+
+            for term in terms:
+                self._add_term(term, doc_id)
+            for field, value in numerics:
+                insort(self._numerics.setdefault(field, []), (value, doc_id))
+
+            self._docs[doc_id] = {
+                'r_type': r_type,
+                'key': dict(zip(SEARCHABLE_RECORDS[r_type], key)),
+                'fingerprint': fingerprint,
+                'terms': terms,
+                'numerics': numerics
+            }
+            self._doc_ids[(r_type, key)] = doc_id
+
+        return True
+
+
+    def remove(self, r_type: str, **key: str) -> bool:
+        """ Removes a single record from the index
+
+        Args:
+            r_type (str): Type of record (eg. 'runs')
+            key (dict): Composite key of the record
+        Returns:
+            Removed state (bool)
+        """
+        key_values = tuple([key.get(field) for field in SEARCHABLE_RECORDS[r_type]])
+
+        with self._lock:
+            doc_id = self._doc_ids.pop((r_type, key_values), None)
+            if doc_id is None:
+                return False
+
+            doc = self._docs.pop(doc_id)
+            for term in doc['terms']:
+                self._remove_term(term, doc_id)
+            for field, value in doc['numerics']:
+                entries = self._numerics.get(field, [])
+                entry_idx = bisect_left(entries, (value, doc_id))
+                if entry_idx < len(entries) and entries[entry_idx] == (value, doc_id):
+                    del entries[entry_idx]
+
+        return True
+
+
+    def search(
+        self,
+        query: str,
+        levels: List[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """ Resolves a query against the index
+
+        Args:
+            query (str): Space-separated query clauses (see class docstring)
+            levels (list(str)): Record types to restrict results to. Facet
+                counts are always computed across all types.
+        Returns:
+            Matching records' types & keys (list(dict))
+            Facet counts per record type (dict)
+        """
+        clauses = query.lower().split()
+        if not clauses:
+            return [], {}
+
+        with self._lock:
+            matches = self._match_clause(clauses[0])
+            for clause in clauses[1:]:
+                if not matches:
+                    break
+                matches &= self._match_clause(clause)
+
+            matched_docs = [self._docs[doc_id] for doc_id in matches]
+
+        facets = dict(Counter([doc['r_type'] for doc in matched_docs]))
+        level_order = list(SEARCHABLE_RECORDS.keys())
+        results = sorted(
+            [
+                {'r_type': doc['r_type'], 'key': doc['key']}
+                for doc in matched_docs
+                if not levels or doc['r_type'] in levels
+            ],
+            key=lambda result: (
+                level_order.index(result['r_type']),
+                tuple(result['key'].values())
+            )
+        )
+        return results, facets
+
+
+    def sync(self, driver: Driver) -> int:
+        """ Walks all searchable records of an orchestrator, indexing new or
+            changed records and removing records that no longer exist
+
+        Args:
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+        Returns:
+            No. of records (re)indexed (int)
+        """
+        def extract_records(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+            return response.get('data', []) or []
+
+        indexed_count = 0
+        seen = set()
+
+        def index_record(r_type: str, record: Dict[str, Any], **parent_key):
+            nonlocal indexed_count
+            indexed_count += self.update(r_type, record, **parent_key)
+            record_key = record.get('key', {})
+            seen.add((r_type, tuple([
+                record_key.get(field) or parent_key.get(field)
+                for field in SEARCHABLE_RECORDS[r_type]
+            ])))
+
+        for collab_record in extract_records(driver.collaborations.read_all()):
+            index_record('collaborations', collab_record)
+            collab_key = {'collab_id': collab_record.get('key', {}).get('collab_id')}
+
+            for project_record in extract_records(driver.projects.read_all(**collab_key)):
+                index_record('projects', project_record, **collab_key)
+                project_key = {
+                    **collab_key,
+                    'project_id': project_record.get('key', {}).get('project_id')
+                }
+
+                for reg_record in extract_records(
+                    driver.registrations.read_all(**project_key)
+                ):
+                    index_record('registrations', reg_record, **project_key)
+                    reg_key = {
+                        **project_key,
+                        'participant_id': reg_record.get('key', {}).get('participant_id')
+                    }
+                    for tag_record in reg_record.get('relations', {}).get('Tag', []):
+                        index_record('tags', tag_record, **reg_key)
+
+                for expt_record in extract_records(
+                    driver.experiments.read_all(**project_key)
+                ):
+                    index_record('experiments', expt_record, **project_key)
+                    expt_key = {
+                        **project_key,
+                        'expt_id': expt_record.get('key', {}).get('expt_id')
+                    }
+
+                    for run_record in extract_records(driver.runs.read_all(**expt_key)):
+                        index_record('runs', run_record, **expt_key)
+
+        with self._lock:
+            for (r_type, key) in set(self._doc_ids.keys()) - seen:
+                self.remove(r_type, **dict(zip(SEARCHABLE_RECORDS[r_type], key)))
+            self.last_synced = time.time()
+
+        return indexed_count
+
+
+    def sync_in_background(self, driver: Driver) -> threading.Thread:
+        """ Resyncs the index in a daemon thread, so that queries are served
+            from the current index in the meantime. At most one background
+            sync runs at any time.
+
+        Args:
+            driver (Driver): Synergos abstraction object to facilitate REST operations
+        Returns:
+            Background sync (threading.Thread)
+        """
+        def run_sync():
+            try:
+                self.sync(driver)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+
+        with self._lock:
+            if self._syncer is None or not self._syncer.is_alive():
+                self._syncer = threading.Thread(target=run_sync, daemon=True)
+                self._syncer.start()
+            return self._syncer
+
+
+    @classmethod
+    def load(cls, address: Tuple[str, int]) -> "SearchIndex":
+        """ Retrieves the search index of the specified orchestrator, creating
+            an empty one if it does not exist yet. Indexes are shared across
+            sessions & reruns connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+        Returns:
+            Orchestrator-specific index (SearchIndex)
+        """
+        if address is None:
+            return cls()
+
+        with cls.__registry_lock:
+            index = cls.__registry.get(address)
+            if index is None:
+                index = cls.__registry[address] = cls()
+
+        return index
@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import math
+from typing import Dict, List, Any, Generator, Union
+
+# Libs
+import numpy as np
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+# NNI parameter types, mapped to the no. of arguments in their `_value`
+SUPPORTED_TYPES = {
+    'choice': None,
+    'randint': 2,
+    'uniform': 2,
+    'quniform': 3,
+    'loguniform': 2,
+    'qloguniform': 3,
+    'normal': 2,
+    'qnormal': 3,
+    'lognormal': 2,
+    'qlognormal': 3
+}
+
+# Parameter types whose (unquantized) values lie on a log scale
+LOG_TYPES = ['loguniform', 'qloguniform', 'lognormal', 'qlognormal']
+
+# Parameter types parameterized by a mean & standard deviation
+NORMAL_TYPES = ['normal', 'qnormal', 'lognormal', 'qlognormal']
+
+# No. of points continuous parameters are discretized into for grid searches
+GRID_RESOLUTION = 5
+
+###########
+# Helpers #
+###########
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def normal_ppf(u: float) -> float:
+    """ Inverts the cumulative distribution function of the standard normal
+        distribution via Newton's method
+
+    Args:
+        u (float): Cumulative probability, in (0, 1)
+    Returns:
+        Standard score (float)
+    """
+    u = min(max(u, 1e-12), 1 - 1e-12)
+    x = 0.0
+    for _ in range(100):
+        error = 0.5 * (1 + math.erf(x / math.sqrt(2))) - u
+        if abs(error) < 1e-12:
+            break
+        x -= error / (math.exp(-x * x / 2) / math.sqrt(2 * math.pi))
+    return x
+
+
+def validate_search_space(spec: Any, path: str = "") -> List[str]:
+    """ Validates an NNI-style search space, where every parameter is declared
+        as {"_type": ..., "_value": [...]}. Nested search spaces are declared
+        as choices of mappings, each named by "_name".
+
+    Args:
+        spec (Any): Search space, as uploaded
+        path (str): Path of a nested search space
+    Returns:
+        Errors, each prefixed by the offending parameter's path (list(str))
+    """
+    if not isinstance(spec, dict) or not spec:
+        return [f"{path or 'search space'}: Must be a non-empty mapping of parameters"]
+
+    errors = []
+    for name, declaration in spec.items():
+        param_path = f"{path}.{name}" if path else name
+        if path and name == "_name":
+            continue
+
+        if not isinstance(declaration, dict):
+            errors.append(f"{param_path}: Must be a mapping with '_type' & '_value'")
+            continue
+
+        p_type = declaration.get('_type')
+        values = declaration.get('_value')
+        if p_type not in SUPPORTED_TYPES:
+            errors.append(
+                f"{param_path}: Unsupported type '{p_type}'! Supported types: {list(SUPPORTED_TYPES)}"
+            )
+            continue
+        if not isinstance(values, list):
+            errors.append(f"{param_path}: '_value' must be a list")
+            continue
+
+        if p_type == "choice":
+            if not values:
+                errors.append(f"{param_path}: Must declare at least 1 choice")
+            for idx, option in enumerate(values):
+                if isinstance(option, dict):
+                    if '_name' not in option:
+                        errors.append(f"{param_path}[{idx}]: Nested search spaces must declare a '_name'")
+                    elif len(option) > 1:
+                        errors.extend(validate_search_space(
+                            option,
+                            f"{param_path}[{option['_name']}]"
+                        ))
+            continue
+
+        arg_count = SUPPORTED_TYPES[p_type]
+        if len(values) != arg_count or not all(is_number(value) for value in values):
+            errors.append(f"{param_path}: '{p_type}' takes exactly {arg_count} numbers")
+            continue
+
+        if p_type in NORMAL_TYPES:
+            if values[1] <= 0:
+                errors.append(f"{param_path}: Standard deviation must be positive")
+        else:
+            low, high = values[:2]
+            if low >= high:
+                errors.append(f"{param_path}: Lower bound must be less than upper bound")
+            if p_type in LOG_TYPES and low <= 0:
+                errors.append(f"{param_path}: Lower bound must be positive on a log scale")
+            if p_type == "randint" and not all(
+                float(value).is_integer() for value in values
+            ):
+                errors.append(f"{param_path}: Bounds of 'randint' must be integers")
+
+        if arg_count == 3 and values[2] <= 0:
+            errors.append(f"{param_path}: Quantization step must be positive")
+
+    return errors
+
+##################################
+# Search Space class - Parameter #
+##################################
+
+class Parameter:
+    """
+    A single dimension of a search space, exposing its cardinality, a lazy
+    enumeration of its values, as well as random & stratified sampling
+
+    Attributes:
+        name (str): Name of parameter
+        p_type (str): One of SUPPORTED_TYPES
+        values (list): Arguments of the parameter (i.e. its `_value`)
+        options (list): Nested search spaces (or None) of every choice
+    """
+    def __init__(self, name: str, p_type: str, values: List[Any]):
+        self.name = name
+        self.p_type = p_type
+        self.values = values
+        self.options = [
+            SearchSpace({
+                option_name: option_value
+                for option_name, option_value in option.items()
+                if option_name != "_name"
+            }) if isinstance(option, dict) and len(option) > 1 else None
+            for option in (values if p_type == "choice" else [])
+        ]
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def cardinality(self) -> Union[int, float]:
+        """ No. of distinct values of the parameter, or infinity if it is
+            continuous or unbounded
+        """
+        if self.p_type == "choice":
+            return sum(
+                option.cardinality if option else 1
+                for option in self.options
+            )
+        elif self.p_type == "randint":
+            return int(self.values[1] - self.values[0])
+        elif self.p_type in ["quniform", "qloguniform"]:
+            low, high, q = self.values
+            return int(math.ceil(high / q) - math.floor(low / q) + 1)
+        return math.inf
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _quantize(self, value: float) -> float:
+        if self.p_type.startswith("q"):
+            q = self.values[2]
+            # Rounded off to suppress floating point noise (eg. 0.30000000000000004)
+            value = round(round(value / q) * q, 12)
+            if self.p_type in ["quniform", "qloguniform"]:
+                value = min(max(value, self.values[0]), self.values[1])
+        return value
+
+
+    def _resolve(self, option_idx: int, sub_params: Dict[str, Any] = None) -> Any:
+        option = self.values[option_idx]
+        if isinstance(option, dict):
+            return {'_name': option.get('_name'), **(sub_params or {})}
+        return option
+
+    ##################
+    # Core functions #
+    ##################
+
+    def quantile(self, u: float, rng: np.random.Generator = None) -> Any:
+        """ Maps a cumulative probability onto a value of the parameter, such
+            that uniformly distributed probabilities yield values following
+            the parameter's distribution
+
+        Args:
+            u (float): Cumulative probability, in [0, 1)
+            rng (np.random.Generator): Generator used to sample nested spaces
+        Returns:
+            Value (Any)
+        """
+        u = float(u)
+        if self.p_type == "choice":
+            option_idx = min(int(u * len(self.values)), len(self.values) - 1)
+            option = self.options[option_idx]
+            sub_params = (
+                next(option.random(1, rng=rng or np.random.default_rng()))
+                if option
+                else None
+            )
+            return self._resolve(option_idx, sub_params)
+
+        elif self.p_type == "randint":
+            low, high = self.values
+            return int(min(low + math.floor(u * (high - low)), high - 1))
+
+        elif self.p_type in NORMAL_TYPES:
+            mu, sigma = self.values[:2]
+            value = mu + sigma * normal_ppf(u)
+            if self.p_type in LOG_TYPES:
+                value = math.exp(value)
+
+        else:
+            low, high = self.values[:2]
+            if self.p_type in LOG_TYPES:
+                value = math.exp(
+                    math.log(low) + u * (math.log(high) - math.log(low))
+                )
+            else:
+                value = low + u * (high - low)
+
+        return self._quantize(value)
+
+
+    def grid(self, resolution: int = GRID_RESOLUTION) -> Generator[Any, None, None]:
+        """ Lazily enumerates the values of the parameter. Continuous or
+            unbounded parameters are discretized into `resolution` values at
+            evenly spaced quantiles.
+
+        Args:
+            resolution (int): No. of values to discretize continuous
+                parameters into
+        Returns:
+            Values (generator)
+        """
+        if self.p_type == "choice":
+            for option_idx, option in enumerate(self.options):
+                if option:
+                    for sub_params in option.grid(resolution):
+                        yield self._resolve(option_idx, sub_params)
+                else:
+                    yield self._resolve(option_idx)
+
+        elif self.p_type == "randint":
+            yield from range(int(self.values[0]), int(self.values[1]))
+
+        elif self.p_type in ["quniform", "qloguniform"]:
+            low, high, q = self.values
+            for step in range(math.floor(low / q), math.ceil(high / q) + 1):
+                yield min(max(round(step * q, 12), low), high)
+
+        else:
+            previous = None
+            for idx in range(resolution):
+                value = self.quantile((idx + 0.5) / resolution)
+                if value != previous:
+                    yield value
+                previous = value
+
+
+    def grid_cardinality(self, resolution: int = GRID_RESOLUTION) -> int:
+        """ No. of values enumerated by `grid` (upper bound for quantized,
+            unbounded parameters)
+        """
+        if self.p_type == "choice":
+            return sum(
+                option.grid_cardinality(resolution) if option else 1
+                for option in self.options
+            )
+        elif math.isinf(self.cardinality):
+            return resolution
+        return self.cardinality
+
+####################################
+# Search Space class - SearchSpace #
+####################################
+
+class SearchSpace:
+    """
+    Parsed NNI-style search space. Trials are generated lazily, one set of
+    hyperparameters at a time, so that the full Cartesian product of all
+    parameters is never materialized.
+
+    Attributes:
+        parameters (list(Parameter)): Dimensions of the search space
+    """
+    def __init__(self, spec: Dict[str, Dict[str, Any]]):
+        errors = validate_search_space(spec)
+        if errors:
+            raise ValueError("Invalid search space! " + "; ".join(errors))
+
+        self.parameters = [
+            Parameter(name, declaration['_type'], declaration['_value'])
+            for name, declaration in spec.items()
+        ]
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def cardinality(self) -> Union[int, float]:
+        """ Exact no. of distinct trials, or infinity if any parameter is
+            continuous or unbounded
+        """
+        cardinality = 1
+        for parameter in self.parameters:
+            cardinality *= parameter.cardinality
+        return cardinality
+
+
+    @property
+    def is_finite(self) -> bool:
+        return not math.isinf(self.cardinality)
+
+
+    def grid_cardinality(self, resolution: int = GRID_RESOLUTION) -> int:
+        """ No. of trials enumerated by a grid search """
+        cardinality = 1
+        for parameter in self.parameters:
+            cardinality *= parameter.grid_cardinality(resolution)
+        return cardinality
+
+
+    def estimate_trial_count(self, max_trial_num: int) -> int:
+        """ No. of trials a tuner would run, given its trial budget """
+        if self.is_finite:
+            return min(self.cardinality, max_trial_num)
+        return max_trial_num
+
+    ##################
+    # Core functions #
+    ##################
+
+    def grid(
+        self,
+        resolution: int = GRID_RESOLUTION
+    ) -> Generator[Dict[str, Any], None, None]:
+        """ Lazily enumerates every combination of parameter values, in the
+            same order as their Cartesian product. Values of every parameter
+            are re-enumerated lazily for each combination of the preceding
+            parameters, so no parameter's grid is ever materialized (eg. a 
+            'randint' spanning millions of values).
+
+        Args:
+            resolution (int): No. of values to discretize continuous
+                parameters into
+        Returns:
+            Hyperparameter sets (generator(dict))
+        """
+        def enumerate_from(
+            param_idx: int, 
+            partial: Dict[str, Any]
+        ) -> Generator[Dict[str, Any], None, None]:
+            if param_idx == len(self.parameters):
+                yield dict(partial)
+                return
+
+            parameter = self.parameters[param_idx]
+            for value in parameter.grid(resolution):
+                partial[parameter.name] = value
+                yield from enumerate_from(param_idx + 1, partial)
+
+        yield from enumerate_from(0, {})
+
+
+    def random(
+        self,
+        count: int,
+        seed: int = None,
+        rng: np.random.Generator = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """ Lazily samples hyperparameter sets at random
+
+        Args:
+            count (int): No. of hyperparameter sets to sample
+            seed (int): Seed for reproducible sampling
+            rng (np.random.Generator): Generator to sample with, if seeded
+                externally
+        Returns:
+            Hyperparameter sets (generator(dict))
+        """
+        rng = rng or np.random.default_rng(seed)
+        for _ in range(count):
+            yield {
+                parameter.name: parameter.quantile(rng.random(), rng)
+                for parameter in self.parameters
+            }
+
+
+    def latin_hypercube(
+        self,
+        count: int,
+        seed: int = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """ Lazily samples hyperparameter sets via Latin hypercube sampling.
+            The range of every parameter is split into `count` equiprobable
+            strata, each of which is sampled exactly once.
+
+        Args:
+            count (int): No. of hyperparameter sets to sample
+            seed (int): Seed for reproducible sampling
+        Returns:
+            Hyperparameter sets (generator(dict))
+        """
+        rng = np.random.default_rng(seed)
+        strata = [rng.permutation(count) for _ in self.parameters]
+        for idx in range(count):
+            yield {
+                parameter.name: parameter.quantile(
+                    (parameter_strata[idx] + rng.random()) / count,
+                    rng
+                )
+                for parameter, parameter_strata in zip(self.parameters, strata)
+            }
@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import bisect
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from typing import Dict, List, Any
+
+# Libs
+
+
+# Custom
+from synergos import Driver
+
+##################
+# Configurations #
+##################
+
+SNAPSHOT_MAGIC = b"SYNSNAP1"
+SNAPSHOT_EXTENSION = "synsnap"
+
+# Footer stores the offset & length of the compressed index, then the magic
+FOOTER_FORMAT = "<QQ"
+FOOTER_SIZE = struct.calcsize(FOOTER_FORMAT) + len(SNAPSHOT_MAGIC)
+
+# Snapshotted resources, mapped to their composite keys (in hierarchical order)
+SNAPSHOT_RECORDS = {
+    'collaborations': ['collab_id'],
+    'projects': ['collab_id', 'project_id'],
+    'experiments': ['collab_id', 'project_id', 'expt_id'],
+    'runs': ['collab_id', 'project_id', 'expt_id', 'run_id'],
+    'participants': ['participant_id'],
+    'registrations': ['collab_id', 'project_id', 'participant_id'],
+    'tags': ['collab_id', 'project_id', 'participant_id'],
+    'alignments': ['collab_id', 'project_id', 'participant_id'],
+    'validations': ['collab_id', 'project_id', 'expt_id', 'run_id']
+}
+
+READ_ONLY_RESPONSE = {
+    'status': 405,
+    'message': "Snapshots are read-only!",
+    'data': {}
+}
+
+####################################
+# Snapshot Writer - SnapshotWriter #
+####################################
+
+class SnapshotWriter:
+    """
+    Streams archival records into a single snapshot file. Every record is
+    compressed individually, so that a memory-mapped reader only ever
+    decompresses the records it is asked for. A compressed index of record
+    offsets is appended at the end of the file. Records are streamed into a
+    temporary file that only replaces the snapshot once finalized, so readers
+    never map a partially written snapshot.
+
+    Attributes:
+        path (str): Path to snapshot file
+        index (dict): Record type -> list of [key, offset, length] entries
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.index = {r_type: [] for r_type in SNAPSHOT_RECORDS}
+        self._written = set()
+        self._file = None
+        self._tmp_path = None
+
+    def __enter__(self):
+        snapshot_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(snapshot_dir, exist_ok=True)
+        tmp_fd, self._tmp_path = tempfile.mkstemp(
+            dir=snapshot_dir, 
+            prefix=f".{os.path.basename(self.path)}.",
+            suffix=".tmp"
+        )
+        self._file = os.fdopen(tmp_fd, 'wb')
+        self._file.write(SNAPSHOT_MAGIC)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        is_finalized = False
+        try:
+            if exc_type is None:
+                self.finalize()
+                is_finalized = True
+        finally:
+            self._file.close()
+            if is_finalized:
+                os.replace(self._tmp_path, self.path)
+            else:
+                os.remove(self._tmp_path)
+
+    ###########
+    # Helpers #
+    ###########
+
+    def write(self, r_type: str, data: Any, **key: str) -> bool:
+        """ Compresses & appends a single record into the snapshot
+
+        Args:
+            r_type (str): Type of snapshotted record (eg. 'runs')
+            data (Any): JSON-serializable record
+            key (dict): Composite key identifying the record
+        Returns:
+            Written state (bool) - False if key is incomplete or a duplicate
+        """
+        key_values = tuple([key.get(field) for field in SNAPSHOT_RECORDS[r_type]])
+        if not all(key_values) or (r_type, key_values) in self._written:
+            return False
+
+        blob = zlib.compress(json.dumps(data, default=str).encode())
+        offset = self._file.tell()
+        self._file.write(blob)
+
+        self.index[r_type].append([list(key_values), offset, len(blob)])
+        self._written.add((r_type, key_values))
+        return True
+
+
+    def finalize(self):
+        """ Appends the compressed record index & footer to the snapshot """
+        index_blob = zlib.compress(json.dumps(self.index).encode())
+        index_offset = self._file.tell()
+        self._file.write(index_blob)
+        self._file.write(struct.pack(FOOTER_FORMAT, index_offset, len(index_blob)))
+        self._file.write(SNAPSHOT_MAGIC)
+
+
+
+def export_snapshot(driver: Driver, path: str) -> Dict[str, int]:
+    """ Exports the full metadata state of an orchestrator (i.e. hierarchy,
+        participants, registrations, tags, alignments & validations) into a
+        single snapshot file
+
+    Args:
+        driver (Driver): Synergos abstraction object to facilitate REST operations
+        path (str): Path to write snapshot to
+    Returns:
+        No. of records exported per type (dict)
+    """
+    def extract_records(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return response.get('data', []) or []
+
+    exported_participant_ids = set()
+    with SnapshotWriter(path) as writer:
+
+        collab_data = extract_records(driver.collaborations.read_all())
+        for collab_record in collab_data:
+            collab_key = {'collab_id': collab_record.get('key', {}).get('collab_id')}
+            writer.write('collaborations', collab_record, **collab_key)
+
+            project_data = extract_records(driver.projects.read_all(**collab_key))
+            for project_record in project_data:
+                project_key = {
+                    **collab_key,
+                    'project_id': project_record.get('key', {}).get('project_id')
+                }
+                detailed_project = driver.projects.read(
+                    **project_key
+                ).get('data', {}) or project_record
+                writer.write('projects', detailed_project, **project_key)
+
+                registry_data = extract_records(
+                    driver.registrations.read_all(**project_key)
+                )
+                for reg_record in registry_data:
+                    participant_id = reg_record.get('key', {}).get('participant_id')
+                    reg_key = {**project_key, 'participant_id': participant_id}
+                    writer.write('registrations', reg_record, **reg_key)
+
+                    relations = reg_record.get('relations', {})
+                    for r_type, relation in [
+                        ('tags', 'Tag'),
+                        ('alignments', 'Alignment')
+                    ]:
+                        for related_record in relations.get(relation, []):
+                            writer.write(r_type, related_record, **reg_key)
+
+                    if participant_id not in exported_participant_ids:
+                        exported_participant_ids.add(participant_id)
+                        participant_data = driver.participants.read(
+                            participant_id=participant_id
+                        ).get('data', {})
+                        writer.write(
+                            'participants',
+                            participant_data,
+                            participant_id=participant_id
+                        )
+
+                expt_data = extract_records(driver.experiments.read_all(**project_key))
+                for expt_record in expt_data:
+                    expt_key = {
+                        **project_key,
+                        'expt_id': expt_record.get('key', {}).get('expt_id')
+                    }
+                    writer.write('experiments', expt_record, **expt_key)
+
+                    run_data = extract_records(driver.runs.read_all(**expt_key))
+                    for run_record in run_data:
+                        run_key = {
+                            **expt_key,
+                            'run_id': run_record.get('key', {}).get('run_id')
+                        }
+                        writer.write('runs', run_record, **run_key)
+
+                        valid_stats = driver.validations.read(**run_key).get('data')
+                        if valid_stats:
+                            writer.write('validations', valid_stats, **run_key)
+
+    return {r_type: len(entries) for r_type, entries in writer.index.items()}
+
+####################################
+# Snapshot Reader - SnapshotReader #
+####################################
+
+class SnapshotReader:
+    """
+    Memory-mapped, random-access reader over a snapshot file. Only the record
+    index is decompressed upon loading; records themselves are decompressed
+    on demand. Keys of every type are also kept sorted, so that records
+    residing under a parent are located by binary search.
+
+    Attributes:
+        path (str): Path to snapshot file
+        index (dict): Record type -> {key (tuple): (offset, length)}
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if (
+            self._mmap[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or
+            self._mmap[-len(SNAPSHOT_MAGIC):] != SNAPSHOT_MAGIC
+        ):
+            self.close()
+            raise ValueError(f"{path} is not a valid Synergos snapshot!")
+
+        footer_start = len(self._mmap) - FOOTER_SIZE
+        index_offset, index_length = struct.unpack(
+            FOOTER_FORMAT,
+            self._mmap[footer_start:footer_start + struct.calcsize(FOOTER_FORMAT)]
+        )
+        raw_index = json.loads(zlib.decompress(
+            self._mmap[index_offset:index_offset + index_length]
+        ))
+        self.index = {
+            r_type: {
+                tuple(key): (offset, length)
+                for key, offset, length in raw_index.get(r_type, [])
+            }
+            for r_type in SNAPSHOT_RECORDS
+        }
+        self._sorted_keys = {
+            r_type: sorted(keys, key=self._normalize)
+            for r_type, keys in self.index.items()
+        }
+        self._normalized_keys = {
+            r_type: [self._normalize(key) for key in keys]
+            for r_type, keys in self._sorted_keys.items()
+        }
+
+    ###########
+    # Helpers #
+    ###########
+
+    @staticmethod
+    def _normalize(key: tuple) -> tuple:
+        """ Renders a key sortable, even if some of its fields are missing """
+        return tuple("" if value is None else str(value) for value in key)
+
+
+    def _load(self, offset: int, length: int) -> Any:
+        return json.loads(zlib.decompress(self._mmap[offset:offset + length]))
+
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    ##################
+    # Core functions #
+    ##################
+
+    def read(self, r_type: str, **key: str) -> Any:
+        """ Retrieves a single snapshotted record identified by its full
+            composite key
+
+        Args:
+            r_type (str): Type of snapshotted record (eg. 'runs')
+            key (dict): Composite key of the record
+        Returns:
+            Record (Any), or an empty dict if it was not snapshotted
+        """
+        key_values = tuple([key.get(field) for field in SNAPSHOT_RECORDS[r_type]])
+        location = self.index[r_type].get(key_values)
+        return self._load(*location) if location else {}
+
+
+    def read_all(self, r_type: str, **filters: str) -> List[Any]:
+        """ Retrieves all snapshotted records of a type matching the specified
+            key filters. Unspecified key fields are not filtered on.
+
+        Args:
+            r_type (str): Type of snapshotted record (eg. 'runs')
+            filters (dict): Subset of the type's composite key fields
+        Returns:
+            Records (list)
+        """
+        conditions = [
+            (idx, filters[field])
+            for idx, field in enumerate(SNAPSHOT_RECORDS[r_type])
+            if filters.get(field) is not None
+        ]
+
+        # Leading filtered fields bound a contiguous range of sorted keys
+        prefix = []
+        for idx, value in conditions:
+            if idx != len(prefix):
+                break
+            prefix.append(str(value))
+
+        normalized_keys = self._normalized_keys[r_type]
+        if prefix:
+            start = bisect.bisect_left(normalized_keys, tuple(prefix))
+            stop = bisect.bisect_left(
+                normalized_keys, 
+                tuple(prefix[:-1]) + (prefix[-1] + "\0",)
+            )
+        else:
+            start, stop = 0, len(normalized_keys)
+
+        # Records are returned in the order they were snapshotted
+        locations = self.index[r_type]
+        matched_locations = sorted(
+            locations[key]
+            for key in self._sorted_keys[r_type][start:stop]
+            if all(key[idx] == value for idx, value in conditions)
+        )
+        return [self._load(*location) for location in matched_locations]
+
+
+    @classmethod
+    def load(cls, path: str) -> "SnapshotReader":
+        """ Retrieves a reader over the specified snapshot, reusing any reader
+            previously opened for the same file. Readers over outdated files
+            are only dropped from the registry, as other sessions may still be
+            reading from them; they are closed once garbage collected.
+
+        Args:
+            path (str): Path to snapshot file
+        Returns:
+            Snapshot reader (SnapshotReader)
+        """
+        path = os.path.abspath(path)
+        modified_at = os.path.getmtime(path)
+
+        with cls.__registry_lock:
+            reader, loaded_at = cls.__registry.get(path, (None, None))
+            if reader is None or loaded_at != modified_at:
+                reader = cls(path)
+                cls.__registry[path] = (reader, modified_at)
+
+        return reader
+
+####################################
+# Driver stand-in - SnapshotDriver #
+####################################
+
+class SnapshotResource:
+    """
+    Read-only view of a single snapshotted resource, mirroring the `read` &
+    `read_all` interface of its Synergos driver counterpart. All other
+    operations are rejected.
+
+    Attributes:
+        r_type (str): Type of snapshotted records (eg. 'runs')
+        reader (SnapshotReader): Snapshot to read from
+    """
+    def __init__(self, r_type: str, reader: SnapshotReader = None):
+        self.r_type = r_type
+        self.reader = reader
+
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: dict(READ_ONLY_RESPONSE)
+
+
+    def _parse_key(self, args: tuple, kwargs: dict) -> Dict[str, str]:
+        """ Maps positional IDs onto the type's composite key fields """
+        key_fields = SNAPSHOT_RECORDS.get(self.r_type, [])
+        return {**dict(zip(key_fields, args)), **kwargs}
+
+
+    def read_all(self, *args, **kwargs) -> Dict[str, Any]:
+        if self.reader is None:
+            return {'status': 404, 'data': []}
+
+        filters = self._parse_key(args, kwargs)
+        return {
+            'status': 200,
+            'data': self.reader.read_all(self.r_type, **filters)
+        }
+
+
+    def read(self, *args, **kwargs) -> Dict[str, Any]:
+        if self.reader is None:
+            return {'status': 404, 'data': {}}
+
+        key = self._parse_key(args, kwargs)
+        return {
+            'status': 200,
+            'data': self.reader.read(self.r_type, **key)
+        }
+
+
+
+class SnapshotDriver:
+    """
+    Read-only stand-in for a Synergos driver, serving all resources from an
+    exported snapshot. Resources that were not snapshotted (eg. models) are
+    reported as empty.
+
+    Attributes:
+        reader (SnapshotReader): Snapshot to read from
+    """
+    def __init__(self, reader: SnapshotReader):
+        self.reader = reader
+        for r_type in SNAPSHOT_RECORDS:
+            setattr(self, r_type, SnapshotResource(r_type, reader))
+
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return SnapshotResource(name)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+from typing import Dict, List, Any, Tuple
+
+# Libs
+
+
+# Custom
+from views.core.leaderboard import Leaderboard
+from views.core.replica import generate_fingerprint
+
+##################
+# Configurations #
+##################
+
+TRACKED_RELATIONS = ['Registration', 'Tag', 'Run', 'Model', 'Validation']
+
+# Relations whose records may be updated in place (eg. validations rewritten
+# by a forced rerun), and hence are versioned by content. All other relations
+# are only tracked by their keys.
+VERSIONED_RELATIONS = ['Registration', 'Tag', 'Model', 'Validation']
+
+TAG_META = ['train', 'evaluate', 'predict']
+
+###########
+# Helpers #
+###########
+
+def identify_record(record: Dict[str, Any]) -> Tuple[Tuple[str, str]]:
+    """ Derives a hashable identity for a related record from its composite
+        key
+
+    Args:
+        record (dict): Related record (eg. a Validation record)
+    Returns:
+        Identity (tuple)
+    """
+    return tuple(sorted(record.get('key', {}).items()))
+
+########################################
+# Statistics class - ProjectStatistics #
+########################################
+
+class ProjectStatistics:
+    """
+    Running aggregates of a project's launchpad statistics. The cache tracks
+    the identities (& versions, where records are mutable) of the project's
+    Registration, Tag, Run, Model & Validation relations. On every refresh,
+    only relations whose records were added, changed or removed are folded
+    into the aggregates; unchanged projects are not recomputed at all.
+
+    Attributes:
+        action (str): ML operation of the project
+        registrations (dict): Participant ID -> no. of registered nodes
+        partitions (dict): Tag identity -> no. of partitions per meta
+        partition_totals (dict): Meta -> no. of partitions across the grid
+        job_count (int): No. of runs declared under the project
+        completed_count (int): No. of models trained under the project
+        leaderboard (Leaderboard): Columnar validation scores
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self):
+        self.action = None
+        self.registrations = {}
+        self.partitions = {}
+        self.partition_totals = {meta: 0 for meta in TAG_META}
+        self.job_count = 0
+        self.completed_count = 0
+        self.leaderboard = Leaderboard()
+        self._signatures = {relation: {} for relation in TRACKED_RELATIONS}
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def grid_count(self) -> int:
+        """ No. of grids available, which is bounded by the participant that
+            registered the fewest nodes
+        """
+        n_counts = [n_count or 0 for n_count in self.registrations.values()]
+        return min(n_counts) if n_counts else 0
+
+    @property
+    def participant_count(self) -> int:
+        return len(self.registrations)
+
+    @property
+    def pending_count(self) -> int:
+        return self.job_count - self.completed_count
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _diff(
+        self,
+        relation: str,
+        records: List[Dict[str, Any]]
+    ) -> Tuple[Dict[tuple, Dict[str, Any]], set]:
+        """ Compares the current records of a relation against those already
+            folded into the aggregates
+
+        Args:
+            relation (str): Name of relation (eg. 'Validation')
+            records (list(dict)): Current records of the relation
+        Returns:
+            Added or changed records, by identity (dict)
+            Identities of removed records (set)
+        """
+        is_versioned = relation in VERSIONED_RELATIONS
+        previous = self._signatures[relation]
+
+        current = {}
+        changed_records = {}
+        for record in records:
+            identity = identify_record(record)
+            version = generate_fingerprint(record) if is_versioned else None
+            current[identity] = version
+
+            if identity not in previous or previous[identity] != version:
+                changed_records[identity] = record
+
+        removed_identities = set(previous) - set(current)
+        self._signatures[relation] = current
+        return changed_records, removed_identities
+
+
+    def _fold_registrations(self, changed: dict, removed: set):
+        for identity in removed:
+            self.registrations.pop(dict(identity).get('participant_id'), None)
+
+        for reg_record in changed.values():
+            participant_id = reg_record.get('key', {}).get('participant_id')
+            self.registrations[participant_id] = reg_record.get('n_count')
+
+
+    def _fold_tags(self, changed: dict, removed: set):
+        for identity in list(removed) + list(changed.keys()):
+            for meta, count in self.partitions.pop(identity, {}).items():
+                self.partition_totals[meta] -= count
+
+        for identity, tag_record in changed.items():
+            tag_partitions = {
+                meta: len(tag_record.get(meta, []) or [])
+                for meta in TAG_META
+            }
+            for meta, count in tag_partitions.items():
+                self.partition_totals[meta] += count
+            self.partitions[identity] = tag_partitions
+
+    ##################
+    # Core functions #
+    ##################
+
+    def refresh(self, project_data: Dict[str, Any]) -> bool:
+        """ Folds any changes in the project's relations into the running
+            aggregates
+
+        Args:
+            project_data (dict): Project record, inclusive of its relations
+        Returns:
+            Change state (bool) - True if any aggregate was updated
+        """
+        relations = project_data.get('relations', {}) or {}
+
+        with self._lock:
+            action = project_data.get('action')
+            if action != self.action:
+                # Tracked metrics depend on the ML operation, so rebuild
+                self.action = action
+                self.leaderboard = Leaderboard(action=action)
+                self._signatures['Validation'] = {}
+
+            is_changed = False
+            for relation in TRACKED_RELATIONS:
+                records = relations.get(relation, []) or []
+                changed, removed = self._diff(relation, records)
+                if not changed and not removed:
+                    continue
+
+                is_changed = True
+                if relation == 'Registration':
+                    self._fold_registrations(changed, removed)
+
+                elif relation == 'Tag':
+                    self._fold_tags(changed, removed)
+
+                elif relation == 'Run':
+                    self.job_count = len(records)
+
+                elif relation == 'Model':
+                    self.completed_count = len(records)
+
+                elif relation == 'Validation':
+                    if removed:
+                        # Scores cannot be unfolded selectively, so rebuild
+                        self.leaderboard = Leaderboard(action=action)
+                        self.leaderboard.extend(records)
+                    else:
+                        self.leaderboard.extend(list(changed.values()))
+
+        return is_changed
+
+
+    @classmethod
+    def load(
+        cls,
+        address: Tuple[str, int],
+        collab_id: str,
+        project_id: str
+    ) -> "ProjectStatistics":
+        """ Retrieves the statistics cached for the specified project, creating
+            an empty cache if it does not exist yet. Caches are shared across
+            sessions & reruns connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            collab_id (str): ID of collaboration
+            project_id (str): ID of project
+        Returns:
+            Project-specific statistics (ProjectStatistics)
+        """
+        if address is None:
+            return cls()
+
+        with cls.__registry_lock:
+            registry_key = (address, collab_id, project_id)
+            statistics = cls.__registry.get(registry_key)
+            if statistics is None:
+                statistics = cls.__registry[registry_key] = cls()
+
+        return statistics
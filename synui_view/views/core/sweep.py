@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple
+
+# Libs
+import numpy as np
+import pandas as pd
+
+# Custom
+from views.core.comparison import flatten_hyperparameters
+from views.core.leaderboard import LOWER_IS_BETTER, TARGET_METRICS, summarize_score
+from views.core.replica import generate_fingerprint
+from views.core.statistics import identify_record
+
+##################
+# Configurations #
+##################
+
+TRACKED_RELATIONS = ['Run', 'Model', 'Validation']
+
+RUN_STATUSES = ["created", "trained", "validated"]
+
+# Fields stamped by the orchestrator whenever a record is (re-)created. Records
+# are only fingerprinted in full if they carry none of them.
+VERSION_FIELDS = ['doc_id', 'created_at']
+
+# Max no. of most recently validated runs drawn on parallel coordinates
+PARALLEL_COORDINATES_LIMIT = 200
+
+###########
+# Helpers #
+###########
+
+def is_better(score: float, best: float, metric: str) -> bool:
+    """ Checks if a score improves on the best score so far """
+    if best is None or np.isnan(best):
+        return True
+    return score < best if metric in LOWER_IS_BETTER else score > best
+
+
+def version_record(record: Dict[str, Any]) -> tuple:
+    """ Stamps a record with the version fields set by the orchestrator, so
+        that unchanged records are recognised without serializing them
+
+    Args:
+        record (dict): Record of a tracked relation
+    Returns:
+        Version stamp (tuple)
+    """
+    stamp = tuple(record.get(field) for field in VERSION_FIELDS)
+    return stamp if any(stamp) else (generate_fingerprint(record),)
+
+###################################
+# Monitoring class - SweepMonitor #
+###################################
+
+class SweepMonitor:
+    """
+    Running aggregates of a hyperparameter sweep (i.e. all runs of an
+    experiment). On every refresh, the version stamps (i.e. document ID &
+    creation time) of the experiment's records are compared against those
+    already folded in, and only runs, models & validations that were added,
+    re-created (eg. re-scored) or removed are folded into the aggregates.
+    Unchanged records are never serialized, and the aggregates themselves are
+    never recomputed from scratch. Grid-wide scores are maintained as running
+    sums over participants' validations, and best-so-far curves are only
+    recomputed from the earliest trial whose score changed.
+
+    Attributes:
+        expt_id (str): ID of monitored experiment
+        action (str): ML operation of the project
+        metrics (list(str)): Metrics tracked
+        runs (OrderedDict): Run ID -> status & numeric hyperparameters, in
+            order of creation
+        validated_order (list(str)): Run IDs, in order of first validation
+    """
+    __registry = {}
+    __registry_lock = threading.Lock()
+
+    def __init__(self, expt_id: str, action: str = "classify"):
+        self.expt_id = expt_id
+        self.action = action
+        self.metrics = TARGET_METRICS.get(action, TARGET_METRICS['regress'])
+        self.runs = OrderedDict()
+        self.validated_order = []
+        self._positions = {}
+        self._score_sums = {}
+        self._contributions = {}
+        self._curves = {}
+        self._versions = {relation: {} for relation in TRACKED_RELATIONS}
+        self._lock = threading.RLock()
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def status_counts(self) -> Dict[str, int]:
+        counts = {status: 0 for status in RUN_STATUSES}
+        for run in self.runs.values():
+            counts[run['status']] += 1
+        return counts
+
+
+    def score(self, run_id: str, metric: str) -> float:
+        """ Grid-wide (i.e. mean across participants) score of a run """
+        score_sum, count = self._score_sums.get(run_id, {}).get(metric, (0.0, 0))
+        return score_sum / count if count else np.nan
+
+
+    def best_curve(self, metric: str) -> pd.DataFrame:
+        """ Best-so-far scores, in order of validation. Only the tail of the
+            curve that follows the earliest changed trial is recomputed.
+
+        Args:
+            metric (str): Metric to trace
+        Returns:
+            Scores & best scores so far, one row per validated run (pd.DataFrame)
+        """
+        with self._lock:
+            curve = self._curves.setdefault(
+                metric,
+                {'scores': [], 'best': [], 'dirty_from': 0}
+            )
+            start = min(curve['dirty_from'], len(curve['scores']))
+            del curve['scores'][start:]
+            del curve['best'][start:]
+
+            best = curve['best'][-1] if curve['best'] else np.nan
+            for run_id in self.validated_order[start:]:
+                score = self.score(run_id, metric)
+                if not np.isnan(score) and is_better(score, best, metric):
+                    best = score
+                curve['scores'].append(score)
+                curve['best'].append(best)
+            curve['dirty_from'] = len(self.validated_order)
+
+            return pd.DataFrame(
+                {'score': curve['scores'], 'best so far': curve['best']},
+                index=pd.RangeIndex(1, len(curve['scores']) + 1, name="trial")
+            )
+
+
+    def recent_runs(self, count: int) -> pd.DataFrame:
+        """ Tabulates the statuses, scores & hyperparameters of the most
+            recently created runs
+
+        Args:
+            count (int): No. of runs to tabulate
+        Returns:
+            Runs, most recent first (pd.DataFrame)
+        """
+        with self._lock:
+            run_ids = list(self.runs.keys())[-count:][::-1]
+            rows = [
+                {
+                    'run_id': run_id,
+                    'status': self.runs[run_id]['status'],
+                    **{metric: self.score(run_id, metric) for metric in self.metrics},
+                    **self.runs[run_id]['hyperparameters']
+                }
+                for run_id in run_ids
+            ]
+        return pd.DataFrame(rows)
+
+
+    def parallel_coordinates(
+        self,
+        metric: str,
+        limit: int = PARALLEL_COORDINATES_LIMIT
+    ) -> pd.DataFrame:
+        """ Normalizes the numeric hyperparameters of the most recently
+            validated runs onto [0, 1], for plotting as parallel coordinates
+
+        Args:
+            metric (str): Metric to colour runs by
+            limit (int): Max no. of runs plotted
+        Returns:
+            Long-form coordinates, one row per (run, hyperparameter) (pd.DataFrame)
+        """
+        with self._lock:
+            run_ids = self.validated_order[-limit:]
+            wide_frame = pd.DataFrame(
+                [
+                    self.runs.get(run_id, {}).get('hyperparameters', {})
+                    for run_id in run_ids
+                ],
+                index=pd.Index(run_ids, name='run_id')
+            )
+            scores = [self.score(run_id, metric) for run_id in run_ids]
+
+        wide_frame = wide_frame.loc[:, wide_frame.nunique() > 1]
+        if wide_frame.empty:
+            return pd.DataFrame(columns=['run_id', 'hyperparameter', 'value', metric])
+
+        spans = (wide_frame.max() - wide_frame.min()).replace(0, 1)
+        normalized = (wide_frame - wide_frame.min()) / spans
+        normalized[metric] = scores
+        return normalized.reset_index().melt(
+            id_vars=['run_id', metric],
+            var_name='hyperparameter',
+            value_name='value'
+        )
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _diff(
+        self,
+        relation: str,
+        records: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], set]:
+        """ Filters the records of a relation down to those of the monitored
+            experiment that were added or re-created since they were last 
+            folded in, alongside the identities of those removed since
+        """
+        previous = self._versions[relation]
+        current = {}
+        new_records = []
+        for record in records:
+            if record.get('key', {}).get('expt_id') != self.expt_id:
+                continue
+            identity = identify_record(record)
+            current[identity] = version_record(record)
+            if previous.get(identity) != current[identity]:
+                new_records.append(record)
+
+        removed_identities = set(previous) - set(current)
+        self._versions[relation] = current
+        return new_records, removed_identities
+
+
+    def _invalidate(self, run_id: str):
+        """ Flags best-so-far curves for recomputation from a re-scored run """
+        position = self._positions.get(run_id)
+        if position is None:
+            return
+        for curve in self._curves.values():
+            curve['dirty_from'] = min(curve['dirty_from'], position)
+
+
+    def _fold_runs(self, new_records: List[Dict[str, Any]]):
+        for run_record in new_records:
+            run_id = run_record.get('key', {}).get('run_id')
+            run = self.runs.setdefault(run_id, {'status': RUN_STATUSES[0]})
+            run['hyperparameters'] = {
+                name: value
+                for name, value in flatten_hyperparameters(run_record).items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            }
+
+
+    def _fold_models(self, new_records: List[Dict[str, Any]]):
+        for model_record in new_records:
+            run_id = model_record.get('key', {}).get('run_id')
+            run = self.runs.get(run_id)
+            if run and run['status'] == RUN_STATUSES[0]:
+                run['status'] = RUN_STATUSES[1]
+
+
+    def _fold_validations(self, new_records: List[Dict[str, Any]]):
+        for val_record in new_records:
+            run_id = val_record.get('key', {}).get('run_id')
+            statistics = val_record.get('evaluate', {}).get('statistics', {})
+            contribution = {
+                metric: summarize_score(statistics[metric])
+                for metric in self.metrics
+                if metric in statistics
+            }
+
+            # Re-scored validations replace their previous contributions
+            identity = identify_record(val_record)
+            if identity in self._contributions:
+                previous_run_id, previous_contribution = self._contributions.pop(identity)
+                self._add_contribution(
+                    identity, 
+                    previous_run_id, 
+                    previous_contribution, 
+                    sign=-1
+                )
+            self._add_contribution(identity, run_id, contribution)
+
+            run = self.runs.get(run_id)
+            if run is not None:
+                run['status'] = RUN_STATUSES[2]
+
+            if run_id in self._positions:
+                self._invalidate(run_id)
+            else:
+                self._positions[run_id] = len(self.validated_order)
+                self.validated_order.append(run_id)
+
+
+    def _add_contribution(
+        self,
+        identity: tuple,
+        run_id: str,
+        contribution: Dict[str, float],
+        sign: int = 1
+    ):
+        run_sums = self._score_sums.setdefault(run_id, {})
+        for metric, score in contribution.items():
+            score_sum, count = run_sums.get(metric, (0.0, 0))
+            run_sums[metric] = (score_sum + sign * score, count + sign)
+
+        if sign > 0:
+            self._contributions[identity] = (run_id, contribution)
+
+    ##################
+    # Core functions #
+    ##################
+
+    def refresh(self, expt_data: Dict[str, Any]) -> bool:
+        """ Folds runs, models & validations of the monitored experiment that
+            were added, changed or removed since the previous refresh into the
+            running aggregates
+
+        Args:
+            expt_data (dict): Experiment record, inclusive of its relations
+        Returns:
+            Change state (bool) - True if any aggregate was updated
+        """
+        relations = expt_data.get('relations', {}) or {}
+
+        with self._lock:
+            is_changed = False
+            for relation in TRACKED_RELATIONS:
+                records = relations.get(relation, []) or []
+                new_records, removed_identities = self._diff(relation, records)
+                if not new_records and not removed_identities:
+                    continue
+
+                is_changed = True
+                if relation == 'Run':
+                    for identity in removed_identities:
+                        self.runs.pop(dict(identity).get('run_id'), None)
+                    self._fold_runs(new_records)
+
+                elif relation == 'Model':
+                    self._fold_models(new_records)
+
+                elif relation == 'Validation':
+                    for identity in removed_identities:
+                        run_id, contribution = self._contributions.pop(identity)
+                        self._add_contribution(identity, run_id, contribution, sign=-1)
+                        self._invalidate(run_id)
+                    self._fold_validations(new_records)
+
+        return is_changed
+
+
+    @classmethod
+    def load(
+        cls,
+        address: Tuple[str, int],
+        collab_id: str,
+        project_id: str,
+        expt_id: str,
+        action: str = "classify"
+    ) -> "SweepMonitor":
+        """ Retrieves the monitor of the specified experiment, creating it if
+            it does not exist yet. Monitors are shared across sessions & reruns
+            connected to the same orchestrator.
+
+        Args:
+            address (tuple): Host & port of orchestrator
+            collab_id (str): ID of collaboration
+            project_id (str): ID of project
+            expt_id (str): ID of experiment
+            action (str): ML operation of the project
+        Returns:
+            Experiment-specific monitor (SweepMonitor)
+        """
+        if address is None:
+            return cls(expt_id, action)
+
+        with cls.__registry_lock:
+            registry_key = (address, collab_id, project_id, expt_id)
+            monitor = cls.__registry.get(registry_key)
+            if monitor is None or monitor.action != action:
+                monitor = cls.__registry[registry_key] = cls(expt_id, action)
+
+        return monitor
@@ -0,0 +1,515 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import hashlib
+import re
+from typing import Dict, List, Iterator, Optional, Tuple
+
+# Libs
+
+
+# Custom
+
+
+##################
+# Configurations #
+##################
+
+TAG_METAS = ["train", "evaluate", "predict"]
+
+# Characters that cannot be declared within a tag (i.e. reserved by common
+# filesystems), as well as control characters
+ILLEGAL_CHARACTERS = re.compile(r'[<>:"|?*\x00-\x1f]')
+
+# Tokens that would escape the data directory mounted onto a worker node
+ILLEGAL_TOKENS = ["..", "~"]
+
+###########
+# Helpers #
+###########
+
+def tokenize_path(path: str) -> Tuple[str, ...]:
+    """ Splits a declared tag path (eg. "/dataset/train") into its tokens.
+        Leading, trailing & repeated separators are ignored, and Windows
+        separators are treated as POSIX separators.
+
+    Args:
+        path (str): Declared path
+    Returns:
+        Tokens (tuple(str))
+    """
+    return tuple([
+        token.strip()
+        for token in path.replace("\\", "/").split("/")
+        if token.strip() and token.strip() != "."
+    ])
+
+
+def format_path(tokens: Tuple[str, ...]) -> str:
+    return "/" + "/".join(tokens)
+
+############################
+# Tag Trie class - TagNode #
+############################
+
+class TagNode:
+    """
+    Node of a prefix-compressed tag trie. Chains of single-child nodes are
+    collapsed into one edge, labelled by all tokens along the chain.
+
+    Attributes:
+        children (dict): First token of edge -> (edge label, child node)
+        is_terminal (bool): Whether a declared tag ends at this node
+    """
+    __slots__ = ['children', 'is_terminal', '_digest']
+
+    def __init__(self):
+        self.children = {}
+        self.is_terminal = False
+        self._digest = None
+
+    ###########
+    # Getters #
+    ###########
+
+    @property
+    def digest(self) -> str:
+        """ Merkle hash of the subtree rooted at this node, so that identical
+            subtrees can be skipped when diffing. Cached until the subtree is
+            modified.
+        """
+        if self._digest is None:
+            hasher = hashlib.sha1(b"1" if self.is_terminal else b"0")
+            for first_token in sorted(self.children):
+                label, child = self.children[first_token]
+                hasher.update("\x1f".join(label).encode())
+                hasher.update(child.digest.encode())
+            self._digest = hasher.hexdigest()
+        return self._digest
+
+############################
+# Tag Trie class - TagTrie #
+############################
+
+class TagTrie:
+    """
+    Prefix-compressed (i.e. radix) trie of the dataset tags of a single meta
+    (i.e. train, evaluate or predict). Every tag is stored once, no matter how
+    many times it is declared, and shared path prefixes are stored once.
+
+    Attributes:
+        root (TagNode): Root of the trie
+        duplicate_count (int): No. of repeated declarations that were dropped
+    """
+    def __init__(self, tags: List[Tuple[str, ...]] = []):
+        self.root = TagNode()
+        self.duplicate_count = 0
+        self._size = 0
+        for tokens in tags:
+            self.insert(tokens)
+
+    ###########
+    # Getters #
+    ###########
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        """ Yields all tags, in lexicographic order of their tokens """
+        stack = [((), self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            if node.is_terminal and prefix:
+                yield prefix
+            for first_token in sorted(node.children, reverse=True):
+                label, child = node.children[first_token]
+                stack.append((prefix + label, child))
+
+
+    def __contains__(self, tokens: Tuple[str, ...]) -> bool:
+        node, remainder = self._locate(tuple(tokens))
+        return node is not None and not remainder and node.is_terminal
+
+
+    @property
+    def depths(self) -> Dict[int, int]:
+        """ No. of tags declared at every depth """
+        depths = {}
+        for tokens in self:
+            depths[len(tokens)] = depths.get(len(tokens), 0) + 1
+        return depths
+
+
+    def edges(self) -> Iterator[Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]]:
+        """ Yields every compressed edge of the trie, for rendering
+
+        Returns:
+            Parent path, child path & edge label (iterator)
+        """
+        stack = [((), self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            for first_token in sorted(node.children, reverse=True):
+                label, child = node.children[first_token]
+                stack.append((prefix + label, child))
+                yield prefix, prefix + label, label
+
+
+    def find_nested(self) -> List[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """ Detects tags that are declared within another tag (eg. /a & /a/b),
+            which would be loaded twice
+
+        Returns:
+            Pairs of enclosing & nested tags (list(tuple))
+        """
+        nested_pairs = []
+        stack = [((), self.root, None)]
+        while stack:
+            prefix, node, enclosing = stack.pop()
+            if node.is_terminal and prefix:
+                if enclosing is not None:
+                    nested_pairs.append((enclosing, prefix))
+                enclosing = prefix
+            for label, child in node.children.values():
+                stack.append((prefix + label, child, enclosing))
+        return sorted(nested_pairs)
+
+    ###########
+    # Helpers #
+    ###########
+
+    def _locate(
+        self,
+        tokens: Tuple[str, ...]
+    ) -> Tuple[Optional[TagNode], Tuple[str, ...]]:
+        """ Walks the trie along a path, returning the deepest node reached
+            on an edge boundary & the tokens left unmatched (None if the path
+            diverges midway through an edge)
+        """
+        node = self.root
+        while tokens:
+            entry = node.children.get(tokens[0])
+            if entry is None:
+                return node, tokens
+            label, child = entry
+            if tokens[:len(label)] != label:
+                return None, tokens
+            node, tokens = child, tokens[len(label):]
+        return node, ()
+
+    ##################
+    # Core functions #
+    ##################
+
+    def insert(self, tokens: Tuple[str, ...]) -> bool:
+        """ Adds a tag to the trie, splitting compressed edges if required
+
+        Args:
+            tokens (tuple(str)): Tokens of tag
+        Returns:
+            Insertion state (bool) - False if the tag already exists
+        """
+        tokens = tuple(tokens)
+        if not tokens:
+            return False
+
+        node = self.root
+        while True:
+            node._digest = None
+            if not tokens:
+                break
+
+            entry = node.children.get(tokens[0])
+            if entry is None:
+                leaf = TagNode()
+                node.children[tokens[0]] = (tokens, leaf)
+                node = leaf
+                break
+
+            label, child = entry
+            shared_length = 0
+            while (
+                shared_length < min(len(label), len(tokens)) and
+                label[shared_length] == tokens[shared_length]
+            ):
+                shared_length += 1
+
+            if shared_length < len(label):
+                # Split edge at the point of divergence
+                split_node = TagNode()
+                split_node.children[label[shared_length]] = (label[shared_length:], child)
+                node.children[tokens[0]] = (label[:shared_length], split_node)
+                child = split_node
+
+            node = child
+            tokens = tokens[shared_length:]
+
+        node._digest = None
+        if node.is_terminal:
+            self.duplicate_count += 1
+            return False
+
+        node.is_terminal = True
+        self._size += 1
+        return True
+
+
+    def remove(self, tokens: Tuple[str, ...]) -> bool:
+        """ Removes a tag from the trie, re-compressing edges left with a
+            single child
+
+        Args:
+            tokens (tuple(str)): Tokens of tag
+        Returns:
+            Removal state (bool) - False if the tag does not exist
+        """
+        if tuple(tokens) not in self:
+            return False
+
+        node = self.root
+        trail = []
+        remainder = tuple(tokens)
+        while remainder:
+            label, child = node.children[remainder[0]]
+            trail.append((node, remainder[0]))
+            node, remainder = child, remainder[len(label):]
+
+        node.is_terminal = False
+        node._digest = None
+        self._size -= 1
+
+        # Prune or merge nodes bottom-up
+        for parent, first_token in reversed(trail):
+            parent._digest = None
+            label, child = parent.children[first_token]
+            if not child.is_terminal and not child.children:
+                parent.children.pop(first_token)
+            elif not child.is_terminal and len(child.children) == 1:
+                child_label, grandchild = next(iter(child.children.values()))
+                parent.children[first_token] = (label + child_label, grandchild)
+        return True
+
+
+    def diff(self, other: "TagTrie") -> Tuple[List[Tuple[str, ...]], List[Tuple[str, ...]]]:
+        """ Compares this trie against another (eg. previously registered)
+            trie. Subtrees with identical digests are skipped entirely, so the
+            cost of diffing scales with the no. of changes rather than the no.
+            of tags.
+
+        Args:
+            other (TagTrie): Trie to compare against
+        Returns:
+            Tags only in this trie (list(tuple))
+            Tags only in the other trie (list(tuple))
+        """
+        added, removed = [], []
+
+        def collect(prefix: tuple, node: TagNode, sink: list):
+            sink += [prefix + tokens for tokens in TagTrie._walk(node)]
+
+        def compare(prefix: tuple, node: TagNode, other_node: TagNode):
+            if node.digest == other_node.digest:
+                return
+
+            if node.is_terminal and not other_node.is_terminal and prefix:
+                added.append(prefix)
+            elif other_node.is_terminal and not node.is_terminal and prefix:
+                removed.append(prefix)
+
+            # Expand compressed edges token by token where they diverge
+            children = TagTrie._expand(node)
+            other_children = TagTrie._expand(other_node)
+            for token in sorted(set(children) | set(other_children)):
+                child = children.get(token)
+                other_child = other_children.get(token)
+                if other_child is None:
+                    collect(prefix + (token,), child, added)
+                elif child is None:
+                    collect(prefix + (token,), other_child, removed)
+                else:
+                    compare(prefix + (token,), child, other_child)
+
+        compare((), self.root, other.root)
+        return sorted(added), sorted(removed)
+
+
+    @staticmethod
+    def _expand(node: TagNode) -> Dict[str, TagNode]:
+        """ Maps the first token of every edge of a node onto the node
+            reached after that token, materializing a virtual node midway
+            through edges longer than one token
+        """
+        expanded = {}
+        for first_token, (label, child) in node.children.items():
+            if len(label) == 1:
+                expanded[first_token] = child
+            else:
+                virtual_node = TagNode()
+                virtual_node.children[label[1]] = (label[1:], child)
+                expanded[first_token] = virtual_node
+        return expanded
+
+
+    @staticmethod
+    def _walk(node: TagNode) -> Iterator[Tuple[str, ...]]:
+        """ Yields all tags within a subtree, relative to its root """
+        if node.is_terminal:
+            yield ()
+        for label, child in node.children.values():
+            for tokens in TagTrie._walk(child):
+                yield label + tokens
+
+###########################
+# Tag Trie class - TagSet #
+###########################
+
+class TagSet:
+    """
+    Dataset tags declared by a participant, with one trie per meta. Tags are
+    deduplicated on declaration, and validated as a whole before submission.
+
+    Attributes:
+        tries (dict): Meta -> Tags declared (TagTrie)
+        invalid_paths (dict): Meta -> Paths rejected while parsing
+    """
+    def __init__(self, tags: Dict[str, List[List[str]]] = {}):
+        self.tries = {}
+        self.invalid_paths = {}
+        for meta, meta_tags in tags.items():
+            if meta in TAG_METAS:
+                self.tries[meta] = TagTrie([
+                    tuple(tokens) for tokens in (meta_tags or [])
+                ])
+
+    ###########
+    # Getters #
+    ###########
+
+    def to_dict(self) -> Dict[str, List[List[str]]]:
+        """ Exports deduplicated tags in the format expected by Synergos """
+        return {
+            meta: [list(tokens) for tokens in trie]
+            for meta, trie in self.tries.items()
+        }
+
+    ###########
+    # Helpers #
+    ###########
+
+    @staticmethod
+    def validate_tokens(tokens: Tuple[str, ...]) -> Optional[str]:
+        """ Checks a tag for illegal tokens & characters
+
+        Args:
+            tokens (tuple(str)): Tokens of tag
+        Returns:
+            Error (str), or None if the tag is legal
+        """
+        if not tokens:
+            return "empty path"
+        for token in tokens:
+            if token in ILLEGAL_TOKENS:
+                return f"illegal token '{token}'"
+            illegal_match = ILLEGAL_CHARACTERS.search(token)
+            if illegal_match:
+                return f"illegal character {illegal_match.group()!r} in '{token}'"
+        return None
+
+    ##################
+    # Core functions #
+    ##################
+
+    def declare(self, meta: str, paths: List[str]) -> TagTrie:
+        """ Parses paths declared for a meta into its trie. Illegal paths are
+            set aside as invalid, rather than inserted.
+
+        Args:
+            meta (str): Type of data tags (i.e. 'train'/'evaluate'/'predict')
+            paths (list(str)): Declared paths, one per tag
+        Returns:
+            Tags of meta (TagTrie)
+        """
+        trie = self.tries[meta] = TagTrie()
+        invalid_paths = self.invalid_paths[meta] = {}
+        for path in paths:
+            if not path.strip():
+                continue
+            tokens = tokenize_path(path)
+            error = self.validate_tokens(tokens)
+            if error:
+                invalid_paths[path] = error
+            else:
+                trie.insert(tokens)
+        return trie
+
+
+    def validate(self) -> List[str]:
+        """ Validates all declared tags, i.e. that they are legal, that tags of
+            a meta share the same depth & are not nested within one another,
+            and that no tag is declared under more than one meta
+
+        Returns:
+            Errors (list(str))
+        """
+        errors = []
+        for meta, trie in self.tries.items():
+            errors += [
+                f"{meta.upper()}: '{path}' is invalid ({error})"
+                for path, error in self.invalid_paths.get(meta, {}).items()
+            ]
+
+            depths = trie.depths
+            if len(depths) > 1:
+                depth_summary = ", ".join([
+                    f"{count} at depth {depth}"
+                    for depth, count in sorted(depths.items())
+                ])
+                errors.append(
+                    f"{meta.upper()}: tags have inconsistent depths ({depth_summary})"
+                )
+
+            errors += [
+                f"{meta.upper()}: '{format_path(nested)}' is nested within '{format_path(enclosing)}'"
+                for enclosing, nested in trie.find_nested()
+            ]
+
+        metas = [meta for meta in TAG_METAS if meta in self.tries]
+        for meta_idx, meta in enumerate(metas):
+            for other_meta in metas[meta_idx + 1:]:
+                trie, other_trie = self.tries[meta], self.tries[other_meta]
+                if len(trie) > len(other_trie):
+                    trie, other_trie = other_trie, trie
+                overlaps = [tokens for tokens in trie if tokens in other_trie]
+                errors += [
+                    f"'{format_path(tokens)}' is declared for both {meta.upper()} & {other_meta.upper()}"
+                    for tokens in overlaps
+                ]
+
+        return errors
+
+
+    def diff(self, previous: "TagSet") -> Dict[str, Dict[str, List[List[str]]]]:
+        """ Compares declared tags against previously registered tags
+
+        Args:
+            previous (TagSet): Previously registered tags
+        Returns:
+            Meta -> Added & removed tags (dict)
+        """
+        differences = {}
+        for meta in TAG_METAS:
+            trie = self.tries.get(meta, TagTrie())
+            previous_trie = previous.tries.get(meta, TagTrie())
+            added, removed = trie.diff(previous_trie)
+            if added or removed:
+                differences[meta] = {
+                    'added': [list(tokens) for tokens in added],
+                    'removed': [list(tokens) for tokens in removed]
+                }
+        return differences
@@ -1,17 +1,33 @@
 # Generic/Built-in
-import pprint
-from typing import Dict, List, Union, Any
+from typing import Dict, List, Tuple, Union, Any
 
 # Libs
+import pandas as pd
 import streamlit as st
 
 # Custom
+from config import ALIGNMENT_PAGE_SIZE
+from views.core.alignment_index import (
+    IndexRanges,
+    diff_alignments,
+    encode_alignment,
+    summarize_alignment
+)
 from .base import BaseRenderer 
 
 ##################
 # Configurations #
 ##################
 
+PARTITION_LABELS = {
+    'train': "Training",
+    'evaluate': "Evaluation",
+    'predict': "Inference"
+}
+
+# Max no. of ranges listed per partition when comparing alignments
+DIFF_RANGE_LIMIT = 50
+
 
 ################################################
 # Alignment Renderer Class - AlignmentRenderer #
@@ -30,44 +46,134 @@ class AlignmentRenderer(BaseRenderer):
 
     def render_alignment_metadata(
         self, 
-        data: Dict[str, Any] = {}
+        data: Dict[str, Any] = {},
+        key: str = "alignment"
     ) -> Dict[str, Union[str, Dict[str, List[Any]]]]:
         """ Renders a form capturing alignments detected for use required for a
             specific participant in a deployed Synergos network, given its 
             prerequisite information, as well as any updates to their values.
 
+            Indexes are shown range-encoded (eg. "0-4, 7, 9-12") alongside a
+            coverage summary, and are only expanded a page at a time on
+            demand, so that wide alignments stay cheap to render.
+
         Args:
             data (dict): Information relevant to a registration entry
+            key (str): Prefix distinguishing widgets of separate alignments
         Returns:
             Updated registration (dict)
         """         
-        train_alignment_idxs = data.get('train', [])
-        valid_alignment_idxs = data.get('evaluate', [])
-        predict_alignment_idxs = data.get('predict', [])
+        alignment = encode_alignment(data)
 
         with st.beta_container():
-            updated_train_alignment_idxs = st.text_area(
-                label="Training Alignment Indexes:", 
-                value=pprint.pformat(train_alignment_idxs),
-                height=200
-            )
-            updated_valid_alignment_idxs = st.text_area(
-                label="Evaluation Alignment Indexes:", 
-                value=pprint.pformat(valid_alignment_idxs),
-                height=200
-            )
-            updated_predict_alignment_idxs = st.text_area(
-                label="Inference Alignment Indexes:", 
-                value=pprint.pformat(predict_alignment_idxs),
-                height=200
-            )
+            st.table(summarize_alignment(alignment))
+
+            updated_alignment = {}
+            for partition, label in PARTITION_LABELS.items():
+                ranges_string = st.text_area(
+                    label=f"{label} Alignment Indexes:", 
+                    value=alignment[partition].to_string(),
+                    height=100,
+                    help="Consecutive indexes are declared as ranges (eg. 0-4, 7, 9-12)",
+                    key=f"{key}_{partition}"
+                )
+                try:
+                    updated_alignment[partition] = IndexRanges.from_string(ranges_string)
+                except ValueError as e:
+                    st.error(f"{e}! Retaining existing {label.lower()} alignment.")
+                    updated_alignment[partition] = alignment[partition]
+
+            is_expanded = st.checkbox(label="Expand indexes", key=f"{key}_expand")
+            if is_expanded:
+                self.render_index_pages(updated_alignment, key=key)
 
         return {
-            'train': updated_train_alignment_idxs,
-            'evaluate': updated_valid_alignment_idxs,
-            'predict': updated_predict_alignment_idxs
+            partition: ranges.to_list() 
+            for partition, ranges in updated_alignment.items()
         }
 
+
+    def render_index_pages(
+        self, 
+        alignment: Dict[str, IndexRanges], 
+        key: str = "alignment"
+    ):
+        """ Renders a single page of indexes from a selected partition of an
+            alignment, expanding none of the other indexes
+
+        Args:
+            alignment (dict(str, IndexRanges)): Encoded alignment
+            key (str): Prefix distinguishing widgets of separate alignments
+        """
+        columns = st.beta_columns(2)
+
+        with columns[0]:
+            partition = st.selectbox(
+                label="Partition:",
+                options=list(PARTITION_LABELS.keys()),
+                format_func=lambda partition: PARTITION_LABELS[partition],
+                key=f"{key}_page_partition"
+            )
+            ranges = alignment[partition]
+            page_count = max(ranges.page_count(ALIGNMENT_PAGE_SIZE), 1)
+
+        with columns[1]:
+            page_no = st.number_input(
+                label=f"Page (of {page_count}):",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                key=f"{key}_page_no"
+            )
+
+        st.write(ranges.page(int(page_no) - 1, ALIGNMENT_PAGE_SIZE))
+
+
+    def render_alignment_diff(
+        self,
+        data: Dict[str, Any] = {},
+        other_data: Dict[str, Any] = {},
+        labels: Tuple[str, str] = ("current", "other")
+    ) -> Dict[str, Dict[str, IndexRanges]]:
+        """ Renders the differences between the alignments of two participants,
+            computed over their encoded ranges rather than their raw indexes
+
+        Args:
+            data (dict): Alignment record of a participant
+            other_data (dict): Alignment record of another participant
+            labels (tuple(str, str)): Names of both participants
+        Returns:
+            Alignment differences (dict)
+        """
+        diff = diff_alignments(encode_alignment(data), encode_alignment(other_data))
+
+        with st.beta_container():
+            st.table(pd.DataFrame(
+                [
+                    {
+                        'partition': partition,
+                        f"only in {labels[0]}": len(changes['removed']),
+                        f"only in {labels[1]}": len(changes['added']),
+                        'shared': len(changes['shared'])
+                    }
+                    for partition, changes in diff.items()
+                ]
+            ))
+
+            for partition, changes in diff.items():
+                if not len(changes['removed']) and not len(changes['added']):
+                    continue
+
+                st.markdown(f"**{PARTITION_LABELS[partition]}**")
+                st.code(
+                    "\n".join([
+                        f"only in {labels[0]}: {changes['removed'].to_string(DIFF_RANGE_LIMIT)}",
+                        f"only in {labels[1]}: {changes['added'].to_string(DIFF_RANGE_LIMIT)}"
+                    ])
+                )
+
+        return diff
+
     ##################
     # Core Functions #
     ##################
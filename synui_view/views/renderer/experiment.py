@@ -13,6 +13,14 @@ from typing import Dict, List, Any
 import streamlit as st
 
 # Custom
+from config import MODEL_MEMORY_LIMIT, MODEL_PARAMETER_LIMIT
+from views.core.architecture import (
+    ArchitectureAnalysis, 
+    format_bytes, 
+    format_shape, 
+    parse_shape
+)
+from views.core.bulk_import import ImportItem, parse_upload, SUPPORTED_UPLOADS
 from .base import BaseRenderer 
 from .utils import download_button
 
@@ -25,6 +33,8 @@ MODIFICATION_OPTIONS = [
     'Modify existing architecture'
 ]
 
+DEFAULT_BATCH_SIZE = 32
+
 ##################################################
 # Experiment Renderer Class - ExperimentRenderer #
 ##################################################
@@ -70,6 +80,35 @@ class ExperimentRenderer(BaseRenderer):
         return architecture
 
 
+    def render_bulk_upload(self) -> List[ImportItem]:
+        """ Renders interface facilitating the declaration of many experiments 
+            at once, via a JSONL file or an archive of JSON files
+
+        Returns:
+            Declared experiments (list(ImportItem))
+        """
+        with st.beta_container():
+
+            uploaded_file = st.file_uploader(
+                label="Upload your model architectures in bulk:",
+                type=SUPPORTED_UPLOADS,
+                help="Provide a JSONL file, or an archive (zip/tar) of JSON files, each declaring a model architecture"    
+            )
+
+            if uploaded_file is not None:
+                items = parse_upload(
+                    filename=uploaded_file.name,
+                    content=uploaded_file.getvalue(),
+                    r_type="experiment"
+                )
+            else:
+                items = []
+
+            st.markdown("---")
+
+        return items
+
+
     def render_minor_mods(
         self,
         data: Dict[str, Any] = {}
@@ -144,6 +183,84 @@ class ExperimentRenderer(BaseRenderer):
         return {'model': architecture}
 
 
+    def render_architecture_analysis(
+        self,
+        model: List[Dict[str, Any]],
+        key: str = "analysis"
+    ) -> ArchitectureAnalysis:
+        """ Renders an offline analysis of a model architecture, validating
+            the compatibility of consecutive layers & estimating its size, so
+            that oversized models are caught before any federated training
+
+        Args:
+            model (list(dict)): Layer specifications of a model
+            key (str): Prefix distinguishing widgets of separate analyses
+        Returns:
+            Analysis of the architecture (ArchitectureAnalysis)
+        """
+        with st.beta_container():
+            columns = st.beta_columns(2)
+
+            with columns[0]:
+                analysis = ArchitectureAnalysis(model)
+                input_shape_string = st.text_input(
+                    label="Input shape (per sample):",
+                    value=format_shape(analysis.input_shape)[1:-1],
+                    help="""Comma-separated dimensions of a single sample, 
+                            excluding the batch dimension (eg. 3, 32, 32). 
+                            Spatial dimensions cannot be inferred from the 
+                            architecture, and must be declared for FLOPs & 
+                            activations of convolutions to be estimated.
+                         """,
+                    key=f"{key}_input_shape"
+                )
+                try:
+                    input_shape = parse_shape(input_shape_string)
+                except ValueError:
+                    st.error(f"Invalid input shape '{input_shape_string}'!")
+                    input_shape = None
+
+            with columns[1]:
+                batch_size = st.number_input(
+                    label="Batch size:",
+                    min_value=1,
+                    value=DEFAULT_BATCH_SIZE,
+                    key=f"{key}_batch_size"
+                )
+
+            analysis = ArchitectureAnalysis(model, input_shape=input_shape)
+            memory = analysis.estimate_memory(batch_size)
+
+            for issue in analysis.issues:
+                st.error(issue)
+
+            parameter_count = analysis.parameter_count
+            if parameter_count is not None and parameter_count > MODEL_PARAMETER_LIMIT:
+                st.warning(
+                    f"Model has {parameter_count:,} parameters, exceeding the limit of {MODEL_PARAMETER_LIMIT:,}."
+                )
+            if memory['total'] is not None and memory['total'] > MODEL_MEMORY_LIMIT:
+                st.warning(
+                    f"Training is estimated to require {format_bytes(memory['total'])} per worker, exceeding the limit of {format_bytes(MODEL_MEMORY_LIMIT)}."
+                )
+
+            def _f(value, formatter=lambda value: f"{value:,}"):
+                return "unknown" if value is None else formatter(value)
+
+            st.code(
+                "\n".join([
+                    f"Parameters          : {_f(parameter_count)}",
+                    f"FLOPs per sample    : {_f(analysis.flop_count)}",
+                    f"Parameter memory    : {_f(memory['parameters'], format_bytes)} (incl. gradients)",
+                    f"Activation memory   : {_f(memory['activations'], format_bytes)} (batch size {batch_size})",
+                    f"Est. training memory: {_f(memory['total'], format_bytes)}"
+                ])
+            )
+            st.dataframe(analysis.layers)
+
+        return analysis
+
+
     def render_architecture_metadata(
         self, 
         data: Dict[str, Any] = {}
@@ -206,6 +323,11 @@ class ExperimentRenderer(BaseRenderer):
                         )
                         st.markdown(download_tag, unsafe_allow_html=True)
 
+            with st.beta_container():
+                is_analyzed = st.checkbox(label="Analyze architecture")
+                if is_analyzed:
+                    self.render_architecture_analysis(model, key="display_analysis")
+
         return {'model': model}
 
     ##################
@@ -263,4 +385,11 @@ class ExperimentRenderer(BaseRenderer):
         else:
             updated_architecture = self.render_upload_mods()
 
+        if updated_architecture.get('model'):
+            with st.beta_expander(label="Architecture analysis", expanded=False):
+                self.render_architecture_analysis(
+                    updated_architecture['model'],
+                    key="modify_analysis"
+                )
+
         return updated_architecture
\ No newline at end of file
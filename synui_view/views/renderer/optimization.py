@@ -5,20 +5,26 @@
 ####################
 
 # Generic/Built-in
+import itertools
 import json
 from io import StringIO
 from typing import Dict, List, Union, Any
 
 # Libs
+import pandas as pd
 import streamlit as st
 
 # Custom
+from views.core.leaderboard import LOWER_IS_BETTER
+from views.core.scheduler import SUPPORTED_PRUNERS, SUPPORTED_STRATEGIES
+from views.core.search_space import SearchSpace, validate_search_space
 from .base import BaseRenderer 
 
 ##################
 # Configurations #
 ##################
 
+SAMPLING_STRATEGIES = ["Grid", "Random", "Latin hypercube"]
 
 ###############################################
 # Optimization Renderer Class - OptimRenderer #
@@ -54,7 +60,22 @@ class OptimRenderer(BaseRenderer):
                 bytes_data = uploaded_file.getvalue()
                 stringio = StringIO(bytes_data.decode("utf-8"))
                 hyperparam_string = stringio.read()
-                hyperparam_ranges = {"search_space": json.loads(hyperparam_string)}
+                try:
+                    hyperparam_ranges = {"search_space": json.loads(hyperparam_string)}
+                except ValueError as e:
+                    st.error(f"Search space is not valid JSON! Error - {e}")
+                    return {}
+
+                # Malformed search spaces are rejected before any compute is spent
+                errors = validate_search_space(hyperparam_ranges['search_space'])
+                if errors:
+                    st.error(
+                        "\n".join(
+                            ["Invalid search space declared:"] + 
+                            [f"- {error}" for error in errors]
+                        )
+                    )
+                    return {}
             
                 # Load preview
                 with st.beta_expander(label="Search space", expanded=False):
@@ -63,16 +84,68 @@ class OptimRenderer(BaseRenderer):
                         language="json"
                     )
 
+                with st.beta_expander(label="Trial preview", expanded=False):
+                    self.render_trial_preview(
+                        SearchSpace(hyperparam_ranges['search_space'])
+                    )
+
             else:
                 hyperparam_ranges = {}
 
         return hyperparam_ranges
 
+
+    def render_trial_preview(self, search_space: SearchSpace):
+        """ Renders the size of a search space, as well as a preview of the
+            trials generated under a selected sampling strategy. Trials are 
+            generated lazily, so only previewed trials are ever materialized.
+
+        Args:
+            search_space (SearchSpace): Validated search space
+        """
+        if search_space.is_finite:
+            st.info(f"Search space contains {search_space.cardinality:,} distinct trials.")
+        else:
+            st.info(
+                f"""
+                Search space is continuous. A grid search would discretize it into {search_space.grid_cardinality():,} trials.
+                """
+            )
+
+        columns = st.beta_columns(2)
+        strategy = columns[0].selectbox(
+            label="Sampling strategy:",
+            options=SAMPLING_STRATEGIES,
+            key="preview_strategy"
+        )
+        preview_count = columns[1].number_input(
+            label="No. of trials to preview:",
+            min_value=1,
+            max_value=100,
+            value=10,
+            key="preview_count"
+        )
+
+        if strategy == SAMPLING_STRATEGIES[0]:
+            trials = search_space.grid()
+        elif strategy == SAMPLING_STRATEGIES[1]:
+            trials = search_space.random(preview_count, seed=0)
+        else:
+            trials = search_space.latin_hypercube(preview_count, seed=0)
+
+        st.dataframe(pd.DataFrame(list(itertools.islice(trials, preview_count))))
+
         
-    def render_tuning_parameters(self) -> Dict[str, Union[float, int, str]]:
+    def render_tuning_parameters(
+        self, 
+        metrics: List[str] = ["accuracy"]
+    ) -> Dict[str, Union[float, int, str]]:
         """ Renders interface facilitating tuner configurations for 
             hyperparmeter tuning submitted in a Synergos network
 
+        Args:
+            metrics (list(str)): Metrics reported for the project's ML 
+                operation (eg. those of its leaderboard)
         Returns:
             Tuning parameters (dict)
         """
@@ -80,13 +153,14 @@ class OptimRenderer(BaseRenderer):
 
             metric = st.selectbox(
                 label="Select your metric:",
-                options=["accuracy"],
+                options=metrics,
                 help="Select a metric to optimize on."
             )
 
             optimize_mode = st.selectbox(
                 label="Direction of optimization:",
                 options=["max", "min"],
+                index=int(metric in LOWER_IS_BETTER),
                 help="Specify if you want to maximize or minimize your selected metric."
             )
 
@@ -99,8 +173,9 @@ class OptimRenderer(BaseRenderer):
             max_exec_duration = st.number_input(
                 label="Time Budget (in seconds):",
                 value=1000,
-                help="""State a time budget for each trial. A time budget is a 
-                        duration after which a trial is forcefully terminated. 
+                help="""State a time budget for the entire tuning session. No new 
+                        trials are launched once it has elapsed, but trials 
+                        already in progress are run to completion.
                      """
             )
 
@@ -117,3 +192,90 @@ class OptimRenderer(BaseRenderer):
             'max_exec_duration': max_exec_duration,
             'max_trial_num': max_trial_num
         }
+
+
+    def render_scheduler_parameters(
+        self, 
+        run_prefix: str = "trial"
+    ) -> Dict[str, Union[int, str, bool]]:
+        """ Renders interface facilitating configurations of the local trial
+            scheduler, which tunes hyperparameters from within the UI instead
+            of the orchestrator
+
+        Args:
+            run_prefix (str): Default prefix of runs created for trials. This
+                must remain the same across reruns, lest the declared prefix
+                be reset.
+        Returns:
+            Scheduler parameters (dict)
+        """
+        with st.beta_container():
+
+            strategy = st.selectbox(
+                label="Sampling strategy:",
+                options=SUPPORTED_STRATEGIES,
+                help="Select how configurations are drawn from your search space."
+            )
+
+            pruner = st.selectbox(
+                label="Early stopping:",
+                options=SUPPORTED_PRUNERS,
+                help="""Select how poor trials are pruned. Pruned trials are only 
+                        trained with a fraction of the full budget.
+                     """
+            )
+
+            columns = st.beta_columns(3)
+            budget_param = columns[0].selectbox(
+                label="Budget hyperparameter:",
+                options=["rounds", "epochs"],
+                help="Hyperparameter controlling how long each trial is trained for."
+            )
+            min_budget = columns[1].number_input(
+                label="Min budget:",
+                min_value=1,
+                value=1,
+                help="Budget that trials are first trained with before pruning."
+            )
+            max_budget = columns[2].number_input(
+                label="Max budget:",
+                min_value=1,
+                value=9,
+                help="Budget that unpruned trials are fully trained with."
+            )
+
+            eta = 3
+            if pruner == SUPPORTED_PRUNERS[2]:
+                eta = st.number_input(
+                    label="Reduction factor:",
+                    min_value=2,
+                    value=3,
+                    help="Only the top 1/n trials of every rung are promoted."
+                )
+
+            run_prefix = st.text_input(
+                label="Run prefix:",
+                value=run_prefix,
+                help="Runs are created as '<prefix>-<configuration>-r<rung>'.",
+                key="run_prefix"
+            )
+
+            is_cached = st.checkbox(
+                label="Reuse results of identical runs",
+                value=True,
+                help="""Trials whose hyperparameters, model architecture & 
+                        alignments match a completed run reuse its validations
+                        instead of being retrained.
+                     """
+            )
+
+        return {
+            'strategy': strategy,
+            'pruner': pruner,
+            'budget_param': budget_param,
+            'min_budget': min_budget,
+            'max_budget': max_budget,
+            'eta': eta,
+            'run_prefix': run_prefix,
+            'is_cached': is_cached
+        }
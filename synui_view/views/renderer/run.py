@@ -17,6 +17,7 @@ from typing import Dict, List, Union, Any
 import streamlit as st
 
 # Custom
+from views.core.bulk_import import ImportItem, parse_upload, SUPPORTED_UPLOADS
 from .base import BaseRenderer 
 from .utils import download_button
 
@@ -76,6 +77,35 @@ class RunRenderer(BaseRenderer):
         return hyperparameters
 
 
+    def render_bulk_upload(self) -> List[ImportItem]:
+        """ Renders interface facilitating the declaration of many runs 
+            at once, via a JSONL file or an archive of JSON files
+
+        Returns:
+            Declared runs (list(ImportItem))
+        """
+        with st.beta_container():
+
+            uploaded_file = st.file_uploader(
+                label="Upload your hyperparameter sets in bulk:",
+                type=SUPPORTED_UPLOADS,
+                help="Provide a JSONL file, or an archive (zip/tar) of JSON files, each declaring a hyperparameter set"    
+            )
+
+            if uploaded_file is not None:
+                items = parse_upload(
+                    filename=uploaded_file.name,
+                    content=uploaded_file.getvalue(),
+                    r_type="run"
+                )
+            else:
+                items = []
+
+            st.markdown("---")
+
+        return items
+
+
     def render_hyperparmeters(
         self, 
         data: Dict[str, Any] = {}
@@ -5,17 +5,15 @@
 ####################
 
 # Generic/Built-in
-import os
 import random
-from itertools import zip_longest
-from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 # Libs
 import pydot
 import streamlit as st
 
 # Custom
+from views.core.tag_trie import TagSet, TagTrie, format_path, tokenize_path
 from .base import BaseRenderer 
 
 ##################
@@ -67,15 +65,30 @@ class TagRenderer(BaseRenderer):
     # Helpers #
     ###########
 
-    def __parse_to_tags(self, meta: str, tag_string: str) -> List[List[str]]:
-        """ Acquires and convert declared paths to data sources into data tags 
+    def __parse_to_tags(
+        self, 
+        tag_set: TagSet, 
+        meta: str, 
+        tag_string: str
+    ) -> TagTrie:
+        """ Acquires and convert declared paths to data sources into data tags.
+            Paths are deduplicated, and illegal paths are set aside for
+            validation.
 
         Args:
+            tag_set (TagSet): All tags declared so far
             meta (str): Type of data tags processed (i.e. 'train'/'evaluate'/'predict')
+            tag_string (str): Declared paths, one per line
         Returns:
-            Meta-specific Data tags (list)
+            Meta-specific Data tags (TagTrie)
         """           
-        data_meta_paths = tag_string.splitlines()
+        data_meta_tags = tag_set.declare(meta, tag_string.splitlines())
+        data_meta_paths = [format_path(tokens) for tokens in data_meta_tags]
+
+        if data_meta_tags.duplicate_count:
+            st.info(
+                f"{data_meta_tags.duplicate_count} duplicated {meta.upper()} tag(s) will only be registered once."
+            )
 
         options_container = st.empty()
         self._options = options_container.multiselect(
@@ -85,21 +98,21 @@ class TagRenderer(BaseRenderer):
             key=f"{meta}_options"
         )
 
-        data_meta_tokens = [
-            Path(path_str).parts[1:] 
-            for path_str in self._options
-        ]
-        return data_meta_tokens
+        for path in set(data_meta_paths) - set(self._options):
+            data_meta_tags.remove(tokenize_path(path))
+
+        return data_meta_tags
 
 
-    def __parse_to_tree(self, meta: str, data_tags: List[List[str]]) -> None:
-        """ Visualizes declared data tags for currrent meta type as a graph 
+    def __parse_to_tree(self, meta: str, data_tags: TagTrie) -> None:
+        """ Visualizes declared data tags for currrent meta type as a graph.
+            Chains of single-child directories are rendered as a single node.
 
         Args:
             meta (str): Type of data tags processed (i.e. 'train'/'evaluate'/'predict')
-            data_tags (list(list(str))): File path tokens declared for use
+            data_tags (TagTrie): File path tokens declared for use
         """
-        if data_tags:
+        if len(data_tags):
             
             data_tree = pydot.Dot(
                 f"{meta.upper()} Dataset Structure", 
@@ -117,41 +130,32 @@ class TagRenderer(BaseRenderer):
                 fontcolor='white'
             )
 
-            # Generate all nodes first
-            node_colours = {}
-            for idx, tags in enumerate(zip_longest(*data_tags)):
+            # Nodes are named by their full paths, so that identically named
+            # directories in separate branches remain distinct
+            root_name = data_tree.get_name()
+            node_levels = {(): 0}
+            level_colours = {}
+            for parent_path, child_path, label in data_tags.edges():
 
                 # Generate unique colors for each token hierarchy
-                curr_colour = node_colours.get(idx, generate_hex_colour())
-                node_colours[idx] = curr_colour
-
-                tags_keypoints = [tag for tag in set(tags) if tag]
-                for idx, node_name in enumerate(tags_keypoints):
-
-                    curr_node = pydot.Node(
-                        node_name, 
-                        label=node_name,
-                        shape='rectangle',
-                        style='filled',
-                        color=curr_colour#"#DC582A"
-                    )
-                    data_tree.add_node(curr_node)
-
-            for idx, tags in enumerate(data_tags):
-
-                curr_edge_colour = generate_hex_colour()
-                prev_node_name = data_tree.get_name()
-                for node_name in tags:
-
-                    # if not data_tree.get_edge(prev_node_name, node_name):
-                    node_edge = pydot.Edge(
-                        prev_node_name, 
-                        node_name, 
-                        color=curr_edge_colour
-                    )
-                    data_tree.add_edge(node_edge)
+                level = node_levels[parent_path] + 1
+                node_levels[child_path] = level
+                curr_colour = level_colours.setdefault(level, generate_hex_colour())
+
+                curr_node = pydot.Node(
+                    format_path(child_path), 
+                    label="/".join(label),
+                    shape='rectangle',
+                    style='filled',
+                    color=curr_colour
+                )
+                data_tree.add_node(curr_node)
 
-                    prev_node_name = node_name
+                node_edge = pydot.Edge(
+                    format_path(parent_path) if parent_path else root_name, 
+                    format_path(child_path)
+                )
+                data_tree.add_edge(node_edge)
 
             with st.beta_container():
                 for _ in range(1):
@@ -169,13 +173,20 @@ class TagRenderer(BaseRenderer):
         self, 
         data: Dict[str, Any] = {},
         tags: List[str] = ["train", "evaluate", "predict"]
-    ) -> Dict[str, List[List[str]]]:
+    ) -> Tuple[Dict[str, List[List[str]]], List[str]]:
         """ Renders entry field for specifying dataset tags for use in 
-            Synergos
+            Synergos. Declared tags are deduplicated & validated as a whole,
+            and compared against any tags already registered. Validation
+            errors are returned to the caller, as renderers are shared across
+            sessions.
 
         Returns:
             Tag details (dict)
+            Validation errors (list(str))
         """
+        registered_tags = TagSet(data)
+        declared_tags = TagSet()
+
         with st.beta_container():
             columns = st.beta_columns((1,2))
             dataset_types = columns[0].multiselect(
@@ -193,10 +204,9 @@ class TagRenderer(BaseRenderer):
                 columns = st.beta_columns((1, 2))
 
                 with columns[0]:
-                    meta_tags = data.get(dataset_type, [])
                     meta_tag_paths = [
-                        Path(*[os.sep, *tokens]).as_posix() 
-                        for tokens in meta_tags
+                        format_path(tokens)
+                        for tokens in registered_tags.tries.get(dataset_type, [])
                     ]
 
                     updated_meta_string = st.text_area(
@@ -209,6 +219,7 @@ class TagRenderer(BaseRenderer):
                     ).replace('\'', '"')
 
                     updated_meta_tags = self.__parse_to_tags(
+                        tag_set=declared_tags,
                         meta=dataset_type,
                         tag_string=updated_meta_string
                     )
@@ -219,11 +230,24 @@ class TagRenderer(BaseRenderer):
                         data_tags=updated_meta_tags
                     )
 
-                tag_details[dataset_type] = updated_meta_tags
+                tag_details[dataset_type] = [
+                    list(tokens) for tokens in updated_meta_tags
+                ]
 
                 st.markdown("---")
 
-        return tag_details
+        tag_errors = declared_tags.validate()
+        for error in tag_errors:
+            st.error(error)
+
+        if any(registered_tags.tries.values()):
+            for meta, changes in declared_tags.diff(registered_tags).items():
+                if meta in dataset_types:
+                    st.info(
+                        f"{meta.upper()}: {len(changes['added'])} tag(s) added, {len(changes['removed'])} tag(s) removed since registration."
+                    )
+
+        return tag_details, tag_errors
 
     ##################
     # Core Functions #
@@ -232,7 +256,7 @@ class TagRenderer(BaseRenderer):
     def display(
         self, 
         data: Dict[str, Any] = {}
-    ) -> Dict[str, List[List[str]]]:
+    ) -> Tuple[Dict[str, List[List[str]]], List[str]]:
         """ Main wrapper encapsulating form design responsible for rendering
             all information captured regarding the dataset tags registered for 
             use under by a participant
@@ -241,13 +265,14 @@ class TagRenderer(BaseRenderer):
             data (dict): Information relevant to a tag entry
         Returns:
             Updated tag info (dict)
+            Validation errors (list(str))
         """
         if not data:
-            return {}
+            return {}, []
 
         super().display(data, is_stacked=False)  # fields are stacked by default
 
         st.header("Registered Datasets")
-        updated_tags = self.render_tag_metadata(data)
+        updated_tags, tag_errors = self.render_tag_metadata(data)
 
-        return updated_tags
\ No newline at end of file
+        return updated_tags, tag_errors
\ No newline at end of file
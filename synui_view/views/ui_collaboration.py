@@ -17,6 +17,7 @@ from views.renderer import CollaborationRenderer
 from views.utils import (
     download_button,
     is_request_successful,
+    load_hierarchy_index,
     render_id_generator,
     render_orchestrator_inputs,
     render_confirmation_form,
@@ -198,7 +199,8 @@ def create_collaborations(driver: Driver = None):
     )
     if is_confirmed:
         create_resp = collab_task.create(collab_id=collab_id)
-        is_request_successful(create_resp)
+        if is_request_successful(create_resp):
+            load_hierarchy_index(driver).invalidate(collab_id=collab_id)
 
 
 ##############################################################
@@ -353,7 +355,8 @@ def remove_collaborations(driver: Driver = None):
     )
     if is_confirmed:
         delete_resp = driver.collaborations.delete(collab_id=selected_collab_id)
-        is_request_successful(delete_resp)
+        if is_request_successful(delete_resp):
+            load_hierarchy_index(driver).invalidate(collab_id=selected_collab_id)
 
 
 
@@ -15,6 +15,8 @@ from synergos import Driver
 from views.renderer import ExperimentRenderer
 from views.utils import (
     is_request_successful,
+    load_hierarchy_index,
+    render_bulk_import,
     render_id_generator,
     render_orchestrator_inputs,
     render_upstream_hierarchy,
@@ -32,7 +34,8 @@ SUPPORTED_ACTIONS = [
     "Create new experiment(s)",
     "Browse existing experiment(s)",
     "Update existing experiment(s)",
-    "Remove existing experiment(s)"
+    "Remove existing experiment(s)",
+    "Import experiment(s) in bulk"
 ]
 
 R_TYPE = "experiment"
@@ -68,6 +71,13 @@ def create_experiments(driver: Driver = None, key: Dict[str, str] = {}):
         expt_id = render_id_generator(r_type=R_TYPE)
         architecture = expt_renderer.render_upload_mods()
 
+        if architecture.get('model'):
+            with st.beta_expander(label="Architecture analysis", expanded=True):
+                expt_renderer.render_architecture_analysis(
+                    architecture['model'],
+                    key="create_analysis"
+                )
+
     ###############################
     # Step 2: Register experiment #
     ###############################
@@ -85,7 +95,8 @@ def create_experiments(driver: Driver = None, key: Dict[str, str] = {}):
             expt_id=expt_id, 
             **architecture
         )
-        is_request_successful(create_resp)
+        if is_request_successful(create_resp):
+            load_hierarchy_index(driver).invalidate(**key, expt_id=expt_id)
 
 
 
@@ -200,7 +211,54 @@ def remove_experiments(driver: Driver = None, key: Dict[str, str] = {}):
     )
     if is_confirmed:
         delete_resp = driver.experiments.delete(**key, expt_id=selected_expt_id)
-        is_request_successful(delete_resp)
+        if is_request_successful(delete_resp):
+            load_hierarchy_index(driver).invalidate(**key, expt_id=selected_expt_id)
+
+
+#######################################################
+# Experiment UI Option - Import Experiment(s) in bulk #
+#######################################################
+
+def import_experiments(driver: Driver = None, key: Dict[str, str] = {}):
+    """ Main function that governs the bulk creation of experiments within a 
+        specified Synergos network, from a JSONL file or an archive of JSON 
+        files
+    """
+    st.title("Orchestrator - Import Experiment(s) in Bulk")
+
+    ###########################################
+    # Step 1: Upload your model architectures #
+    ###########################################
+
+    st.header("Step 1: Upload your model architectures")
+    with st.beta_container():
+        items = expt_renderer.render_bulk_upload()
+
+    #####################################################
+    # Step 2: Validate & submit your experiment entries #
+    #####################################################
+
+    st.header("Step 2: Validate & submit your experiment entries")
+    existing_ids = [
+        record.get('key', {}).get('expt_id')
+        for record in driver.experiments.read_all(**key).get('data', []) or []
+    ]
+
+    def create_experiment(item):
+        return driver.experiments.create(**key, expt_id=item.record_id, model=item.payload)
+
+    imported_items = render_bulk_import(
+        items=items,
+        r_type=R_TYPE,
+        existing_ids=existing_ids,
+        create=create_experiment
+    )
+
+    hierarchy_index = load_hierarchy_index(driver)
+    for item in imported_items:
+        if item.status == "created":
+            hierarchy_index.invalidate(**key, expt_id=item.record_id)
+
 
 
 ###################################
@@ -214,6 +272,7 @@ def app(action: str):
     core_app.add_view(title=SUPPORTED_ACTIONS[1], func=browse_experiments)
     core_app.add_view(title=SUPPORTED_ACTIONS[2], func=update_experiments)
     core_app.add_view(title=SUPPORTED_ACTIONS[3], func=remove_experiments)
+    core_app.add_view(title=SUPPORTED_ACTIONS[4], func=import_experiments)
 
     driver = render_orchestrator_inputs()
 
@@ -14,11 +14,21 @@ import streamlit as st
 
 # Custom
 from synergos import Driver
+from views.core.comparison import (
+    diff_hyperparameters,
+    fetch_runs,
+    label_run,
+    overlay_metrics
+)
+from views.core.export import SUPPORTED_FORMATS, export_results
 from views.core.processes import TrackedInference
 from views.renderer import ParticipantRenderer, TagRenderer
 from views.ui_submission import collate_model_statistics
 from views.utils import (
     download_button,
+    load_completion_notifier,
+    load_hierarchy_index,
+    load_project_statistics,
     render_orchestrator_inputs,
     render_cascading_filter,
     render_participant,
@@ -40,6 +50,66 @@ tag_renderer = TagRenderer()
 # Helpers #
 ###########
 
+def render_run_comparison(driver: Driver, filters: Dict[str, str]):
+    """ Renders a side-by-side comparison of multiple runs under a project,
+        consisting of the hyperparameters that differ across the selected
+        runs, as well as an overlay of their grid-wide validation scores
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific project
+    """
+    hierarchy_index = load_hierarchy_index(driver)
+    collab_id = filters.get('collab_id')
+    project_id = filters.get('project_id')
+
+    run_keys = [
+        {
+            'collab_id': collab_id,
+            'project_id': project_id,
+            'expt_id': expt_id,
+            'run_id': run_id
+        }
+        for expt_id in hierarchy_index.children(collab_id, project_id)
+        for run_id in hierarchy_index.children(collab_id, project_id, expt_id)
+    ]
+
+    selected_run_keys = st.multiselect(
+        label="Runs to compare:",
+        options=run_keys,
+        format_func=label_run,
+        help="Select 2 or more runs to compare."
+    )
+
+    if len(selected_run_keys) < 2:
+        st.info("Please select at least 2 runs to compare.")
+        return
+
+    with st.spinner("Retrieving runs..."):
+        fetched_runs = fetch_runs(driver, selected_run_keys)
+
+    run_records = {}
+    validations = {}
+    for run_key, (run_data, val_data) in zip(selected_run_keys, fetched_runs):
+        run_records[label_run(run_key)] = run_data
+        validations[label_run(run_key)] = val_data
+
+    st.subheader("Hyperparameters")
+    differences = diff_hyperparameters(run_records)
+    if differences.empty:
+        st.info("All selected runs share identical hyperparameters.")
+    else:
+        st.dataframe(differences.astype(str))
+
+    st.subheader("Metrics")
+    action = load_project_statistics(driver, filters).action
+    scores = overlay_metrics(validations, action=action)
+    if scores.empty:
+        st.info("None of the selected runs have been validated yet.")
+    else:
+        st.dataframe(scores)
+        st.bar_chart(scores)
+
 
 #####################################################
 # Inference UI Option - Submit an inference request #
@@ -66,7 +136,10 @@ def commence_inference(
 
     st.header("Summary")
     with st.beta_expander(label="Statistics", expanded=True):
-        collate_model_statistics(driver, filters)
+        collate_model_statistics(load_project_statistics(driver, filters))
+
+    with st.beta_expander(label="Compare runs", expanded=False):
+        render_run_comparison(driver, filters)
 
     ###################################################
     # 0B. Show participants their reference data tags #
@@ -88,10 +161,11 @@ def commence_inference(
     ####################################################
 
     with st.beta_expander(label="2. Declare your prediction tags", expanded=False):
-        predict_tags = tag_renderer.render_tag_metadata(
+        declared_tags, _ = tag_renderer.render_tag_metadata(
             data=tag_details,
             tags=["predict"]
-        ).get('predict', {})
+        )
+        predict_tags = declared_tags.get('predict', {})
 
 
     st.header("Configurations")
@@ -101,25 +175,23 @@ def commence_inference(
     # 2. Extract hierarchical keys #
     ################################
 
-    expt_data = driver.experiments.read_all(**filters).get('data', [])
-    expt_ids = [
-        expt_record.get('key', {}).get('expt_id', "")
-        for expt_record in expt_data
-    ]
+    hierarchy_index = load_hierarchy_index(driver)
+
+    expt_ids = hierarchy_index.children(
+        filters.get('collab_id'), 
+        filters.get('project_id')
+    )
     selected_expt_id = code_columns[0].selectbox(
         label="Experiment ID:", 
         options=expt_ids,
         help="""Select an experiment to peruse."""
     )
 
-    run_data = driver.runs.read_all(
-        **filters,
-        expt_id=selected_expt_id
-    ).get('data', [])
-    run_ids = [
-        run_record.get('key', {}).get('run_id', "")
-        for run_record in run_data
-    ]
+    run_ids = hierarchy_index.children(
+        filters.get('collab_id'), 
+        filters.get('project_id'),
+        selected_expt_id
+    )
     selected_run_id = code_columns[0].selectbox(
         label="Run ID:", 
         options=run_ids,
@@ -140,12 +212,18 @@ def commence_inference(
     fl_job = TrackedInference(
         driver=driver, 
         participant_id=participant_id, 
-        filters=job_key
+        filters=job_key,
+        notifier=load_completion_notifier(driver, job_key)
     ) 
     detected_status = fl_job.check()
+    if fl_job.is_recovered:
+        code_columns[0].info(
+            "The session tracking a previous run of this job has ended, and its tracking has been released."
+        )
     idle_key = fl_job.statuses[0]
     in_progress_key = fl_job.statuses[1]
     completed_key = fl_job.statuses[2]
+    abandoned_key = fl_job.statuses[3]
 
     manual_status = code_columns[0].text_input(
         label="Status:", 
@@ -183,6 +261,30 @@ def commence_inference(
             ) == "Yes"
             
         detected_status = manual_status if is_forced else detected_status
+
+    # Edge 2: Participant is resubmitting a job that may still be running
+    elif detected_status == abandoned_key and manual_status == idle_key:
+
+        with code_columns[1]:
+            with st.beta_expander(label="Alerts", expanded=True):
+                st.warning(
+                    """
+                    You have chosen to override the current job state.
+
+                    If the previous run is still in progress, both runs will compete for the same grid.
+
+                    Please confirm to proceed.
+                    """
+                )
+
+        with code_columns[0]:
+            is_forced = st.selectbox(
+                label="Are you sure you want to resubmit?",
+                options=["No", "Yes"],
+                key=f"forced_resubmission"
+            ) == "Yes"
+            
+        detected_status = manual_status if is_forced else detected_status
         
     ########################################################################
     # Step 3a: If federated job has already completed, preview & download  #
@@ -217,14 +319,28 @@ def commence_inference(
                     value=f"INFERENCE_{job_key['collab_id']}_{job_key['project_id']}_{job_key['expt_id']}_{job_key['run_id']}",
                     help="Specify a custom filename if desired"
                 )
-                download_name = f"{filename}.json"
-                download_tag = download_button(
-                    object_to_download={
-                        'inferences': inferences 
-                    },
-                    download_filename=download_name,
-                    button_text="Download"
+                export_format = st.selectbox(
+                    label="Format:",
+                    options=["JSON"] + list(SUPPORTED_FORMATS.keys()),
+                    help="Columnar formats only contain flattened statistics."
                 )
+                if export_format == "JSON":
+                    download_name = f"{filename}.json"
+                    download_tag = download_button(
+                        object_to_download={
+                            'inferences': inferences 
+                        },
+                        download_filename=download_name,
+                        button_text="Download"
+                    )
+                else:
+                    extension = SUPPORTED_FORMATS[export_format]
+                    download_name = f"{filename}.{extension}"
+                    download_tag = download_button(
+                        object_to_download=export_results(inferences, export_format),
+                        download_filename=download_name,
+                        button_text="Download"
+                    )
                 st.markdown(download_tag, unsafe_allow_html=True)
 
     #########################################################################
@@ -249,6 +365,24 @@ def commence_inference(
                     """
                 )
 
+    ########################################################################
+    # Step 3c: If federated job lost its tracking session, verify it first #
+    ########################################################################
+
+    elif detected_status == abandoned_key:
+
+        with code_columns[1]:
+            with st.beta_expander(label="Alerts", expanded=True):
+                st.warning(
+                    f"""
+                    The session tracking a previous run of this job has ended before the run completed.
+
+                    The run may still be in progress on the grid!
+
+                    Please verify that it has stopped before resubmitting, or override the status with '{idle_key}' to resubmit anyway.
+                    """
+                )
+
     elif detected_status == idle_key:
 
         with code_columns[0]:
@@ -267,15 +401,20 @@ def commence_inference(
             if is_submitted:
                 placeholder.empty()
                 
-                fl_job.start()
-                with st.spinner('Job in progress...'):
-
-                    driver.predictions.create(
-                        tags={job_key['project_id']: predict_tags},
-                        participant_id=participant_id,
-                        **job_key,
-                        auto_align=is_auto_aligned
-                    )
+                fl_job.start(participants=[participant_id])
+                try:
+                    with st.spinner('Job in progress...'), fl_job.stage("prediction"):
+
+                        driver.predictions.create(
+                            tags={job_key['project_id']: predict_tags},
+                            participant_id=participant_id,
+                            **job_key,
+                            auto_align=is_auto_aligned
+                        )
+
+                except Exception:
+                    fl_job.stop(outcome="failed")
+                    raise
 
                 fl_job.stop()
                 st.info("Job Completed! Please refresh to view results.")
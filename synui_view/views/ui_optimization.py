@@ -7,6 +7,8 @@
 # Generic/Built-in
 import json
 import os
+import time
+import uuid
 from collections import Counter
 from io import StringIO
 from typing import Dict, List, Any, Tuple
@@ -15,10 +17,14 @@ from typing import Dict, List, Any, Tuple
 import streamlit as st
 
 # Custom
-from config import STYLES_DIR
+from config import STYLES_DIR, SWEEP_REFRESH_INTERVAL, SWEEP_TABLE_SIZE
 from synergos import Driver
 from views.renderer import OptimRenderer
+from views.core.history import JobHistory
 from views.core.processes import TrackedProcess
+from views.core.scheduler import Trial, TrialScheduler
+from views.core.search_space import SearchSpace
+from views.core.sweep import SweepMonitor
 from views.ui_submission import(
     load_command_station,
     collate_general_statistics,
@@ -32,6 +38,10 @@ from views.utils import (
     wait_for_completion,
     download_button,
     load_custom_css,
+    load_project_statistics,
+    load_trial_cache,
+    retrieve_orchestrator_address,
+    retrieve_session_default,
     render_orchestrator_inputs,
     render_upstream_hierarchy,
     MultiApp
@@ -41,10 +51,190 @@ from views.utils import (
 # Configurations #
 ##################
 
-SUPPORTED_DASHBOARDS = ['Hyperdrive', 'Command Station']
+SUPPORTED_DASHBOARDS = ['Hyperdrive', 'Sweep Monitor', 'Command Station']
+SUPPORTED_SCHEDULERS = ["Orchestrator", "Local"]
 
 optim_renderer = OptimRenderer()
 
+###########
+# Helpers #
+###########
+
+def run_trial_scheduler(
+    driver: Driver,
+    filters: Dict[str, str],
+    search_space: SearchSpace,
+    tuning_parameters: Dict[str, Any],
+    scheduler_parameters: Dict[str, Any],
+    pipeline_kwargs: Dict[str, Any]
+):
+    """ Tunes hyperparameters with the local trial scheduler, rendering the
+        trials as they are launched & completed
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific experiment
+        search_space (SearchSpace): Validated search space
+        tuning_parameters (dict): Tuner configurations
+        scheduler_parameters (dict): Local scheduler configurations
+        pipeline_kwargs (dict): Parameters for model & validation creation
+    """
+    statistics = load_project_statistics(driver, filters)
+
+    scheduler_parameters = dict(scheduler_parameters)
+    result_cache = (
+        load_trial_cache(driver, filters)
+        if scheduler_parameters.pop('is_cached', False)
+        else None
+    )
+
+    try:
+        scheduler = TrialScheduler(
+            driver=driver,
+            filters=filters,
+            search_space=search_space,
+            waiter=wait_for_completion,
+            action=statistics.action,
+            metric=tuning_parameters['metric'],
+            optimize_mode=tuning_parameters['optimize_mode'],
+            trial_concurrency=tuning_parameters['trial_concurrency'],
+            max_trial_num=tuning_parameters['max_trial_num'],
+            max_exec_duration=tuning_parameters['max_exec_duration'],
+            result_cache=result_cache,
+            pipeline_kwargs=pipeline_kwargs,
+            **scheduler_parameters
+        )
+    except ValueError as e:
+        st.error(f"Invalid tuning configuration! Error - {e}")
+        return
+
+    progress_bar = st.progress(0)
+    trial_placeholder = st.empty()
+
+    def update_trials(trial: Trial):
+        progress = min(scheduler.spent / scheduler.max_trial_num, 1.0)
+        progress_bar.progress(progress)
+        trial_placeholder.dataframe(scheduler.summarize())
+
+    job_history = JobHistory.load()
+    job_id = job_history.start_job(
+        p_type="optimization",
+        filters=filters,
+        grid_size=statistics.grid_count,
+        participants=list(statistics.registrations.keys())
+    )
+    try:
+        with st.spinner("Trials in progress..."), job_history.stage(job_id, "scheduling"):
+            scheduler.run(on_update=update_trials)
+
+    except Exception:
+        job_history.end_job(job_id, outcome="failed")
+        raise
+
+    job_history.end_job(job_id)
+    trial_placeholder.dataframe(scheduler.summarize())
+
+    best_trial = scheduler.best()
+    if best_trial:
+        reuse_note = (
+            f", reusing the results of run {best_trial.reused_from}"
+            if best_trial.reused_from
+            else ""
+        )
+        st.info(
+            f"Tuning completed! Best run: {best_trial.run_id} ({tuning_parameters['metric']} = {best_trial.score:.4f}{reuse_note})"
+        )
+    else:
+        st.warning("Tuning completed, but no trial was validated successfully.")
+
+
+def refresh_sweep_monitor(
+    driver: Driver,
+    filters: Dict[str, str],
+    action: str
+) -> Tuple[SweepMonitor, bool]:
+    """ Retrieves the cached monitor of an experiment's sweep, folding in any
+        runs, models & validations added since it was last refreshed. Only
+        the monitored experiment is pulled, rather than its entire project.
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific experiment
+        action (str): ML operation of the project
+    Returns:
+        Sweep monitor (SweepMonitor)
+        Change state (bool)
+    """
+    expt_data = driver.experiments.read(
+        collab_id=filters['collab_id'],
+        project_id=filters['project_id'],
+        expt_id=filters['expt_id']
+    ).get('data', {}) or {}
+
+    monitor = SweepMonitor.load(
+        address=retrieve_orchestrator_address(driver),
+        collab_id=filters['collab_id'],
+        project_id=filters['project_id'],
+        expt_id=filters['expt_id'],
+        action=action
+    )
+    is_changed = monitor.refresh(expt_data)
+    return monitor, is_changed
+
+
+def render_sweep(monitor: SweepMonitor, metric: str, placeholders: List[Any]):
+    """ Renders the status counts, best-so-far curve, parallel coordinates &
+        recent trials of a monitored sweep onto their respective placeholders
+
+    Args:
+        monitor (SweepMonitor): Refreshed sweep monitor
+        metric (str): Metric to trace
+        placeholders (list): Streamlit placeholders, one per visualisation
+    """
+    status_placeholder, curve_placeholder, coord_placeholder, table_placeholder = placeholders
+
+    status_counts = monitor.status_counts
+    status_placeholder.markdown(
+        " | ".join([
+            f"**{status.capitalize()}**: {count}" 
+            for status, count in status_counts.items()
+        ])
+    )
+
+    best_curve = monitor.best_curve(metric)
+    if best_curve.empty:
+        curve_placeholder.info("No trial has been validated yet.")
+    else:
+        curve_placeholder.line_chart(best_curve)
+
+    coordinates = monitor.parallel_coordinates(metric)
+    if coordinates.empty:
+        coord_placeholder.info("No hyperparameter has been varied across validated trials yet.")
+    else:
+        coord_placeholder.vega_lite_chart(
+            coordinates,
+            {
+                'mark': {'type': "line", 'opacity': 0.6},
+                'encoding': {
+                    'x': {'field': "hyperparameter", 'type': "nominal"},
+                    'y': {
+                        'field': "value", 
+                        'type': "quantitative", 
+                        'title': "normalized value"
+                    },
+                    'detail': {'field': "run_id", 'type': "nominal"},
+                    'color': {'field': metric, 'type': "quantitative"},
+                    'tooltip': [
+                        {'field': "run_id", 'type': "nominal"},
+                        {'field': metric, 'type': "quantitative"}
+                    ]
+                }
+            },
+            use_container_width=True
+        )
+
+    table_placeholder.dataframe(monitor.recent_runs(SWEEP_TABLE_SIZE))
+
 #########################################
 # Submission UI Option - Open Launchpad #
 #########################################
@@ -69,15 +259,16 @@ def load_hyperdrive(driver: Driver, filters: Dict[str, str]):
 
     st.header("Summary")
 
+    statistics = load_project_statistics(driver, filters)
     with st.beta_expander(label="Grid statistics", expanded=True):
         columns = st.beta_columns(2)
 
         with columns[0]:
-            collate_general_statistics(driver, filters)
+            collate_general_statistics(statistics)
         with columns[1]:
-            collate_participant_statistics(driver, filters)
+            collate_participant_statistics(statistics)
 
-        collate_model_statistics(driver, filters)
+        collate_model_statistics(statistics)
 
     st.header(f"Hyperdrive")
 
@@ -86,9 +277,48 @@ def load_hyperdrive(driver: Driver, filters: Dict[str, str]):
     with columns[0]:
         show_hierarchy({**filters, 'run_id': "*"})
         has_inactive_components, has_active_grids = perform_healthcheck(driver, filters)
-        tuning_parameters = optim_renderer.render_tuning_parameters()
+        tuning_parameters = optim_renderer.render_tuning_parameters(
+            metrics=statistics.leaderboard.metrics
+        )
         search_space = optim_renderer.render_upload_mods()
 
+        scheduler_mode = st.radio(
+            label="Schedule trials on:",
+            options=SUPPORTED_SCHEDULERS,
+            help="""The local scheduler launches trials as individual runs from 
+                    this UI, and prunes poor trials early.
+                 """
+        )
+        scheduler_parameters = (
+            optim_renderer.render_scheduler_parameters(
+                run_prefix=retrieve_session_default(
+                    "run_prefix", 
+                    lambda: f"trial-{uuid.uuid4().hex[:6]}"
+                )
+            )
+            if scheduler_mode == SUPPORTED_SCHEDULERS[1]
+            else {}
+        )
+
+        if search_space:
+            max_trial_num = tuning_parameters['max_trial_num']
+            parsed_space = SearchSpace(search_space['search_space'])
+            trial_count = parsed_space.estimate_trial_count(max_trial_num)
+            if trial_count < max_trial_num:
+                st.warning(
+                    f"""
+                    Search space only contains {trial_count} distinct trials, fewer than the {max_trial_num} trials requested.
+                    """
+                )
+
+            budget_param = scheduler_parameters.get('budget_param')
+            if budget_param in [parameter.name for parameter in parsed_space.parameters]:
+                st.warning(
+                    f"""
+                    Budget hyperparameter '{budget_param}' is also declared in the search space. Please remove it from the search space, or select another budget hyperparameter.
+                    """
+                )
+
     if has_inactive_components or not has_active_grids:
 
         with columns[-1]:
@@ -149,21 +379,136 @@ def load_hyperdrive(driver: Driver, filters: Dict[str, str]):
 
                     is_submitted = st.button(label="Start", key=f"start_job")
 
-                if is_submitted:
+                if is_submitted and scheduler_parameters:
                     placeholder.empty()
+                    run_trial_scheduler(
+                        driver, 
+                        filters, 
+                        search_space=SearchSpace(search_space['search_space']),
+                        tuning_parameters=tuning_parameters,
+                        scheduler_parameters=scheduler_parameters,
+                        pipeline_kwargs={
+                            'auto_align': is_auto_aligned,
+                            'log_msgs': is_logged,
+                            'verbose': is_verbose
+                        }
+                    )
 
-                    with st.spinner('Hyperjob in progress...'):
-                        driver.optimizations.create(
-                            **filters,
-                            **search_space,
-                            **tuning_parameters,
-                            auto_align=is_auto_aligned,
-                            log_msgs=is_logged,
-                            verbose=is_verbose        
-                        )
+                elif is_submitted:
+                    placeholder.empty()
 
-                    st.info("Hyperjob submitted! You may track your progress via the Command Station.")
+                    job_history = JobHistory.load()
+                    job_id = job_history.start_job(
+                        p_type="optimization",
+                        filters=filters,
+                        grid_size=statistics.grid_count,
+                        participants=list(statistics.registrations.keys())
+                    )
+                    try:
+                        with st.spinner('Hyperjob in progress...'), job_history.stage(job_id, "submission"):
+                            driver.optimizations.create(
+                                **filters,
+                                **search_space,
+                                **tuning_parameters,
+                                auto_align=is_auto_aligned,
+                                log_msgs=is_logged,
+                                verbose=is_verbose        
+                            )
+
+                    except Exception:
+                        job_history.end_job(job_id, outcome="failed")
+                        raise
+
+                    # Only the submission itself is timed here, so the job is
+                    # excluded from the completed job latencies
+                    job_history.end_job(job_id, outcome="submitted")
+
+                    st.info("Hyperjob submitted! You may track your progress via the Sweep Monitor.")
+
+
+######################################
+# Submission UI Option - Watch Sweep #
+######################################
+
+def load_sweep_monitor(driver: Driver, filters: Dict[str, str]):
+    """ Loads up a live dashboard tracking the progress of a hyperparameter
+        sweep (i.e. all runs under an experiment). Only records added since 
+        the previous refresh are aggregated, so that refreshes remain cheap
+        even as trials accumulate.
 
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific experiment
+    """
+    st.title("Orchestrator - Hyperparameter Sweep Monitor")
+
+    if not filters.get('expt_id'):
+        st.warning("Please select an experiment to monitor its sweep.")
+        return
+
+    show_hierarchy({**filters, 'run_id': "*"})
+
+    statistics = load_project_statistics(driver, filters)
+    monitor, _ = refresh_sweep_monitor(driver, filters, statistics.action)
+
+    columns = st.beta_columns(2)
+    with columns[0]:
+        metric = st.selectbox(
+            label="Metric to trace:",
+            options=monitor.metrics,
+            help="Scores are averaged across all participants' validations."
+        )
+    with columns[1]:
+        refresh_interval = st.number_input(
+            label="Refresh interval (s):",
+            min_value=1,
+            value=SWEEP_REFRESH_INTERVAL,
+            help="Time between polls for new runs & validations."
+        )
+
+    is_live = st.checkbox(
+        label="Watch live",
+        value=False,
+        help="Keeps polling the orchestrator until unchecked."
+    )
+
+    st.header("Trial Statuses")
+    status_placeholder = st.empty()
+
+    st.header("Best So Far")
+    curve_placeholder = st.empty()
+
+    st.header("Parallel Coordinates")
+    coord_placeholder = st.empty()
+
+    st.header("Recent Trials")
+    table_placeholder = st.empty()
+
+    refresh_placeholder = st.empty()
+
+    placeholders = [
+        status_placeholder, 
+        curve_placeholder, 
+        coord_placeholder, 
+        table_placeholder
+    ]
+    render_sweep(monitor, metric, placeholders)
+
+    # Streamlit only acts on a pending rerun (eg. once "Watch live" is
+    # unchecked) when the script writes to the page, so every poll is
+    # reported, even when nothing has changed
+    while is_live:
+        refresh_placeholder.text(
+            f"Last refreshed at {time.strftime('%H:%M:%S')}"
+        )
+        time.sleep(refresh_interval)
+        monitor, is_changed = refresh_sweep_monitor(
+            driver, 
+            filters, 
+            statistics.action
+        )
+        if is_changed:
+            render_sweep(monitor, metric, placeholders)
 
 #######################################
 # Job Submission UI - Page Formatting #
@@ -174,7 +519,8 @@ def app(action: str):
 
     core_app = MultiApp()
     core_app.add_view(title=SUPPORTED_DASHBOARDS[0], func=load_hyperdrive)
-    core_app.add_view(title=SUPPORTED_DASHBOARDS[1], func=load_command_station)
+    core_app.add_view(title=SUPPORTED_DASHBOARDS[1], func=load_sweep_monitor)
+    core_app.add_view(title=SUPPORTED_DASHBOARDS[2], func=load_command_station)
 
     driver = render_orchestrator_inputs()
 
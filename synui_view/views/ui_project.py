@@ -16,6 +16,7 @@ from synergos import Driver
 from views.renderer import ProjectRenderer
 from views.utils import (
     is_request_successful,
+    load_hierarchy_index,
     render_id_generator,
     render_orchestrator_inputs,
     render_upstream_hierarchy,
@@ -24,6 +25,7 @@ from views.utils import (
     render_experiments,
     render_runs,
     render_orchestrator_registrations,
+    render_alignment_coverage,
     MultiApp
 )
 
@@ -90,7 +92,8 @@ def create_projects(driver: Driver = None, key: Dict[str, str] = {}):
             project_id=project_id, 
             **project_info
         )
-        is_request_successful(create_resp)
+        if is_request_successful(create_resp):
+            load_hierarchy_index(driver).invalidate(**key, project_id=project_id)
 
 
 
@@ -145,6 +148,17 @@ def browse_projects(driver: Driver = None, key: Dict[str, str] = {}):
         project_id=selected_project_id
     )
 
+    ###########################################################
+    # Step 4: Inspect alignment coverage of specified project #
+    ###########################################################
+
+    st.header("Step 4: Inspect Alignment Coverage")
+    render_alignment_coverage(
+        driver=driver,
+        **key,
+        project_id=selected_project_id
+    )
+
 
 
 ##################################################
@@ -221,7 +235,11 @@ def remove_projects(driver: Driver = None, key: Dict[str, str] = {}):
             **key, 
             project_id=selected_project_id
         )
-        is_request_successful(delete_resp)
+        if is_request_successful(delete_resp):
+            load_hierarchy_index(driver).invalidate(
+                **key, 
+                project_id=selected_project_id
+            )
 
 
 
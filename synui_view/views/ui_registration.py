@@ -5,22 +5,37 @@
 ####################
 
 # Generic/Built-in
-
+from typing import Dict, Any
 
 # Libs
+import pandas as pd
 import streamlit as st
 
 # Custom
+from config import (
+    BENCHMARK_REQUEST_SAMPLES,
+    BENCHMARK_RTT_LIMIT, 
+    BENCHMARK_SAMPLES, 
+    NODE_PROBE_TTL
+)
 from synergos import Driver
+from views.core.probe import (
+    EXPECTED_CHANNELS,
+    benchmark_connection, 
+    probe_nodes, 
+    summarize_probes
+)
 from views.renderer import RegistrationRenderer, TagRenderer
 from views.utils import (
     is_request_successful,
+    load_hierarchy_index,
     render_orchestrator_inputs,
     render_cascading_filter,
     render_confirmation_form,
     render_collaborations,
     render_projects,
     render_participant_registrations,
+    retrieve_orchestrator_address,
     MultiApp
 )
 
@@ -45,6 +60,101 @@ tag_renderer = TagRenderer()
 # Helpers #
 ###########
 
+@st.cache(ttl=NODE_PROBE_TTL, show_spinner=False)
+def probe_declared_nodes(node_details: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """ Probes declared compute nodes, reusing the results for identical 
+        declarations for NODE_PROBE_TTL seconds, so that reruns of the page 
+        do not re-probe every node
+    """
+    return summarize_probes(probe_nodes(node_details))
+
+
+def render_node_probe(node_details: Dict[str, Dict[str, Any]]) -> bool:
+    """ Tests the command & data ports of all declared compute nodes
+        concurrently, reporting the latency of reachable ports & the kind of
+        failure encountered on all others. Probes are made from the machine
+        running this interface, which may not share the orchestrator's
+        network path to the nodes, and are hence only advisory.
+
+    Args:
+        node_details (dict): Declared compute nodes
+    Returns:
+        Are all expected ports (i.e. command ports) reachable (bool)
+    """
+    if not node_details:
+        st.warning("No valid compute nodes declared!")
+        return False
+
+    with st.spinner("Probing declared compute nodes..."):
+        probes = probe_declared_nodes(node_details)
+
+    is_unreachable = probes['status'] != "reachable"
+    is_expected = probes['channel'].isin(EXPECTED_CHANNELS)
+    unexpected_failure_count = int((is_unreachable & is_expected).sum())
+    idle_failure_count = int((is_unreachable & ~is_expected).sum())
+
+    if unexpected_failure_count:
+        st.error(
+            f"{unexpected_failure_count} of {int(is_expected.sum())} command port(s) cannot be reached from this machine! Please check your node declarations."
+        )
+    else:
+        st.success(f"All {int(is_expected.sum())} command port(s) are reachable.")
+
+    if idle_failure_count:
+        st.info(
+            f"{idle_failure_count} data port(s) cannot be reached. Data ports usually only accept connections while a job is running."
+        )
+
+    st.dataframe(probes)
+    return not unexpected_failure_count
+
+
+def render_orchestrator_benchmark(driver: Driver):
+    """ Benchmarks the round-trip time of the connection to the orchestrator,
+        as well as its API response time. Measurements are taken from the
+        machine running this interface, and hence only reflect the connections
+        of compute nodes hosted alongside it.
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+    """
+    address = retrieve_orchestrator_address(driver)
+    if not address:
+        st.warning("Orchestrator address is unknown, and cannot be benchmarked.")
+        return
+
+    host, port = address
+    with st.spinner("Benchmarking connection to orchestrator..."):
+        try:
+            benchmark = benchmark_connection(
+                host=host,
+                port=port,
+                samples=BENCHMARK_SAMPLES,
+                request=driver.collaborations.read_all,
+                request_samples=BENCHMARK_REQUEST_SAMPLES
+            )
+        except Exception as e:
+            st.error(f"Orchestrator could not be benchmarked: {e}")
+            return
+
+    if not benchmark['samples']:
+        st.error("Orchestrator did not respond to any benchmarking attempt!")
+    elif benchmark['rtt_median_ms'] > BENCHMARK_RTT_LIMIT:
+        st.warning(
+            f"Median round-trip time of {benchmark['rtt_median_ms']}ms exceeds {BENCHMARK_RTT_LIMIT}ms, and may not sustain training."
+        )
+
+    st.code(
+        "\n".join([
+            f"Round trips     : {benchmark['samples']} ({benchmark['failures']} failed)",
+            f"RTT min/med/max : {benchmark['rtt_min_ms']} / {benchmark['rtt_median_ms']} / {benchmark['rtt_max_ms']} ms",
+            f"Jitter          : {benchmark['jitter_ms']} ms",
+            f"API response    : {benchmark['response_median_ms']} ms (collaboration listing)"
+        ])
+    )
+
+
 
 #######################################################
 # Registration UI Option - Create new Registration(s) #
@@ -81,13 +191,31 @@ def create_registrations(driver: Driver = None, participant_id: str = None):
         user_role = registration_renderer.render_role_declaration()
         node_details = registration_renderer.render_registration_metadata()
 
+    with st.beta_expander("Node Connectivity", expanded=True):
+        is_reachable = render_node_probe(node_details)
+
+        is_overridden = False
+        if not is_reachable and node_details:
+            is_overridden = st.checkbox(
+                label="Register anyway",
+                help="""Nodes are probed from this machine, which may not share 
+                        the orchestrator's network path to them (eg. across 
+                        private networks). Tick this if you have verified 
+                        your nodes by other means.
+                     """
+            )
+
+        is_benchmarked = st.checkbox(label="Benchmark connection to orchestrator")
+        if is_benchmarked:
+            render_orchestrator_benchmark(driver)
+
     ######################################
     # Step 3: Register your dataset tags #
     ######################################
 
     st.header("Step 3: Register your dataset tags")
     with st.beta_expander("Tag Registration"):
-        tag_details = tag_renderer.render_tag_metadata()
+        tag_details, tag_errors = tag_renderer.render_tag_metadata()
 
     ##########################################
     # Step 4: Submit your registration entry #
@@ -102,6 +230,18 @@ def create_registrations(driver: Driver = None, participant_id: str = None):
     )
     if is_confirmed:
 
+        # Nothing is submitted unless the declared tags are valid
+        if tag_errors:
+            st.error("Invalid tag hierarchy detected! Please check and try again!")
+            return
+
+        # Unreachable nodes are only registered upon an explicit override
+        if not (is_reachable or is_overridden):
+            st.error(
+                "Unreachable compute nodes declared! Please check and try again, or tick 'Register anyway' to override."
+            )
+            return
+
         try:
             # Submit registrations
             registration_task = driver.registrations
@@ -115,7 +255,11 @@ def create_registrations(driver: Driver = None, participant_id: str = None):
                 **user_role
             )
             st.info("Processing node registrations...")
-            is_request_successful(reg_create_resp)
+            if is_request_successful(reg_create_resp):
+                load_hierarchy_index(driver).invalidate(
+                    collab_id=selected_collab_id,
+                    project_id=selected_project_id
+                )
         except:
             st.error("Invalid node metadata declared! Please check and try again!")
 
@@ -176,7 +320,7 @@ def update_registrations(driver: Driver = None, participant_id: str = None):
     ##################################################################
 
     st.header("Step 1: Modify your registration of interest")
-    key, updated_node_details, updated_tags = render_participant_registrations(
+    key, updated_node_details, updated_tags, tag_errors = render_participant_registrations(
         driver=driver,
         participant_id=participant_id
     )
@@ -194,6 +338,11 @@ def update_registrations(driver: Driver = None, participant_id: str = None):
     )
 
     if is_confirmed:
+
+        # Nothing is submitted unless the updated tags are valid
+        if tag_errors:
+            st.error("Invalid tag hierarchy detected! Please check and try again!")
+            return
         
         try:           
             # Submit registrations
@@ -232,7 +381,7 @@ def remove_registrations(driver: Driver = None, participant_id: str = None):
     ######################################################################
 
     st.header("Step 1: Target your registration of interest")
-    key, updated_node_details, updated_tags = render_participant_registrations(
+    key, updated_node_details, updated_tags, _ = render_participant_registrations(
         driver=driver,
         participant_id=participant_id
     )
@@ -259,7 +408,8 @@ def remove_registrations(driver: Driver = None, participant_id: str = None):
             # automatically be deleted as well
 
             st.info("Processing deletion request...")
-            is_request_successful(delete_resp)
+            if is_request_successful(delete_resp):
+                load_hierarchy_index(driver).invalidate(**key)
             
         except:
             st.error("Invalid node metadata declared! Please check and try again!")
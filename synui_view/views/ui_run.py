@@ -16,6 +16,8 @@ from synergos import Driver
 from views.renderer import RunRenderer
 from views.utils import (
     is_request_successful,
+    load_hierarchy_index,
+    render_bulk_import,
     rerun,
     render_id_generator,
     render_orchestrator_inputs,
@@ -33,7 +35,8 @@ SUPPORTED_ACTIONS = [
     "Create new Run(s)",
     "Browse existing Run(s)",
     "Update existing Run(s)",
-    "Remove existing Run(s)"
+    "Remove existing Run(s)",
+    "Import Run(s) in bulk"
 ]
 
 R_TYPE = "run"
@@ -81,7 +84,8 @@ def create_runs(driver: Driver = None, key: Dict[str, str] = {}):
     )
     if is_confirmed:
         create_resp = driver.runs.create(**key, run_id=run_id, **hyperparameters)
-        is_request_successful(create_resp)
+        if is_request_successful(create_resp):
+            load_hierarchy_index(driver).invalidate(**key, run_id=run_id)
 
 
 
@@ -191,10 +195,57 @@ def remove_runs(driver: Driver = None, key: Dict[str, str] = {}):
     )
     if is_confirmed:
         delete_resp = driver.runs.delete(**key, run_id=selected_run_id)
-        is_request_successful(delete_resp)
+        if is_request_successful(delete_resp):
+            load_hierarchy_index(driver).invalidate(**key, run_id=selected_run_id)
             
 
 
+#########################################
+# Run UI Option - Import Run(s) in bulk #
+#########################################
+
+def import_runs(driver: Driver = None, key: Dict[str, str] = {}):
+    """ Main function that governs the bulk creation of runs within a 
+        specified Synergos network, from a JSONL file or an archive of JSON 
+        files
+    """
+    st.title("Orchestrator - Import Run(s) in Bulk")
+
+    ###########################################
+    # Step 1: Upload your hyperparameter sets #
+    ###########################################
+
+    st.header("Step 1: Upload your hyperparameter sets")
+    with st.beta_container():
+        items = run_renderer.render_bulk_upload()
+
+    ##############################################
+    # Step 2: Validate & submit your run entries #
+    ##############################################
+
+    st.header("Step 2: Validate & submit your run entries")
+    existing_ids = [
+        record.get('key', {}).get('run_id')
+        for record in driver.runs.read_all(**key).get('data', []) or []
+    ]
+
+    def create_run(item):
+        return driver.runs.create(**key, run_id=item.record_id, **item.payload)
+
+    imported_items = render_bulk_import(
+        items=items,
+        r_type=R_TYPE,
+        existing_ids=existing_ids,
+        create=create_run
+    )
+
+    hierarchy_index = load_hierarchy_index(driver)
+    for item in imported_items:
+        if item.status == "created":
+            hierarchy_index.invalidate(**key, run_id=item.record_id)
+
+
+
 ############################
 # Run UI - Page Formatting #
 ############################
@@ -206,6 +257,7 @@ def app(action: str):
     core_app.add_view(title=SUPPORTED_ACTIONS[1], func=browse_runs)
     core_app.add_view(title=SUPPORTED_ACTIONS[2], func=update_runs)
     core_app.add_view(title=SUPPORTED_ACTIONS[3], func=remove_runs)
+    core_app.add_view(title=SUPPORTED_ACTIONS[4], func=import_runs)
 
     driver = render_orchestrator_inputs()
 
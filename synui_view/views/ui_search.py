@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+####################
+# Required Modules #
+####################
+
+# Generic/Built-in
+import json
+import time
+
+# Libs
+import pandas as pd
+import streamlit as st
+
+# Custom
+from synergos import Driver
+from views.core.search import SEARCHABLE_RECORDS
+from views.utils import (
+    load_search_index,
+    render_orchestrator_inputs,
+    MultiApp
+)
+
+##################
+# Configurations #
+##################
+
+SUPPORTED_ACTIONS = ["Search existing record(s)"]
+
+MAX_RESULTS = 100
+
+QUERY_HELP = """
+    Space-separated clauses, all of which must match:
+
+    - `linear` matches a term in any field
+    - `l_type:linear` matches a term in a specific field
+    - `fed*` / `algorithm:fed*` matches a prefix
+    - `lr:0.001..0.01` matches a numeric range (either end may be left open)
+"""
+
+###########
+# Helpers #
+###########
+
+
+################################################
+# Search UI Option - Search existing record(s) #
+################################################
+
+def search_records(driver: Driver = None):
+    """ Main function that governs the searching of all records archived
+        within a specified Synergos network
+    """
+    st.title("Orchestrator - Search Existing Record(s)")
+
+    search_index = load_search_index(driver)
+
+    ###########################
+    # Step 1: Declare a query #
+    ###########################
+
+    st.header("Step 1: Declare your query")
+    columns = st.beta_columns((3, 2))
+
+    with columns[0]:
+        query = st.text_input(
+            label="Query:",
+            help=QUERY_HELP
+        )
+
+    with columns[1]:
+        selected_levels = st.multiselect(
+            label="Record type(s):",
+            options=list(SEARCHABLE_RECORDS.keys()),
+            default=list(SEARCHABLE_RECORDS.keys()),
+            help="Select which types of records to show."
+        )
+
+    if not query:
+        st.info(f"{len(search_index)} records indexed. Declare a query to begin.")
+        return
+
+    start_time = time.time()
+    results, facets = search_index.search(query, levels=selected_levels)
+    duration = (time.time() - start_time) * 1000
+
+    ###############################
+    # Step 2: Browse your results #
+    ###############################
+
+    st.header("Step 2: Browse your results")
+    st.code(
+        "\n".join([
+            f"Found {len(results)} record(s) in {duration:.1f}ms",
+            *[
+                f"  > {r_type.ljust(15)} {facets.get(r_type, 0)}"
+                for r_type in SEARCHABLE_RECORDS
+            ]
+        ])
+    )
+
+    if not results:
+        return
+
+    if len(results) > MAX_RESULTS:
+        st.warning(
+            f"Only the first {MAX_RESULTS} results are shown. Please refine your query."
+        )
+
+    displayed_results = results[:MAX_RESULTS]
+    st.dataframe(pd.DataFrame([
+        {'type': result['r_type'], **result['key']}
+        for result in displayed_results
+    ]).fillna(""))
+
+    ####################################
+    # Step 3: Inspect a matched record #
+    ####################################
+
+    st.header("Step 3: Inspect a matched record")
+    selected_result = st.selectbox(
+        label="Record:",
+        options=displayed_results,
+        format_func=lambda result: " > ".join([
+            result['r_type'],
+            *result['key'].values()
+        ])
+    )
+
+    record = getattr(driver, selected_result['r_type']).read(
+        **selected_result['key']
+    ).get('data', {})
+    if isinstance(record, dict):
+        record.pop('relations', None)   # no relations rendered!
+
+    with st.beta_expander("Record Details", expanded=True):
+        st.code(json.dumps(record, sort_keys=True, indent=4), language="json")
+
+
+
+###############################
+# Search UI - Page Formatting #
+###############################
+
+def app(action: str):
+    """ Main app orchestrating record search procedures """
+    core_app = MultiApp()
+    core_app.add_view(title=SUPPORTED_ACTIONS[0], func=search_records)
+
+    driver = render_orchestrator_inputs()
+
+    if driver:
+        # Search is the sole view, registered under the first ("create") slot
+        core_app.run("create")(driver)
+
+    else:
+        st.warning(
+            """
+            Please declare a valid grid connection to continue.
+
+            You will see this message if:
+
+                1. You have not declared your grid in the sidebar
+                2. Connection parameters you have declared are invalid
+            """
+        )
@@ -6,24 +6,41 @@
 
 # Generic/Built-in
 import json
+import math
 import os
 import time
-from collections import Counter
-from typing import Dict, List, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 # Libs
+import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components 
 
 # Custom
 from config import STYLES_DIR, SUPPORTED_COMPONENTS, TRACKER_HOST, TRACKER_PORT
 from synergos import Driver
+from views.core.capacity import GridCapacityPlanner
+from views.core.export import SUPPORTED_FORMATS, export_results
+from views.core.history import (
+    JobHistory, 
+    attribute_participants, 
+    summarize_durations
+)
+from views.core.leaderboard import LOWER_IS_BETTER, SUPPORTED_AGGREGATIONS
 from views.core.processes import TrackedProcess
+from views.core.progress import TrainingProgress
+from views.core.statistics import ProjectStatistics
 from views.utils import (
     is_connection_valid,
     wait_for_completion,
     download_button,
+    filter_options,
+    load_completion_notifier,
     load_custom_css,
+    load_project_statistics,
+    load_trial_cache,
+    paginate_options,
     render_orchestrator_inputs,
     render_upstream_hierarchy,
     MultiApp
@@ -35,7 +52,7 @@ from views.utils import (
 
 R_TYPE = "model"
 
-SUPPORTED_DASHBOARDS = ['Launchpad', 'Command Station']
+SUPPORTED_DASHBOARDS = ['Launchpad', 'Command Station', 'Leaderboard', 'Job History']
 SUPPORTED_OPTIONS = ["Preview results", "Download results"]
 
 GLOBAL_CSS_PATH = os.path.join(STYLES_DIR, "custom", "st_global.css")
@@ -61,88 +78,22 @@ def _f(target: str, padding: int = PADDING, postfix: str = ":") -> str:
 # Submission UI Option - Open Launchpad #
 #########################################
 
-def collate_general_statistics(driver: Driver, filters: Dict[str, str]):
+def collate_general_statistics(statistics: ProjectStatistics):
     """ Composes a table of metadata summarizing the general state of jobs &
-        resource available for a project under specified collaboration
+        resource available for a project under specified collaboration. The
+        number of grids available is determined by the number of grids 
+        registered across all participants at the specified project level,
+        while a job is defined as a unique hierarchical combination of 
+        collab/proj/expt/run.
 
     Args:
-        driver (Driver): Helper object to facilitate connection
-        filters (dict): Composite key set identifying a specific federated job
+        statistics (ProjectStatistics): Cached statistics of the project
     """
-    def count_grids(registry_data: Dict[str, Any]) -> int:
-        """ Count number of grids available for use for the current set of 
-            filters. This is determined by the number of grids registered 
-            across all participants at the specified project level.
-
-        Args:
-            registry_data (list): All registration records made by participants
-                under the current project
-        Returns:
-            Grid count (int)            
-        """
-        node_counts = [reg_record.get('n_count') for reg_record in registry_data]
-        grids_available = min(node_counts) if node_counts else 0
-        return grids_available
-
-    def count_participants(registry_data: List[Dict[str, Any]]) -> int:
-        """ Count number of participants registered under current collaboration
-
-        Args:
-            registry_data (list): All registration records made by participants
-                under the current project
-        Returns:
-            Participant count (int)
-        """
-        return len(registry_data)
-
-    def count_total_jobs(project_data: List[Dict[str, Any]]) -> int:
-        """ Count total number of federated jobs submitted under the specified
-            project. A job is defined as a unique hierarchical combination
-            of collab/proj/expt/run.
-
-        Args:
-            run_data (list): All run records registered under specified experiment
-        Returns:
-            Total count (int)
-        """
-        run_data = project_data.get('relations', {}).get('Run', [])
-        return len(run_data)
-
-    def count_completed_jobs(project_data: List[Dict[str, Any]]) -> int:
-        """ Count total number of federated jobs submitted under the specified
-            experiment. A job is defined as a unique hierarchical combination
-            of collab/proj/expt/run.
-
-        Args:
-            model_data (list): All model records created after succcesfully 
-                their respective models have been successfully trained
-        Returns:
-            Completed job count (int)
-        """
-        model_data = project_data.get('relations', {}).get('Model', [])
-        return len(model_data)
-
-    def count_pending_jobs(project_data: List[Dict[str, Any]]) -> int:
-        """ Count number of jobs (i.e. unique collab/proj/expt/run id set)
-            currently registered under specific project
-        """
-        return count_total_jobs(project_data) - count_completed_jobs(project_data)
-
-    collab_id = filters.get('collab_id', "")
-    project_id = filters.get('project_id', "")
-
-    project_data = driver.projects.read(
-        collab_id=collab_id, 
-        project_id=project_id
-    ).get('data', {})
-
-    registry_data = project_data.get('relations', {}).get('Registration', [])
-
-    grid_count = count_grids(registry_data)
-    participant_count = count_participants(registry_data)
-    job_count = count_total_jobs(project_data)
-    completed_count = count_completed_jobs(project_data)
-    pending_count = count_pending_jobs(project_data)
+    grid_count = statistics.grid_count
+    participant_count = statistics.participant_count
+    job_count = statistics.job_count
+    completed_count = statistics.completed_count
+    pending_count = statistics.pending_count
 
     st.subheader("General")
     st.code(
@@ -155,48 +106,23 @@ def collate_general_statistics(driver: Driver, filters: Dict[str, str]):
     )
 
 
-def collate_participant_statistics(driver: Driver, filters: Dict[str, str]):
+def collate_participant_statistics(statistics: ProjectStatistics):
     """ Composes a table of metadata summarizing the state of participant-specific 
-        resource available for a project under specified collaboration
+        resource available for a project under specified collaboration. A
+        partition is defined as combinable datasets to represent a single
+        participant's dataset. Partition count indirectly represents the
+        amount of variation in training data, since each partition can 
+        constitute non-IID problems as well
 
     Args:
-        driver (Driver): Helper object to facilitate connection
-        filters (dict): Composite key set identifying a specific federated job
+        statistics (ProjectStatistics): Cached statistics of the project
     """
-    def count_dataset_partitions(project_data: List[Dict[str, Any]]) -> int:
-        """ Counts the total number of dataset partitions across the grid. A
-            partition is defined as combinable datasets to represent a single
-            participant's dataset. Partition count indirectly represents
-            the amount of variation in training data, since each partition
-            can constitute non-IID problems as well
-
-        Args:
-            project_data (list): All project records created under specified
-                collaboration.
-        Returns:
-            Grid partition count
-        """
-        tag_data = project_data.get('relations', {}).get('Tag', [])
-        grid_partitions = {}
-        for tag_record in tag_data:
-            for meta in ['train', 'evaluate', 'predict']:
-                curr_partitions = len(tag_record.get(meta, []))
-                meta_partitions = grid_partitions.get(meta, 0)
-                meta_partitions += curr_partitions
-                grid_partitions[meta] = meta_partitions
-
-        return grid_partitions
-
-    collab_id = filters.get('collab_id', "")
-    project_id = filters.get('project_id', "")
-
-    project_data = driver.projects.read(
-        collab_id=collab_id, 
-        project_id=project_id
-    ).get('data', {})
-
-    action = project_data.get('action')
-    grid_partitions = count_dataset_partitions(project_data)
+    action = statistics.action
+    grid_partitions = (
+        statistics.partition_totals 
+        if statistics.partitions 
+        else {}
+    )
 
     st.subheader("Participants")
     st.code(
@@ -210,88 +136,21 @@ def collate_participant_statistics(driver: Driver, filters: Dict[str, str]):
     )
 
 
-def collate_model_statistics(driver: Driver, filters: Dict[str, str]):
+def collate_model_statistics(
+    statistics: ProjectStatistics,
+    aggregation: str = "mean"
+):
     """ Composes a table of metadata summarizing the model performances for the
         project under specified collaboration
 
     Args:
-        driver (Driver): Helper object to facilitate connection
-        filters (dict): Composite key set identifying a specific federated job
+        statistics (ProjectStatistics): Cached statistics of the project
+        aggregation (str): How participant scores are aggregated across the
+            grid (i.e. 'mean', 'median', 'min', 'max' or 'weighted')
     """
-    def extract_grid_stats(project_data: List[Dict[str, Any]]) -> int:
-        """ Analyses and extracts best expt-run combos that give the highest
-            averaged metrics across the grid
-
-        Args:
-            project_data (list): All project records created under specified
-                collaboration.
-        Returns:
-            Completed job count (int)
-        """
-        action = project_data.get('action')
-        if action == "classify":
-            target_metrics = ["accuracy", "roc_auc_score", "pr_auc_score", "f_score"]
-        else:
-            target_metrics = ["R2", "MSE", "MAE"]
-
-        val_data = project_data.get('relations', {}).get('Validation', [])
-        avg_metrics = {}
-        for val_record in val_data:
-            
-            expt_id = val_record.get('key', {}).get('expt_id')
-            run_id = val_record.get('key', {}).get('run_id')
-
-            val_stats = val_record.get('evaluate', {}).get('statistics', {})
-            for metric, results in val_stats.items():
-
-                if metric in target_metrics:
-                    if isinstance(results, list) and results:
-                        score = sum(results)/len(results)
-                    elif isinstance(results, float):
-                        score = results
-                    else:
-                        score = 0
-
-                    expt_score_collection = avg_metrics.get(expt_id, {})
-                    run_score_collection = expt_score_collection.get(run_id, {})
-                
-                    score_collection = run_score_collection.get(metric, [])
-                    score_collection.append(score)
-
-                    run_score_collection[metric] = score_collection
-                    expt_score_collection[run_id] = run_score_collection
-                    avg_metrics[expt_id] = expt_score_collection
-
-        consolidated_avgs = {}
-        for expt, expt_scores in avg_metrics.items():
-            for run, run_scores in expt_scores.items():
-                for metric, score_collection in run_scores.items():
-                    grid_avg = sum(score_collection)/len(score_collection)
-                    metric_collection = consolidated_avgs.get(metric, [])
-                    metric_collection.append((expt, run, grid_avg))
-                    consolidated_avgs[metric] = metric_collection
-
-        best_metrics = {}
-        for metric, metric_collection in consolidated_avgs.items():
-            best_metrics[metric] = max(metric_collection, key=lambda x: x[-1])
-
-        best_overall = Counter([
-            combination[:-1] 
-            for combination in list(best_metrics.values())
-        ]).most_common()
-
-        return best_metrics, best_overall
-
-    collab_id = filters.get('collab_id', "")
-    project_id = filters.get('project_id', "")
-
-    project_data = driver.projects.read(
-        collab_id=collab_id, 
-        project_id=project_id
-    ).get('data', {})
-
-    model_count = len(project_data.get('relations', {}).get('Model', []))
-    best_metrics, best_overall = extract_grid_stats(project_data)
+    model_count = statistics.completed_count
+    best_metrics, best_overall = statistics.leaderboard.best(how=aggregation)
+    aggregation_label = "avg" if aggregation == "mean" else aggregation
     
     best_architectures = list(set([combination[0][0] for combination in best_overall]))
 
@@ -307,13 +166,119 @@ def collate_model_statistics(driver: Driver, filters: Dict[str, str]):
             f"{_f('No. of models submitted', 29)} {model_count}",
             f"{_f('  > Best architectures', 29)} {best_architectures}",
             *[
-                f"{_f(f'  > Best avg {metric}', 29)} {_f(f'{expt_id} > {run_id}', id_buffer_length+3, '')}   -> {score}"
+                f"{_f(f'  > Best {aggregation_label} {metric}', 29)} {_f(f'{expt_id} > {run_id}', id_buffer_length+3, '')}   -> {score}"
                 for metric, (expt_id, run_id, score) in best_metrics.items()
             ]
         ])
     )
 
 
+def collate_capacity_statistics(
+    driver: Driver, 
+    filters: Dict[str, str],
+    statistics: ProjectStatistics
+):
+    """ Composes a capacity plan of the grids available to the project under
+        specified collaboration, and estimates the time required to clear all
+        pending jobs
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific federated job
+        statistics (ProjectStatistics): Cached statistics of the project
+    """
+    def probe_nodes(
+        registry_data: List[Dict[str, Any]]
+    ) -> Dict[Tuple[str, int], bool]:
+        """ Concurrently tests if the REST port of every registered node is
+            reachable
+
+        Args:
+            registry_data (list): All registration records made by participants
+                under the current project
+        Returns:
+            Node states (dict)
+        """
+        node_addresses = {}
+        for reg_record in registry_data:
+            participant_id = reg_record.get('key', {}).get('participant_id', "")
+            for node_idx in range(reg_record.get('n_count', 0) or 0):
+                node_info = reg_record.get(f"node_{node_idx}", {}) or {}
+                node_addresses[(participant_id, node_idx)] = (
+                    node_info.get('host', ""), 
+                    node_info.get('f_port', 0)
+                )
+
+        if not node_addresses:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(16, len(node_addresses))) as pool:
+            states = pool.map(
+                lambda address: is_connection_valid(*address),
+                node_addresses.values()
+            )
+            return dict(zip(node_addresses.keys(), states))
+
+    def format_duration(seconds: float) -> str:
+        if math.isnan(seconds) or math.isinf(seconds):
+            return "N.A."
+        hours, remainder = divmod(int(seconds), 3600)
+        return f"{hours}h {remainder // 60}m"
+
+    registry_data = driver.registrations.read_all(
+        collab_id=filters.get('collab_id', ""), 
+        project_id=filters.get('project_id', "")
+    ).get('data', []) or []
+
+    is_probed = st.checkbox(
+        label="Include live node health",
+        help="Probes every registered node. Otherwise, all registered nodes are assumed to be usable."
+    )
+    node_states = probe_nodes(registry_data) if is_probed else None
+    planner = GridCapacityPlanner(registry_data, node_states)
+
+    columns = st.beta_columns(2)
+    queue_size = columns[0].number_input(
+        label="No. of jobs to submit:",
+        min_value=0,
+        value=statistics.pending_count,
+        step=1
+    )
+    durations = JobHistory.load().durations(
+        p_type="submission",
+        collab_id=filters.get('collab_id'),
+        project_id=filters.get('project_id')
+    )
+    if durations:
+        st.info(f"Wall-clock estimates are based on {len(durations)} completed job(s).")
+    else:
+        durations = [60 * columns[1].number_input(
+            label="Expected duration per job (minutes):",
+            min_value=0.0,
+            value=30.0,
+            help="No jobs have completed yet. Please provide an estimate."
+        )]
+    estimates = planner.estimate_wall_clock(queue_size, durations)
+
+    st.subheader("Capacity")
+    st.code(
+        "\n".join([
+            f"{_f('No. of registered grids', 29)} {len(planner.registered_grids)}",
+            f"{_f('No. of usable grids', 29)} {len(planner.usable_grids)}",
+            f"{_f('Parallel training slots', 29)} {planner.parallel_slots}",
+            f"{_f('No. of submission waves', 29)} {estimates['waves']}",
+            f"{_f('  > Expected wall-clock', 29)} {format_duration(estimates['expected'])}",
+            f"{_f('  > Pessimistic wall-clock', 29)} {format_duration(estimates['pessimistic'])}",
+            f"Bottlenecks ({len(planner.bottlenecks)})",
+            *[
+                f"{_f(f'  > {p_id}', 29)} {details['available']} available, "
+                f"{details['shortfall']} short, unavailable: {details['unavailable_nodes']}"
+                for p_id, details in planner.bottlenecks.items()
+            ]
+        ])
+    )
+
+
 def show_hierarchy(filters: Dict[str, str]):
     """ List out keyword hierarchy derived from specified filters
 
@@ -465,8 +430,125 @@ def perform_healthcheck(driver: Driver, filters: Dict[str, str]) -> Tuple[bool]:
     ])
 
     return has_inactive_components, has_active_grids
+
+
+def render_training_progress(
+    driver: Driver, 
+    filters: Dict[str, str]
+) -> Optional[Callable]:
+    """ Renders placeholders for the live progress of a federated job, as
+        streamed from the Synergos Logger declared in its collaboration. Only
+        newly logged messages are rendered on every update.
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific federated job
+    Returns:
+        Progress update function (callable), or None if no logger is declared
+    """
+    collab_data = driver.collaborations.read(
+        filters.get('collab_id')
+    ).get('data', {})
+    progress = TrainingProgress.from_collaboration(collab_data, filters)
+    if progress is None:
+        return None
+
+    summary_placeholder = st.empty()
+    loss_chart = st.line_chart(pd.DataFrame({'loss': []}, dtype=float))
+    participant_placeholder = st.empty()
+    log_placeholder = st.empty()
+
+    def update_progress():
+        new_messages = progress.poll()
+        if not new_messages:
+            return
+
+        summary_placeholder.code(
+            "\n".join([
+                f"{_f('Round')} {progress.round}",
+                f"{_f('Epoch')} {progress.epoch}",
+                f"{_f('Loss')} {progress.loss}"
+            ])
+        )
+
+        new_losses = [
+            message for message in new_messages
+            if 'loss' in message['progress']
+        ]
+        if new_losses:
+            loss_chart.add_rows(pd.DataFrame(
+                {'loss': [message['progress']['loss'] for message in new_losses]},
+                index=pd.to_datetime([message.get('timestamp') for message in new_losses])
+            ))
+
+        if progress.participants:
+            participant_placeholder.table(
+                pd.DataFrame.from_dict(progress.participants, orient='index')
+            )
+        log_placeholder.code("\n".join(progress.tail()))
+
+    return update_progress
  
 
+def render_job_results(driver: Driver, result_keys: Dict[str, str]):
+    """ Renders the preview & download options of the models & validation 
+        statistics of a completed federated job
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        result_keys (dict): Composite key set identifying the completed job
+            whose results are to be rendered
+    """
+    trained_model = driver.models.read(**result_keys).get('data', {})
+    valid_stats = driver.validations.read(**result_keys).get('data', {})
+
+    action = st.radio(
+        label="Select an action:",
+        options=SUPPORTED_OPTIONS,
+        key=f"action"
+    )
+    
+    if action == SUPPORTED_OPTIONS[0]:
+
+        with st.beta_expander(label="Preview", expanded=False):
+            st.code(
+                json.dumps(valid_stats, sort_keys=True, indent=4),
+                language="json"
+            )
+
+    else:
+
+        filename = st.text_input(
+            label="Filename:",
+            value=f"RESULTS_{result_keys['collab_id']}_{result_keys['project_id']}_{result_keys['expt_id']}_{result_keys['run_id']}",
+            help="Specify a custom filename if desired"
+        )
+        export_format = st.selectbox(
+            label="Format:",
+            options=["JSON"] + list(SUPPORTED_FORMATS.keys()),
+            help="Columnar formats only contain flattened statistics."
+        )
+        if export_format == "JSON":
+            download_name = f"{filename}.json"
+            download_tag = download_button(
+                object_to_download={
+                    'models': trained_model,
+                    'validations': valid_stats 
+                },
+                download_filename=download_name,
+                button_text="Download"
+            )
+        else:
+            extension = SUPPORTED_FORMATS[export_format]
+            download_name = f"{filename}.{extension}"
+            download_tag = download_button(
+                object_to_download=export_results(valid_stats, export_format),
+                download_filename=download_name,
+                button_text="Download"
+            )
+        st.markdown(download_tag, unsafe_allow_html=True)
+
+
 def load_launchpad(driver: Driver, filters: Dict[str, str]):
     """ Loads up launch page for initializing a federated job. This corresponds
         to Phase 2A > 2B > 3A.
@@ -483,21 +565,32 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
 
     st.header("Summary")
 
+    # Project (incl. relations) is retrieved once, & shared across all views
+    project_data = driver.projects.read(
+        collab_id=filters.get('collab_id', ""),
+        project_id=filters.get('project_id', "")
+    ).get('data', {}) or {}
+    statistics = load_project_statistics(driver, filters, project_data)
+
     with st.beta_expander(label="Grid statistics", expanded=True):
         columns = st.beta_columns(2)
 
         with columns[0]:
-            collate_general_statistics(driver, filters)
+            collate_general_statistics(statistics)
         with columns[1]:
-            collate_participant_statistics(driver, filters)
+            collate_participant_statistics(statistics)
+
+        collate_model_statistics(statistics)
 
-        collate_model_statistics(driver, filters)
+    with st.beta_expander(label="Capacity planning", expanded=False):
+        collate_capacity_statistics(driver, filters, statistics)
 
     ###########################################################
     # Step 2: Peform health checks on all deployed components #
     ###########################################################
 
-    job_id = driver.runs.read(**filters).get('data', {}).get('doc_id')
+    run_data = driver.runs.read(**filters).get('data', {}) or {}
+    job_id = run_data.get('doc_id')
     st.header(f"Job #{job_id}:")
 
     columns = st.beta_columns((3, 2))
@@ -539,12 +632,18 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
     
     elif not has_inactive_components and has_active_grids:
 
+        notifier = load_completion_notifier(driver, filters)
         fl_job = TrackedProcess(
             driver=driver, 
             p_type="submission", 
-            filters=filters
+            filters=filters,
+            notifier=notifier
         ) 
         detected_status = fl_job.check()
+        if fl_job.is_recovered:
+            columns[0].info(
+                "The session tracking a previous run of this job has ended, and its tracking has been released."
+            )
 
         with columns[0]:
             manual_status = st.text_input(
@@ -556,6 +655,7 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
         idle_key = fl_job.statuses[0]
         in_progress_key = fl_job.statuses[1]
         completed_key = fl_job.statuses[2]
+        abandoned_key = fl_job.statuses[3]
 
         # Edge 1: Orchestrator is forcing a rerun of a completed job
         if detected_status == completed_key and manual_status == idle_key:
@@ -581,48 +681,75 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
                 ) == "Yes"
                 
             detected_status = manual_status if is_forced else detected_status
-        
-        ########################################################################
-        # Step 3a: If federated job has already completed, preview & download  #
-        ########################################################################
 
-        if detected_status == completed_key:
+        # Edge 2: Orchestrator is resubmitting a job that may still be running
+        elif detected_status == abandoned_key and manual_status == idle_key:
 
-            trained_model = driver.models.read(**filters).get('data', {})
-            valid_stats = driver.validations.read(**filters).get('data', {})
+            with columns[1]:
+                with st.beta_expander(label="Alerts", expanded=True):
+                    st.warning(
+                        """
+                        You have chosen to override the current job state.
 
+                        If the previous run is still in progress, both runs will compete for the same grid.
+
+                        Please confirm to proceed.
+                        """
+                    )
             with columns[0]:
-                action = st.radio(
-                    label="Select an action:",
-                    options=SUPPORTED_OPTIONS,
-                    key=f"action"
-                )
+                is_forced = st.selectbox(
+                    label="Are you sure you want to resubmit?",
+                    options=["No", "Yes"],
+                    key=f"forced_resubmission"
+                ) == "Yes"
                 
-                if action == SUPPORTED_OPTIONS[0]:
+            detected_status = manual_status if is_forced else detected_status
 
-                    with st.beta_expander(label="Preview", expanded=False):
-                        st.code(
-                            json.dumps(valid_stats, sort_keys=True, indent=4),
-                            language="json"
+        # Jobs identical to a completed run need not be retrained
+        run_keys = {
+            'collab_id': filters['collab_id'],
+            'project_id': filters['project_id'],
+            'expt_id': filters['expt_id'],
+            'run_id': filters['run_id']
+        }
+        reused_keys = None
+        duplicate_keys = None
+        is_reused = False
+        if detected_status == idle_key:
+            reused_keys = JobHistory.load().read_reuse(run_keys)
+            duplicate_keys = reused_keys or load_trial_cache(driver, filters, project_data).lookup(
+                expt_id=filters['expt_id'],
+                hyperparameters=run_data,
+                exclude=run_keys
+            )
+            if duplicate_keys:
+                with columns[0]:
+                    if reused_keys:
+                        st.info(
+                            f"""
+                            This job has reused the results of the completed run '{duplicate_keys['expt_id']} > {duplicate_keys['run_id']}' in place of being trained.
+                            """
                         )
+                    else:
+                        st.info(
+                            f"""
+                            This job's hyperparameters, model architecture & alignments are identical to those of the completed run '{duplicate_keys['expt_id']} > {duplicate_keys['run_id']}'.
+                            """
+                        )
+                    is_reused = st.checkbox(
+                        label="Reuse results of identical run",
+                        value=True,
+                        key="reuse_results"
+                    )
+        
+        ########################################################################
+        # Step 3a: If federated job has already completed, preview & download  #
+        ########################################################################
 
-                else:
+        if detected_status == completed_key:
 
-                    filename = st.text_input(
-                        label="Filename:",
-                        value=f"RESULTS_{filters['collab_id']}_{filters['project_id']}_{filters['expt_id']}_{filters['run_id']}",
-                        help="Specify a custom filename if desired"
-                    )
-                    download_name = f"{filename}.json"
-                    download_tag = download_button(
-                        object_to_download={
-                            'models': trained_model,
-                            'validations': valid_stats 
-                        },
-                        download_filename=download_name,
-                        button_text="Download"
-                    )
-                    st.markdown(download_tag, unsafe_allow_html=True)
+            with columns[0]:
+                render_job_results(driver, filters)
 
         #########################################################################
         # Step 3b: If federated job is still in progress, alert and do nothing  #
@@ -646,8 +773,44 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
                         """
                     )
 
+        ########################################################################
+        # Step 3c: If federated job lost its tracking session, verify it first #
+        ########################################################################
+
+        elif detected_status == abandoned_key:
+
+            with columns[1]:
+                with st.beta_expander(label="Alerts", expanded=True):
+                    st.warning(
+                        f"""
+                        The session tracking a previous run of this job has ended before the run completed.
+
+                        The run may still be in progress on the grid!
+
+                        Please verify that it has stopped before resubmitting, or override the status with '{idle_key}' to resubmit anyway.
+                        """
+                    )
+
+        ###########################################################################
+        # Step 3d: If federated job duplicates a completed run, reuse its results #
+        ###########################################################################
+
+        elif detected_status == idle_key and is_reused:
+
+            with columns[0]:
+                if not reused_keys:
+                    is_adopted = st.button(
+                        label="Adopt results",
+                        key=f"adopt_results"
+                    )
+                    if is_adopted:
+                        JobHistory.load().record_reuse(run_keys, duplicate_keys)
+                        st.info("Results adopted! This job will now resolve to them.")
+
+                render_job_results(driver, duplicate_keys)
+
         ####################################################################
-        # Step 3c: If federated job has not been trained before, start it  #
+        # Step 3e: If federated job has not been trained before, start it  #
         ####################################################################
 
         elif detected_status == idle_key:
@@ -685,41 +848,75 @@ def load_launchpad(driver: Driver, filters: Dict[str, str]):
                 if is_submitted:
                     placeholder.empty()
 
-                    fl_job.start()
-                    with st.spinner("Grid alignment in progress..."):
-                        align_keys = {
-                            'collab_id': filters.get('collab_id'),
-                            'project_id': filters.get('project_id')
-                        }
-                        driver.alignments.create(
-                            **align_keys,
-                            auto_align=is_auto_aligned,
-                            auto_fix=is_auto_fixed
-                        ).get('data', [])
+                    # Training this job supersedes any results it reused
+                    JobHistory.load().release_reuse(run_keys)
+                    fl_job.start(
+                        grid_size=statistics.grid_count,
+                        participants=list(statistics.registrations.keys())
+                    )
+                    try:
+                        with st.spinner("Grid alignment in progress..."), fl_job.stage("alignment"):
+                            align_keys = {
+                                'collab_id': filters.get('collab_id'),
+                                'project_id': filters.get('project_id')
+                            }
+                            driver.alignments.create(
+                                **align_keys,
+                                auto_align=is_auto_aligned,
+                                auto_fix=is_auto_fixed
+                            ).get('data', [])
                         
-                        wait_for_completion(driver.alignments, align_keys)
-
-                    with st.spinner("Model training in progress..."):
-                        driver.models.create(
-                            **filters,
-                            auto_align=is_auto_aligned,
-                            dockerised=True,
-                            log_msgs=is_logged,
-                            verbose=is_verbose
-                        ).get('data', [])
-
-                        wait_for_completion(driver.models, filters)
-
-                    with st.spinner("Model validation in progress..."):
-                        driver.validations.create(
-                            **filters,
-                            auto_align=is_auto_aligned,
-                            dockerised=True,
-                            log_msgs=is_logged,
-                            verbose=is_verbose
-                        ).get('data', [])
-
-                        wait_for_completion(driver.validations, filters)
+                            wait_for_completion(
+                                driver.alignments, 
+                                align_keys,
+                                notifier=notifier,
+                                event="alignment"
+                            )
+
+                        # Runs are fingerprinted against the alignment they train on
+                        load_trial_cache(driver, filters).record(run_keys, run_data)
+
+                        with st.spinner("Model training in progress..."), fl_job.stage("training"):
+                            update_progress = (
+                                render_training_progress(driver, filters)
+                                if is_logged
+                                else None
+                            )
+                            driver.models.create(
+                                **filters,
+                                auto_align=is_auto_aligned,
+                                dockerised=True,
+                                log_msgs=is_logged,
+                                verbose=is_verbose
+                            ).get('data', [])
+
+                            wait_for_completion(
+                                driver.models, 
+                                filters, 
+                                callback=update_progress,
+                                notifier=notifier,
+                                event="training"
+                            )
+
+                        with st.spinner("Model validation in progress..."), fl_job.stage("validation"):
+                            driver.validations.create(
+                                **filters,
+                                auto_align=is_auto_aligned,
+                                dockerised=True,
+                                log_msgs=is_logged,
+                                verbose=is_verbose
+                            ).get('data', [])
+
+                            wait_for_completion(
+                                driver.validations, 
+                                filters,
+                                notifier=notifier,
+                                event="validation"
+                            )
+
+                    except Exception:
+                        fl_job.stop(outcome="failed")
+                        raise
 
                     fl_job.stop()
                     st.info("Job Completed! Please refresh to view results.")
@@ -804,6 +1001,226 @@ def load_command_station(driver: Driver, filters: Dict[str, str]):
 
 
 
+###########################################
+# Submission UI Option - Open leaderboard #
+###########################################
+
+def load_leaderboard(driver: Driver, filters: Dict[str, str]):
+    """ Loads up a sortable leaderboard of all runs trained under the project
+        corresponding to the specified set of filters. Sorting, filtering &
+        pagination are all performed server-side, so only a single page of
+        the leaderboard is ever rendered.
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific federated job
+    """
+    st.title("Orchestrator - Leaderboard")
+
+    statistics = load_project_statistics(driver, filters)
+    leaderboard = statistics.leaderboard
+
+    if not len(leaderboard):
+        st.warning(
+            """
+            No validation statistics have been found for this project!
+
+            Please train & validate at least one model before trying again.
+            """
+        )
+        return
+
+    ##############################
+    # Step 1: Configure rankings #
+    ##############################
+
+    st.header("Step 1: Configure your rankings")
+    columns = st.beta_columns(3)
+
+    with columns[0]:
+        aggregation = st.selectbox(
+            label="Aggregation across participants:",
+            options=SUPPORTED_AGGREGATIONS,
+            help="""Select how participant scores are combined into a grid-wide
+            score. 'weighted' weighs each participant by its sample count."""
+        )
+
+    summary = leaderboard.summarize(how=aggregation)
+    metric_columns = [
+        metric for metric in leaderboard.metrics 
+        if metric in summary.columns
+    ]
+
+    with columns[1]:
+        sort_column = st.selectbox(
+            label="Sort by:",
+            options=metric_columns + ['participants', 'expt_id', 'run_id']
+        )
+
+    with columns[2]:
+        is_ascending = st.checkbox(
+            label="Ascending",
+            value=sort_column in LOWER_IS_BETTER + ['expt_id', 'run_id']
+        )
+
+    with st.beta_expander(label="Filters"):
+        selected_expt_ids = st.multiselect(
+            label="Experiment ID(s):",
+            options=sorted(summary['expt_id'].unique()),
+            help="Leave empty to include all experiments."
+        )
+        run_query = st.text_input(
+            label="Run ID contains:",
+            help="Filter by space-separated terms (case insensitive)."
+        )
+
+    ##############################
+    # Step 2: Browse leaderboard #
+    ##############################
+
+    if selected_expt_ids:
+        summary = summary[summary['expt_id'].isin(selected_expt_ids)]
+
+    if run_query:
+        matched_run_ids = set(filter_options(summary['run_id'].unique(), run_query))
+        summary = summary[summary['run_id'].isin(matched_run_ids)]
+
+    summary = summary.sort_values(
+        by=sort_column, 
+        ascending=is_ascending, 
+        na_position="last",
+        kind="mergesort"
+    ).reset_index(drop=True)
+    summary.index += 1  # ranks start from 1
+
+    st.header("Step 2: Browse your leaderboard")
+
+    _, page_count = paginate_options(summary, 1)
+    page = st.number_input(
+        label=f"Page (of {page_count}):",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1
+    ) if page_count > 1 else 1
+
+    paged_summary, _ = paginate_options(summary, page)
+    st.dataframe(paged_summary)
+    st.info(
+        f"Showing {len(paged_summary)} of {len(summary)} matching runs. "
+        f"Spreads denote the range of participant scores."
+    )
+
+
+
+###########################################
+# Submission UI Option - Open job history #
+###########################################
+
+def load_job_history(driver: Driver, filters: Dict[str, str]):
+    """ Loads up analytics over all jobs previously launched from this UI for
+        the project corresponding to the specified set of filters
+
+    Args:
+        driver (Driver): Helper object to facilitate connection
+        filters (dict): Composite key set identifying a specific federated job
+    """
+    st.title("Orchestrator - Job History")
+
+    job_history = JobHistory.load()
+
+    p_type = st.selectbox(
+        label="Job type:",
+        options=["submission", "optimization", "inference"]
+    )
+    jobs = job_history.read_jobs(
+        p_type=p_type,
+        collab_id=filters.get('collab_id'),
+        project_id=filters.get('project_id')
+    )
+
+    if jobs.empty:
+        st.warning(
+            """
+            No jobs of this type have been launched for this project yet!
+
+            Jobs are recorded as they are launched from the Launchpad, Hyperdrive or Inference pages.
+            """
+        )
+        return
+
+    ##########################
+    # Step 1: Summarize jobs #
+    ##########################
+
+    st.header("Summary")
+    outcome_counts = jobs['outcome'].value_counts().to_dict()
+    st.code(
+        "\n".join([
+            f"{_f('No. of jobs', 24)} {len(jobs)}",
+            *[
+                f"{_f(f'  > {outcome}', 24)} {count}"
+                for outcome, count in outcome_counts.items()
+            ]
+        ])
+    )
+
+    stages = job_history.read_stages(jobs['job_id'].tolist())
+    completed_stages = stages[stages['outcome'] == "completed"]
+    completed_jobs = jobs[jobs['outcome'] == "completed"]
+
+    latencies = pd.DataFrame({
+        'overall': summarize_durations(completed_jobs['duration']),
+        **{
+            stage: summarize_durations(stage_durations)
+            for stage, stage_durations in completed_stages.groupby(
+                'stage', 
+                sort=False
+            )['duration']
+        }
+    }).T
+    st.subheader("Latencies (seconds)")
+    st.dataframe(latencies)
+
+    ###############################
+    # Step 2: Visualize the trend #
+    ###############################
+
+    st.header("Trends")
+    if not completed_stages.empty:
+        stage_trends = completed_stages.pivot_table(
+            index='job_id',
+            columns='stage',
+            values='duration',
+            aggfunc='sum'
+        )
+        stage_trends.index = pd.to_datetime(
+            jobs.set_index('job_id').loc[stage_trends.index, 'started_at'],
+            unit='s'
+        )
+        st.line_chart(stage_trends.rolling(window=5, min_periods=1).median())
+    else:
+        st.info("No stages have completed yet.")
+
+    #####################################
+    # Step 3: Attribute to participants #
+    #####################################
+
+    st.header("Participants")
+    attributions = attribute_participants(
+        jobs, 
+        job_history.read_participants(jobs['job_id'].tolist())
+    )
+    if attributions.empty:
+        st.info("Not enough completed jobs to attribute durations.")
+    else:
+        st.dataframe(attributions)
+        st.info(
+            "Slowdown: median duration (s) of jobs with vs. without participant"
+        )
+
+
+
 #######################################
 # Job Submission UI - Page Formatting #
 #######################################
@@ -814,6 +1231,8 @@ def app(action: str):
     core_app = MultiApp()
     core_app.add_view(title=SUPPORTED_DASHBOARDS[0], func=load_launchpad)
     core_app.add_view(title=SUPPORTED_DASHBOARDS[1], func=load_command_station)
+    core_app.add_view(title=SUPPORTED_DASHBOARDS[2], func=load_leaderboard)
+    core_app.add_view(title=SUPPORTED_DASHBOARDS[3], func=load_job_history)
 
     driver = render_orchestrator_inputs()
 
@@ -13,7 +13,8 @@ import re
 import socket
 import time
 import uuid
-from typing import Callable, Dict, List, Any, Union
+import weakref
+from typing import Callable, Dict, List, Any, Tuple, Union
 
 # Libs
 import numpy as np
@@ -27,7 +28,38 @@ from streamlit.script_runner import RerunException
 from streamlit.server.server import Server
 
 # Custom
+from config import (
+    SNAPSHOT_DIR, 
+    SELECTOR_PAGE_SIZE, 
+    SELECTOR_RECENT_LIMIT,
+    POLL_MIN_INTERVAL,
+    POLL_MAX_INTERVAL,
+    POLL_BACKOFF,
+    MQ_FALLBACK_INTERVAL,
+    COVERAGE_MATRIX_COLUMNS
+)
 from synergos import Driver
+from views.core.alignment_index import ALIGNMENT_PARTITIONS
+from views.core.bulk_import import (
+    ImportItem,
+    import_items,
+    summarize_items,
+    validate_items,
+    IMPORT_STATUSES
+)
+from views.core.coverage import AlignmentCoverage, fetch_alignments
+from views.core.hierarchy import HierarchyIndex
+from views.core.notifications import CompletionNotifier
+from views.core.replica import OrchestratorReplica, ReplicaDriver
+from views.core.result_cache import TrialResultCache
+from views.core.search import SearchIndex
+from views.core.statistics import ProjectStatistics
+from views.core.snapshot import (
+    SNAPSHOT_EXTENSION,
+    SnapshotDriver,
+    SnapshotReader,
+    export_snapshot
+)
 from views.renderer import (
     CollaborationRenderer, 
     ProjectRenderer,
@@ -44,6 +76,9 @@ from views.renderer import (
 # Configurations #
 ##################
 
+SUPPORTED_SOURCES = ["Orchestrator", "Snapshot"]
+SUPPORTED_READ_MODES = ["Live", "Replica"]
+
 collab_renderer = CollaborationRenderer()
 project_renderer = ProjectRenderer()
 expt_renderer = ExperimentRenderer()
@@ -54,6 +89,9 @@ participant_renderer = ParticipantRenderer()
 align_renderer = AlignmentRenderer()
 optim_renderer = OptimRenderer()
 
+# Tracks the orchestrator address each connected driver was built against
+orchestrator_addresses = weakref.WeakKeyDictionary()
+
 ###################
 # General Helpers #
 ###################
@@ -103,6 +141,193 @@ def is_connection_valid(host: str, port: int) -> bool:
         return False
 
 
+def retrieve_orchestrator_address(driver: Driver) -> Tuple[str, int]:
+    """ Retrieves the address of the orchestrator that a driver (declared
+        via `render_orchestrator_inputs`) is connected to
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+    Returns:
+        Orchestrator host & port (tuple), or None if driver is unregistered
+    """
+    return orchestrator_addresses.get(driver) if driver else None
+
+
+def load_hierarchy_index(driver: Driver) -> HierarchyIndex:
+    """ Retrieves the materialized collaboration/project/experiment/run
+        hierarchy of the orchestrator that a driver is connected to. The same
+        index is reused across reruns for as long as the app is alive.
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+    Returns:
+        Hierarchy index (HierarchyIndex)
+    """
+    address = retrieve_orchestrator_address(driver)
+    return HierarchyIndex.load(address=address, driver=driver)
+
+
+def load_search_index(driver: Driver) -> SearchIndex:
+    """ Retrieves the search index of the orchestrator that a driver is
+        connected to. The index is only built on the request path the first
+        time; afterwards, a stale index is resynced in the background while
+        the current index keeps serving queries. Only new or changed records
+        are reindexed.
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+    Returns:
+        Search index (SearchIndex)
+    """
+    address = retrieve_orchestrator_address(driver)
+    search_index = SearchIndex.load(address=address)
+
+    if search_index.last_synced is None:
+        with st.spinner("Indexing records..."):
+            search_index.sync(driver)
+
+    elif search_index.is_stale():
+        search_index.sync_in_background(driver)
+
+    return search_index
+
+
+def load_project_statistics(
+    driver: Driver,
+    filters: Dict[str, str],
+    project_data: Dict[str, Any] = None
+) -> ProjectStatistics:
+    """ Retrieves the cached statistics of a project, folding in any records
+        added to, changed in or removed from the project since they were last
+        computed
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+        filters (dict): Composite key set identifying a specific project
+        project_data (dict): Project record (incl. relations), if it has
+            already been retrieved
+    Returns:
+        Project statistics (ProjectStatistics)
+    """
+    collab_id = filters.get('collab_id', "")
+    project_id = filters.get('project_id', "")
+
+    if project_data is None:
+        project_data = driver.projects.read(
+            collab_id=collab_id,
+            project_id=project_id
+        ).get('data', {}) or {}
+
+    address = retrieve_orchestrator_address(driver)
+    statistics = ProjectStatistics.load(address, collab_id, project_id)
+    statistics.refresh(project_data)
+    return statistics
+
+
+def load_trial_cache(
+    driver: Driver,
+    filters: Dict[str, str],
+    project_data: Dict[str, Any] = None
+) -> TrialResultCache:
+    """ Retrieves the cached result index of a project, indexing any runs &
+        validations added to the project since it was last refreshed
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+        filters (dict): Composite key set identifying a specific project
+        project_data (dict): Project record (incl. relations), if it has
+            already been retrieved
+    Returns:
+        Result cache (TrialResultCache)
+    """
+    project_key = {
+        'collab_id': filters.get('collab_id', ""),
+        'project_id': filters.get('project_id', "")
+    }
+    if project_data is None:
+        project_data = driver.projects.read(**project_key).get('data', {}) or {}
+    expt_data = driver.experiments.read_all(**project_key).get('data', []) or []
+
+    address = retrieve_orchestrator_address(driver)
+    result_cache = TrialResultCache.load(address, **project_key)
+    result_cache.refresh(project_data, expt_data)
+    return result_cache
+
+
+def load_alignment_coverage(
+    driver: Driver,
+    filters: Dict[str, str]
+) -> Tuple[AlignmentCoverage, Dict[str, str]]:
+    """ Retrieves the cached alignment coverage matrix of a project, updating
+        only the rows of participants whose alignments have changed since it
+        was last refreshed. Alignments embedded within registrations are
+        reused, while all others are retrieved concurrently. Participants
+        whose alignments could not be retrieved retain their previous rows.
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+        filters (dict): Composite key set identifying a specific project
+    Returns:
+        Coverage matrix (AlignmentCoverage) & participants whose alignments
+        could not be retrieved (dict(str, str))
+    """
+    project_key = {
+        'collab_id': filters.get('collab_id', ""),
+        'project_id': filters.get('project_id', "")
+    }
+    registry_data = driver.registrations.read_all(**project_key).get('data', []) or []
+
+    alignments = {}
+    pending_ids = []
+    for registration in registry_data:
+        participant_id = registration['key']['participant_id']
+        embedded = registration.get('relations', {}).get('Alignment', [])
+        if embedded:
+            alignments[participant_id] = embedded[-1]
+        else:
+            pending_ids.append(participant_id)
+
+    fetched, failures = fetch_alignments(
+        participant_ids=pending_ids,
+        read=lambda participant_id: driver.alignments.read(
+            **project_key,
+            participant_id=participant_id
+        )
+    )
+    alignments.update(fetched)
+
+    address = retrieve_orchestrator_address(driver)
+    coverage = AlignmentCoverage.load(address, **project_key)
+    coverage.refresh(alignments, retained_ids=list(failures))
+    return coverage, failures
+
+
+def load_completion_notifier(
+    driver: Driver,
+    filters: Dict[str, str]
+) -> CompletionNotifier:
+    """ Retrieves the subscriber to job completion events published by the
+        Synergos MQ declared in a collaboration, if any
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+        filters (dict): Composite key set identifying a specific collaboration
+    Returns:
+        Notifier (CompletionNotifier), or None if no MQ is declared
+    """
+    collab_data = driver.collaborations.read(
+        filters.get('collab_id', "")
+    ).get('data', {}) or {}
+    return CompletionNotifier.load(collab_data)
+
+
 def is_request_successful(resp: dict):
     """ Parses a REST response for its status code and renders a corresponding
         onscreen notification
@@ -130,24 +355,103 @@ def is_request_successful(resp: dict):
 def wait_for_completion(
     resource: Callable, 
     filters: Dict[str, str], 
-    step: int = 5
+    step: int = POLL_MIN_INTERVAL,
+    callback: Callable = None,
+    notifier: CompletionNotifier = None,
+    event: str = None
 ):
     """ A delay function that checks if a job that was previously submitted to 
         a particular Synergos REST resource is still in progress, and suspends
-        system functions until it is completed.
+        system functions until it is completed. 
+        
+        If a Synergos MQ notifier is specified, the job's completion event is
+        subscribed to, and the resource is only re-checked once the event is 
+        published (or periodically, in case it never arrives). Only events 
+        received after the last check wake the waiter, so events of previous
+        runs under the same keys are disregarded. Otherwise, the
+        resource is polled at intervals that grow from `step` up till 
+        POLL_MAX_INTERVAL, so that long jobs do not load the orchestrator.
 
     Args:
         resource (callable): Specific driver resource 
         filters (dict): Composite key set identifying a specific federated job
-        step (int): Time interval between every check
+        step (int): Initial time interval between checks
+        callback (callable): Function invoked after every unsuccessful check
+            (eg. to report progress)
+        notifier (CompletionNotifier): Subscriber to Synergos MQ events
+        event (str): Completion event of the job (eg. 'training')
     """
+    interval = step
     while True:
+        checked_at = time.time()
         resp = resource.read(**filters)
         data = resp.get('data')
         if data:
             break
 
-        time.sleep(step)
+        if callback:
+            callback()
+
+        if notifier and event and notifier.is_connected:
+            # Progress reports, if any, still have to be refreshed regularly
+            timeout = POLL_MAX_INTERVAL if callback else MQ_FALLBACK_INTERVAL
+            notifier.subscribe(event, filters, since=checked_at).wait(timeout)
+        else:
+            time.sleep(interval)
+            interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+
+
+def filter_options(options: List[str], query: str = "") -> List[str]:
+    """ Filters selectable IDs against a type-ahead query. Matching is case
+        insensitive, and every space-separated term has to occur in an ID.
+        Exact matches are ranked first, followed by prefix matches, then all
+        other matches, each in their original order.
+
+    Args:
+        options (list(str)): Selectable IDs
+        query (str): Type-ahead query
+    Returns:
+        Matching IDs (list(str))
+    """
+    terms = query.lower().split()
+    if not terms:
+        return list(options)
+
+    ranked_options = ([], [], [])
+    for option in options:
+        normalized_option = str(option).lower()
+        if not all(term in normalized_option for term in terms):
+            continue
+
+        if normalized_option == terms[0] and len(terms) == 1:
+            ranked_options[0].append(option)
+        elif normalized_option.startswith(terms[0]):
+            ranked_options[1].append(option)
+        else:
+            ranked_options[2].append(option)
+
+    return [option for ranking in ranked_options for option in ranking]
+
+
+def paginate_options(
+    options: List[str],
+    page: int = 1,
+    page_size: int = SELECTOR_PAGE_SIZE
+) -> Tuple[List[str], int]:
+    """ Slices out a single page of selectable IDs
+
+    Args:
+        options (list(str)): Selectable IDs
+        page (int): Page to retrieve, starting from 1
+        page_size (int): No. of IDs per page
+    Returns:
+        IDs on page (list(str))
+        Total no. of pages (int)
+    """
+    page_count = max(1, -(-len(options) // page_size))
+    page = min(max(1, page), page_count)
+    start_idx = (page - 1) * page_size
+    return options[start_idx:start_idx + page_size], page_count
 
 
 def rerun(msg: str = None, delay: int = 3):
@@ -264,6 +568,25 @@ def _get_state(hash_funcs=None):
     return session._custom_session_state
 
 
+def retrieve_session_default(name: str, generate: Callable[[], Any]) -> Any:
+    """ Retrieves a default value that is generated only once per session.
+        Streamlit derives widget IDs from their defaults, so widgets with
+        generated defaults (eg. random IDs) must reuse them across reruns, 
+        lest user inputs be discarded.
+
+    Args:
+        name (str): Name of default value
+        generate (callable): Function generating the default value
+    Returns:
+        Default value (Any)
+    """
+    state = _get_state()
+    state_key = f"{name}-default"
+    if state[state_key] is None:
+        state[state_key] = generate()
+    return state[state_key]
+
+
 #####################
 # Rendering Helpers #
 #####################
@@ -356,6 +679,18 @@ def render_orchestrator_inputs() -> Union[Driver, None]:
 
         st.header("NETWORK")
 
+        source = st.radio(
+            label="Source:",
+            options=SUPPORTED_SOURCES,
+            help="""Browse a live orchestrator, or an exported snapshot of one 
+            without any connection (read-only)."""
+        )
+
+    if source == SUPPORTED_SOURCES[1]:
+        return render_snapshot_inputs()
+
+    with st.sidebar.beta_container():
+
         with st.beta_expander("Orchestrator Parameters", expanded=True):
         
             orchestrator_host = st.text_input(
@@ -367,15 +702,91 @@ def render_orchestrator_inputs() -> Union[Driver, None]:
                 value=5000,
                 help="Declare the access port of your selected orchestrator."
             )
+            read_mode = st.radio(
+                label="Read mode:",
+                options=SUPPORTED_READ_MODES,
+                help="""Live reads query the orchestrator directly. Replica 
+                reads are served from a periodically synchronised local copy."""
+            )
 
     if is_connection_valid(host=orchestrator_host, port=orchestrator_port):
+        address = (orchestrator_host, orchestrator_port)
         driver = Driver(host=orchestrator_host, port=orchestrator_port)
+
+        if read_mode == SUPPORTED_READ_MODES[1]:
+            replica = OrchestratorReplica.load(address=address, driver=driver)
+            staleness = replica.staleness()
+
+            if staleness is None:
+                st.sidebar.info("Replica is synchronising. Reading live for now.")
+            else:
+                driver = ReplicaDriver(replica=replica, driver=driver)
+                st.sidebar.info(
+                    f"Replica last synced {int(staleness)}s ago "
+                    f"(resynced every {int(replica.synchronizer.interval)}s)."
+                )
+
+        orchestrator_addresses[driver] = address
+
+        with st.sidebar.beta_expander("Snapshot Parameters", expanded=False):
+            is_exported = st.button(label="Export snapshot", key="export_snapshot")
+            if is_exported:
+                snapshot_name = re.sub(
+                    r"[^\w\-]", "_", 
+                    f"{orchestrator_host}_{orchestrator_port}_{int(time.time())}"
+                )
+                snapshot_path = os.path.join(
+                    SNAPSHOT_DIR, 
+                    f"{snapshot_name}.{SNAPSHOT_EXTENSION}"
+                )
+                with st.spinner("Exporting snapshot..."):
+                    export_snapshot(driver=driver, path=snapshot_path)
+                st.info(f"Snapshot exported to {snapshot_path}")
+
     else:
         driver = None    # Ensures rendering of unpopulated widgets
 
     return driver
 
 
+def render_snapshot_inputs() -> Union[SnapshotDriver, None]:
+    """ Renders input form for selecting a previously exported orchestrator
+        snapshot, and assembles a read-only driver stand-in over it.
+
+    Returns:
+        Snapshot-backed driver (SnapshotDriver)
+    """
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    snapshot_names = sorted([
+        filename 
+        for filename in os.listdir(SNAPSHOT_DIR)
+        if filename.endswith(f".{SNAPSHOT_EXTENSION}")
+    ])
+
+    with st.sidebar.beta_container():
+
+        with st.beta_expander("Snapshot Parameters", expanded=True):
+            selected_snapshot = st.selectbox(
+                label="Snapshot:",
+                options=snapshot_names,
+                help=f"Select a snapshot exported into {SNAPSHOT_DIR}."
+            )
+
+    if not selected_snapshot:
+        return None
+
+    snapshot_path = os.path.join(SNAPSHOT_DIR, selected_snapshot)
+    try:
+        reader = SnapshotReader.load(snapshot_path)
+    except (OSError, ValueError) as e:
+        st.sidebar.error(f"Unable to load snapshot! Error - {e}")
+        return None
+
+    driver = SnapshotDriver(reader=reader)
+    orchestrator_addresses[driver] = ("snapshot", snapshot_path)
+    return driver
+
+
 def render_upstream_hierarchy(r_type: str, driver: Driver) -> Dict[str, str]:
     """ Renders input form for collecting keys corresponding to a record's
         upstream hierarchy for subsequent use.
@@ -459,16 +870,7 @@ def render_cascading_filter(
     if not show_details:
         return participant_id, None
 
-    if participant_id:
-        participant_data = driver.participants.read(participant_id).get('data', {})   
-        participant_relations = participant_data.get('relations', {})
-        participant_registrations = participant_relations.get('Registration', [])
-        participant_filters = [
-            reg_record.get('key', {})
-            for reg_record in participant_registrations
-        ]
-    else:
-        participant_filters = []
+    hierarchy_index = load_hierarchy_index(driver)
 
     with st.sidebar.beta_container():
 
@@ -479,10 +881,7 @@ def render_cascading_filter(
             combination_key = {}
 
             if r_type in SUPPORTED_RECORDS[1:]:
-                collab_ids = [
-                    keyset.get('collab_id', "") 
-                    for keyset in participant_filters
-                ]
+                collab_ids = hierarchy_index.registered_children(participant_id)
                 selected_collab_id = st.selectbox(
                     label="Collaboration ID:", 
                     options=collab_ids,
@@ -491,11 +890,10 @@ def render_cascading_filter(
                 combination_key['collab_id'] = selected_collab_id
 
                 if r_type in SUPPORTED_RECORDS[2:]:
-                    project_ids = [
-                        keyset.get('project_id', "") 
-                        for keyset in participant_filters
-                        if keyset.get('collab_id') == selected_collab_id
-                    ]
+                    project_ids = hierarchy_index.registered_children(
+                        participant_id,
+                        selected_collab_id
+                    )
                     selected_project_id = st.selectbox(
                         label="Project ID:", 
                         options=project_ids,
@@ -504,14 +902,10 @@ def render_cascading_filter(
                     combination_key['project_id'] = selected_project_id
 
                     if r_type in SUPPORTED_RECORDS[3:]:
-                        expt_data = driver.experiments.read_all(
-                            collab_id=selected_collab_id, 
-                            project_id=selected_project_id
-                        ).get('data', [])
-                        expt_ids = [
-                            expt_record.get('key', {}).get('expt_id', "")
-                            for expt_record in expt_data
-                        ]
+                        expt_ids = hierarchy_index.children(
+                            selected_collab_id, 
+                            selected_project_id
+                        )
                         selected_expt_id = st.selectbox(
                             label="Experiment ID:", 
                             options=expt_ids,
@@ -520,15 +914,11 @@ def render_cascading_filter(
                         combination_key['expt_id'] = selected_expt_id
 
                         if r_type in SUPPORTED_RECORDS[4:]:
-                            run_data = driver.runs.read_all(
-                                collab_id=selected_collab_id,
-                                project_id=selected_project_id,
-                                expt_id=selected_expt_id
-                            ).get('data', [])
-                            run_ids = [
-                                run_record.get('key', {}).get('run_id', "")
-                                for run_record in run_data
-                            ]
+                            run_ids = hierarchy_index.children(
+                                selected_collab_id,
+                                selected_project_id,
+                                selected_expt_id
+                            )
                             selected_run_id = st.selectbox(
                                 label="Run ID:", 
                                 options=run_ids,
@@ -610,6 +1000,180 @@ def render_confirmation_form(
     return is_correct and is_submitted
 
 
+def render_bulk_import(
+    items: List[ImportItem],
+    r_type: str,
+    existing_ids: List[str],
+    create: Callable
+) -> List[ImportItem]:
+    """ Renders the validation report of a bulk upload, and creates all valid
+        records once the user confirms the submission. Invalid records are
+        skipped, while records that fail to be created are reported without
+        interrupting the rest of the import.
+
+    Args:
+        items (list(ImportItem)): Items parsed from a bulk upload
+        r_type (str): Type of document/archival record handled
+        existing_ids (list(str)): IDs of records that already exist
+        create (callable): Function creating the record of an item, returning
+            the orchestrator's response
+    Returns:
+        Imported items (list(ImportItem)), or an empty list if no import was
+        submitted
+    """
+    if not items:
+        return []
+
+    items = validate_items(items, r_type, existing_ids)
+    valid_ids = [item.record_id for item in items if item.is_valid]
+    invalid_count = len(items) - len(valid_ids)
+
+    report_placeholder = st.empty()
+    report_placeholder.dataframe(summarize_items(items))
+    if invalid_count:
+        st.warning(
+            f"{invalid_count} of {len(items)} declared {r_type}s are invalid, and will be skipped."
+        )
+    if not valid_ids:
+        return []
+
+    is_confirmed = render_confirmation_form(
+        data={f"{r_type}s": valid_ids},
+        r_type=r_type,
+        r_action="bulk creation",
+        use_warnings=False
+    )
+    if not is_confirmed:
+        return []
+
+    progress_bar = st.progress(0)
+    processed_count = 0
+
+    def update_progress(item: ImportItem):
+        nonlocal processed_count
+        processed_count += 1
+        progress_bar.progress(processed_count / len(valid_ids))
+
+    with st.spinner(f"Importing {len(valid_ids)} {r_type}s..."):
+        items = import_items(items, create, on_update=update_progress)
+
+    report_placeholder.dataframe(summarize_items(items))
+    created_count = sum(item.status == IMPORT_STATUSES[2] for item in items)
+    failed_count = sum(item.status == IMPORT_STATUSES[3] for item in items)
+    if failed_count:
+        st.error(f"{failed_count} {r_type}s could not be created. Please refer to the report above.")
+    st.success(f"{created_count} {r_type}s successfully created.")
+    return items
+
+
+def render_paginated_selector(
+    label: str,
+    options: List[str],
+    help: str = "",
+    page_size: int = SELECTOR_PAGE_SIZE
+) -> Union[str, None]:
+    """ Renders a searchable, paginated alternative to `st.selectbox` for
+        potentially huge lists of IDs. Filtering & paging take place on the
+        server, so only the pinned IDs (i.e. favourites & recent selections
+        of the current session) and a single page of matching IDs are ever
+        sent to the frontend.
+
+    Args:
+        label (str): Label of selector (eg. "Run ID:")
+        options (list(str)): All selectable IDs
+        help (str): Tooltip to display on selector
+        page_size (int): No. of IDs rendered per page
+    Returns:
+        Selected ID (str)
+    """
+    state = _get_state()
+    state_key = label.rstrip(":").strip()
+    state(**{
+        f"{state_key}-recent": [],
+        f"{state_key}-favourite": [],
+        f"{state_key}-selected": None
+    })
+
+    with st.beta_container():
+
+        search_column, page_column = st.beta_columns((3, 1))
+
+        query = search_column.text_input(
+            label=f"Search {state_key}:",
+            help="Filter by space-separated terms (case insensitive)."
+        )
+        matched_options = filter_options(options, query)
+
+        _, page_count = paginate_options(matched_options, 1, page_size)
+        page = page_column.number_input(
+            label=f"Page (of {page_count}):",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            step=1
+        ) if page_count > 1 else 1
+        paged_options, _ = paginate_options(matched_options, page, page_size)
+
+        # Pinned IDs must still exist & satisfy the current query
+        matched_set = set(matched_options)
+        pinned_options = [
+            option
+            for option in (
+                state[f"{state_key}-favourite"] +
+                state[f"{state_key}-recent"]
+            )
+            if option in matched_set
+        ]
+        displayed_options = list(dict.fromkeys(pinned_options + paged_options))
+
+        favourites = set(state[f"{state_key}-favourite"])
+        selected_option = st.selectbox(
+            label=label,
+            options=displayed_options,
+            format_func=lambda option: (
+                f"★ {option}" if option in favourites else option
+            ),
+            help=help
+        )
+
+        if len(options) > len(displayed_options):
+            st.info(
+                f"Showing {len(displayed_options)} of {len(matched_options)} "
+                f"matching IDs ({len(options)} total)."
+            )
+
+        if selected_option is None:
+            return None
+
+        is_favourite = st.checkbox(
+            label=f"Pin {selected_option} as favourite",
+            value=selected_option in favourites,
+            key=f"{state_key}-favourite-{selected_option}"
+        )
+        if is_favourite and selected_option not in favourites:
+            state[f"{state_key}-favourite"] = (
+                state[f"{state_key}-favourite"] + [selected_option]
+            )
+        elif not is_favourite and selected_option in favourites:
+            state[f"{state_key}-favourite"] = [
+                option
+                for option in state[f"{state_key}-favourite"]
+                if option != selected_option
+            ]
+
+    # Only explicit changes in selection are remembered as recent selections
+    previous_option = state[f"{state_key}-selected"]
+    if previous_option is not None and previous_option != selected_option:
+        state[f"{state_key}-recent"] = [selected_option] + [
+            option
+            for option in state[f"{state_key}-recent"]
+            if option != selected_option
+        ][:SELECTOR_RECENT_LIMIT - 1]
+    state[f"{state_key}-selected"] = selected_option
+
+    return selected_option
+
+
 def render_collaborations(driver: Driver, show_details: bool = True):
     """ Renders out retrieved collaboration metadata in a custom form 
 
@@ -621,13 +1185,12 @@ def render_collaborations(driver: Driver, show_details: bool = True):
         Selected collaboration ID    (str)
         Updated collaboration record (dict)
     """
-    collab_data = driver.collaborations.read_all().get('data', [])
-    collab_ids = [collab['key']['collab_id'] for collab in collab_data]
+    collab_ids = load_hierarchy_index(driver).children()
 
     with st.beta_container():
 
-        selected_collab_id = st.selectbox(
-            label="Collaboration ID:", 
+        selected_collab_id = render_paginated_selector(
+            label="Collaboration ID:",
             options=collab_ids,
             help="Select a collaboration to peruse."
         )
@@ -664,13 +1227,12 @@ def render_projects(
         Selected project ID    (str)
         Updated project record (dict)
     """
-    project_data = driver.projects.read_all(collab_id).get('data', [])
-    project_ids = [proj['key']['project_id'] for proj in project_data]
+    project_ids = load_hierarchy_index(driver).children(collab_id)
 
     with st.beta_container():
 
-        selected_project_id = st.selectbox(
-            label="Project ID:", 
+        selected_project_id = render_paginated_selector(
+            label="Project ID:",
             options=project_ids,
             help="""Select a project to peruse."""
         )
@@ -713,16 +1275,12 @@ def render_experiments(
         Selected experiment ID    (str)
         Updated experiment record (dict)
     """
-    expt_data = driver.experiments.read_all(
-        collab_id=collab_id, 
-        project_id=project_id
-    ).get('data', [])
-    expt_ids = [expt['key']['expt_id'] for expt in expt_data]
+    expt_ids = load_hierarchy_index(driver).children(collab_id, project_id)
     
     with st.beta_container():
 
-        selected_expt_id = st.selectbox(
-            label="Experiment ID:", 
+        selected_expt_id = render_paginated_selector(
+            label="Experiment ID:",
             options=expt_ids,
             help="""Select an experiment to peruse."""
         )
@@ -772,17 +1330,16 @@ def render_runs(
         Selected run ID    (str)
         Updated run record (dict)
     """
-    run_data = driver.runs.read_all(
-        collab_id=collab_id, 
-        project_id=project_id,
-        expt_id=expt_id
-    ).get('data', [])
-    run_ids = [run['key']['run_id'] for run in run_data]
+    run_ids = load_hierarchy_index(driver).children(
+        collab_id, 
+        project_id, 
+        expt_id
+    )
     
     with st.beta_container():
 
-        selected_run_id = st.selectbox(
-            label="Run ID:", 
+        selected_run_id = render_paginated_selector(
+            label="Run ID:",
             options=run_ids,
             help="""Select an run to peruse."""
         )
@@ -873,8 +1430,8 @@ def render_orchestrator_registrations(
         registry_data = []
         participant_ids = []
 
-    selected_participant_id = st.selectbox(
-        label="Participant ID:", 
+    selected_participant_id = render_paginated_selector(
+        label="Participant ID:",
         options=participant_ids,
         help="""Select an participant to view."""
     )
@@ -907,9 +1464,103 @@ def render_orchestrator_registrations(
             alignment_details = alignments.pop() if alignments else {}
             align_renderer.display(alignment_details)
 
+            other_participant_ids = [
+                p_id for p_id in participant_ids
+                if p_id != selected_participant_id
+            ]
+            compared_participant_id = st.selectbox(
+                label="Compare alignments with:",
+                options=[None] + other_participant_ids,
+                format_func=lambda p_id: "-" if p_id is None else p_id,
+                help="""Select another participant to compare alignments with."""
+            )
+            if alignment_details and compared_participant_id:
+                compared_registry = [
+                    reg for reg in registry_data
+                    if reg['key']['participant_id'] == compared_participant_id
+                ].pop()
+                compared_alignments = compared_registry.get('relations', {}).get('Alignment', [])
+                align_renderer.render_alignment_diff(
+                    alignment_details,
+                    compared_alignments[-1] if compared_alignments else {},
+                    labels=(selected_participant_id, compared_participant_id)
+                )
+
     return selected_participant_id
 
 
+def render_alignment_coverage(
+    driver: Driver = None, 
+    collab_id: str = None, 
+    project_id: str = None
+):
+    """ Renders out the participant x feature alignment coverage of a project,
+        highlighting the features that force participants to pad
+
+    Args:
+        driver (Driver): A connected Synergos driver to communicate with the
+            selected orchestrator.
+        collab_id (str): ID of selected collaboration to be rendered
+        project_id (str): ID of selected project to be rendered
+    """
+    if not (driver and collab_id and project_id):
+        return
+
+    coverage, failures = load_alignment_coverage(
+        driver, 
+        {'collab_id': collab_id, 'project_id': project_id}
+    )
+    for participant_id, error in failures.items():
+        st.warning(
+            f"Alignment of participant '{participant_id}' could not be retrieved, so its last known alignment (if any) is shown: {error}"
+        )
+
+    if coverage.unaligned_ids:
+        st.info(
+            f"Not yet aligned, and hence excluded: {', '.join(coverage.unaligned_ids)}"
+        )
+
+    if not len(coverage):
+        st.info("No registered participants have been aligned for this project yet.")
+        return
+
+    partition = st.selectbox(
+        label="Partition:",
+        options=ALIGNMENT_PARTITIONS,
+        format_func=lambda partition: partition.capitalize(),
+        help="""Select an alignment partition to inspect."""
+    )
+
+    padded_feature_count = coverage.padded_feature_count(partition)
+    if not padded_feature_count:
+        st.success(f"All {len(coverage)} aligned participant(s) align without padding.")
+        return
+
+    st.warning(
+        f"{padded_feature_count} feature(s) force padding across {len(coverage)} participant(s)."
+    )
+    padded_features = coverage.padded_features(partition, limit=COVERAGE_MATRIX_COLUMNS)
+
+    with st.beta_expander("Padded Features", expanded=True):
+        st.dataframe(padded_features)
+
+    with st.beta_expander("Participant Coverage"):
+        st.dataframe(coverage.participant_summary(partition))
+        st.info(
+            f"""
+            Padded share: fraction of the {padded_feature_count} feature(s) padded by any participant that a participant pads. Alignments do not record the total no. of features.
+            """
+        )
+
+    with st.beta_expander("Coverage Matrix"):
+        matrix = coverage.to_frame(partition, padded_features['feature'].tolist())
+        st.dataframe(
+            matrix.style.applymap(
+                lambda is_padded: "background-color: #f8d7da" if is_padded else ""
+            )
+        )
+
+
 def render_participant_registrations(
     driver: Driver = None, 
     participant_id: str = None
@@ -921,6 +1572,11 @@ def render_participant_registrations(
             selected orchestrator.
         collab_id (str): ID of selected collaboration to be rendered
         project_id (str): ID of selected project to be rendered
+    Returns:
+        Composite key of selected registration (dict)
+        Updated registration details (dict)
+        Updated tag details (dict)
+        Tag validation errors (list(str))
     """
     if participant_id:
         participant_data = driver.participants.read(participant_id).get('data', {})
@@ -966,14 +1622,14 @@ def render_participant_registrations(
         ]
         relevant_tags = retrieved_tags.pop() if retrieved_tags else {}
         
-        updated_tags = tag_renderer.display(data=relevant_tags)
+        updated_tags, tag_errors = tag_renderer.display(data=relevant_tags)
 
     composite_key = {
         'participant_id': participant_id,
         'collab_id': selected_collab_id, 
         'project_id': selected_project_id
     } 
-    return composite_key, updated_registrations, updated_tags
+    return composite_key, updated_registrations, updated_tags, tag_errors
     
 
 #####################